@@ -31,7 +31,7 @@ analysis_status = {}
 # 백그라운드 분석 작업
 # ============================================================
 
-async def run_analysis(result_key: str, jd_url: str, s3_keys: list[str]):
+async def run_analysis(result_key: str, jd_url: str, s3_keys: list[str], force_refresh: bool = False):
     """백그라운드에서 실행되는 전체 분석 파이프라인 (LangChain)"""
     company_chain = None
     applicant_chain = None
@@ -56,7 +56,7 @@ async def run_analysis(result_key: str, jd_url: str, s3_keys: list[str]):
         logger.info(f"\n{'─' * 40}")
         logger.info("🚀 [1/3] 회사 + 구직자 병렬 분석 시작")
         logger.info(f"   📋 회사 JD: {jd_url}")
-        logger.info(f"   📄 구직자 S3: {s3_keys[0] if s3_keys else 'N/A'}")
+        logger.info(f"   📄 구직자 S3: {', '.join(s3_keys) if s3_keys else 'N/A'}")
         step_start = time.time()
 
         if not s3_keys:
@@ -71,8 +71,8 @@ async def run_analysis(result_key: str, jd_url: str, s3_keys: list[str]):
 
         # 병렬 실행
         company_data, candidate_data = await asyncio.gather(
-            company_chain.run(jd_url),
-            applicant_chain.run_from_s3(s3_keys[0])
+            company_chain.run(jd_url, force_refresh=force_refresh),
+            applicant_chain.run_from_s3_keys(s3_keys)
         )
 
         analysis_status[result_key]["progress"] = 70
@@ -175,6 +175,7 @@ async def upload(data: RequestAnalyze):
         "progress": 0,
         "message": "파일 업로드 대기 중...",
         "jd_url": data.jd_url,
+        "force_refresh": data.force_refresh,
         # "s3_keys": s3_keys
     }
 
@@ -202,6 +203,7 @@ async def start_analysis(result_key: str, background_tasks: BackgroundTasks):
         raise HTTPException(status_code=404, detail="result_key not found")
 
     jd_url = analysis_status[result_key].get("jd_url", "")
+    force_refresh = analysis_status[result_key].get("force_refresh", False)
 
     # S3에서 'result_key/' prefix를 가진 파일 목록을 직접 가져옵니다.
     s3_keys = list_files_in_prefix(result_key)
@@ -211,7 +213,7 @@ async def start_analysis(result_key: str, background_tasks: BackgroundTasks):
         raise HTTPException(status_code=400, detail="S3에 업로드된 파일이 없습니다. 파일을 먼저 업로드해주세요.")
 
     # 백그라운드에서 분석 실행
-    background_tasks.add_task(run_analysis, result_key, jd_url, s3_keys)
+    background_tasks.add_task(run_analysis, result_key, jd_url, s3_keys, force_refresh)
 
     # 상태 업데이트: 분석 시작됨을 명시하고, 찾은 s3_keys를 저장
     analysis_status[result_key].update({
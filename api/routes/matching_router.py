@@ -0,0 +1,53 @@
+from bson import ObjectId
+from fastapi import APIRouter, BackgroundTasks, HTTPException
+
+from db.repositories import culture_fit_result_repository
+from schema.culture_fit_result import BatchMatchingRequest, MatchRankingRequest
+from services.batch_matching_service import batch_jobs, create_batch_job, run_batch_matching
+
+router = APIRouter(prefix="/api/matching", tags=["matching"])
+
+
+@router.post("/companies/{company_profile_id}/ranking")
+async def rank_candidates(company_profile_id: str, request: MatchRankingRequest):
+    """회사 기준 지원자 순위 (요청 가중치로 저장된 축별 점수를 재계산, LLM 호출 없음)"""
+    return await culture_fit_result_repository.rank_matches_for_company(
+        company_profile_id,
+        weights=request.weights.model_dump(),
+        skip=request.skip,
+        limit=request.limit,
+    )
+
+
+@router.post("/companies/{company_profile_id}/batch")
+async def start_batch_matching(
+    company_profile_id: str,
+    request: BatchMatchingRequest,
+    background_tasks: BackgroundTasks
+):
+    """회사 1곳 vs 저장된 지원자 풀 일괄 매칭 시작 (진행 상황은 /batch/{job_id}로 조회)"""
+    # 잘못된 ID를 조용히 빼면 전부 잘못된 경우 0명으로 "completed"가 되므로 요청 단계에서 거부
+    invalid_ids = [i for i in request.candidate_ids or [] if not ObjectId.is_valid(i)]
+    if invalid_ids:
+        raise HTTPException(status_code=422, detail={"message": "유효하지 않은 candidate_ids", "invalid_ids": invalid_ids})
+
+    job_id = create_batch_job(company_profile_id)
+    background_tasks.add_task(
+        run_batch_matching,
+        job_id,
+        company_profile_id,
+        role=request.role,
+        min_score=request.min_score,
+        candidate_ids=request.candidate_ids,
+        limit=request.limit,
+        concurrency=request.concurrency,
+    )
+    return {"job_id": job_id, "status": "started"}
+
+
+@router.get("/batch/{job_id}")
+async def get_batch_matching_status(job_id: str):
+    """배치 매칭 진행 상황 / 결과 요약"""
+    if job_id not in batch_jobs:
+        raise HTTPException(status_code=404, detail="job_id not found")
+    return batch_jobs[job_id]
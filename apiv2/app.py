@@ -11,6 +11,11 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from apiv2.routers import culture_fit_router
+from apiv2.langchain_pipeline.scrapers.browser_pool import start_browser_pool, close_browser_pool
+from apiv2.langchain_pipeline.scrapers.tiered_scraper import close_http_client
+from apiv2.langchain_pipeline.utils.company_registry import start_company_registry, close_company_registry
+from apiv2.langchain_pipeline.utils.context_cache import close_context_cache
+from apiv2.langchain_pipeline.utils.file_registry import start_file_registry, close_file_registry
 
 
 @asynccontextmanager
@@ -18,8 +23,16 @@ async def lifespan(app: FastAPI):
     """앱 시작/종료 시 실행되는 로직"""
     # Startup
     print("🚀 Culture-Fit Analysis API Server Starting...")
+    await start_company_registry()
+    await start_browser_pool()
+    await start_file_registry()
     yield
     # Shutdown
+    await close_browser_pool()
+    await close_context_cache()
+    await close_file_registry()
+    await close_company_registry()
+    await close_http_client()
     print("👋 Culture-Fit Analysis API Server Shutting Down...")
 
 
@@ -5,10 +5,20 @@
 1. 텍스트 기반: 이력서 텍스트 → 프로필 분석 → JSON 출력
 2. S3 PDF 기반: S3 PDF → Gemini Files API → 프로필 분석 → JSON 출력
 3. 로컬 PDF 기반: 로컬 PDF들 → Gemini Files API → 통합 분석 → JSON 출력
+4. S3 다중 PDF 기반: S3 PDF들 → 동시 다운로드/업로드 → 통합 분석 → JSON 출력
 
 S3/로컬 PDF 연동 시 google-genai SDK를 직접 사용합니다 (PDF multimodal 지원)
+Gemini 호출/업로드/삭제는 모두 비동기 클라이언트(client.aio)를 사용하고,
+동기 DB 저장은 스레드에서 실행해 이벤트 루프를 막지 않습니다.
+업로드한 PDF는 파일 레지스트리(utils/file_registry.py)에 SHA-256 기준으로 남겨 같은 문서를
+다시 분석할 때 업로드/처리 대기 없이 재사용합니다 (분석 실패 시에는 재사용하지 않음).
+
+PDF 흐름(2~4)은 업로드 전에 로더의 사전 분석으로 텍스트를 추출하고, 모든 문서가 텍스트 PDF면
+업로드 없이 텍스트 분석(analyze)으로 처리합니다 (PDF_TEXT_FAST_PATH, loaders/pdf_text_extractor.py).
+스캔/이미지 위주 문서가 하나라도 있으면 전체를 multimodal로 분석합니다.
 """
 
+import asyncio
 import logging
 import json
 import re
@@ -20,13 +30,21 @@ from langchain_core.output_parsers import JsonOutputParser
 
 from apiv2.langchain_pipeline.config import (
     GOOGLE_API_KEY,
+    PDF_TEXT_FAST_PATH,
     S3_BUCKET_NAME,
     S3_REGION,
     AWS_ACCESS_KEY_ID,
     AWS_SECRET_ACCESS_KEY,
 )
+from apiv2.langchain_pipeline.loaders.pdf_text_extractor import (
+    ExtractedPDF,
+    format_documents_for_prompt,
+    record_extraction,
+    record_multimodal_upload,
+)
 from apiv2.langchain_pipeline.utils.schema_loader import get_schema_for_prompt
 from apiv2.langchain_pipeline.utils.db_handler import DatabaseHandler
+from apiv2.langchain_pipeline.utils.file_registry import get_file_registry
 from apiv2.langchain_pipeline.prompts import applicant_analyze
 
 logger = logging.getLogger(__name__)
@@ -119,13 +137,15 @@ class ApplicantAnalysisChain:
         self,
         model_name: str = "gemini-2.0-flash-exp",
         temperature: float = 0.0,
-        save_to_db: bool = True
+        save_to_db: bool = True,
+        text_fast_path: bool = PDF_TEXT_FAST_PATH
     ):
         """
         Args:
             model_name: Gemini 모델명
             temperature: 생성 온도
             save_to_db: DB 저장 여부
+            text_fast_path: 텍스트 PDF는 업로드 없이 로컬 추출 텍스트로 분석
         """
         logger.info(f"Initializing ApplicantAnalysisChain with model='{model_name}', temperature={temperature}, save_to_db={save_to_db}")
         self.model_name = model_name
@@ -140,12 +160,11 @@ class ApplicantAnalysisChain:
 
         self.save_to_db = save_to_db
         self.db = DatabaseHandler() if save_to_db else None
+        self.text_fast_path = text_fast_path
 
         # PDF 로더 (지연 초기화)
         self._s3_loader = None
         self._local_loader = None
-        self._uploaded_file = None
-        self._uploaded_files: list = []  # 여러 파일 추적용
 
         # 프롬프트 템플릿 설정
         self._setup_prompts()
@@ -171,6 +190,7 @@ class ApplicantAnalysisChain:
                 aws_region=S3_REGION,
                 aws_access_key_id=AWS_ACCESS_KEY_ID or None,
                 aws_secret_access_key=AWS_SECRET_ACCESS_KEY or None,
+                file_registry=get_file_registry(),
             )
 
         return self._s3_loader
@@ -181,7 +201,8 @@ class ApplicantAnalysisChain:
             from apiv2.langchain_pipeline.loaders.local_pdf_loader import LocalPDFLoader
 
             self._local_loader = LocalPDFLoader(
-                gemini_api_key=GOOGLE_API_KEY
+                gemini_api_key=GOOGLE_API_KEY,
+                file_registry=get_file_registry(),
             )
 
         return self._local_loader
@@ -207,6 +228,26 @@ class ApplicantAnalysisChain:
 
         return result
 
+    async def _analyze_extracted(self, documents: list[ExtractedPDF]) -> Optional[dict[str, Any]]:
+        """
+        사전 분석 결과 처리: 모든 문서가 텍스트 PDF면 추출 텍스트로 analyze() 실행
+
+        Args:
+            documents: 로더의 extract_text_* 결과
+
+        Returns:
+            구직자 프로필 분석 결과, multimodal 경로가 필요하면 None
+        """
+        use_text = all(doc.is_text_native for doc in documents)
+        summaries = record_extraction(documents, use_text)
+        if not use_text:
+            return None
+
+        logger.info(f"👤 [Applicant] 텍스트 PDF {len(documents)}개 → 업로드 없이 텍스트 분석")
+        profile = await self.analyze(format_documents_for_prompt(documents))
+        profile["_source"] = {"analysis_path": "text", "documents": summaries}
+        return profile
+
     async def analyze_pdf(self, s3_key: str) -> dict[str, Any]:
         """
         S3의 PDF 파일 분석 (Gemini Files API 직접 사용)
@@ -218,7 +259,6 @@ class ApplicantAnalysisChain:
             구직자 프로필 분석 결과 (JSON)
         """
         import time
-        from google import genai
         from google.genai import types
 
         total_start = time.time()
@@ -226,15 +266,29 @@ class ApplicantAnalysisChain:
 
         loader = self._get_s3_loader()
 
+        # 0. 사전 분석: 텍스트 PDF면 업로드 없이 텍스트 분석 (아니면 받은 바이트를 업로드에 재사용)
+        documents = []
+        if self.text_fast_path:
+            documents = await loader.extract_text_from_s3([s3_key])
+            profile = await self._analyze_extracted(documents)
+            if profile is not None:
+                logger.info(f"👤 [Applicant] ✅ 분석 완료! 총 소요시간: {time.time() - total_start:.1f}초")
+                return profile
+
+        # 같은 체인을 동시에 여러 요청이 쓰므로 업로드 파일은 지역 변수로 추적
+        uploaded_file = None
+        succeeded = False
+
         try:
             # 1. S3 → Gemini 업로드
             step_start = time.time()
             logger.info("👤 [Applicant] 1/3 S3에서 PDF 다운로드 → Gemini 업로드 중...")
-            self._uploaded_file = loader.load_from_s3(s3_key)
+            uploaded_file = await loader.load_from_s3(s3_key, prefetched=documents[0] if documents else None)
+            record_multimodal_upload(time.time() - step_start)
             logger.info(f"👤 [Applicant] 1/3 업로드 완료 ({time.time() - step_start:.1f}초)")
 
-            if self._uploaded_file.state != 'ACTIVE':
-                raise Exception(f"파일 처리 실패: {self._uploaded_file.state}")
+            if uploaded_file.state != 'ACTIVE':
+                raise Exception(f"파일 처리 실패: {uploaded_file.state}")
 
             # 2. 스키마 로드 (Gemini 직접 사용이므로 이스케이프 불필요)
             schema = get_schema_for_prompt("applicant_schema", escape_braces=False)
@@ -254,15 +308,13 @@ class ApplicantAnalysisChain:
             # 4. Gemini에 PDF + 프롬프트 전송
             step_start = time.time()
             logger.info("👤 [Applicant] 2/3 Gemini LLM 분석 중...")
-            client = genai.Client(api_key=GOOGLE_API_KEY)
-
             # URI 문자열이 아닌 types.Part.from_uri()로 변환해야 Gemini가 PDF를 인식함
             pdf_part = types.Part.from_uri(
-                file_uri=self._uploaded_file.uri,
+                file_uri=uploaded_file.uri,
                 mime_type="application/pdf"
             )
 
-            response = client.models.generate_content(
+            response = await loader.genai_client.aio.models.generate_content(
                 model=self.model_name,
                 contents=[pdf_part, prompt]
             )
@@ -275,14 +327,89 @@ class ApplicantAnalysisChain:
             logger.info(f"👤 [Applicant] 3/3 JSON 파싱 완료")
             logger.info(f"👤 [Applicant] ✅ 분석 완료! 총 소요시간: {time.time() - total_start:.1f}초")
 
+            succeeded = True
             return result
 
         finally:
-            # 6. 정리: Gemini에서 파일 삭제
-            if self._uploaded_file:
-                logger.debug("👤 [Applicant] Gemini 파일 삭제 중...")
-                loader.delete_file(self._uploaded_file)
-                self._uploaded_file = None
+            # 6. 정리: 업로드 전에 실패했으면 사전 분석 바이트 예약 해제, Gemini 파일 반환
+            #    (레지스트리 파일은 재사용을 위해 유지, 그 외는 삭제)
+            await loader.release_prefetched(documents)
+            if uploaded_file:
+                logger.debug("👤 [Applicant] Gemini 파일 정리 중...")
+                await loader.release_file(uploaded_file, evict=not succeeded)
+
+    async def _analyze_uploaded_files(self, gemini_client, uploaded_files: list) -> dict[str, Any]:
+        """
+        업로드된 여러 PDF를 하나의 Gemini 요청으로 통합 분석
+
+        Args:
+            gemini_client: google-genai 클라이언트 (aio 사용)
+            uploaded_files: ACTIVE 상태의 GeminiFile 목록
+
+        Returns:
+            구직자 프로필 분석 결과 (JSON)
+        """
+        from google.genai import types
+
+        # 업로드 상태 확인
+        for uploaded_file in uploaded_files:
+            if uploaded_file.state != 'ACTIVE':
+                raise Exception(f"파일 처리 실패: {uploaded_file.display_name} - {uploaded_file.state}")
+
+        # 1. 스키마 로드 (Gemini 직접 사용이므로 이스케이프 불필요)
+        schema = get_schema_for_prompt("applicant_schema", escape_braces=False)
+
+        # 2. 파일 목록 설명 생성
+        file_descriptions = []
+        for i, uploaded_file in enumerate(uploaded_files, 1):
+            filename = uploaded_file.display_name
+            # 파일명에서 문서 유형 추측
+            if "이력서" in filename or "resume" in filename.lower():
+                doc_type = "이력서 (Resume)"
+            elif "포트폴리오" in filename or "portfolio" in filename.lower():
+                doc_type = "포트폴리오 (Portfolio)"
+            elif "자기소개서" in filename or "essay" in filename.lower() or "자소서" in filename:
+                doc_type = "자기소개서 (Personal Statement)"
+            else:
+                doc_type = "기타 문서"
+            file_descriptions.append(f"{i}. {filename} - {doc_type}")
+
+        files_summary = "\n".join(file_descriptions)
+
+        # 3. 프롬프트 구성
+        prompt = f"""{applicant_analyze.SYSTEM_MESSAGE}
+
+Analyze the following attached PDF documents for this candidate:
+
+{files_summary}
+
+## Output JSON Schema
+{schema}
+
+Instructions:
+- Integrate information from ALL provided documents (resume, portfolio, essay)
+- Use doc_id in evidence to specify which document the quote is from
+- Score each axis based on combined evidence from all documents
+- If information is not explicitly stated in any document, mark as "unknown"
+
+Output MUST be valid JSON only. No markdown, no explanations."""
+
+        # 4. Gemini에 모든 PDF + 프롬프트 전송
+        # contents 배열 구성: [파일1 Part, 파일2 Part, ..., 프롬프트]
+        # URI 문자열이 아닌 types.Part.from_uri()로 변환해야 Gemini가 PDF를 인식함
+        contents = [
+            types.Part.from_uri(file_uri=uploaded_file.uri, mime_type="application/pdf")
+            for uploaded_file in uploaded_files
+        ]
+        contents.append(prompt)
+
+        response = await gemini_client.aio.models.generate_content(
+            model=self.model_name,
+            contents=contents
+        )
+
+        # 5. JSON 파싱
+        return parse_json_response(response.text)
 
     async def analyze_local_pdfs(self, file_paths: list[str]) -> dict[str, Any]:
         """
@@ -296,85 +423,89 @@ class ApplicantAnalysisChain:
         Returns:
             구직자 프로필 분석 결과 (JSON)
         """
-        from google import genai
-        from google.genai import types
-        from pathlib import Path
+        import time
 
         loader = self._get_local_loader()
 
+        # 0. 사전 분석: 모두 텍스트 PDF면 업로드 없이 텍스트 분석
+        if self.text_fast_path:
+            profile = await self._analyze_extracted(await loader.extract_text_from_files(file_paths))
+            if profile is not None:
+                return profile
+
+        uploaded_files = []
+        succeeded = False
+
         try:
             # 1. 모든 PDF를 Gemini에 업로드
-            self._uploaded_files = loader.load_files(file_paths)
+            step_start = time.time()
+            uploaded_files = await loader.load_files(file_paths)
+            record_multimodal_upload(time.time() - step_start, len(file_paths))
 
-            # 업로드 상태 확인
-            for uploaded_file in self._uploaded_files:
-                if uploaded_file.state != 'ACTIVE':
-                    raise Exception(f"파일 처리 실패: {uploaded_file.display_name} - {uploaded_file.state}")
+            # 2. 통합 분석
+            result = await self._analyze_uploaded_files(loader.genai_client, uploaded_files)
+            succeeded = True
+            return result
 
-            # 2. 스키마 로드 (Gemini 직접 사용이므로 이스케이프 불필요)
-            schema = get_schema_for_prompt("applicant_schema", escape_braces=False)
+        finally:
+            # 3. 정리: Gemini 파일 반환
+            if uploaded_files:
+                await loader.release_files(uploaded_files, evict=not succeeded)
 
-            # 3. 파일 목록 설명 생성
-            file_descriptions = []
-            for i, uploaded_file in enumerate(self._uploaded_files, 1):
-                filename = uploaded_file.display_name
-                # 파일명에서 문서 유형 추측
-                if "이력서" in filename or "resume" in filename.lower():
-                    doc_type = "이력서 (Resume)"
-                elif "포트폴리오" in filename or "portfolio" in filename.lower():
-                    doc_type = "포트폴리오 (Portfolio)"
-                elif "자기소개서" in filename or "essay" in filename.lower() or "자소서" in filename:
-                    doc_type = "자기소개서 (Personal Statement)"
-                else:
-                    doc_type = "기타 문서"
-                file_descriptions.append(f"{i}. {filename} - {doc_type}")
-
-            files_summary = "\n".join(file_descriptions)
-
-            # 4. 프롬프트 구성
-            prompt = f"""{applicant_analyze.SYSTEM_MESSAGE}
+    async def analyze_s3_pdfs(self, s3_keys: list[str]) -> dict[str, Any]:
+        """
+        S3의 여러 PDF(이력서, 포트폴리오, 자기소개서) 통합 분석
 
-Analyze the following attached PDF documents for this candidate:
+        다운로드/업로드/처리 대기를 모든 파일에 대해 동시에 진행하고 한 번의 Gemini 요청으로 분석
 
-{files_summary}
+        Args:
+            s3_keys: S3 객체 키 목록
 
-## Output JSON Schema
-{schema}
+        Returns:
+            구직자 프로필 분석 결과 (JSON)
+        """
+        import time
 
-Instructions:
-- Integrate information from ALL provided documents (resume, portfolio, essay)
-- Use doc_id in evidence to specify which document the quote is from
-- Score each axis based on combined evidence from all documents
-- If information is not explicitly stated in any document, mark as "unknown"
+        total_start = time.time()
+        logger.info(f"👤 [Applicant] 다중 문서 분석 시작 | S3 Keys: {s3_keys}")
 
-Output MUST be valid JSON only. No markdown, no explanations."""
+        loader = self._get_s3_loader()
 
-            # 5. Gemini에 모든 PDF + 프롬프트 전송
-            client = genai.Client(api_key=GOOGLE_API_KEY)
+        # 0. 사전 분석: 모두 텍스트 PDF면 업로드 없이 텍스트 분석 (아니면 받은 바이트를 업로드에 재사용)
+        documents = []
+        if self.text_fast_path:
+            documents = await loader.extract_text_from_s3(s3_keys)
+            profile = await self._analyze_extracted(documents)
+            if profile is not None:
+                logger.info(f"👤 [Applicant] ✅ 분석 완료! 총 소요시간: {time.time() - total_start:.1f}초")
+                return profile
 
-            # contents 배열 구성: [파일1 Part, 파일2 Part, ..., 프롬프트]
-            # URI 문자열이 아닌 types.Part.from_uri()로 변환해야 Gemini가 PDF를 인식함
-            contents = [
-                types.Part.from_uri(file_uri=uploaded_file.uri, mime_type="application/pdf")
-                for uploaded_file in self._uploaded_files
-            ]
-            contents.append(prompt)
+        uploaded_files = []
+        succeeded = False
 
-            response = client.models.generate_content(
-                model=self.model_name,
-                contents=contents
-            )
+        try:
+            # 1. S3 → Gemini 동시 업로드 + 함께 ACTIVE 대기
+            step_start = time.time()
+            logger.info(f"👤 [Applicant] 1/2 PDF {len(s3_keys)}개 동시 다운로드 → Gemini 업로드 중...")
+            uploaded_files = await loader.load_many_from_s3(s3_keys, prefetched=documents or None)
+            record_multimodal_upload(time.time() - step_start, len(s3_keys))
+            logger.info(f"👤 [Applicant] 1/2 업로드 완료 ({time.time() - step_start:.1f}초)")
 
-            # 6. JSON 파싱
-            result = parse_json_response(response.text)
+            # 2. 통합 분석
+            step_start = time.time()
+            logger.info("👤 [Applicant] 2/2 Gemini LLM 통합 분석 중...")
+            result = await self._analyze_uploaded_files(loader.genai_client, uploaded_files)
+            logger.info(f"👤 [Applicant] 2/2 LLM 분석 완료 ({time.time() - step_start:.1f}초)")
+            logger.info(f"👤 [Applicant] ✅ 분석 완료! 총 소요시간: {time.time() - total_start:.1f}초")
 
+            succeeded = True
             return result
 
         finally:
-            # 7. 정리: Gemini에서 모든 파일 삭제
-            if self._uploaded_files:
-                loader.delete_files(self._uploaded_files)
-                self._uploaded_files = []
+            # 3. 정리: 업로드 전에 실패했으면 사전 분석 바이트 예약 해제, Gemini 파일 반환
+            await loader.release_prefetched(documents)
+            if uploaded_files:
+                await asyncio.gather(*(loader.release_file(f, evict=not succeeded) for f in uploaded_files))
 
     async def run_from_local_pdfs(
         self,
@@ -402,11 +533,13 @@ Output MUST be valid JSON only. No markdown, no explanations."""
         profile["_source"] = {
             "type": "local_pdfs",
             "files": [Path(p).name for p in file_paths],
+            "analysis_path": "multimodal",
+            **profile.get("_source", {}),
         }
 
         # 3. DB 저장 (옵션)
         if self.save_to_db and self.db:
-            doc_id = self.db.save_applicant_profile(profile)
+            doc_id = await asyncio.to_thread(self.db.save_applicant_profile, profile)
             profile["_id"] = doc_id
 
         return profile
@@ -431,7 +564,7 @@ Output MUST be valid JSON only. No markdown, no explanations."""
 
         # 2. DB 저장 (옵션)
         if self.save_to_db and self.db:
-            doc_id = self.db.save_applicant_profile(profile)
+            doc_id = await asyncio.to_thread(self.db.save_applicant_profile, profile)
             profile["_id"] = doc_id
 
         return profile
@@ -458,11 +591,49 @@ Output MUST be valid JSON only. No markdown, no explanations."""
         profile["_source"] = {
             "type": "s3_pdf",
             "s3_key": s3_key,
+            "analysis_path": "multimodal",
+            **profile.get("_source", {}),
+        }
+
+        # 3. DB 저장 (옵션)
+        if self.save_to_db and self.db:
+            doc_id = await asyncio.to_thread(self.db.save_applicant_profile, profile)
+            profile["_id"] = doc_id
+
+        return profile
+
+    async def run_from_s3_keys(
+        self,
+        s3_keys: list[str],
+        candidate_name: Optional[str] = None
+    ) -> dict[str, Any]:
+        """
+        S3 PDF 기반 파이프라인 실행 (여러 문서 통합)
+
+        Args:
+            s3_keys: S3 객체 키 목록 (이력서, 포트폴리오, 자기소개서 등)
+            candidate_name: 구직자명 (옵션)
+
+        Returns:
+            최종 분석 결과
+        """
+        if len(s3_keys) == 1:
+            return await self.run_from_s3(s3_keys[0], candidate_name)
+
+        # 1. PDF 통합 분석
+        profile = await self.analyze_s3_pdfs(s3_keys)
+
+        # 2. 소스 정보 추가
+        profile["_source"] = {
+            "type": "s3_pdfs",
+            "s3_keys": list(s3_keys),
+            "analysis_path": "multimodal",
+            **profile.get("_source", {}),
         }
 
         # 3. DB 저장 (옵션)
         if self.save_to_db and self.db:
-            doc_id = self.db.save_applicant_profile(profile)
+            doc_id = await asyncio.to_thread(self.db.save_applicant_profile, profile)
             profile["_id"] = doc_id
 
         return profile
@@ -8,6 +8,7 @@
 지원 회사: 현대오토에버, 업스테이지, 토스
 """
 
+import asyncio
 import logging
 import json
 import re
@@ -95,14 +96,39 @@ def parse_json_with_markdown(response) -> dict:
 
 from apiv2.langchain_pipeline.config import (
     GOOGLE_API_KEY,
-    COMPANY_KEYWORDS,
-    match_company,
-    get_company_sources,
+    COMPANY_PROFILE_CACHE_ENABLED,
+    HTTP_FETCH_ENABLED,
+    ANALYSIS_MODES,
+    COMPANY_ANALYSIS_MODE,
+    TEXT_DEDUP_ENABLED,
+    TEXT_DEDUP_SHINGLE_LINES,
+    COLLECT_MAX_PROMPT_TOKENS,
+    COLLECT_CHUNK_TOKENS,
+    COLLECT_MAP_CONCURRENCY,
+    COLLECT_SECTION_PARALLEL,
+    COLLECT_SECTION_CONCURRENCY,
 )
 from apiv2.langchain_pipeline.scrapers.browser_scraper import BrowserScraper
-from apiv2.langchain_pipeline.utils.schema_loader import get_schema_for_prompt
+from apiv2.langchain_pipeline.scrapers.browser_pool import get_browser_pool
+from apiv2.langchain_pipeline.scrapers.tiered_scraper import TieredScraper
+from apiv2.langchain_pipeline.scrapers.scrape_cache import CachedScraper, get_scrape_cache
+from apiv2.langchain_pipeline.utils.schema_loader import (
+    get_schema_for_prompt,
+    get_section_schema_for_prompt,
+    load_schema,
+    select_paths,
+)
 from apiv2.langchain_pipeline.utils.db_handler import DatabaseHandler
-from apiv2.langchain_pipeline.prompts import company_data_collect, company_culture_analyze
+from apiv2.langchain_pipeline.utils.company_registry import get_company_registry
+from apiv2.langchain_pipeline.utils.profile_cache import CompanyProfileCache, hash_sources
+from apiv2.langchain_pipeline.utils.text_dedup import dedupe_pages
+from apiv2.langchain_pipeline.utils.token_counter import estimate_tokens
+from apiv2.langchain_pipeline.utils.map_reduce import chunk_content, merge_partials
+from apiv2.langchain_pipeline.prompts import (
+    company_data_collect,
+    company_culture_analyze,
+    company_fused_analyze,
+)
 
 
 class UnsupportedCompanyError(Exception):
@@ -113,32 +139,53 @@ class UnsupportedCompanyError(Exception):
 class CompanyAnalysisChain:
     """회사 컬쳐핏 분석 체인"""
 
-    SUPPORTED_COMPANIES = list(COMPANY_KEYWORDS.keys())
-
     def __init__(
         self,
         model_name: str = "gemini-2.5-flash",
         temperature: float = 0.0,
-        save_to_db: bool = True
+        save_to_db: bool = True,
+        analysis_mode: Optional[str] = None
     ):
         """
         Args:
             model_name: Gemini 모델명
             temperature: 생성 온도
             save_to_db: DB 저장 여부
+            analysis_mode: "two_stage" | "fused" (None이면 회사별 레지스트리 설정 → 기본값)
         """
+        if analysis_mode is not None and analysis_mode not in ANALYSIS_MODES:
+            raise ValueError(f"지원하지 않는 분석 모드: {analysis_mode} (가능: {', '.join(ANALYSIS_MODES)})")
         logger.info(f"Initializing CompanyAnalysisChain with model='{model_name}', temperature={temperature}, save_to_db={save_to_db}")
         self.llm = ChatGoogleGenerativeAI(
             model=model_name,
             google_api_key=GOOGLE_API_KEY,
             temperature=temperature,
         )
-        self.scraper = BrowserScraper(headless=True)
+        # 앱 lifespan에서 브라우저 풀이 떠 있으면 공유 (없으면 job마다 브라우저 실행)
+        browser_scraper = BrowserScraper(headless=True, pool=get_browser_pool())
+        # 서버 렌더링 페이지는 HTTP로 먼저 시도하고 필요할 때만 브라우저 사용
+        self.scraper = TieredScraper(browser_scraper) if HTTP_FETCH_ENABLED else browser_scraper
+        # 회사 소개/문화 페이지는 캐시 경유 (채용공고는 항상 새로 스크래핑)
+        self.source_scraper = CachedScraper(self.scraper, cache=get_scrape_cache())
         self.save_to_db = save_to_db
         self.db = DatabaseHandler() if save_to_db else None
+        self.profile_cache = (
+            CompanyProfileCache(self.db) if self.db and COMPANY_PROFILE_CACHE_ENABLED else None
+        )
+        self.analysis_mode = analysis_mode
+        # LLM 호출 누적 사용량 (모드 비교용)
+        self.usage = {"calls": 0, "input_tokens": 0, "output_tokens": 0}
 
         # 프롬프트 템플릿 설정
         self._setup_prompts()
+        # 프롬프트 중 스크래핑 텍스트를 제외한 고정 부분 (토큰 예산 계산용)
+        schema_tokens = estimate_tokens(get_schema_for_prompt("company_schema", escape_braces=False))
+        self._collect_overhead_tokens = schema_tokens + estimate_tokens(
+            company_data_collect.SYSTEM_MESSAGE + company_data_collect.HUMAN_MESSAGE_TEMPLATE
+        )
+        self._fused_overhead_tokens = schema_tokens + estimate_tokens(
+            company_fused_analyze.SYSTEM_MESSAGE + company_fused_analyze.HUMAN_MESSAGE_TEMPLATE
+        )
         logger.info("CompanyAnalysisChain initialized successfully.")
 
     def _setup_prompts(self):
@@ -155,9 +202,30 @@ class CompanyAnalysisChain:
             ("human", company_culture_analyze.HUMAN_MESSAGE_TEMPLATE),
         ])
 
+        # 섹션 병렬 추출 프롬프트 (스키마 섹션 그룹별)
+        self.section_prompt = ChatPromptTemplate.from_messages([
+            ("system", company_data_collect.SYSTEM_MESSAGE),
+            ("human", company_data_collect.SECTION_HUMAN_MESSAGE_TEMPLATE),
+        ])
+
+        # 단일 호출 프롬프트 (collect + analyze 통합)
+        self.fused_prompt = ChatPromptTemplate.from_messages([
+            ("system", company_fused_analyze.SYSTEM_MESSAGE),
+            ("human", company_fused_analyze.HUMAN_MESSAGE_TEMPLATE),
+        ])
+
         # JSON 파서
         self.json_parser = JsonOutputParser()
 
+    async def _invoke(self, prompt: ChatPromptTemplate, inputs: dict[str, Any]) -> dict[str, Any]:
+        """LLM 호출 + 토큰 사용량 누적 + JSON 파싱"""
+        response = await (prompt | self.llm).ainvoke(inputs)
+        usage = getattr(response, "usage_metadata", None) or {}
+        self.usage["calls"] += 1
+        self.usage["input_tokens"] += usage.get("input_tokens", 0)
+        self.usage["output_tokens"] += usage.get("output_tokens", 0)
+        return parse_json_with_markdown(response)
+
     async def scrape_urls(self, urls: list[str]) -> str:
         """
         URL들에서 텍스트 추출
@@ -183,6 +251,10 @@ class CompanyAnalysisChain:
         """
         스크래핑 결과에서 회사 데이터 수집
 
+        추정 프롬프트 토큰이 COLLECT_MAX_PROMPT_TOKENS를 넘으면
+        섹션 단위 청크로 나눠 동시에 추출한 뒤 병합한다.
+        COLLECT_SECTION_PARALLEL이면 스키마 섹션 그룹별로 동시에 추출한다.
+
         Args:
             scraped_content: 스크래핑된 텍스트
 
@@ -191,14 +263,105 @@ class CompanyAnalysisChain:
         """
         schema = get_schema_for_prompt("company_schema")
 
-        chain = self.collect_prompt | self.llm
+        prompt_tokens = self._collect_overhead_tokens + estimate_tokens(scraped_content)
+        if prompt_tokens > COLLECT_MAX_PROMPT_TOKENS:
+            return await self._collect_map_reduce(scraped_content, schema, prompt_tokens)
+
+        if COLLECT_SECTION_PARALLEL:
+            return await self._collect_by_sections(scraped_content)
 
-        response = await chain.ainvoke({
+        return await self._invoke(self.collect_prompt, {
             "scraped_content": scraped_content,
             "output_schema": schema,
         })
 
-        return parse_json_with_markdown(response)
+    async def _collect_map_reduce(
+        self,
+        scraped_content: str,
+        schema: str,
+        prompt_tokens: int,
+    ) -> dict[str, Any]:
+        """
+        토큰 예산 초과 시 청크별 동시 추출 후 규칙 기반 병합
+
+        Args:
+            scraped_content: 스크래핑된 텍스트
+            schema: 프롬프트용 스키마 문자열
+            prompt_tokens: 단일 호출 시 추정 프롬프트 토큰 수
+
+        Returns:
+            병합된 회사 데이터
+        """
+        chunk_budget = max(1000, min(COLLECT_CHUNK_TOKENS, COLLECT_MAX_PROMPT_TOKENS - self._collect_overhead_tokens))
+        chunks = chunk_content(scraped_content, chunk_budget)
+        logger.info(
+            f"🏢 [Company]    토큰 예산 초과 (약 {prompt_tokens:,} > {COLLECT_MAX_PROMPT_TOKENS:,}) "
+            f"→ {len(chunks)}개 청크 map-reduce (동시 {COLLECT_MAP_CONCURRENCY}개)"
+        )
+
+        semaphore = asyncio.Semaphore(COLLECT_MAP_CONCURRENCY)
+
+        async def extract(index: int, chunk: str) -> Optional[dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return await self._invoke(self.collect_prompt, {
+                        "scraped_content": chunk,
+                        "output_schema": schema,
+                    })
+                except Exception as e:
+                    logger.warning(f"🏢 [Company]    청크 {index + 1}/{len(chunks)} 추출 실패: {e}")
+                    return None
+
+        partials = await asyncio.gather(*(extract(i, chunk) for i, chunk in enumerate(chunks)))
+        succeeded = [p for p in partials if p is not None]
+        if not succeeded:
+            raise Exception(f"회사 데이터 수집 실패: 모든 청크({len(chunks)}개) 추출 실패")
+
+        logger.info(f"🏢 [Company]    청크 추출 {len(succeeded)}/{len(chunks)} 성공 → 병합")
+        return merge_partials(succeeded)
+
+    async def _collect_by_sections(self, scraped_content: str) -> dict[str, Any]:
+        """
+        스키마 섹션 그룹별 동시 추출 후 같은 문서 구조로 병합
+
+        그룹마다 원문 전체를 보내므로 입력 토큰은 그룹 수만큼 늘지만,
+        출력이 작은 호출 여러 개를 동시에 실행해서 꼬리 지연 시간을 줄인다.
+
+        Args:
+            scraped_content: 스크래핑된 텍스트
+
+        Returns:
+            company_schema 구조의 회사 데이터
+        """
+        groups = company_data_collect.SECTION_GROUPS
+        semaphore = asyncio.Semaphore(COLLECT_SECTION_CONCURRENCY)
+        logger.info(f"🏢 [Company]    섹션 병렬 추출: {len(groups)}개 그룹 (동시 {COLLECT_SECTION_CONCURRENCY}개)")
+
+        async def extract(index: int, paths: list[str]) -> Optional[dict[str, Any]]:
+            async with semaphore:
+                try:
+                    partial = await self._invoke(self.section_prompt, {
+                        "scraped_content": scraped_content,
+                        "output_schema": get_section_schema_for_prompt("company_schema", paths),
+                        "section_names": ", ".join(path.split(".")[-1] for path in paths),
+                    })
+                    # 다른 그룹 섹션을 함께 출력한 경우 무시
+                    return select_paths(partial, paths)
+                except Exception as e:
+                    logger.warning(f"🏢 [Company]    섹션 그룹 {index + 1}/{len(groups)} 추출 실패: {e}")
+                    return None
+
+        partials = await asyncio.gather(*(extract(i, paths) for i, paths in enumerate(groups)))
+        succeeded = [p for p in partials if p is not None]
+        if not succeeded:
+            raise Exception(f"회사 데이터 수집 실패: 모든 섹션 그룹({len(groups)}개) 추출 실패")
+
+        merged = merge_partials(succeeded)
+        # 단일 호출 결과와 같은 키 순서/구조로 정리 (scoring_axes는 collect 단계에서 비워둠)
+        schema = load_schema("company_schema")
+        merged["schema_version"] = schema.get("schema_version")
+        merged["scoring_axes"] = {}
+        return {key: merged[key] for key in schema if key in merged}
 
     async def analyze_culture(self, company_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -212,24 +375,109 @@ class CompanyAnalysisChain:
         """
         schema = get_schema_for_prompt("company_schema")
 
-        chain = self.analyze_prompt | self.llm
-
-        response = await chain.ainvoke({
+        return await self._invoke(self.analyze_prompt, {
             "company_data": json.dumps(company_data, ensure_ascii=False, indent=2),
             "output_schema": schema,
         })
 
-        return parse_json_with_markdown(response)
+    async def analyze_fused(self, scraped_content: str) -> dict[str, Any]:
+        """
+        스크래핑 원문에서 바로 컬쳐핏 분석 (collect + analyze 단일 호출)
+
+        Args:
+            scraped_content: 스크래핑된 텍스트
+
+        Returns:
+            컬쳐핏 분석 결과 (analyze_culture와 같은 형식)
+        """
+        schema = get_schema_for_prompt("company_schema")
+
+        return await self._invoke(self.fused_prompt, {
+            "scraped_content": scraped_content,
+            "output_schema": schema,
+        })
+
+    def resolve_mode(self, company_name: Optional[str]) -> str:
+        """분석 모드 결정 (생성자 인자 → 회사별 레지스트리 설정 → 기본값)"""
+        if self.analysis_mode:
+            return self.analysis_mode
+        if company_name:
+            mode = get_company_registry().get_analysis_mode(company_name)
+            if mode:
+                return mode
+        return COMPANY_ANALYSIS_MODE
+
+    def effective_mode(self, scraped_content: str, mode: str) -> str:
+        """fused 모드라도 토큰 예산을 넘으면 map-reduce가 가능한 two_stage 사용"""
+        if mode != "fused":
+            return "two_stage"
+        prompt_tokens = self._fused_overhead_tokens + estimate_tokens(scraped_content)
+        if prompt_tokens > COLLECT_MAX_PROMPT_TOKENS:
+            logger.info(f"🏢 [Company]    토큰 예산 초과 (약 {prompt_tokens:,}) → fused 대신 two_stage 사용")
+            return "two_stage"
+        return "fused"
+
+    async def analyze_content(self, scraped_content: str, mode: str) -> tuple[dict[str, Any], str]:
+        """
+        스크래핑 텍스트 → 컬쳐핏 분석 (모드별 LLM 단계 실행)
+
+        fused 모드라도 토큰 예산을 넘으면 two_stage로 실행한다 (effective_mode 참고).
+
+        Args:
+            scraped_content: 스크래핑된 텍스트
+            mode: "two_stage" | "fused"
+
+        Returns:
+            (컬쳐핏 분석 결과, 실제 사용한 모드)
+        """
+        import time
+
+        if self.effective_mode(scraped_content, mode) == "fused":
+            step_start = time.time()
+            logger.info("🏢 [Company] 3/3 단일 호출 컬쳐핏 분석 중 (LLM 호출)...")
+            result = await self.analyze_fused(scraped_content)
+            logger.info(f"🏢 [Company] 3/3 단일 호출 분석 완료 ({time.time() - step_start:.1f}초)")
+            return result, "fused"
+
+        # 회사 데이터 수집
+        step_start = time.time()
+        logger.info("🏢 [Company] 3/4 회사 데이터 수집 중 (LLM 호출)...")
+        company_data = await self.collect_company_data(scraped_content)
+        logger.info(f"🏢 [Company] 3/4 데이터 수집 완료 ({time.time() - step_start:.1f}초)")
+
+        # 컬쳐핏 분석
+        step_start = time.time()
+        logger.info("🏢 [Company] 4/4 컬쳐핏 분석 중 (LLM 호출)...")
+        culture_analysis = await self.analyze_culture(company_data)
+        logger.info(f"🏢 [Company] 4/4 컬쳐핏 분석 완료 ({time.time() - step_start:.1f}초)")
+        return culture_analysis, "two_stage"
+
+    async def _abort_prefetch(
+        self,
+        sources_task: Optional[asyncio.Task],
+        candidates_task: Optional[asyncio.Task],
+    ):
+        """공고 스크래핑 실패 시 미리 시작한 작업 정리 (브라우저 컨텍스트 반환)"""
+        for task in (sources_task, candidates_task):
+            if task is not None and not task.done():
+                task.cancel()
+        await asyncio.gather(
+            *(t for t in (sources_task, candidates_task) if t is not None),
+            return_exceptions=True,
+        )
+        await self.source_scraper.close()
 
     async def run(
         self,
         job_posting_url: str,
+        force_refresh: bool = False,
     ) -> dict[str, Any]:
         """
         전체 파이프라인 실행
 
         Args:
             job_posting_url: 채용공고 URL
+            force_refresh: True면 프로필 캐시를 무시하고 LLM 분석을 다시 수행
 
         Returns:
             최종 분석 결과
@@ -241,61 +489,110 @@ class CompanyAnalysisChain:
         total_start = time.time()
         logger.info(f"🏢 [Company] 분석 시작 | URL: {job_posting_url}")
 
+        # 회사 목록은 핫 리로드되므로 실행 단위로 스냅샷 사용
+        registry = get_company_registry()
+
+        # 0. URL 도메인으로 회사 선확정 (성공 시 추가 소스 스크래핑/프로필 후보 조회를 공고 스크래핑과 동시에 시작)
+        early_company = registry.match_url(job_posting_url)
+        sources_task: Optional[asyncio.Task] = None
+        candidates_task: Optional[asyncio.Task] = None
+        if early_company:
+            logger.info(f"🏢 [Company] URL로 회사 선확정: {early_company} - 추가 소스 스크래핑 동시 시작")
+            sources_task = asyncio.create_task(
+                self.source_scraper.scrape_multiple(registry.get_sources(early_company))
+            )
+            if self.profile_cache and not force_refresh:
+                candidates_task = asyncio.create_task(asyncio.to_thread(
+                    self.profile_cache.prefetch, early_company, mode=self.resolve_mode(early_company)
+                ))
+
         # 1. 채용공고 스크래핑
         step_start = time.time()
         logger.info("🏢 [Company] 1/4 채용공고 스크래핑 중...")
         job_result = await self.scraper.scrape(job_posting_url)
 
         if not job_result.success:
+            await self._abort_prefetch(sources_task, candidates_task)
             raise Exception(f"채용공고 스크래핑 실패: {job_result.error_message}")
 
         job_content = job_result.content
         logger.info(f"🏢 [Company] 1/4 스크래핑 완료 ({time.time() - step_start:.1f}초)")
 
-        # 2. 회사 매칭
-        company_name = match_company(job_content)
+        # 2. 회사 매칭 (URL로 못 찾은 경우 본문 키워드로 폴백)
+        company_name = early_company or registry.match_text(job_content)
 
         if company_name is None:
-            await self.scraper.close()
-            raise UnsupportedCompanyError(
-                f"지원하지 않는 회사입니다. 지원 회사: {', '.join(self.SUPPORTED_COMPANIES)}"
-            )
+            await self._abort_prefetch(sources_task, candidates_task)
+            supported = registry.names
+            listed = ", ".join(supported[:10]) + (f" 외 {len(supported) - 10}개" if len(supported) > 10 else "")
+            raise UnsupportedCompanyError(f"지원하지 않는 회사입니다. 지원 회사: {listed}")
 
         logger.info(f"🏢 [Company] 회사 매칭 완료: {company_name}")
 
         # 3. 추가 URL 스크래핑
-        additional_urls = get_company_sources(company_name)
+        additional_urls = registry.get_sources(company_name)
         step_start = time.time()
         logger.info(f"🏢 [Company] 2/4 추가 소스 {len(additional_urls)}개 스크래핑 중...")
 
-        all_contents = [f"=== 채용공고: {job_posting_url} ===\n{job_content}"]
+        # (페이지 헤더, 본문) - 채용공고를 맨 앞에 둬서 중복 제거 시 공고 본문 우선
+        pages = [(f"=== 채용공고: {job_posting_url} ===", job_content)]
 
-        for url in additional_urls:
-            logger.debug(f"🏢 [Company]    스크래핑: {url}")
-            result = await self.scraper.scrape(url)
+        # 동시 스크래핑 (입력 순서 유지, 제한 시간 초과 페이지는 제외하고 부분 결과 사용)
+        if sources_task is None:
+            sources_task = asyncio.create_task(self.source_scraper.scrape_multiple(additional_urls))
+        results = await sources_task
+        for result in results:
             if result.success:
-                all_contents.append(f"=== {url} ===\n{result.content}")
+                pages.append((f"=== {result.url} ===", result.content))
             else:
-                logger.warning(f"🏢 [Company]    스크래핑 실패: {url} - {result.error_message}")
+                logger.warning(f"🏢 [Company]    스크래핑 실패: {result.url} - {result.error_message}")
 
-        await self.scraper.close()
+        cache_states = [(r.metadata or {}).get("cache", "miss") for r in results if r.success]
+        logger.info(f"🏢 [Company]    캐시: {cache_states.count('fresh')} hit / {cache_states.count('stale')} stale / {cache_states.count('miss')} miss")
+
+        await self.source_scraper.close()
         logger.info(f"🏢 [Company] 2/4 추가 스크래핑 완료 ({time.time() - step_start:.1f}초)")
 
-        # 4. 전체 텍스트 결합
-        scraped_content = "\n\n".join(all_contents)
+        # 프로필 캐시 키: 채용공고를 뺀 회사 소스 원문 (공고마다 미스가 나지 않도록 중복 제거 전 기준)
+        source_hash = hash_sources(pages)
+
+        # 4. 페이지 간 반복 블록(메뉴/푸터/공고 목록 등) 제거 후 전체 텍스트 결합
+        if TEXT_DEDUP_ENABLED:
+            contents, dedup_stats = dedupe_pages([content for _, content in pages], TEXT_DEDUP_SHINGLE_LINES)
+            pages = [(header, content) for (header, _), content in zip(pages, contents)]
+            logger.info(
+                f"🏢 [Company] 중복 블록 제거: {dedup_stats.lines_removed:,}줄, "
+                f"{dedup_stats.chars_removed:,} chars / 약 {dedup_stats.tokens_removed:,} tokens 감소 "
+                f"({dedup_stats.chars_before:,} → {dedup_stats.chars_after:,} chars)"
+            )
+        scraped_content = "\n\n".join(f"{header}\n{content}" for header, content in pages)
         logger.info(f"🏢 [Company] 총 텍스트 길이: {len(scraped_content):,} chars")
 
-        # 5. 회사 데이터 수집
-        step_start = time.time()
-        logger.info("🏢 [Company] 3/4 회사 데이터 수집 중 (LLM 호출)...")
-        company_data = await self.collect_company_data(scraped_content)
-        logger.info(f"🏢 [Company] 3/4 데이터 수집 완료 ({time.time() - step_start:.1f}초)")
+        # 분석 모드 결정 (fused라도 토큰 예산 초과 시 two_stage)
+        requested_mode = self.resolve_mode(company_name)
+        mode = self.effective_mode(scraped_content, requested_mode)
+
+        # 프로필 캐시 조회 (회사 소스 원문/프롬프트 버전이 같으면 LLM 분석 생략)
+        if self.profile_cache:
+            candidates = await candidates_task if candidates_task else None
+            if mode != requested_mode:
+                # 선조회 후보는 요청 모드 버전 기준이므로 DB에서 다시 조회
+                candidates = None
+            # pymongo는 동기 → 스레드에서 조회 (선조회 후보에 없으면 DB 왕복)
+            cached = await asyncio.to_thread(
+                self.profile_cache.lookup,
+                company_name, source_hash, force_refresh=force_refresh, candidates=candidates, mode=mode
+            )
+            if cached is not None:
+                cached.setdefault("_meta", {})["profile_cache"] = "hit"
+                # 같은 회사 소스로 다른 공고에서 만든 프로필일 수 있으므로 이번 요청 공고를 따로 표시
+                cached["_meta"]["requested_job_posting_url"] = job_posting_url
+                logger.info(f"🏢 [Company] ✅ 프로필 캐시 히트 ({cached['_id']}) - LLM 분석 생략, 총 소요시간: {time.time() - total_start:.1f}초")
+                return cached
 
-        # 6. 컬쳐핏 분석
-        step_start = time.time()
-        logger.info("🏢 [Company] 4/4 컬쳐핏 분석 중 (LLM 호출)...")
-        culture_analysis = await self.analyze_culture(company_data)
-        logger.info(f"🏢 [Company] 4/4 컬쳐핏 분석 완료 ({time.time() - step_start:.1f}초)")
+        # 5. LLM 분석 (two_stage: 데이터 수집 → 컬쳐핏 분석 / fused: 단일 호출)
+        logger.info(f"🏢 [Company] 분석 모드: {mode}")
+        culture_analysis, used_mode = await self.analyze_content(scraped_content, mode)
 
         # 결과: 컬쳐핏 분석 결과만 반환 (중복 제거)
         # culture_analysis에 메타 정보 추가
@@ -304,7 +601,11 @@ class CompanyAnalysisChain:
             "company_name": company_name,
             "job_posting_url": job_posting_url,
             "source_urls": [job_posting_url] + additional_urls,
+            "analysis_mode": used_mode,
+            "llm_usage": dict(self.usage),
         }
+        if self.profile_cache:
+            result["_meta"].update(self.profile_cache.cache_fields(source_hash, mode=used_mode))
 
         # 7. DB 저장 (옵션)
         if self.save_to_db and self.db:
@@ -4,22 +4,59 @@
 파이프라인 흐름:
 회사 컬쳐핏 JSON + 구직자 컬쳐핏 JSON → 비교 분석 → 매칭 점수 출력
 
+축별 병렬 모드(COMPARE_AXIS_FANOUT):
+축마다 관련 프로필 일부만 넣어 동시에 비교하고 overall은 가중치로 로컬 계산
+
+overall 로컬 계산(COMPARE_LOCAL_OVERALL):
+단일 호출 모드에서도 LLM은 axis_alignments까지만 출력하고 overall은 match_scoring으로 계산
+
+컨텍스트 캐시(COMPARE_CONTEXT_CACHE):
+시스템 프롬프트 + 스키마 + 회사 프로필을 Gemini cached content로 재사용하고
+매 호출에는 지원자 프로필만 전송 (캐시 불가 시 전체 프롬프트로 폴백)
+
+프로필 축약(COMPARE_COMPACT_PROFILES):
+프롬프트가 쓰는 필드만 남기고 공백 없는 JSON으로 직렬화, evidence quote 길이 제한
+
 AI팀 프롬프트 적용 (matching_prompt_gemini01.txt)
 """
 
+import asyncio
 import logging
 import json
 import re
+from datetime import datetime
 from typing import Any, Optional
 
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 
-from apiv2.langchain_pipeline.config import GOOGLE_API_KEY
+from apiv2.langchain_pipeline.config import (
+    GOOGLE_API_KEY,
+    COMPARE_AXIS_FANOUT,
+    COMPARE_AXIS_CONCURRENCY,
+    COMPARE_LOCAL_OVERALL,
+    COMPARE_COMPACT_PROFILES,
+)
+from apiv2.langchain_pipeline.utils.context_cache import ContextCache, get_context_cache, is_missing_cache_error
 from apiv2.langchain_pipeline.utils.db_handler import DatabaseHandler
-from apiv2.langchain_pipeline.utils.schema_loader import get_schema_for_prompt
-from apiv2.langchain_pipeline.prompts import culture_compare
+from apiv2.langchain_pipeline.utils.schema_loader import (
+    get_schema_for_prompt,
+    get_section_schema_for_prompt,
+    select_paths,
+)
+from apiv2.langchain_pipeline.utils.profile_projection import (
+    COMPANY_PROMPT_KEYS,
+    DEVELOPER_PROMPT_KEYS,
+    serialize_for_prompt,
+)
+from apiv2.langchain_pipeline.utils.match_scoring import (
+    AXES,
+    SCORING_VERSION,
+    compute_overall,
+    normalize_weights,
+)
+from apiv2.langchain_pipeline.prompts import culture_compare, culture_compare_axis
 
 logger = logging.getLogger(__name__)
 
@@ -105,14 +142,30 @@ class CultureCompareChain:
         self,
         model_name: str = "gemini-2.5-flash",
         temperature: float = 0.0,
-        save_to_db: bool = True
+        save_to_db: bool = True,
+        axis_fanout: bool = COMPARE_AXIS_FANOUT,
+        weights: Optional[Any] = None,
+        local_overall: bool = COMPARE_LOCAL_OVERALL,
+        context_cache: Optional[ContextCache] = None,
+        compact_profiles: bool = COMPARE_COMPACT_PROFILES
     ):
         """
         Args:
             model_name: Gemini 모델명
             temperature: 생성 온도
             save_to_db: DB 저장 여부
+            axis_fanout: 축별 병렬 비교 여부 (overall 로컬 계산)
+            weights: 축별 가중치 (ScoringWeights 또는 dict, 기본 동일 가중치)
+            local_overall: 단일 호출 모드에서 overall을 로컬 계산할지 여부
+            context_cache: 컨텍스트 캐시 (기본: COMPARE_CONTEXT_CACHE 설정에 따름)
+            compact_profiles: 프롬프트용 프로필 축약 여부
         """
+        self.compact_profiles = compact_profiles
+        self.axis_fanout = axis_fanout
+        self.local_overall = local_overall
+        self.model_name = model_name
+        self.context_cache = context_cache or get_context_cache()
+        self.weights = normalize_weights(weights)
         logger.info(f"Initializing CultureCompareChain with model='{model_name}', temperature={temperature}, save_to_db={save_to_db}")
         self.llm = ChatGoogleGenerativeAI(
             model=model_name,
@@ -133,6 +186,26 @@ class CultureCompareChain:
             ("human", culture_compare.HUMAN_MESSAGE_TEMPLATE),
         ])
 
+        self.local_overall_prompt = ChatPromptTemplate.from_messages([
+            ("system", culture_compare.SYSTEM_MESSAGE),
+            ("human", culture_compare.LOCAL_OVERALL_HUMAN_MESSAGE_TEMPLATE),
+        ])
+
+        self.cached_context_prompt = ChatPromptTemplate.from_messages([
+            ("human", culture_compare.CACHED_CONTEXT_TEMPLATE),
+        ])
+        self.cached_prompt = ChatPromptTemplate.from_messages([
+            ("human", culture_compare.CACHED_HUMAN_MESSAGE_TEMPLATE),
+        ])
+        self.local_overall_cached_prompt = ChatPromptTemplate.from_messages([
+            ("human", culture_compare.LOCAL_OVERALL_CACHED_HUMAN_MESSAGE_TEMPLATE),
+        ])
+
+        self.axis_prompt = ChatPromptTemplate.from_messages([
+            ("system", culture_compare_axis.SYSTEM_MESSAGE),
+            ("human", culture_compare_axis.HUMAN_MESSAGE_TEMPLATE),
+        ])
+
         self.json_parser = JsonOutputParser()
 
     async def compare(
@@ -150,18 +223,182 @@ class CultureCompareChain:
         Returns:
             비교 분석 결과 (6축 매칭 점수, overall score 등)
         """
-        # 스키마 로드
-        schema = get_schema_for_prompt("matching_schema")
+        if self.axis_fanout:
+            return await self.compare_by_axis(company_profile, developer_profile)
+
+        if self.local_overall:
+            # overall 제외 스키마 → LLM은 축별 결과만 출력
+            schema = get_section_schema_for_prompt("matching_schema", culture_compare.LOCAL_OVERALL_SCHEMA_PATHS)
+            chain = self.local_overall_prompt | self.llm
+        else:
+            # 스키마 로드
+            schema = get_schema_for_prompt("matching_schema")
+            chain = self.compare_prompt | self.llm
+
+        if self.compact_profiles:
+            company_json = serialize_for_prompt(company_profile, COMPANY_PROMPT_KEYS, "회사")
+            developer_json = serialize_for_prompt(developer_profile, DEVELOPER_PROMPT_KEYS, "지원자")
+        else:
+            company_json = json.dumps(company_profile, ensure_ascii=False, indent=2)
+            developer_json = json.dumps(developer_profile, ensure_ascii=False, indent=2)
+
+        response = None
+        if self.context_cache is not None:
+            response = await self._compare_with_context_cache(company_json, developer_json, schema)
+        if response is None:
+            response = await chain.ainvoke({
+                "company_profile": company_json,
+                "developer_profile": developer_json,
+                "output_schema": schema,
+            })
+        result = parse_json_with_markdown(response)
+
+        if self.local_overall:
+            result["overall"] = compute_overall(result.get("axis_alignments") or {}, self.weights)
+            meta = result.setdefault("meta", {})
+            if isinstance(meta, dict):
+                meta["scoring_version"] = SCORING_VERSION
+        return result
+
+    async def _compare_with_context_cache(
+        self,
+        company_json: str,
+        developer_json: str,
+        schema: str,
+    ) -> Optional[Any]:
+        """
+        회사 컨텍스트를 cached content로 재사용해 비교
 
-        chain = self.compare_prompt | self.llm
+        Returns:
+            LLM 응답, 캐시를 쓸 수 없거나 서버에서 캐시가 만료/삭제됐으면 None (전체 프롬프트로 폴백)
 
+        Raises:
+            Exception: 그 외 캐시 호출 오류 (429/타임아웃 등, 핸들은 다른 동시 호출이 계속 사용)
+        """
+        context = self.cached_context_prompt.format_messages(
+            company_profile=company_json,
+            output_schema=schema,
+        )[0].content
+        prompt_version = culture_compare.PROMPT_METADATA["version"] + ("-local" if self.local_overall else "")
+
+        name = await self.context_cache.get_or_create(
+            model=self.model_name,
+            prompt_version=prompt_version,
+            system_instruction=culture_compare.SYSTEM_MESSAGE,
+            context=context,
+        )
+        if name is None:
+            return None
+
+        prompt = self.local_overall_cached_prompt if self.local_overall else self.cached_prompt
+        try:
+            return await (prompt | self.llm.bind(cached_content=name)).ainvoke({
+                "developer_profile": developer_json,
+            })
+        except Exception as e:
+            if not is_missing_cache_error(e):
+                # 한도 초과/타임아웃 등: 핸들을 지우면 같은 핸들을 쓰는 동시 호출까지 실패하고
+                # 전체 프롬프트 재시도로 부하만 늘어나므로 그대로 전파
+                raise
+            # 서버 측 만료/삭제 → 핸들 폐기 후 전체 프롬프트로 재시도
+            logger.warning(f"🔄 [Match] 컨텍스트 캐시가 서버에서 만료/삭제됨, 전체 프롬프트로 폴백: {e}")
+            await self.context_cache.invalidate(name)
+            return None
+
+    async def _compare_axis(
+        self,
+        axis: str,
+        company_profile: dict[str, Any],
+        developer_profile: dict[str, Any],
+    ) -> dict[str, Any]:
+        """한 축 비교 (관련 프로필 일부만 전달)"""
+        paths = culture_compare_axis.AXIS_PROFILE_PATHS[axis]
+        company_slice = select_paths(company_profile, culture_compare_axis.COMMON_PROFILE_PATHS + paths["company"])
+        developer_slice = select_paths(developer_profile, culture_compare_axis.COMMON_PROFILE_PATHS + paths["developer"])
+
+        if self.compact_profiles:
+            company_json = serialize_for_prompt(company_slice, keys=None, label=f"{axis} 회사")
+            developer_json = serialize_for_prompt(developer_slice, keys=None, label=f"{axis} 지원자")
+        else:
+            company_json = json.dumps(company_slice, ensure_ascii=False, indent=2)
+            developer_json = json.dumps(developer_slice, ensure_ascii=False, indent=2)
+
+        chain = self.axis_prompt | self.llm
         response = await chain.ainvoke({
-            "company_profile": json.dumps(company_profile, ensure_ascii=False, indent=2),
-            "developer_profile": json.dumps(developer_profile, ensure_ascii=False, indent=2),
-            "output_schema": schema,
+            "axis": axis,
+            "company_profile": company_json,
+            "developer_profile": developer_json,
+            "output_schema": get_section_schema_for_prompt("matching_schema", [f"axis_alignments.{axis}"]),
         })
+        result = parse_json_with_markdown(response)
+
+        # 스키마 경로째로 감싸서 응답한 경우 풀기
+        if "axis_alignments" in result:
+            result = result["axis_alignments"]
+        if axis in result and isinstance(result[axis], dict):
+            result = result[axis]
+        return result
 
-        return parse_json_with_markdown(response)
+    async def compare_by_axis(
+        self,
+        company_profile: dict[str, Any],
+        developer_profile: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        축별 병렬 비교 + overall 로컬 계산
+
+        Args:
+            company_profile: 회사 컬쳐핏 분석 결과
+            developer_profile: 구직자 프로필 분석 결과
+
+        Returns:
+            compare()와 같은 형식의 비교 결과
+        """
+        semaphore = asyncio.Semaphore(COMPARE_AXIS_CONCURRENCY)
+
+        async def run_axis(axis: str) -> dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self._compare_axis(axis, company_profile, developer_profile)
+                except Exception as e:
+                    logger.warning(f"🔄 [Match]    {axis} 축 비교 실패 → unknown 처리: {e}")
+                    return {
+                        "status": "unknown",
+                        "axis_score": "unknown",
+                        "summary": "unknown",
+                        "rationale": {"company_signals": [], "developer_signals": [], "comparison_notes": f"축 비교 실패: {e}"},
+                        "evidence_refs": {"company": [], "developer": []},
+                        "followup_questions": [],
+                    }
+
+        alignments = await asyncio.gather(*(run_axis(axis) for axis in AXES))
+        axis_alignments = dict(zip(AXES, alignments))
+
+        company_meta = company_profile.get("profile_meta", {}) or {}
+        developer_meta = developer_profile.get("profile_meta", {}) or {}
+        return {
+            "schema_version": "1.0",
+            "meta": {
+                "generated_at": datetime.utcnow().strftime("%Y-%m-%d"),
+                "scoring_version": SCORING_VERSION,
+                "axes_used": list(AXES),
+                "notes": "축별 병렬 비교, overall은 가중치로 로컬 계산",
+            },
+            "inputs": {
+                "company_profile_ref": {
+                    "profile_id": str(company_profile.get("_id") or company_meta.get("company_name") or "unknown"),
+                    "company_name": company_meta.get("company_name", "unknown"),
+                    "source_docs": company_meta.get("source_docs", []),
+                },
+                "developer_profile_ref": {
+                    "profile_id": str(developer_meta.get("profile_id") or developer_profile.get("_id") or "unknown"),
+                    "candidate_name": developer_meta.get("candidate_name", "unknown"),
+                    "source_docs": developer_meta.get("source_docs", []),
+                },
+            },
+            "axis_alignments": axis_alignments,
+            "overall": compute_overall(axis_alignments, self.weights),
+        }
 
     async def run(
         self,
@@ -194,7 +431,7 @@ class CultureCompareChain:
 
         # 1. 비교 분석
         step_start = time.time()
-        logger.info("🔄 [Match] 1/1 LLM 매칭 분석 중...")
+        logger.info(f"🔄 [Match] 1/1 LLM 매칭 분석 중{' (축별 병렬)' if self.axis_fanout else ''}...")
         comparison = await self.compare(company_profile, developer_profile)
         logger.info(f"🔄 [Match] 1/1 LLM 분석 완료 ({time.time() - step_start:.1f}초)")
 
@@ -209,7 +446,7 @@ class CultureCompareChain:
 
         # 2. DB 저장 (옵션)
         if self.save_to_db and self.db:
-            doc_id = self.db.save_comparison_result(result)
+            doc_id = await asyncio.to_thread(self.db.save_comparison_result, result)
             result["_id"] = doc_id
             logger.info(f"🔄 [Match] DB 저장 완료: {doc_id}")
 
@@ -237,11 +474,11 @@ class CultureCompareChain:
         if not self.db:
             raise ValueError("DB 핸들러가 초기화되지 않았습니다.")
 
-        company_profile = self.db.get_company_profile(company_name)
+        company_profile = await asyncio.to_thread(self.db.get_company_profile, company_name)
         if not company_profile:
             raise ValueError(f"회사 프로필을 찾을 수 없습니다: {company_name}")
 
-        developer_profile = self.db.get_applicant_profile(developer_name)
+        developer_profile = await asyncio.to_thread(self.db.get_applicant_profile, developer_name)
         if not developer_profile:
             raise ValueError(f"구직자 프로필을 찾을 수 없습니다: {developer_name}")
 
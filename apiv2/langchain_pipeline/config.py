@@ -29,6 +29,145 @@ S3_REGION = os.getenv("AWS_REGION", "ap-northeast-2")
 AWS_ACCESS_KEY_ID = os.getenv("S3_ACCESS_KEY", "")
 AWS_SECRET_ACCESS_KEY = os.getenv("S3_SECRET_ACCESS_KEY", "")
 
+# Playwright 브라우저 풀 설정
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "1"))
+BROWSER_MAX_PAGES = int(os.getenv("BROWSER_MAX_PAGES", "8"))
+BROWSER_RECYCLE_AFTER_PAGES = int(os.getenv("BROWSER_RECYCLE_AFTER_PAGES", "200"))
+
+# 동시 스크래핑 설정 (도메인별 동시 요청 수, 추가 소스 전체 제한 시간)
+SCRAPE_PER_DOMAIN_CONCURRENCY = int(os.getenv("SCRAPE_PER_DOMAIN_CONCURRENCY", "4"))
+SCRAPE_DEADLINE_SECONDS = float(os.getenv("SCRAPE_DEADLINE_SECONDS", "45"))
+
+# HTTP 우선 스크래핑 설정 (텍스트가 짧거나 SPA 껍데기면 브라우저로 전환)
+HTTP_FETCH_ENABLED = os.getenv("HTTP_FETCH_ENABLED", "true").lower() == "true"
+HTTP_FETCH_TIMEOUT_SECONDS = float(os.getenv("HTTP_FETCH_TIMEOUT_SECONDS", "10"))
+HTTP_FETCH_MIN_TEXT_LENGTH = int(os.getenv("HTTP_FETCH_MIN_TEXT_LENGTH", "300"))
+# 도메인별 브라우저 전환 비율이 높으면 HTTP 단계 생략 (N번에 한 번은 재시도)
+TIER_SKIP_MIN_SAMPLES = int(os.getenv("TIER_SKIP_MIN_SAMPLES", "3"))
+TIER_SKIP_ESCALATION_RATIO = float(os.getenv("TIER_SKIP_ESCALATION_RATIO", "0.8"))
+TIER_REPROBE_EVERY = int(os.getenv("TIER_REPROBE_EVERY", "20"))
+
+# 페이지 준비 완료 감지 설정 (고정 대기 대신 DOM 정지/텍스트 길이 안정화 감지)
+READINESS_QUIET_MS = int(os.getenv("READINESS_QUIET_MS", "500"))
+READINESS_PLATEAU_MS = int(os.getenv("READINESS_PLATEAU_MS", "800"))
+READINESS_HARD_CAP_MS = int(os.getenv("READINESS_HARD_CAP_MS", "5000"))
+READINESS_POLL_MS = int(os.getenv("READINESS_POLL_MS", "100"))
+
+# 도메인별 준비 완료 CSS 셀렉터 (설정된 도메인은 셀렉터가 나타나면 바로 추출)
+# 예: {"career.hyundai-autoever.com": "main .content"}
+READY_SELECTORS: dict[str, str] = {}
+
+# 스크래핑 요청 차단 설정 (본문 텍스트만 필요하므로 무거운 리소스/분석 스크립트 차단)
+# stylesheet는 innerText 결과(숨김 요소 노출)에 영향을 주므로 기본 차단 대상에서 제외
+BLOCKED_RESOURCE_TYPES = ["image", "media", "font"]
+BLOCKED_DOMAIN_PATTERNS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googleadservices.com",
+    "facebook.net",
+    "hotjar.com",
+    "amplitude.com",
+    "mixpanel.com",
+    "segment.io",
+    "sentry.io",
+    "clarity.ms",
+    "channel.io",
+    "braze.com",
+]
+# 도메인별 예외 (allow_resource_types / block_resource_types / allow_domains / block_domains)
+BLOCKING_OVERRIDES: dict[str, dict[str, list[str]]] = {}
+# 차단 요청 절감 바이트 추정용 리소스 타입별 평균 크기
+BLOCKED_RESOURCE_AVG_BYTES = {
+    "image": 60_000,
+    "media": 500_000,
+    "font": 40_000,
+    "stylesheet": 30_000,
+    "script": 80_000,
+    "other": 5_000,
+}
+
+# 스크래핑 캐시 설정 (backend: mongo | disk | none)
+SCRAPE_CACHE_BACKEND = os.getenv("SCRAPE_CACHE_BACKEND", "mongo").lower()
+SCRAPE_CACHE_DIR = os.getenv("SCRAPE_CACHE_DIR", str(PROJECT_ROOT / ".cache" / "scrape"))
+SCRAPE_CACHE_TTL_SECONDS = float(os.getenv("SCRAPE_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+SCRAPE_CACHE_STALE_SECONDS = float(os.getenv("SCRAPE_CACHE_STALE_SECONDS", str(30 * 24 * 3600)))
+SCRAPE_CACHE_MAX_ENTRIES = int(os.getenv("SCRAPE_CACHE_MAX_ENTRIES", "500"))
+SCRAPE_CACHE_MAX_BYTES = int(os.getenv("SCRAPE_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+# 용량 검사(저장소 전체 집계) 주기: N번 쓰기마다 또는 마지막 검사 후 interval초가 지났을 때
+SCRAPE_CACHE_EVICT_EVERY_WRITES = int(os.getenv("SCRAPE_CACHE_EVICT_EVERY_WRITES", "20"))
+SCRAPE_CACHE_EVICT_INTERVAL_SECONDS = float(os.getenv("SCRAPE_CACHE_EVICT_INTERVAL_SECONDS", "300"))
+
+# 회사 프로필 캐시 설정 (같은 원문 + 같은 프롬프트 버전이면 LLM 호출 생략)
+COMPANY_PROFILE_CACHE_ENABLED = os.getenv("COMPANY_PROFILE_CACHE_ENABLED", "true").lower() == "true"
+COMPANY_PROFILE_CACHE_MAX_AGE_SECONDS = float(
+    os.getenv("COMPANY_PROFILE_CACHE_MAX_AGE_SECONDS", str(7 * 24 * 3600))
+)
+
+# 회사 레지스트리 리로드 주기 (초, 0이면 시작 시 1회만 로드)
+COMPANY_REGISTRY_RELOAD_SECONDS = float(os.getenv("COMPANY_REGISTRY_RELOAD_SECONDS", "60"))
+
+# 페이지 간 중복 블록 제거 (연속 N줄 지문 기준, collect 프롬프트 축소용)
+TEXT_DEDUP_ENABLED = os.getenv("TEXT_DEDUP_ENABLED", "true").lower() == "true"
+TEXT_DEDUP_SHINGLE_LINES = int(os.getenv("TEXT_DEDUP_SHINGLE_LINES", "3"))
+
+# collect 단계 토큰 예산 (추정 프롬프트 토큰이 넘으면 청크 map-reduce로 전환)
+COLLECT_MAX_PROMPT_TOKENS = int(os.getenv("COLLECT_MAX_PROMPT_TOKENS", "40000"))
+COLLECT_CHUNK_TOKENS = int(os.getenv("COLLECT_CHUNK_TOKENS", "15000"))
+COLLECT_MAP_CONCURRENCY = int(os.getenv("COLLECT_MAP_CONCURRENCY", "4"))
+
+# collect 단계 섹션 병렬 추출 (스키마 섹션 그룹별로 작은 호출을 동시에 실행)
+COLLECT_SECTION_PARALLEL = os.getenv("COLLECT_SECTION_PARALLEL", "false").lower() == "true"
+COLLECT_SECTION_CONCURRENCY = int(os.getenv("COLLECT_SECTION_CONCURRENCY", "5"))
+
+# 컬쳐핏 비교 축별 병렬 모드 (축마다 1회 호출, overall은 로컬 계산)
+COMPARE_AXIS_FANOUT = os.getenv("COMPARE_AXIS_FANOUT", "false").lower() == "true"
+COMPARE_AXIS_CONCURRENCY = int(os.getenv("COMPARE_AXIS_CONCURRENCY", "6"))
+
+# 단일 호출 비교에서도 overall을 LLM 대신 로컬 가중치 계산으로 생성 (출력 토큰 절감)
+COMPARE_LOCAL_OVERALL = os.getenv("COMPARE_LOCAL_OVERALL", "true").lower() == "true"
+
+# 비교 프롬프트 컨텍스트 캐시 (시스템 프롬프트 + 스키마 + 회사 프로필을 Gemini cached content로 재사용)
+COMPARE_CONTEXT_CACHE = os.getenv("COMPARE_CONTEXT_CACHE", "false").lower() == "true"
+CONTEXT_CACHE_TTL_SECONDS = int(os.getenv("CONTEXT_CACHE_TTL_SECONDS", "900"))
+CONTEXT_CACHE_MIN_TOKENS = int(os.getenv("CONTEXT_CACHE_MIN_TOKENS", "1024"))
+
+# 비교 프롬프트에 넣는 프로필 축약 (사용 필드만 + 공백 없는 JSON + evidence 길이 제한)
+COMPARE_COMPACT_PROFILES = os.getenv("COMPARE_COMPACT_PROFILES", "true").lower() == "true"
+EVIDENCE_MAX_ITEMS = int(os.getenv("EVIDENCE_MAX_ITEMS", "3"))
+EVIDENCE_QUOTE_MAX_CHARS = int(os.getenv("EVIDENCE_QUOTE_MAX_CHARS", "160"))
+
+# 구직자 PDF 업로드 재사용 (PDF SHA-256 → Gemini 업로드 파일, Files API 보관 48시간)
+GEMINI_FILE_REUSE = os.getenv("GEMINI_FILE_REUSE", "true").lower() == "true"
+GEMINI_FILE_TTL_SECONDS = float(os.getenv("GEMINI_FILE_TTL_SECONDS", str(48 * 3600)))
+GEMINI_FILE_REUSE_MARGIN_SECONDS = float(os.getenv("GEMINI_FILE_REUSE_MARGIN_SECONDS", "3600"))
+GEMINI_FILE_IDLE_SECONDS = float(os.getenv("GEMINI_FILE_IDLE_SECONDS", str(6 * 3600)))
+GEMINI_FILE_SWEEP_SECONDS = float(os.getenv("GEMINI_FILE_SWEEP_SECONDS", "300"))
+# 추적되지 않는 cf-pdf-* 파일 삭제 (음수면 끔, 같은 API 키를 이 프로세스만 쓸 때만 켤 것)
+GEMINI_FILE_ORPHAN_GRACE_SECONDS = float(os.getenv("GEMINI_FILE_ORPHAN_GRACE_SECONDS", "-1"))
+
+# S3 → Gemini PDF 전송 (메모리 한도 + 큰 파일은 청크 스트리밍/임시 파일)
+PDF_MEMORY_BUDGET_BYTES = int(os.getenv("PDF_MEMORY_BUDGET_BYTES", str(64 * 1024 * 1024)))
+PDF_STREAM_THRESHOLD_BYTES = int(os.getenv("PDF_STREAM_THRESHOLD_BYTES", str(8 * 1024 * 1024)))
+# 재개 가능 업로드의 중간 청크는 256KiB 배수여야 함
+PDF_STREAM_CHUNK_BYTES = int(os.getenv("PDF_STREAM_CHUNK_BYTES", str(8 * 1024 * 1024)))
+PDF_SPOOL_DIR = os.getenv("PDF_SPOOL_DIR") or None
+
+# 텍스트 PDF 빠른 경로 (로컬 텍스트 추출 → 텍스트 분석, 스캔/이미지 위주 문서는 multimodal 유지)
+PDF_TEXT_FAST_PATH = os.getenv("PDF_TEXT_FAST_PATH", "true").lower() == "true"
+PDF_TEXT_MIN_CHARS_PER_PAGE = int(os.getenv("PDF_TEXT_MIN_CHARS_PER_PAGE", "100"))
+PDF_TEXT_MIN_PAGE_RATIO = float(os.getenv("PDF_TEXT_MIN_PAGE_RATIO", "0.8"))
+PDF_TEXT_MAX_GARBLED_RATIO = float(os.getenv("PDF_TEXT_MAX_GARBLED_RATIO", "0.05"))
+PDF_TEXT_MAX_PAGES = int(os.getenv("PDF_TEXT_MAX_PAGES", "30"))
+PDF_TEXT_MAX_BYTES = int(os.getenv("PDF_TEXT_MAX_BYTES", str(10 * 1024 * 1024)))
+# 절감 시간 계산용 문서당 업로드+처리 대기 시간 (초, multimodal 업로드 측정값이 생기기 전까지 사용)
+PDF_TEXT_UPLOAD_BASELINE_SECONDS = float(os.getenv("PDF_TEXT_UPLOAD_BASELINE_SECONDS", "4.0"))
+
+# 회사 분석 모드 기본값 (회사별 설정은 company_registry.analysis_mode)
+# two_stage: 데이터 수집 → 컬쳐핏 분석 2회 호출 / fused: 원문 → 컬쳐핏 분석 1회 호출
+ANALYSIS_MODES = ("two_stage", "fused")
+COMPANY_ANALYSIS_MODE = os.getenv("COMPANY_ANALYSIS_MODE", "two_stage")
+
 # 스키마 경로
 SCHEMAS_DIR = BASE_DIR / "schemas"
 
@@ -37,11 +176,14 @@ COLLECTIONS = {
     "companies": "companies",
     "applicants": "candidates",
     "comparisons": "culture_fit_results",
+    "scrape_cache": "scrape_cache",
+    "company_registry": "company_registry",
 }
 
 
 # ============================================================
-# 회사별 참고 URL (하드코딩)
+# 회사별 참고 URL (레지스트리 시드 / DB 미사용 시 기본값)
+# 운영 중 회사 목록은 company_registry 컬렉션에서 관리 (utils/company_registry.py)
 # 지원 회사: 현대오토에버, 업스테이지, 토스
 # ============================================================
 
@@ -68,19 +210,13 @@ COMPANY_SOURCES = {
 }
 
 
-def match_company(text: str) -> str | None:
-    """스크래핑된 텍스트에서 회사명 매칭"""
-    text_lower = text.lower()
-    for company, keywords in COMPANY_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                return company
-    return None
-
-
-def get_company_sources(company: str) -> list[str]:
-    """회사명으로 추가 URL 목록 반환"""
-    return COMPANY_SOURCES.get(company, [])
+# 채용공고 URL 도메인 → 회사 (서브도메인 포함 suffix 매칭)
+# 공고 본문을 받기 전에 회사를 확정해서 추가 소스 스크래핑을 미리 시작하는 데 사용
+COMPANY_DOMAINS = {
+    "현대오토에버": ["hyundai-autoever.com"],
+    "업스테이지": ["upstage.ai"],
+    "토스": ["toss.im", "tossbank.com", "tosspayments.com", "tossinsurance.com"],
+}
 
 
 def validate_config(require_s3: bool = False) -> dict:
@@ -2,6 +2,7 @@
 문서 로더 모듈
 
 - S3PDFLoader: S3에서 PDF 다운로드 → Gemini Files API 업로드
+- pdf_text_extractor: 텍스트 PDF 판별 + 로컬 텍스트 추출 (업로드 전 사전 분석)
 """
 
 from apiv2.langchain_pipeline.loaders.s3_pdf_loader import S3PDFLoader, GeminiFile
@@ -2,10 +2,14 @@
 Local PDF Loader + Gemini Files API
 
 Load local PDF files and upload them to Gemini for multimodal analysis.
+Gemini calls use the async client (client.aio) and file reads run in a thread,
+so uploads never block the event loop. load_files uploads all files concurrently.
+extract_text_from_files is the pre-analysis step: it extracts text locally so
+text-native PDFs can skip the upload (see pdf_text_extractor.py).
 
 Usage:
     loader = LocalPDFLoader(gemini_api_key="...")
-    gemini_files = loader.load_files([
+    gemini_files = await loader.load_files([
         "user_profile/profile_P1/resume.pdf",
         "user_profile/profile_P1/portfolio.pdf",
         "user_profile/profile_P1/essay.pdf"
@@ -13,8 +17,8 @@ Usage:
     # Use gemini_files in Gemini generate_content call
 """
 
+import asyncio
 import io
-import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -22,6 +26,10 @@ from typing import Optional
 from google import genai
 from google.genai import types
 
+from apiv2.langchain_pipeline.config import PDF_TEXT_MAX_BYTES
+from apiv2.langchain_pipeline.loaders.pdf_text_extractor import ExtractedPDF, extract_pdf_text
+from apiv2.langchain_pipeline.utils.file_registry import GeminiFileRegistry, content_digest
+
 
 @dataclass
 class GeminiFile:
@@ -40,28 +48,31 @@ class LocalPDFLoader:
     Reads local PDF files and uploads them to Gemini for multimodal analysis.
     """
 
-    def __init__(self, gemini_api_key: str):
+    # Gemini file processing poll interval (seconds)
+    POLL_INTERVAL_SECONDS = 2
+
+    def __init__(self, gemini_api_key: str, file_registry: Optional[GeminiFileRegistry] = None):
         """
         Args:
             gemini_api_key: Gemini API key
+            file_registry: Upload reuse registry (None uploads and deletes every time)
         """
         self.genai_client = genai.Client(api_key=gemini_api_key)
+        self.file_registry = file_registry
 
-    def _upload_to_gemini(
+    async def _upload_new(
         self,
         pdf_bytes: bytes,
         filename: str,
-        wait_for_processing: bool = True,
-        max_wait_seconds: int = 60
+        display_name: Optional[str] = None
     ) -> GeminiFile:
         """
-        Upload PDF to Gemini Files API
+        Upload PDF to Gemini Files API (without waiting for processing)
 
         Args:
             pdf_bytes: PDF file bytes
             filename: File name
-            wait_for_processing: Wait for processing to complete
-            max_wait_seconds: Maximum wait time (seconds)
+            display_name: Display name on the Gemini side (defaults to filename)
 
         Returns:
             GeminiFile: Uploaded file info
@@ -69,21 +80,14 @@ class LocalPDFLoader:
         file_obj = io.BytesIO(pdf_bytes)
         file_obj.name = filename
 
-        uploaded_file = self.genai_client.files.upload(
+        uploaded_file = await self.genai_client.aio.files.upload(
             file=file_obj,
             config=types.UploadFileConfig(
-                display_name=filename,
+                display_name=display_name or filename,
                 mime_type='application/pdf'
             )
         )
 
-        if wait_for_processing:
-            elapsed = 0
-            while uploaded_file.state == 'PROCESSING' and elapsed < max_wait_seconds:
-                time.sleep(2)
-                elapsed += 2
-                uploaded_file = self.genai_client.files.get(name=uploaded_file.name)
-
         return GeminiFile(
             name=uploaded_file.name,
             uri=uploaded_file.uri,
@@ -92,7 +96,69 @@ class LocalPDFLoader:
             size_bytes=getattr(uploaded_file, 'size_bytes', None)
         )
 
-    def load_file(
+    async def _wait_until_active(
+        self,
+        gemini_file: GeminiFile,
+        max_wait_seconds: int = 60
+    ) -> GeminiFile:
+        """
+        Poll until the file leaves PROCESSING
+
+        Args:
+            gemini_file: Uploaded file info
+            max_wait_seconds: Maximum wait time (seconds)
+
+        Returns:
+            GeminiFile: File info with the latest state
+        """
+        elapsed = 0
+        while gemini_file.state == 'PROCESSING' and elapsed < max_wait_seconds:
+            await asyncio.sleep(self.POLL_INTERVAL_SECONDS)
+            elapsed += self.POLL_INTERVAL_SECONDS
+            uploaded_file = await self.genai_client.aio.files.get(name=gemini_file.name)
+            gemini_file.state = uploaded_file.state
+            gemini_file.uri = uploaded_file.uri or gemini_file.uri
+        return gemini_file
+
+    async def _upload_to_gemini(
+        self,
+        pdf_bytes: bytes,
+        filename: str,
+        wait_for_processing: bool = True,
+        max_wait_seconds: int = 60
+    ) -> GeminiFile:
+        """
+        Upload PDF to Gemini Files API
+
+        With a file registry, an existing upload with the same content (SHA-256)
+        is reused. Call release_file instead of delete_file when done.
+
+        Args:
+            pdf_bytes: PDF file bytes
+            filename: File name
+            wait_for_processing: Wait for processing to complete
+            max_wait_seconds: Maximum wait time (seconds)
+
+        Returns:
+            GeminiFile: Uploaded file info
+        """
+        if self.file_registry is not None:
+            digest = await asyncio.to_thread(content_digest, pdf_bytes)
+            gemini_file = await self.file_registry.acquire(
+                digest,
+                filename,
+                upload=lambda display_name: self._upload_new(pdf_bytes, filename, display_name),
+                size_bytes=len(pdf_bytes)
+            )
+        else:
+            gemini_file = await self._upload_new(pdf_bytes, filename)
+
+        if wait_for_processing:
+            gemini_file = await self._wait_until_active(gemini_file, max_wait_seconds)
+
+        return gemini_file
+
+    async def load_file(
         self,
         file_path: str,
         wait_for_processing: bool = True,
@@ -121,24 +187,24 @@ class LocalPDFLoader:
         if path.suffix.lower() != '.pdf':
             raise ValueError(f"Not a PDF file: {file_path}")
 
-        pdf_bytes = path.read_bytes()
+        pdf_bytes = await asyncio.to_thread(path.read_bytes)
         filename = path.name
 
-        return self._upload_to_gemini(
+        return await self._upload_to_gemini(
             pdf_bytes=pdf_bytes,
             filename=filename,
             wait_for_processing=wait_for_processing,
             max_wait_seconds=max_wait_seconds
         )
 
-    def load_files(
+    async def load_files(
         self,
         file_paths: list[str],
         wait_for_processing: bool = True,
         max_wait_seconds: int = 60
     ) -> list[GeminiFile]:
         """
-        Load multiple local PDF files and upload to Gemini
+        Load multiple local PDF files and upload to Gemini (concurrently)
 
         Args:
             file_paths: List of paths to local PDF files
@@ -152,18 +218,61 @@ class LocalPDFLoader:
             FileNotFoundError: If any file doesn't exist
             ValueError: If any file is not a PDF
         """
-        gemini_files = []
-        for file_path in file_paths:
-            gemini_file = self.load_file(
-                file_path=file_path,
-                wait_for_processing=wait_for_processing,
-                max_wait_seconds=max_wait_seconds
-            )
-            gemini_files.append(gemini_file)
+        results = await asyncio.gather(
+            *(
+                self.load_file(
+                    file_path=file_path,
+                    wait_for_processing=wait_for_processing,
+                    max_wait_seconds=max_wait_seconds
+                )
+                for file_path in file_paths
+            ),
+            return_exceptions=True
+        )
+
+        gemini_files = [r for r in results if isinstance(r, GeminiFile)]
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            # Don't leave already-uploaded files behind when one of them fails
+            await self.release_files(gemini_files, evict=True)
+            raise errors[0]
 
         return gemini_files
 
-    def load_from_bytes(
+    async def extract_text_from_files(self, file_paths: list[str]) -> list[ExtractedPDF]:
+        """
+        Pre-analysis before upload: extract text locally and detect text-native PDFs (concurrently)
+
+        Files larger than PDF_TEXT_MAX_BYTES are not parsed and stay multimodal.
+
+        Args:
+            file_paths: List of paths to local PDF files
+
+        Returns:
+            list[ExtractedPDF]: Extraction result per file (same order)
+
+        Raises:
+            FileNotFoundError: If any file doesn't exist
+            ValueError: If any file is not a PDF
+        """
+        async def extract(file_path: str) -> ExtractedPDF:
+            path = Path(file_path)
+
+            if not path.exists():
+                raise FileNotFoundError(f"File not found: {file_path}")
+
+            if path.suffix.lower() != '.pdf':
+                raise ValueError(f"Not a PDF file: {file_path}")
+
+            size = (await asyncio.to_thread(path.stat)).st_size
+            if size > PDF_TEXT_MAX_BYTES:
+                return ExtractedPDF.skipped(path.name, f"too_large({size})")
+
+            return await asyncio.to_thread(extract_pdf_text, str(path), path.name)
+
+        return list(await asyncio.gather(*(extract(p) for p in file_paths)))
+
+    async def load_from_bytes(
         self,
         pdf_bytes: bytes,
         filename: str,
@@ -180,13 +289,13 @@ class LocalPDFLoader:
         Returns:
             GeminiFile: Uploaded file info
         """
-        return self._upload_to_gemini(
+        return await self._upload_to_gemini(
             pdf_bytes=pdf_bytes,
             filename=filename,
             wait_for_processing=wait_for_processing
         )
 
-    def delete_file(self, gemini_file: GeminiFile) -> bool:
+    async def delete_file(self, gemini_file: GeminiFile) -> bool:
         """
         Delete file from Gemini (cleanup)
 
@@ -197,12 +306,12 @@ class LocalPDFLoader:
             bool: Success status
         """
         try:
-            self.genai_client.files.delete(name=gemini_file.name)
+            await self.genai_client.aio.files.delete(name=gemini_file.name)
             return True
         except Exception:
             return False
 
-    def delete_files(self, gemini_files: list[GeminiFile]) -> int:
+    async def delete_files(self, gemini_files: list[GeminiFile]) -> int:
         """
         Delete multiple files from Gemini
 
@@ -212,8 +321,34 @@ class LocalPDFLoader:
         Returns:
             int: Number of successfully deleted files
         """
-        deleted_count = 0
-        for gemini_file in gemini_files:
-            if self.delete_file(gemini_file):
-                deleted_count += 1
-        return deleted_count
+        results = await asyncio.gather(*(self.delete_file(f) for f in gemini_files))
+        return sum(results)
+
+    async def release_file(self, gemini_file: GeminiFile, evict: bool = False) -> bool:
+        """
+        Release a file after analysis (registry files are kept for reuse, others are deleted)
+
+        Args:
+            gemini_file: File to release
+            evict: Stop reusing the file in the registry too (e.g. analysis failed)
+
+        Returns:
+            bool: Success status
+        """
+        if self.file_registry is not None and await self.file_registry.release(gemini_file, evict=evict):
+            return True
+        return await self.delete_file(gemini_file)
+
+    async def release_files(self, gemini_files: list[GeminiFile], evict: bool = False) -> int:
+        """
+        Release multiple files after analysis
+
+        Args:
+            gemini_files: Files to release
+            evict: Stop reusing the files in the registry too
+
+        Returns:
+            int: Number of successfully released files
+        """
+        results = await asyncio.gather(*(self.release_file(f, evict=evict) for f in gemini_files))
+        return sum(results)
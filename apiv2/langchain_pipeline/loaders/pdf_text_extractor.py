@@ -0,0 +1,275 @@
+"""
+텍스트 PDF 판별 + 로컬 텍스트 추출 (Gemini 업로드 전 사전 분석)
+
+대부분의 이력서는 텍스트 PDF이므로 Gemini Files 업로드 + PROCESSING 대기 + multimodal 분석
+대신 로컬에서 텍스트를 추출해 텍스트 분석(ApplicantAnalysisChain.analyze)으로 보낸다.
+스캔/이미지 위주 문서는 multimodal 경로를 유지한다.
+
+판별 기준 (페이지 단위):
+- 텍스트 페이지: 글자 수(공백 제외) >= PDF_TEXT_MIN_CHARS_PER_PAGE
+  또는 이미지가 없고 짧은 텍스트만 있는 페이지 (마지막 페이지 등)
+- 텍스트 PDF: 텍스트 페이지 비율 >= PDF_TEXT_MIN_PAGE_RATIO,
+  깨진 글자(대체 문자/사용자 정의 영역) 비율 <= PDF_TEXT_MAX_GARBLED_RATIO,
+  페이지 수 <= PDF_TEXT_MAX_PAGES
+
+추출 텍스트는 각 줄 앞에 [p<페이지>:L<줄>] 라벨을 붙이고, Evidence.line_refs에
+같은 라벨("p1:L12")을 쓰도록 안내한다.
+
+pypdf는 함수 안에서 불러오며, 추출 실패(손상/암호화/미설치 등)는 multimodal 경로로 처리한다.
+"""
+
+import io
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Optional, Union
+
+from apiv2.langchain_pipeline.config import (
+    PDF_TEXT_MIN_CHARS_PER_PAGE,
+    PDF_TEXT_MIN_PAGE_RATIO,
+    PDF_TEXT_MAX_GARBLED_RATIO,
+    PDF_TEXT_MAX_PAGES,
+    PDF_TEXT_UPLOAD_BASELINE_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# 이미지가 없는 페이지를 텍스트 페이지로 보기 위한 최소 글자 수
+SHORT_PAGE_MIN_CHARS = 20
+
+LINE_REF_GUIDE = (
+    "각 줄 앞의 [p<페이지>:L<줄>] 라벨은 원문 위치입니다. "
+    "evidence.line_refs에는 이 라벨을 그대로 사용하세요 (예: \"p1:L12\")."
+)
+
+_stats = {
+    "documents": 0,
+    "text_native": 0,
+    "multimodal": 0,
+    "extract_seconds": 0.0,
+    "upload_seconds_saved": 0.0,
+}
+# multimodal 경로의 문서당 업로드+처리 대기 시간 (지수 이동 평균, 측정 전에는 PDF_TEXT_UPLOAD_BASELINE_SECONDS)
+_upload_seconds_avg: Optional[float] = None
+
+
+@dataclass
+class PageText:
+    """페이지별 추출 결과"""
+    page: int
+    lines: list[str]
+    chars: int
+    images: int
+
+
+@dataclass
+class ExtractedPDF:
+    """PDF 사전 분석 결과"""
+    filename: str
+    doc_id: str
+    is_text_native: bool
+    reason: str
+    pages: list[PageText] = field(default_factory=list)
+    extract_seconds: float = 0.0
+    # 사전 분석 때 받은 원본 (S3 로더만 설정, multimodal 경로로 넘어가면 다시 받지 않고 업로드)
+    pdf_bytes: Optional[bytes] = field(default=None, repr=False)
+    # pdf_bytes가 잡고 있는 메모리 한도 예약 (S3PDFLoader.release_prefetched로 반환)
+    reserved_bytes: int = field(default=0, repr=False)
+
+    @classmethod
+    def skipped(cls, filename: str, reason: str) -> "ExtractedPDF":
+        """추출하지 않고 multimodal로 보내는 문서 (크기 초과 등)"""
+        return cls(filename=filename, doc_id=guess_doc_id(filename), is_text_native=False, reason=reason)
+
+    @property
+    def line_count(self) -> int:
+        return sum(len(p.lines) for p in self.pages)
+
+    def to_prompt_text(self) -> str:
+        """[p<페이지>:L<줄>] 라벨이 붙은 본문"""
+        lines = []
+        for page in self.pages:
+            for i, line in enumerate(page.lines, 1):
+                lines.append(f"[p{page.page}:L{i}] {line}")
+        return "\n".join(lines)
+
+    def summary(self) -> dict:
+        return {
+            "filename": self.filename,
+            "doc_id": self.doc_id,
+            "is_text_native": self.is_text_native,
+            "reason": self.reason,
+            "pages": len(self.pages),
+            "lines": self.line_count,
+            "extract_seconds": round(self.extract_seconds, 3),
+        }
+
+
+def guess_doc_id(filename: str) -> str:
+    """파일명으로 문서 유형 추측 (applicant_schema의 doc_id)"""
+    lowered = filename.lower()
+    if "이력서" in filename or "resume" in lowered:
+        return "resume"
+    if "포트폴리오" in filename or "portfolio" in lowered:
+        return "portfolio"
+    if "자기소개서" in filename or "자소서" in filename or "essay" in lowered:
+        return "essay"
+    return "other"
+
+
+def _count_images(page) -> int:
+    """페이지 리소스의 이미지 XObject 수 (이미지를 디코딩하지 않음)"""
+    resources = page.get("/Resources")
+    if resources is None:
+        return 0
+    xobjects = resources.get_object().get("/XObject")
+    if xobjects is None:
+        return 0
+    return sum(
+        1 for obj in xobjects.get_object().values()
+        if obj.get_object().get("/Subtype") == "/Image"
+    )
+
+
+def _is_garbled(ch: str) -> bool:
+    """글리프 매핑이 없는 글자 (대체 문자 / 사용자 정의 영역)"""
+    return ch == "\ufffd" or "\ue000" <= ch <= "\uf8ff"
+
+
+def extract_pdf_text(source: Union[bytes, str], filename: str) -> ExtractedPDF:
+    """
+    PDF 텍스트 추출 + 텍스트 PDF 판별 (CPU 작업이므로 asyncio.to_thread로 호출)
+
+    Args:
+        source: PDF 바이트 또는 파일 경로
+        filename: 원본 파일명
+
+    Returns:
+        ExtractedPDF (is_text_native=False면 multimodal 경로 사용)
+    """
+    start = time.perf_counter()
+    result = ExtractedPDF(filename=filename, doc_id=guess_doc_id(filename), is_text_native=False, reason="")
+
+    try:
+        from pypdf import PdfReader
+
+        reader = PdfReader(io.BytesIO(source) if isinstance(source, bytes) else source)
+        if reader.is_encrypted and not reader.decrypt(""):
+            result.reason = "encrypted"
+            return result
+
+        page_count = len(reader.pages)
+        if page_count == 0:
+            result.reason = "empty"
+            return result
+        if page_count > PDF_TEXT_MAX_PAGES:
+            result.reason = f"too_many_pages({page_count})"
+            return result
+
+        text_pages = 0
+        total_chars = 0
+        garbled_chars = 0
+        for number, page in enumerate(reader.pages, 1):
+            text = page.extract_text() or ""
+            lines = [line.strip() for line in text.splitlines() if line.strip()]
+            visible = [ch for line in lines for ch in line if not ch.isspace()]
+            images = _count_images(page)
+            result.pages.append(PageText(page=number, lines=lines, chars=len(visible), images=images))
+
+            total_chars += len(visible)
+            garbled_chars += sum(1 for ch in visible if _is_garbled(ch))
+            if len(visible) >= PDF_TEXT_MIN_CHARS_PER_PAGE or (images == 0 and len(visible) >= SHORT_PAGE_MIN_CHARS):
+                text_pages += 1
+
+        text_ratio = text_pages / page_count
+        garbled_ratio = garbled_chars / total_chars if total_chars else 1.0
+        if text_ratio < PDF_TEXT_MIN_PAGE_RATIO:
+            result.reason = f"image_pages({page_count - text_pages}/{page_count})"
+        elif garbled_ratio > PDF_TEXT_MAX_GARBLED_RATIO:
+            result.reason = f"garbled_text({garbled_ratio:.0%})"
+        else:
+            result.is_text_native = True
+            result.reason = "text"
+        return result
+
+    except Exception as e:
+        result.reason = f"extract_failed({type(e).__name__})"
+        logger.debug(f"📄 [PDFText] {filename} 텍스트 추출 실패: {e}")
+        return result
+
+    finally:
+        result.extract_seconds = time.perf_counter() - start
+
+
+def format_documents_for_prompt(documents: list[ExtractedPDF]) -> str:
+    """추출된 문서들을 텍스트 분석 입력(resume_text)으로 결합"""
+    sections = [LINE_REF_GUIDE]
+    for doc in documents:
+        sections.append(
+            f"=== doc_id: {doc.doc_id} | filename: {doc.filename} | pages: {len(doc.pages)} ===\n"
+            f"{doc.to_prompt_text()}"
+        )
+    return "\n\n".join(sections)
+
+
+# ============================================================
+# 절감 시간 메트릭
+# ============================================================
+
+def record_multimodal_upload(seconds: float, documents: int = 1):
+    """multimodal 경로의 업로드+처리 대기 시간 기록 (문서당 평균으로 환산)"""
+    global _upload_seconds_avg
+    if documents <= 0:
+        return
+    per_document = seconds / documents
+    _upload_seconds_avg = per_document if _upload_seconds_avg is None else 0.8 * _upload_seconds_avg + 0.2 * per_document
+
+
+def _upload_seconds_estimate() -> tuple[float, str]:
+    """문서당 업로드+처리 대기 시간 추정치와 근거 (measured | baseline)"""
+    if _upload_seconds_avg is not None:
+        return _upload_seconds_avg, "measured"
+    return PDF_TEXT_UPLOAD_BASELINE_SECONDS, "baseline"
+
+
+def record_extraction(documents: list[ExtractedPDF], used_text_path: bool) -> list[dict]:
+    """
+    사전 분석 결과 기록 + 문서별 절감 시간 로그
+
+    Returns:
+        문서별 요약 (text 경로면 upload_seconds_saved 포함)
+    """
+    upload_seconds, basis = _upload_seconds_estimate()
+    summaries = []
+    for doc in documents:
+        _stats["documents"] += 1
+        _stats["extract_seconds"] += doc.extract_seconds
+        summary = doc.summary()
+        if used_text_path:
+            _stats["text_native"] += 1
+            saved = max(0.0, upload_seconds - doc.extract_seconds)
+            _stats["upload_seconds_saved"] += saved
+            summary["upload_seconds_saved"] = round(saved, 2)
+            logger.info(
+                f"📄 [PDFText] {doc.filename}: 텍스트 경로 ({len(doc.pages)}쪽, {doc.line_count}줄) | "
+                f"추출 {doc.extract_seconds:.2f}초 | "
+                f"업로드+처리 {'평균' if basis == 'measured' else '기준'} {upload_seconds:.1f}초 → 약 {saved:.1f}초 절감"
+            )
+        else:
+            _stats["multimodal"] += 1
+            reason = doc.reason if not doc.is_text_native else "함께 분석하는 문서가 텍스트 PDF가 아님"
+            logger.info(f"📄 [PDFText] {doc.filename}: multimodal 경로 ({reason})")
+        summaries.append(summary)
+    return summaries
+
+
+def get_text_extraction_stats() -> dict:
+    """텍스트 빠른 경로 메트릭"""
+    upload_seconds, basis = _upload_seconds_estimate()
+    return {
+        **_stats,
+        "extract_seconds": round(_stats["extract_seconds"], 2),
+        "upload_seconds_saved": round(_stats["upload_seconds_saved"], 1),
+        "avg_multimodal_upload_seconds": round(upload_seconds, 2),
+        "upload_seconds_basis": basis,
+    }
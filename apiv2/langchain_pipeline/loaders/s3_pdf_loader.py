@@ -3,22 +3,60 @@ S3 PDF 로더 + Gemini Files API 연동
 
 역할: S3에서 PDF 다운로드 → Gemini에 업로드 → 분석 가능 상태로 반환
 
+이벤트 루프를 막지 않도록 Gemini 호출은 비동기 클라이언트(client.aio)를 사용하고,
+boto3 다운로드는 스레드에서 실행한다.
+
+전송 경로 (S3 객체 크기 기준):
+- STREAM_THRESHOLD_BYTES 이하: 메모리로 다운로드 후 업로드 (파일 크기만큼 메모리 한도 예약)
+- 초과: S3 본문을 청크 단위로 읽어 Gemini 재개 가능 업로드로 바로 전송
+  (파일 레지스트리 사용 시 S3 객체(버킷/키/ETag) 해시로 재사용, 히트면 본문을 받지 않음)
+- 스트리밍 실패 / ETag 없음 + 레지스트리 사용: 임시 파일로 받으면서 SHA-256 계산 → 경로로 업로드
+큰 PDF는 청크 크기만큼만 메모리 한도(utils/byte_budget.py)를 예약한다.
+
+extract_text_from_s3: 업로드 전 사전 분석 (PDF_TEXT_MAX_BYTES 이하 PDF의 로컬 텍스트 추출,
+텍스트 PDF면 업로드 없이 텍스트 분석 가능, pdf_text_extractor.py 참고)
+STREAM_THRESHOLD_BYTES 이하 PDF의 사전 분석 바이트(ExtractedPDF.pdf_bytes)는 메모리 한도 예약과 함께
+보관했다가 load_from_s3/load_many_from_s3에 넘겨 multimodal 경로에서도 S3에서 다시 받지 않는다.
+(모두 텍스트 PDF면 바로 해제, 업로드가 끝나면 release_prefetched로 해제)
+
 사용법:
     loader = S3PDFLoader(bucket_name="my-bucket", gemini_api_key="...")
-    gemini_file = loader.load_from_s3("token123/resume.pdf")
+    gemini_file = await loader.load_from_s3("token123/resume.pdf")
     # gemini_file.uri를 Gemini generate_content에 전달
 """
 
+import asyncio
+import hashlib
 import io
-import time
+import logging
+import os
+import tempfile
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional, Union
 
 import boto3
+import httpx
 from botocore.exceptions import ClientError
 from google import genai
 from google.genai import types
 
+from apiv2.langchain_pipeline.config import (
+    PDF_STREAM_THRESHOLD_BYTES,
+    PDF_STREAM_CHUNK_BYTES,
+    PDF_SPOOL_DIR,
+    PDF_TEXT_MAX_BYTES,
+)
+from apiv2.langchain_pipeline.loaders.pdf_text_extractor import ExtractedPDF, extract_pdf_text
+from apiv2.langchain_pipeline.utils.byte_budget import get_pdf_byte_budget
+from apiv2.langchain_pipeline.utils.file_registry import GeminiFileRegistry, content_digest, object_digest
+
+logger = logging.getLogger(__name__)
+
+# Gemini Files API 재개 가능 업로드 엔드포인트 / 중간 청크 단위
+RESUMABLE_UPLOAD_URL = "https://generativelanguage.googleapis.com/upload/v1beta/files"
+UPLOAD_CHUNK_GRANULARITY = 256 * 1024
+UPLOAD_TIMEOUT_SECONDS = 120
+
 
 @dataclass
 class GeminiFile:
@@ -38,6 +76,13 @@ class S3DownloadResult:
     filename: Optional[str] = None
     content_type: Optional[str] = None
     error_message: Optional[str] = None
+    body: Optional[Any] = None          # read_body=False일 때 읽지 않은 S3 본문 스트림
+    size_bytes: Optional[int] = None    # S3 ContentLength
+    etag: Optional[str] = None          # S3 ETag (본문을 받기 전 레지스트리 키)
+
+
+async def _single_chunk(data: bytes):
+    yield data
 
 
 class S3PDFLoader:
@@ -48,6 +93,14 @@ class S3PDFLoader:
     업로드된 파일은 Gemini의 multimodal 분석에 사용할 수 있습니다.
     """
 
+    # Gemini 파일 처리 상태 확인 간격 (초)
+    POLL_INTERVAL_SECONDS = 2
+
+    # 이보다 큰 PDF는 스트리밍/임시 파일 경로로 전송
+    STREAM_THRESHOLD_BYTES = PDF_STREAM_THRESHOLD_BYTES
+    STREAM_CHUNK_BYTES = PDF_STREAM_CHUNK_BYTES
+    SPOOL_DIR = PDF_SPOOL_DIR
+
     def __init__(
         self,
         bucket_name: str,
@@ -55,6 +108,7 @@ class S3PDFLoader:
         aws_region: str = "ap-northeast-2",
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
+        file_registry: Optional[GeminiFileRegistry] = None,
     ):
         """
         Args:
@@ -63,6 +117,7 @@ class S3PDFLoader:
             aws_region: AWS 리전 (기본: 서울)
             aws_access_key_id: AWS Access Key (없으면 환경변수/IAM Role 사용)
             aws_secret_access_key: AWS Secret Key (없으면 환경변수/IAM Role 사용)
+            file_registry: 업로드 파일 재사용 레지스트리 (None이면 매번 업로드 후 삭제)
         """
         self.bucket_name = bucket_name
 
@@ -75,14 +130,17 @@ class S3PDFLoader:
         self.s3_client = boto3.client('s3', **s3_kwargs)
 
         # Gemini 클라이언트 초기화
+        self.gemini_api_key = gemini_api_key
         self.genai_client = genai.Client(api_key=gemini_api_key)
+        self.file_registry = file_registry
 
-    def _download_from_s3(self, s3_key: str) -> S3DownloadResult:
+    def _download_from_s3(self, s3_key: str, read_body: bool = True) -> S3DownloadResult:
         """
         S3에서 파일 다운로드
 
         Args:
             s3_key: S3 객체 키 (예: "{token}/resume.pdf")
+            read_body: False면 본문을 읽지 않고 스트림(body)과 크기만 반환
 
         Returns:
             S3DownloadResult: 다운로드 결과
@@ -93,15 +151,28 @@ class S3PDFLoader:
                 Key=s3_key
             )
 
-            pdf_bytes = response['Body'].read()
             content_type = response.get('ContentType', 'application/pdf')
             filename = s3_key.split('/')[-1]
+            size_bytes = response.get('ContentLength')
+
+            if not read_body:
+                return S3DownloadResult(
+                    success=True,
+                    filename=filename,
+                    content_type=content_type,
+                    body=response['Body'],
+                    size_bytes=size_bytes,
+                    etag=response.get('ETag')
+                )
+
+            pdf_bytes = response['Body'].read()
 
             return S3DownloadResult(
                 success=True,
                 data=pdf_bytes,
                 filename=filename,
-                content_type=content_type
+                content_type=content_type,
+                size_bytes=len(pdf_bytes)
             )
 
         except ClientError as e:
@@ -127,46 +198,38 @@ class S3PDFLoader:
                 error_message=f"다운로드 실패: {str(e)}"
             )
 
-    def _upload_to_gemini(
+    async def _upload_new(
         self,
-        pdf_bytes: bytes,
+        source: Union[bytes, str],
         filename: str,
-        wait_for_processing: bool = True,
-        max_wait_seconds: int = 60
+        display_name: Optional[str] = None
     ) -> GeminiFile:
         """
-        Gemini Files API로 PDF 업로드
+        Gemini Files API로 PDF 업로드 (처리 완료를 기다리지 않음)
 
         Args:
-            pdf_bytes: PDF 파일 바이트
+            source: PDF 파일 바이트 또는 임시 파일 경로 (경로는 SDK가 청크 단위로 비동기 읽기)
             filename: 파일명
-            wait_for_processing: 처리 완료까지 대기 여부
-            max_wait_seconds: 최대 대기 시간 (초)
+            display_name: Gemini 쪽 표시 이름 (없으면 파일명)
 
         Returns:
             GeminiFile: 업로드된 파일 정보
         """
-        # BytesIO로 파일 객체 생성
-        file_obj = io.BytesIO(pdf_bytes)
-        file_obj.name = filename  # Gemini가 파일명 인식하도록
-
-        # Gemini에 업로드
-        uploaded_file = self.genai_client.files.upload(
+        if isinstance(source, bytes):
+            # BytesIO로 파일 객체 생성
+            file_obj = io.BytesIO(source)
+            file_obj.name = filename  # Gemini가 파일명 인식하도록
+        else:
+            file_obj = source
+
+        uploaded_file = await self.genai_client.aio.files.upload(
             file=file_obj,
             config=types.UploadFileConfig(
-                display_name=filename,
+                display_name=display_name or filename,
                 mime_type='application/pdf'
             )
         )
 
-        # 처리 완료 대기
-        if wait_for_processing:
-            elapsed = 0
-            while uploaded_file.state == 'PROCESSING' and elapsed < max_wait_seconds:
-                time.sleep(2)
-                elapsed += 2
-                uploaded_file = self.genai_client.files.get(name=uploaded_file.name)
-
         return GeminiFile(
             name=uploaded_file.name,
             uri=uploaded_file.uri,
@@ -175,11 +238,51 @@ class S3PDFLoader:
             size_bytes=getattr(uploaded_file, 'size_bytes', None)
         )
 
-    def load_from_s3(
+    async def _upload_to_gemini(
         self,
-        s3_key: str,
+        pdf_bytes: bytes,
+        filename: str,
         wait_for_processing: bool = True,
         max_wait_seconds: int = 60
+    ) -> GeminiFile:
+        """
+        Gemini Files API로 PDF 업로드
+
+        파일 레지스트리가 있으면 내용(SHA-256)이 같은 업로드 파일을 재사용한다.
+        사용 후에는 delete_file 대신 release_file을 호출한다.
+
+        Args:
+            pdf_bytes: PDF 파일 바이트
+            filename: 파일명
+            wait_for_processing: 처리 완료까지 대기 여부
+            max_wait_seconds: 최대 대기 시간 (초)
+
+        Returns:
+            GeminiFile: 업로드된 파일 정보
+        """
+        if self.file_registry is not None:
+            digest = await asyncio.to_thread(content_digest, pdf_bytes)
+            gemini_file = await self.file_registry.acquire(
+                digest,
+                filename,
+                upload=lambda display_name: self._upload_new(pdf_bytes, filename, display_name),
+                size_bytes=len(pdf_bytes)
+            )
+        else:
+            gemini_file = await self._upload_new(pdf_bytes, filename)
+
+        # 처리 완료 대기
+        if wait_for_processing:
+            gemini_file = (await self._wait_until_active([gemini_file], max_wait_seconds))[0]
+
+        return gemini_file
+
+    async def load_from_s3(
+        self,
+        s3_key: str,
+        wait_for_processing: bool = True,
+        max_wait_seconds: int = 60,
+        prefetched: Optional[ExtractedPDF] = None
     ) -> GeminiFile:
         """
         S3에서 PDF 다운로드 → Gemini에 업로드
@@ -188,6 +291,7 @@ class S3PDFLoader:
             s3_key: S3 객체 키 (예: "{token}/resume.pdf")
             wait_for_processing: Gemini 처리 완료까지 대기 여부
             max_wait_seconds: 최대 대기 시간 (초)
+            prefetched: extract_text_from_s3 결과 (pdf_bytes가 남아 있으면 S3에서 다시 받지 않음)
 
         Returns:
             GeminiFile: Gemini에 업로드된 파일 정보
@@ -195,23 +299,372 @@ class S3PDFLoader:
         Raises:
             Exception: S3 다운로드 또는 Gemini 업로드 실패 시
         """
-        # 1. S3에서 다운로드
-        download_result = self._download_from_s3(s3_key)
-
-        if not download_result.success:
-            raise Exception(download_result.error_message)
-
-        # 2. Gemini에 업로드
-        gemini_file = self._upload_to_gemini(
-            pdf_bytes=download_result.data,
-            filename=download_result.filename,
+        return await self._transfer_to_gemini(
+            s3_key,
             wait_for_processing=wait_for_processing,
-            max_wait_seconds=max_wait_seconds
+            max_wait_seconds=max_wait_seconds,
+            prefetched=prefetched
         )
 
+    async def extract_text_from_s3(self, s3_keys: list[str]) -> list[ExtractedPDF]:
+        """
+        업로드 전 사전 분석: PDF를 받아 로컬에서 텍스트 추출 + 텍스트 PDF 판별 (동시 실행)
+
+        PDF_TEXT_MAX_BYTES보다 큰 PDF는 받지 않고 multimodal 대상으로 표시한다.
+        STREAM_THRESHOLD_BYTES 이하 PDF는 받은 바이트와 메모리 한도 예약을 결과(pdf_bytes/reserved_bytes)에
+        남겨 multimodal 경로의 업로드에 재사용한다. 모두 텍스트 PDF면 업로드가 필요 없으므로 바로 해제한다.
+        남은 예약은 업로드 후 또는 호출 측에서 release_prefetched로 해제해야 한다.
+
+        Args:
+            s3_keys: S3 객체 키 목록
+
+        Returns:
+            list[ExtractedPDF]: 문서별 추출 결과 (s3_keys 순서)
+        """
+        budget = get_pdf_byte_budget()
+
+        async def extract(s3_key: str) -> ExtractedPDF:
+            opened = await self._open_s3_object(s3_key)
+            size = opened.size_bytes
+            if size is None or size > PDF_TEXT_MAX_BYTES:
+                opened.body.close()
+                return ExtractedPDF.skipped(opened.filename, f"too_large({size})")
+
+            reserved = await budget.acquire(size)
+            try:
+                try:
+                    pdf_bytes = await asyncio.to_thread(opened.body.read)
+                finally:
+                    opened.body.close()
+                extracted = await asyncio.to_thread(extract_pdf_text, pdf_bytes, opened.filename)
+            except BaseException:
+                await budget.release(reserved)
+                raise
+
+            # 큰 PDF는 보관하지 않고 업로드 때 스트리밍/임시 파일 경로로 다시 받음
+            if size <= self.STREAM_THRESHOLD_BYTES:
+                extracted.pdf_bytes = pdf_bytes
+                extracted.reserved_bytes = reserved
+            else:
+                await budget.release(reserved)
+            return extracted
+
+        results = await asyncio.gather(*(extract(key) for key in s3_keys), return_exceptions=True)
+        documents = [r for r in results if isinstance(r, ExtractedPDF)]
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors or all(doc.is_text_native for doc in documents):
+            await self.release_prefetched(documents)
+        if errors:
+            raise errors[0]
+        return documents
+
+    async def release_prefetched(self, documents: list[ExtractedPDF]) -> None:
+        """사전 분석에서 보관한 PDF 바이트와 메모리 한도 예약 해제 (여러 번 호출해도 안전)"""
+        budget = get_pdf_byte_budget()
+        for doc in documents:
+            doc.pdf_bytes = None
+            reserved, doc.reserved_bytes = doc.reserved_bytes, 0
+            if reserved:
+                await budget.release(reserved)
+
+    async def _open_s3_object(self, s3_key: str) -> S3DownloadResult:
+        """S3 객체 열기 (boto3는 동기 → 스레드에서 실행, 본문은 읽지 않음)"""
+        opened = await asyncio.to_thread(self._download_from_s3, s3_key, False)
+        if not opened.success:
+            raise Exception(opened.error_message)
+        return opened
+
+    async def _transfer_to_gemini(
+        self,
+        s3_key: str,
+        wait_for_processing: bool = True,
+        max_wait_seconds: int = 60,
+        prefetched: Optional[ExtractedPDF] = None
+    ) -> GeminiFile:
+        """
+        S3 객체를 크기에 따라 메모리/스트리밍/임시 파일 경로로 Gemini에 전송
+
+        Args:
+            s3_key: S3 객체 키
+            wait_for_processing: Gemini 처리 완료까지 대기 여부
+            max_wait_seconds: 최대 대기 시간 (초)
+            prefetched: 사전 분석 결과 (pdf_bytes가 있으면 S3를 거치지 않고 업로드, 업로드 후 예약 해제)
+
+        Returns:
+            GeminiFile: Gemini에 업로드된 파일 정보
+        """
+        budget = get_pdf_byte_budget()
+        gemini_file = None
+
+        # 0. 사전 분석에서 받은 바이트: 사전 분석의 예약을 그대로 유지한 채 업로드 후 해제
+        if prefetched is not None and prefetched.pdf_bytes is not None:
+            try:
+                gemini_file = await self._upload_to_gemini(
+                    pdf_bytes=prefetched.pdf_bytes,
+                    filename=s3_key.split('/')[-1],
+                    wait_for_processing=False
+                )
+            finally:
+                await self.release_prefetched([prefetched])
+            if wait_for_processing:
+                gemini_file = (await self._wait_until_active([gemini_file], max_wait_seconds))[0]
+            return gemini_file
+
+        opened = await self._open_s3_object(s3_key)
+        size = opened.size_bytes
+
+        # 1. 작은 PDF: 메모리 경로 (업로드가 끝나면 바이트 해제, 처리 대기 중에는 예약하지 않음)
+        if size is not None and size <= self.STREAM_THRESHOLD_BYTES:
+            async with budget.reserve(size):
+                try:
+                    pdf_bytes = await asyncio.to_thread(opened.body.read)
+                finally:
+                    opened.body.close()
+                gemini_file = await self._upload_to_gemini(
+                    pdf_bytes=pdf_bytes,
+                    filename=opened.filename,
+                    wait_for_processing=False
+                )
+                del pdf_bytes
+
+        # 2. 큰 PDF: S3 본문 → Gemini 재개 가능 업로드로 바로 전송
+        #    (레지스트리가 있으면 S3 객체 해시로 재사용, ETag가 없으면 임시 파일 경로에서 SHA-256으로 재사용)
+        elif size and (self.file_registry is None or opened.etag):
+            try:
+                async with budget.reserve(self.STREAM_CHUNK_BYTES):
+                    gemini_file = await self._stream_or_reuse(s3_key, opened, size)
+            except Exception as e:
+                logger.warning(f"👤 [Applicant] 스트리밍 업로드 실패, 임시 파일 경로로 재시도 ({s3_key}): {e}")
+                opened = await self._open_s3_object(s3_key)
+
+        # 3. 임시 파일 경로 (레지스트리 재사용을 위해 받으면서 SHA-256 계산)
+        if gemini_file is None:
+            async with budget.reserve(self.STREAM_CHUNK_BYTES):
+                gemini_file = await self._spool_and_upload(opened)
+
+        if wait_for_processing:
+            gemini_file = (await self._wait_until_active([gemini_file], max_wait_seconds))[0]
         return gemini_file
 
-    def load_from_bytes(
+    def _read_chunk(self, body, chunk_bytes: int) -> bytes:
+        """S3 본문에서 chunk_bytes만큼 읽기 (끝이 아니면 항상 정확히 chunk_bytes)"""
+        parts = []
+        remaining = chunk_bytes
+        while remaining > 0:
+            part = body.read(remaining)
+            if not part:
+                break
+            parts.append(part)
+            remaining -= len(part)
+        return b"".join(parts)
+
+    async def _stream_or_reuse(self, s3_key: str, opened: S3DownloadResult, size: int) -> GeminiFile:
+        """
+        스트리밍 업로드 (레지스트리가 있으면 같은 S3 객체의 업로드 파일 재사용, 히트면 본문을 받지 않고 닫음)
+
+        Args:
+            s3_key: S3 객체 키
+            opened: read_body=False로 연 S3 객체
+            size: 객체 크기 (ContentLength)
+
+        Returns:
+            GeminiFile: 업로드된 파일 정보 (처리 대기 전)
+        """
+        if self.file_registry is None:
+            return await self._stream_to_gemini(opened, size)
+        try:
+            return await self.file_registry.acquire(
+                object_digest(self.bucket_name, s3_key, opened.etag),
+                opened.filename,
+                upload=lambda display_name: self._stream_to_gemini(opened, size, display_name),
+                size_bytes=size
+            )
+        finally:
+            opened.body.close()
+
+    async def _stream_to_gemini(
+        self,
+        opened: S3DownloadResult,
+        size: int,
+        display_name: Optional[str] = None
+    ) -> GeminiFile:
+        """
+        S3 본문을 청크 단위로 Gemini 재개 가능 업로드에 전송 (파일 전체를 메모리에 두지 않음)
+
+        Args:
+            opened: read_body=False로 연 S3 객체
+            size: 객체 크기 (ContentLength)
+            display_name: Gemini 쪽 표시 이름 (없으면 파일명)
+
+        Returns:
+            GeminiFile: 업로드된 파일 정보 (처리 대기 전)
+        """
+        chunk_bytes = max(
+            UPLOAD_CHUNK_GRANULARITY,
+            self.STREAM_CHUNK_BYTES // UPLOAD_CHUNK_GRANULARITY * UPLOAD_CHUNK_GRANULARITY
+        )
+        try:
+            async with httpx.AsyncClient(timeout=UPLOAD_TIMEOUT_SECONDS) as client:
+                start = await client.post(
+                    RESUMABLE_UPLOAD_URL,
+                    headers={
+                        "x-goog-api-key": self.gemini_api_key,
+                        "X-Goog-Upload-Protocol": "resumable",
+                        "X-Goog-Upload-Command": "start",
+                        "X-Goog-Upload-Header-Content-Length": str(size),
+                        "X-Goog-Upload-Header-Content-Type": "application/pdf",
+                    },
+                    json={"file": {"display_name": display_name or opened.filename}},
+                )
+                start.raise_for_status()
+                upload_url = start.headers["x-goog-upload-url"]
+
+                offset = 0
+                while True:
+                    chunk = await asyncio.to_thread(self._read_chunk, opened.body, chunk_bytes)
+                    last = not chunk or offset + len(chunk) >= size
+                    # bytes를 그대로 넘기면 요청 객체가 청크를 참조한 채 순환 참조로 남아
+                    # GC 전까지 해제되지 않으므로 한 번만 읽히는 스트림으로 전달
+                    response = await client.post(
+                        upload_url,
+                        headers={
+                            "X-Goog-Upload-Command": "upload, finalize" if last else "upload",
+                            "X-Goog-Upload-Offset": str(offset),
+                            "Content-Length": str(len(chunk)),
+                        },
+                        content=_single_chunk(chunk),
+                    )
+                    response.raise_for_status()
+                    offset += len(chunk)
+                    if last:
+                        break
+        finally:
+            opened.body.close()
+
+        uploaded_file = response.json()["file"]
+        return GeminiFile(
+            name=uploaded_file["name"],
+            uri=uploaded_file.get("uri"),
+            display_name=opened.filename,
+            state=uploaded_file.get("state", "PROCESSING"),
+            size_bytes=int(uploaded_file.get("sizeBytes", offset))
+        )
+
+    def _spool_to_tempfile(self, body) -> tuple[str, str, int]:
+        """
+        S3 본문을 청크 단위로 임시 파일에 기록하면서 SHA-256 계산 (스레드에서 실행)
+
+        Returns:
+            (임시 파일 경로, SHA-256, 크기)
+        """
+        digest = hashlib.sha256()
+        size = 0
+        spool = tempfile.NamedTemporaryFile(prefix="cf-pdf-", suffix=".pdf", dir=self.SPOOL_DIR, delete=False)
+        try:
+            with spool:
+                while chunk := body.read(self.STREAM_CHUNK_BYTES):
+                    spool.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+        except BaseException:
+            os.unlink(spool.name)
+            raise
+        finally:
+            body.close()
+        return spool.name, digest.hexdigest(), size
+
+    async def _spool_and_upload(self, opened: S3DownloadResult) -> GeminiFile:
+        """
+        임시 파일 경유 업로드 (레지스트리가 있으면 같은 내용의 업로드 파일 재사용)
+
+        Args:
+            opened: read_body=False로 연 S3 객체
+
+        Returns:
+            GeminiFile: 업로드된 파일 정보 (처리 대기 전)
+        """
+        path, digest, size = await asyncio.to_thread(self._spool_to_tempfile, opened.body)
+        try:
+            if self.file_registry is not None:
+                return await self.file_registry.acquire(
+                    digest,
+                    opened.filename,
+                    upload=lambda display_name: self._upload_new(path, opened.filename, display_name),
+                    size_bytes=size
+                )
+            return await self._upload_new(path, opened.filename)
+        finally:
+            await asyncio.to_thread(os.unlink, path)
+
+    async def _wait_until_active(
+        self,
+        gemini_files: list[GeminiFile],
+        max_wait_seconds: int = 60
+    ) -> list[GeminiFile]:
+        """
+        여러 파일의 처리 완료를 함께 대기 (매 간격마다 PROCESSING 파일 상태를 동시에 조회)
+
+        Args:
+            gemini_files: 업로드된 파일 목록
+            max_wait_seconds: 최대 대기 시간 (초)
+
+        Returns:
+            list[GeminiFile]: 최신 상태가 반영된 파일 목록 (입력 순서 유지)
+        """
+        elapsed = 0
+        files = list(gemini_files)
+        while elapsed < max_wait_seconds:
+            pending = [i for i, f in enumerate(files) if f.state == 'PROCESSING']
+            if not pending:
+                break
+            await asyncio.sleep(self.POLL_INTERVAL_SECONDS)
+            elapsed += self.POLL_INTERVAL_SECONDS
+            refreshed = await asyncio.gather(
+                *(self.genai_client.aio.files.get(name=files[i].name) for i in pending)
+            )
+            for i, uploaded_file in zip(pending, refreshed):
+                files[i].state = uploaded_file.state
+                files[i].uri = uploaded_file.uri or files[i].uri
+        return files
+
+    async def load_many_from_s3(
+        self,
+        s3_keys: list[str],
+        max_wait_seconds: int = 60,
+        prefetched: Optional[list[ExtractedPDF]] = None
+    ) -> list[GeminiFile]:
+        """
+        여러 PDF를 S3에서 동시에 다운로드 → 동시에 업로드 → 함께 ACTIVE 대기
+
+        전체 지연은 파일 수의 합이 아니라 가장 느린 파일 기준이 된다.
+
+        Args:
+            s3_keys: S3 객체 키 목록
+            max_wait_seconds: 최대 처리 대기 시간 (초)
+            prefetched: s3_keys 순서의 extract_text_from_s3 결과 (pdf_bytes가 없는 항목만 S3에서 받음)
+
+        Returns:
+            list[GeminiFile]: 업로드된 파일 목록 (s3_keys 순서)
+
+        Raises:
+            Exception: 다운로드/업로드 실패 시 (이미 업로드된 파일은 정리)
+        """
+        results = await asyncio.gather(
+            *(
+                self._transfer_to_gemini(key, wait_for_processing=False, prefetched=doc)
+                for key, doc in zip(s3_keys, prefetched or [None] * len(s3_keys))
+            ),
+            return_exceptions=True
+        )
+        gemini_files = [r for r in results if isinstance(r, GeminiFile)]
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            await asyncio.gather(*(self.release_file(f, evict=True) for f in gemini_files))
+            raise errors[0]
+
+        return await self._wait_until_active(gemini_files, max_wait_seconds)
+
+    async def load_from_bytes(
         self,
         pdf_bytes: bytes,
         filename: str,
@@ -228,13 +681,13 @@ class S3PDFLoader:
         Returns:
             GeminiFile: 업로드된 파일 정보
         """
-        return self._upload_to_gemini(
+        return await self._upload_to_gemini(
             pdf_bytes=pdf_bytes,
             filename=filename,
             wait_for_processing=wait_for_processing
         )
 
-    def delete_file(self, gemini_file: GeminiFile) -> bool:
+    async def delete_file(self, gemini_file: GeminiFile) -> bool:
         """
         Gemini에서 파일 삭제 (정리용)
 
@@ -245,8 +698,22 @@ class S3PDFLoader:
             bool: 삭제 성공 여부
         """
         try:
-            self.genai_client.files.delete(name=gemini_file.name)
+            await self.genai_client.aio.files.delete(name=gemini_file.name)
             return True
         except Exception:
             return False
 
+    async def release_file(self, gemini_file: GeminiFile, evict: bool = False) -> bool:
+        """
+        분석이 끝난 파일 반환 (레지스트리 파일은 재사용을 위해 유지, 그 외는 삭제)
+
+        Args:
+            gemini_file: 반환할 파일 정보
+            evict: True면 레지스트리에서도 더 이상 재사용하지 않음 (분석 실패 등)
+
+        Returns:
+            bool: 정리 성공 여부
+        """
+        if self.file_registry is not None and await self.file_registry.release(gemini_file, evict=evict):
+            return True
+        return await self.delete_file(gemini_file)
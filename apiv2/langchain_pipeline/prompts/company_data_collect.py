@@ -165,6 +165,36 @@ HUMAN_MESSAGE_TEMPLATE = """다음 웹 페이지 내용에서 회사 정보를 
 
 반드시 유효한 JSON 형식으로만 응답하세요."""
 
+# 섹션 병렬 추출용 사용자 메시지 (스키마에는 해당 섹션 그룹만 포함)
+SECTION_HUMAN_MESSAGE_TEMPLATE = """다음 웹 페이지 내용에서 회사 정보 중 아래 스키마에 포함된 섹션만 추출해주세요.
+
+## 웹 페이지 내용
+{scraped_content}
+
+## 출력 JSON 스키마 (추출 대상 섹션: {section_names})
+{output_schema}
+
+## 추출 지침
+1. 스키마에 있는 키만 출력하세요. 다른 섹션은 다른 호출에서 추출합니다.
+2. 명시되지 않은 정보는 "unknown" 또는 빈 배열로 두세요.
+
+모든 섹션에 evidence 포함 필수:
+- doc_id: 소스 문서 ID (job_posting, official_site 등)
+- line_refs: 라인 번호 (불가시 ["unknown"])
+- quote: 짧은 직접 인용
+
+반드시 유효한 JSON 형식으로만 응답하세요."""
+
+# 섹션 병렬 추출 그룹 (company_schema 경로, 그룹당 LLM 1회 호출)
+# scoring_axes는 collect 단계에서 비워두므로 제외
+SECTION_GROUPS = [
+    ["profile_meta", "company_info_fields.basic_profile", "extraction_quality"],
+    ["company_info_fields.technical_environment", "company_info_fields.role_and_hiring_signals"],
+    ["company_info_fields.execution_culture_signals", "company_info_fields.collaboration_culture_signals"],
+    ["company_info_fields.ownership_expectation_signals", "company_info_fields.growth_learning_culture_signals"],
+    ["company_info_fields.work_environment_expectations", "company_info_fields.verification_needed_areas"],
+]
+
 # 스키마 파일 참조 (동적 로딩)
 SCHEMA_FILE = "company_schema.json"
 
@@ -0,0 +1,67 @@
+"""
+회사 컬쳐핏 단일 호출 분석 프롬프트
+
+역할: 스크래핑 원문에서 바로 최종 컬쳐핏 분석 JSON 생성 (collect + analyze 통합)
+입력: 채용공고/회사 페이지 스크래핑 텍스트
+출력: company_culture_analyze와 같은 형식의 JSON
+
+company_culture_analyze의 시스템 메시지가 이미 원문(공식 사이트 + 채용공고)을
+입력으로 가정하고 있으므로 그대로 사용하고, 사용자 메시지에 추출 지침을 합친다.
+"""
+
+from apiv2.langchain_pipeline.prompts import company_culture_analyze
+
+SYSTEM_MESSAGE = company_culture_analyze.SYSTEM_MESSAGE
+
+HUMAN_MESSAGE_TEMPLATE = """다음 웹 페이지 내용에서 회사 정보를 추출하고 컬쳐핏 점수를 산정해주세요.
+
+## 웹 페이지 내용
+{scraped_content}
+
+## 출력 JSON 스키마
+{output_schema}
+
+## 추출 지침
+1. profile_meta: 회사 기본 메타 정보 (company_name, industry, analyzed_scope, source_docs)
+   - industry_domain_label: 소스에서 명시된 도메인 라벨 (fintech, AI, SaaS 등) 또는 "unknown"
+   - company_stage_label: 소스에서 명시된 회사 규모/단계 라벨 (startup, enterprise 등) 또는 "unknown"
+2. company_info_fields: 회사 기본 프로필, 기술 환경, 채용 신호, 실행/협업/오너십/성장/근무 문화 신호
+   - culture_keywords_overview.culture_keywords: 소스에서 추출한 문화 관련 키워드/구문 목록
+   - culture_keywords_overview.culture_summary_keywords: 문화 개요를 키워드로만 표현 (문장 금지)
+3. 모든 섹션에 evidence 포함 필수:
+   - doc_id: 소스 문서 ID (job_posting, official_site 등)
+   - line_refs: 라인 번호 (불가시 ["unknown"])
+   - quote: 짧은 직접 인용
+
+## 분석 지침
+4. scoring_axes 섹션의 6개 축을 위에서 추출한 사실만으로 평가합니다:
+   - technical_fit_company: 기술 스택, 품질 문화
+   - execution_style_company: 속도 vs 안정성, 프로토타입 vs 구조화
+   - collaboration_style_company: 코드리뷰, 문서화, 크로스펑셔널 협업
+   - ownership_company: 문제 정의, 의사결정, 역할 포지셔닝
+   - growth_orientation_company: 신기술 도입, 자기주도 학습, 피드백 루프
+   - work_expectation_company: 근무 강도, 워라밸, 책임 밀도
+5. 각 축마다 필수 항목:
+   - score: 0-4 정수
+   - summary: 1-2문장 요약
+   - confidence: low|medium|high
+   - evidence: [{{doc_id, line_refs, quote}}] (score > 0일 경우 필수)
+   - subsignals: 세부 신호 점수
+6. extraction_quality: unknown_policy_applied 및 notes
+
+반드시 유효한 JSON 형식으로만 응답하세요."""
+
+# 스키마 파일 참조 (동적 로딩)
+SCHEMA_FILE = "company_schema.json"
+
+# 입력 변수 목록
+INPUT_VARIABLES = ["scraped_content", "output_schema"]
+
+# 프롬프트 메타데이터
+PROMPT_METADATA = {
+    "name": "company_fused_analyze",
+    "version": "1.0.0",
+    "description": "스크래핑 원문 → 컬쳐핏 분석 단일 호출 (collect + analyze 통합)",
+    "author": "AI Team",
+    "last_updated": "2026-10-16",
+}
@@ -142,6 +142,49 @@ HUMAN_MESSAGE_TEMPLATE = """Compare the following company and developer profiles
 Analyze and compare the two profiles according to the rules above.
 Output MUST be valid JSON only. No markdown, no explanations."""
 
+# overall을 로컬 계산할 때 사용 (출력 스키마에서 overall 제외)
+LOCAL_OVERALL_HUMAN_MESSAGE_TEMPLATE = """Compare the following company and developer profiles.
+
+## Company Culture Profile
+{company_profile}
+
+## Developer Profile
+{developer_profile}
+
+## Output JSON Schema
+{output_schema}
+
+Analyze and compare the two profiles according to the rules above.
+Do NOT output the "overall" section; it is computed separately from axis_score values and weights.
+Output MUST be valid JSON only. No markdown, no explanations."""
+
+# 컨텍스트 캐시 사용 시: 회사 프로필 + 스키마는 cached content로, 지원자 프로필만 매 호출 전송
+CACHED_CONTEXT_TEMPLATE = """## Company Culture Profile
+{company_profile}
+
+## Output JSON Schema
+{output_schema}"""
+
+CACHED_HUMAN_MESSAGE_TEMPLATE = """Compare the company culture profile above with the following developer profile.
+
+## Developer Profile
+{developer_profile}
+
+Analyze and compare the two profiles according to the rules above.
+Output MUST be valid JSON only. No markdown, no explanations."""
+
+LOCAL_OVERALL_CACHED_HUMAN_MESSAGE_TEMPLATE = """Compare the company culture profile above with the following developer profile.
+
+## Developer Profile
+{developer_profile}
+
+Analyze and compare the two profiles according to the rules above.
+Do NOT output the "overall" section; it is computed separately from axis_score values and weights.
+Output MUST be valid JSON only. No markdown, no explanations."""
+
+# overall 로컬 계산 시 LLM에 요청하는 matching_schema 경로
+LOCAL_OVERALL_SCHEMA_PATHS = ["schema_version", "meta", "inputs", "axis_alignments"]
+
 # 스키마 파일 참조 (동적 로딩)
 SCHEMA_FILE = "matching_schema.json"
 
@@ -0,0 +1,185 @@
+"""
+컬쳐핏 축별 비교 프롬프트
+
+역할: 회사/구직자 프로필 중 한 축에 해당하는 부분만 비교하여 축별 정합성 산출
+입력: 축 이름 + 회사 프로필 일부 JSON + 구직자 프로필 일부 JSON
+출력: matching_schema.axis_alignments.<axis> 형식 JSON (overall은 로컬 계산)
+
+culture_compare(6축 단일 호출)의 규칙을 축 하나 기준으로 옮긴 버전
+"""
+
+SYSTEM_MESSAGE = """You are an analytical alignment assistant.
+
+You compare ONE alignment axis between two structured JSON excerpts:
+(1) company culture / role profile excerpt
+(2) developer profile excerpt.
+
+The excerpts contain only the fields relevant to the requested axis.
+You are NOT a hiring decision-maker, evaluator, recommender, or culture judge.
+Your role is strictly analytical, descriptive, and evidence-grounded.
+
+────────────────────────
+[Core Rules – MUST FOLLOW]
+
+1. Scope & Evidence
+- Use ONLY what is explicitly present in the two input JSON excerpts.
+- Do NOT use external knowledge.
+- Do NOT infer motivations, personality, intent, or unstated context.
+- If information is insufficient, set status and axis_score to "unknown".
+
+2. Axis Constraint
+- Evaluate ONLY the requested axis. Do NOT comment on other axes.
+
+3. Language Rules (IMPORTANT)
+- summary, rationale and comparison_notes MUST be written in Korean.
+- Evidence quotes MUST preserve the original language exactly as they appear in the input JSON.
+
+4. Evidence Requirement
+- If status is NOT "unknown":
+  - Include at least one evidence reference from the company side AND one from the developer side, if available.
+  - If evidence exists on only one side, explicitly state that in the rationale.
+- Never assign an axis_score > 0 without explicit evidence.
+- evidence_refs.path must be the JSON path inside the given excerpt.
+
+5. No Judgement Language
+- Do NOT conclude "good fit" or "bad fit".
+- Describe alignment patterns only, not hiring suitability.
+
+────────────────────────
+[Explanation & Rationale]
+
+summary: 4–8 sentences in Korean covering company signals, developer signals,
+where they align / partially align / diverge, and missing information.
+
+rationale.company_signals / rationale.developer_signals:
+bullet items, each corresponding to evidence in the input.
+
+rationale.comparison_notes: 5–10 sentences explaining alignment points, gaps,
+unknown limitations, and why the chosen axis_score is appropriate.
+
+────────────────────────
+[Scoring Rules]
+
+axis_score MUST be one of:
+- 100: strong alignment (explicit match on both sides)
+- 75: mostly aligned (minor gaps)
+- 50: mixed / partially aligned
+- 25: mostly mismatched
+- 0: strong mismatch
+- unknown: do not score
+
+status MUST be one of: aligned | partial | mismatch | unknown
+
+────────────────────────
+[Output Constraints]
+
+- Output MUST be ONE valid JSON object for the requested axis only.
+- Use ONLY the predefined schema keys.
+- Do NOT output explanations, markdown, or extra text.
+"""
+
+HUMAN_MESSAGE_TEMPLATE = """Compare the company and developer excerpts on the axis: {axis}
+
+## Company Profile Excerpt
+{company_profile}
+
+## Developer Profile Excerpt
+{developer_profile}
+
+## Output JSON Schema (axis_alignments.{axis})
+{output_schema}
+
+Output MUST be valid JSON only. No markdown, no explanations."""
+
+# 축별로 프롬프트에 넣을 프로필 경로 (select_paths 형식)
+# profile_meta는 모든 축에 공통으로 포함
+AXIS_PROFILE_PATHS = {
+    "technical_fit": {
+        "company": [
+            "company_info_fields.technical_environment",
+            "scoring_axes.technical_fit_company",
+        ],
+        "developer": [
+            "user_info_fields.technical_capability",
+            "user_info_fields.project_behavior_data",
+            "scoring_axes.technical_fit_user",
+        ],
+    },
+    "execution_style": {
+        "company": [
+            "company_info_fields.execution_culture_signals",
+            "scoring_axes.execution_style_company",
+        ],
+        "developer": [
+            "profile_keywords.execution_keywords",
+            "user_info_fields.project_behavior_data",
+            "scoring_axes.execution_style_user",
+        ],
+    },
+    "collaboration_style": {
+        "company": [
+            "company_info_fields.collaboration_culture_signals",
+            "scoring_axes.collaboration_style_company",
+        ],
+        "developer": [
+            "profile_keywords.collaboration_keywords",
+            "user_info_fields.collaboration_experience",
+            "scoring_axes.collaboration_style_user",
+        ],
+    },
+    "growth_learning_orientation": {
+        "company": [
+            "company_info_fields.growth_learning_culture_signals",
+            "scoring_axes.growth_orientation_company",
+        ],
+        "developer": [
+            "profile_keywords.growth_keywords",
+            "user_info_fields.growth_tendency",
+            "scoring_axes.growth_orientation_user",
+        ],
+    },
+    "product_user_impact_orientation": {
+        "company": [
+            "company_info_fields.basic_profile",
+            "company_info_fields.execution_culture_signals",
+            "company_info_fields.ownership_expectation_signals",
+            "scoring_axes.ownership_company",
+        ],
+        "developer": [
+            "profile_keywords.ownership_keywords",
+            "user_info_fields.project_behavior_data",
+            "scoring_axes.ownership_user",
+        ],
+    },
+    "ops_quality_responsibility": {
+        "company": [
+            "company_info_fields.technical_environment",
+            "company_info_fields.ownership_expectation_signals",
+            "company_info_fields.work_environment_expectations",
+            "scoring_axes.work_expectation_company",
+        ],
+        "developer": [
+            "user_info_fields.technical_capability",
+            "user_info_fields.work_environment_signals",
+            "scoring_axes.ownership_user",
+            "scoring_axes.work_expectation_user",
+        ],
+    },
+}
+
+COMMON_PROFILE_PATHS = ["profile_meta"]
+
+# 스키마 파일 참조 (동적 로딩)
+SCHEMA_FILE = "matching_schema.json"
+
+# 입력 변수 목록
+INPUT_VARIABLES = ["axis", "company_profile", "developer_profile", "output_schema"]
+
+# 프롬프트 메타데이터
+PROMPT_METADATA = {
+    "name": "culture_compare_axis",
+    "version": "1.0.0",
+    "description": "회사-구직자 컬쳐핏 축별 비교 (축 단위 병렬 호출, overall은 로컬 계산)",
+    "author": "AI Team",
+    "last_updated": "2026-10-16",
+}
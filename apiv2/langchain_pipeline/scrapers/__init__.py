@@ -4,6 +4,20 @@ from apiv2.langchain_pipeline.scrapers.base_scraper import BaseScraper, ScrapeRe
 from apiv2.langchain_pipeline.scrapers.jina_scraper import JinaScraper
 from apiv2.langchain_pipeline.scrapers.gemini_scraper import GeminiScraper
 from apiv2.langchain_pipeline.scrapers.browser_scraper import BrowserScraper
+from apiv2.langchain_pipeline.scrapers.browser_pool import (
+    BrowserPool,
+    start_browser_pool,
+    close_browser_pool,
+    get_browser_pool,
+)
+from apiv2.langchain_pipeline.scrapers.tiered_scraper import TieredScraper
+from apiv2.langchain_pipeline.scrapers.scrape_cache import (
+    CachedScraper,
+    ScrapeCache,
+    MongoScrapeCacheStore,
+    DiskScrapeCacheStore,
+    get_scrape_cache,
+)
 
 __all__ = [
     "BaseScraper",
@@ -11,4 +25,14 @@ __all__ = [
     "JinaScraper",
     "GeminiScraper",
     "BrowserScraper",
+    "BrowserPool",
+    "start_browser_pool",
+    "close_browser_pool",
+    "get_browser_pool",
+    "TieredScraper",
+    "CachedScraper",
+    "ScrapeCache",
+    "MongoScrapeCacheStore",
+    "DiskScrapeCacheStore",
+    "get_scrape_cache",
 ]
@@ -7,9 +7,11 @@ Strategy 패턴으로 다양한 스크래핑 방식 지원
 - BrowserScraper: Playwright/ChromeDevTools (추후 확장)
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
+from urllib.parse import urlparse
 
 
 @dataclass
@@ -51,6 +53,66 @@ class BaseScraper(ABC):
         """
         pass
 
+    async def scrape_concurrent(
+        self,
+        urls: list[str],
+        per_domain_limit: int = 4,
+        deadline: Optional[float] = None
+    ) -> list[ScrapeResult]:
+        """
+        여러 URL 동시 스크래핑
+
+        도메인별 동시 요청 수를 제한하고, 전체 deadline을 넘기면 남은 작업을 취소한다.
+        결과는 입력 순서대로 반환하며, 취소/실패한 URL은 success=False로 채운다.
+
+        Args:
+            urls: 스크래핑할 URL 리스트
+            per_domain_limit: 도메인별 동시 스크래핑 수
+            deadline: 전체 제한 시간 (초, None이면 무제한)
+
+        Returns:
+            입력 순서와 동일한 스크래핑 결과 리스트
+        """
+        if not urls:
+            return []
+
+        semaphores: dict[str, asyncio.Semaphore] = {}
+
+        async def _scrape_limited(url: str) -> ScrapeResult:
+            domain = urlparse(url).netloc.lower()
+            if domain not in semaphores:
+                semaphores[domain] = asyncio.Semaphore(max(1, per_domain_limit))
+            async with semaphores[domain]:
+                return await self.scrape(url)
+
+        tasks = [asyncio.create_task(_scrape_limited(url)) for url in urls]
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        results = []
+        for url, task in zip(urls, tasks):
+            if task in done and task.exception() is None:
+                results.append(task.result())
+            elif task in done:
+                results.append(ScrapeResult(
+                    url=url,
+                    content="",
+                    success=False,
+                    error_message=str(task.exception()),
+                ))
+            else:
+                results.append(ScrapeResult(
+                    url=url,
+                    content="",
+                    success=False,
+                    error_message=f"전체 제한 시간 초과 ({deadline}초)",
+                ))
+        return results
+
     def validate_url(self, url: str) -> bool:
         """URL 유효성 검사"""
         return url.startswith(("http://", "https://"))
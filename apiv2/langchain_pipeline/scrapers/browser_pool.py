@@ -0,0 +1,298 @@
+"""
+Playwright 브라우저 풀 (앱 단위 공유)
+
+분석 요청마다 Chromium을 띄우고 닫는 대신, FastAPI lifespan에서 브라우저를
+미리 띄워두고 작업(job)마다 격리된 BrowserContext를 발급한다.
+
+- 작업 단위 격리: 쿠키/스토리지가 섞이지 않도록 job마다 새 BrowserContext
+- 헬스체크: 연결이 끊긴 브라우저는 발급 전에 교체
+- 재활용: 브라우저당 N개 페이지를 처리하면 새 브라우저로 교체 (메모리 누수 방지)
+- 동시 페이지 수 제한: 풀 전체에서 열려 있는 페이지 수 상한
+- 메트릭: 풀 크기, 페이지 대기 시간 등 stats()로 노출
+
+사용법:
+    await start_browser_pool()          # lifespan startup
+    pool = get_browser_pool()
+    context = await pool.new_context()
+    async with pool.page(context) as page:
+        await page.goto(url)
+    await pool.release_context(context)
+    await close_browser_pool()          # lifespan shutdown
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+
+from apiv2.langchain_pipeline.config import (
+    BROWSER_POOL_SIZE,
+    BROWSER_MAX_PAGES,
+    BROWSER_RECYCLE_AFTER_PAGES,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _BrowserSlot:
+    """풀에서 관리하는 브라우저 1개"""
+    browser: Browser
+    launched_at: float
+    pages_served: int = 0
+    active_contexts: int = 0
+    retiring: bool = False
+
+
+class BrowserPool:
+    """
+    앱 단위 Playwright 브라우저 풀
+
+    브라우저는 최대 pool_size개까지 띄우고, 활성 컨텍스트가 가장 적은
+    브라우저에 새 컨텍스트를 배정한다.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = BROWSER_POOL_SIZE,
+        max_pages: int = BROWSER_MAX_PAGES,
+        recycle_after_pages: int = BROWSER_RECYCLE_AFTER_PAGES,
+        headless: bool = True,
+    ):
+        """
+        Args:
+            pool_size: 동시에 유지할 브라우저 수
+            max_pages: 풀 전체에서 동시에 열 수 있는 페이지 수
+            recycle_after_pages: 브라우저 1개가 처리할 페이지 수 (초과 시 교체)
+            headless: 헤드리스 모드
+        """
+        self.pool_size = max(1, pool_size)
+        self.max_pages = max(1, max_pages)
+        self.recycle_after_pages = max(1, recycle_after_pages)
+        self.headless = headless
+
+        self._playwright = None
+        self._slots: list[_BrowserSlot] = []
+        self._retiring: list[_BrowserSlot] = []
+        self._context_slots: dict[int, _BrowserSlot] = {}
+        self._lock = asyncio.Lock()
+        self._page_semaphore = asyncio.Semaphore(self.max_pages)
+
+        # 메트릭
+        self._live_pages = 0
+        self._live_contexts = 0
+        self._browsers_launched = 0
+        self._browsers_recycled = 0
+        self._browsers_replaced_unhealthy = 0
+        self._pages_served = 0
+        self._page_wait_count = 0
+        self._page_wait_total = 0.0
+        self._page_wait_max = 0.0
+
+    @property
+    def started(self) -> bool:
+        return self._playwright is not None
+
+    async def start(self):
+        """Playwright 시작 + 브라우저 1개 워밍업"""
+        if self._playwright is not None:
+            return
+        self._playwright = await async_playwright().start()
+        async with self._lock:
+            self._slots.append(await self._launch())
+        logger.info(
+            f"🌐 [BrowserPool] 시작 (pool_size={self.pool_size}, "
+            f"max_pages={self.max_pages}, recycle_after={self.recycle_after_pages})"
+        )
+
+    async def close(self):
+        """모든 브라우저 + Playwright 종료"""
+        async with self._lock:
+            for slot in self._slots + self._retiring:
+                await self._close_browser(slot)
+            self._slots = []
+            self._retiring = []
+            self._context_slots = {}
+            self._live_contexts = 0
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+        logger.info("🌐 [BrowserPool] 종료")
+
+    async def _launch(self) -> _BrowserSlot:
+        """브라우저 1개 실행"""
+        browser = await self._playwright.chromium.launch(headless=self.headless)
+        self._browsers_launched += 1
+        return _BrowserSlot(browser=browser, launched_at=time.monotonic())
+
+    async def _close_browser(self, slot: _BrowserSlot):
+        try:
+            await slot.browser.close()
+        except Exception as e:
+            logger.warning(f"🌐 [BrowserPool] 브라우저 종료 실패: {e}")
+
+    async def _acquire_slot(self) -> _BrowserSlot:
+        """헬스체크 후 컨텍스트를 배정할 브라우저 선택 (lock 보유 상태에서 호출)"""
+        healthy = []
+        for slot in self._slots:
+            if slot.browser.is_connected():
+                healthy.append(slot)
+            else:
+                logger.warning("🌐 [BrowserPool] 연결 끊긴 브라우저 교체")
+                self._browsers_replaced_unhealthy += 1
+                await self._close_browser(slot)
+        self._slots = healthy
+
+        if len(self._slots) < self.pool_size:
+            slot = await self._launch()
+            self._slots.append(slot)
+            return slot
+
+        return min(self._slots, key=lambda s: s.active_contexts)
+
+    async def _retire(self, slot: _BrowserSlot):
+        """재활용 대상 브라우저를 신규 배정에서 제외 (lock 보유 상태에서 호출)"""
+        if slot in self._slots:
+            self._slots.remove(slot)
+            self._retiring.append(slot)
+            self._browsers_recycled += 1
+            logger.info(f"🌐 [BrowserPool] 브라우저 재활용 ({slot.pages_served} pages)")
+        if slot.active_contexts == 0 and slot in self._retiring:
+            self._retiring.remove(slot)
+            await self._close_browser(slot)
+
+    async def new_context(self, **context_kwargs) -> BrowserContext:
+        """
+        작업 단위 격리 컨텍스트 발급
+
+        Returns:
+            BrowserContext: 사용 후 release_context()로 반환해야 함
+        """
+        if not self.started:
+            await self.start()
+
+        async with self._lock:
+            slot = await self._acquire_slot()
+            context = await slot.browser.new_context(**context_kwargs)
+            slot.active_contexts += 1
+            self._context_slots[id(context)] = slot
+            self._live_contexts += 1
+        return context
+
+    async def release_context(self, context: BrowserContext):
+        """컨텍스트 반환 (닫고, 재활용 대상 브라우저면 정리)"""
+        try:
+            await context.close()
+        except Exception as e:
+            logger.debug(f"🌐 [BrowserPool] 컨텍스트 종료 실패: {e}")
+
+        async with self._lock:
+            slot = self._context_slots.pop(id(context), None)
+            # 이미 반환됐거나 close()로 정리된 컨텍스트는 집계하지 않음
+            if slot is None:
+                return
+            self._live_contexts -= 1
+            slot.active_contexts -= 1
+            if slot.retiring:
+                await self._retire(slot)
+
+    @asynccontextmanager
+    async def context(self, **context_kwargs) -> AsyncIterator[BrowserContext]:
+        """new_context/release_context 컨텍스트 매니저 버전"""
+        context = await self.new_context(**context_kwargs)
+        try:
+            yield context
+        finally:
+            await self.release_context(context)
+
+    @asynccontextmanager
+    async def page(self, context: BrowserContext) -> AsyncIterator[Page]:
+        """
+        동시 페이지 수 상한 내에서 페이지 열기
+
+        Args:
+            context: new_context()로 발급받은 컨텍스트
+        """
+        wait_start = time.monotonic()
+        await self._page_semaphore.acquire()
+        waited = time.monotonic() - wait_start
+        self._page_wait_count += 1
+        self._page_wait_total += waited
+        self._page_wait_max = max(self._page_wait_max, waited)
+
+        self._live_pages += 1
+        page: Optional[Page] = None
+        try:
+            page = await context.new_page()
+            self._pages_served += 1
+
+            slot = self._context_slots.get(id(context))
+            if slot is not None:
+                slot.pages_served += 1
+                if not slot.retiring and slot.pages_served >= self.recycle_after_pages:
+                    slot.retiring = True
+                    async with self._lock:
+                        await self._retire(slot)
+
+            yield page
+        finally:
+            if page:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+            self._live_pages -= 1
+            self._page_semaphore.release()
+
+    def stats(self) -> dict:
+        """풀 상태/대기 시간 메트릭"""
+        avg_wait = self._page_wait_total / self._page_wait_count if self._page_wait_count else 0.0
+        return {
+            "started": self.started,
+            "pool_size": self.pool_size,
+            "browsers_active": len(self._slots),
+            "browsers_retiring": len(self._retiring),
+            "browsers_launched": self._browsers_launched,
+            "browsers_recycled": self._browsers_recycled,
+            "browsers_replaced_unhealthy": self._browsers_replaced_unhealthy,
+            "live_contexts": self._live_contexts,
+            "live_pages": self._live_pages,
+            "max_pages": self.max_pages,
+            "pages_served": self._pages_served,
+            "page_wait_count": self._page_wait_count,
+            "page_wait_avg_ms": round(avg_wait * 1000, 1),
+            "page_wait_max_ms": round(self._page_wait_max * 1000, 1),
+        }
+
+
+# ============================================================
+# 앱 단위 싱글톤 (db/mongodb.py의 connect_db/close_db와 동일한 패턴)
+# ============================================================
+
+_browser_pool: Optional[BrowserPool] = None
+
+
+async def start_browser_pool(**kwargs) -> BrowserPool:
+    """앱 시작 시 브라우저 풀 시작"""
+    global _browser_pool
+    if _browser_pool is None:
+        _browser_pool = BrowserPool(**kwargs)
+        await _browser_pool.start()
+    return _browser_pool
+
+
+async def close_browser_pool():
+    """앱 종료 시 브라우저 풀 종료"""
+    global _browser_pool
+    if _browser_pool:
+        await _browser_pool.close()
+        _browser_pool = None
+
+
+def get_browser_pool() -> Optional[BrowserPool]:
+    """현재 브라우저 풀 반환 (lifespan 밖에서는 None)"""
+    return _browser_pool
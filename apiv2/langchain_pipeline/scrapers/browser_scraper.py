@@ -2,15 +2,21 @@
 Playwright 기반 웹 스크래퍼 (헤드리스)
 
 브라우저 창 없이 백그라운드에서 웹페이지 텍스트 추출
+BrowserPool이 주어지면 공유 브라우저에서 작업 단위 컨텍스트를 받아 사용
 """
 
 import asyncio
 import re
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 
-from playwright.async_api import async_playwright, Browser, Page
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
+from apiv2.langchain_pipeline.config import SCRAPE_PER_DOMAIN_CONCURRENCY, SCRAPE_DEADLINE_SECONDS
 from apiv2.langchain_pipeline.scrapers.base_scraper import BaseScraper, ScrapeResult
+from apiv2.langchain_pipeline.scrapers.browser_pool import BrowserPool
+from apiv2.langchain_pipeline.scrapers.page_readiness import wait_for_ready
+from apiv2.langchain_pipeline.scrapers.request_blocker import attach_request_blocker
 
 
 class BrowserScraper(BaseScraper):
@@ -20,27 +26,49 @@ class BrowserScraper(BaseScraper):
     JavaScript 렌더링이 필요한 SPA 페이지도 처리 가능
     """
 
-    def __init__(self, headless: bool = True, timeout: int = 30000):
+    def __init__(
+        self,
+        headless: bool = True,
+        timeout: int = 30000,
+        pool: Optional[BrowserPool] = None,
+        block_resources: bool = True
+    ):
         """
         Args:
             headless: 헤드리스 모드 (기본 True, 브라우저 창 안 뜸)
             timeout: 페이지 로드 타임아웃 (ms)
+            pool: 공유 브라우저 풀 (없으면 스크래퍼가 직접 브라우저 실행)
+            block_resources: 이미지/폰트/분석 스크립트 등 요청 차단 여부
         """
         self.headless = headless
         self.timeout = timeout
+        self.pool = pool
+        self.block_resources = block_resources
         self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
         self._playwright = None
+        # 동시 scrape() 호출 시 브라우저/컨텍스트 중복 생성 방지
+        self._start_lock = asyncio.Lock()
 
     async def start(self):
-        """브라우저 시작"""
-        if self._browser is None:
-            self._playwright = await async_playwright().start()
-            self._browser = await self._playwright.chromium.launch(
-                headless=self.headless
-            )
+        """브라우저 시작 (풀 사용 시 작업 단위 컨텍스트 발급)"""
+        async with self._start_lock:
+            if self.pool is not None:
+                if self._context is None:
+                    self._context = await self.pool.new_context()
+                return
+
+            if self._browser is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=self.headless
+                )
 
     async def close(self):
-        """브라우저 종료"""
+        """브라우저 종료 (풀 사용 시 컨텍스트만 반환)"""
+        if self._context is not None:
+            await self.pool.release_context(self._context)
+            self._context = None
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -48,6 +76,20 @@ class BrowserScraper(BaseScraper):
             await self._playwright.stop()
             self._playwright = None
 
+    @asynccontextmanager
+    async def _open_page(self) -> AsyncIterator[Page]:
+        """페이지 열기 (풀 사용 시 동시 페이지 수 상한 적용)"""
+        if self.pool is not None:
+            async with self.pool.page(self._context) as page:
+                yield page
+            return
+
+        page = await self._browser.new_page()
+        try:
+            yield page
+        finally:
+            await page.close()
+
     async def scrape(self, url: str) -> ScrapeResult:
         """
         단일 URL 스크래핑
@@ -60,41 +102,20 @@ class BrowserScraper(BaseScraper):
         """
         await self.start()
 
-        page: Optional[Page] = None
         try:
-            page = await self._browser.new_page()
-
-            # 페이지 로드 (networkidle 대신 load 사용 - SPA 사이트 타임아웃 방지)
-            await page.goto(url, wait_until="load", timeout=self.timeout)
-
-            # 추가 대기 (동적 콘텐츠 로딩)
-            await asyncio.sleep(2)
-
-            # 본문 텍스트 추출
-            content = await page.evaluate("""
-                () => {
-                    // 불필요한 요소 제거
-                    const selectorsToRemove = [
-                        'script', 'style', 'noscript', 'iframe',
-                        'nav', 'footer', 'header',
-                        '[role="navigation"]', '[role="banner"]',
-                        '.cookie-banner', '.popup', '.modal'
-                    ];
+            async with self._open_page() as page:
+                blocking = await attach_request_blocker(page, url) if self.block_resources else None
+                content, readiness = await self._load_and_extract(page, url)
 
-                    selectorsToRemove.forEach(selector => {
-                        document.querySelectorAll(selector).forEach(el => el.remove());
-                    });
-
-                    return document.body.innerText || '';
-                }
-            """)
-
-            content = self._clean_text(content)
+            metadata = {"readiness": readiness}
+            if blocking is not None:
+                metadata["blocking"] = blocking.to_dict()
 
             return ScrapeResult(
                 url=url,
                 content=content,
                 success=True,
+                metadata=metadata,
             )
 
         except Exception as e:
@@ -105,17 +126,42 @@ class BrowserScraper(BaseScraper):
                 error_message=str(e),
             )
 
-        finally:
-            if page:
-                await page.close()
+    async def _load_and_extract(self, page: Page, url: str) -> tuple[str, dict]:
+        """페이지 로드 후 본문 텍스트 추출 (텍스트, 준비 완료 대기 정보)"""
+        # 페이지 로드 (networkidle 대신 load 사용 - SPA 사이트 타임아웃 방지)
+        await page.goto(url, wait_until="load", timeout=self.timeout)
+
+        # 동적 콘텐츠 로딩 대기 (DOM 정지/텍스트 안정화/셀렉터, 최대 대기 시간 제한)
+        readiness = await wait_for_ready(page, url)
+
+        # 본문 텍스트 추출
+        content = await page.evaluate("""
+            () => {
+                // 불필요한 요소 제거
+                const selectorsToRemove = [
+                    'script', 'style', 'noscript', 'iframe',
+                    'nav', 'footer', 'header',
+                    '[role="navigation"]', '[role="banner"]',
+                    '.cookie-banner', '.popup', '.modal'
+                ];
+
+                selectorsToRemove.forEach(selector => {
+                    document.querySelectorAll(selector).forEach(el => el.remove());
+                });
+
+                return document.body.innerText || '';
+            }
+        """)
+
+        return self._clean_text(content), readiness
 
     async def scrape_multiple(self, urls: list[str]) -> list[ScrapeResult]:
-        """여러 URL 순차 스크래핑"""
-        results = []
-        for url in urls:
-            result = await self.scrape(url)
-            results.append(result)
-        return results
+        """여러 URL 동시 스크래핑 (도메인별 동시 수 제한, 입력 순서 유지)"""
+        return await self.scrape_concurrent(
+            urls,
+            per_domain_limit=SCRAPE_PER_DOMAIN_CONCURRENCY,
+            deadline=SCRAPE_DEADLINE_SECONDS,
+        )
 
     def _clean_text(self, text: str) -> str:
         """텍스트 정리"""
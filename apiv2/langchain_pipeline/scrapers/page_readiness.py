@@ -0,0 +1,192 @@
+"""
+페이지 준비 완료(readiness) 감지
+
+load 이벤트 이후 고정 대기(asyncio.sleep) 대신 페이지 안에서 다음 조건 중
+먼저 만족하는 시점을 준비 완료로 본다.
+
+- selector: 도메인별로 설정된 CSS 셀렉터가 나타남 (config.READY_SELECTORS)
+- dom_quiet: quiet_ms 동안 DOM 변경(MutationObserver)이 없음
+- text_plateau: plateau_ms 동안 본문 텍스트 길이가 변하지 않음
+- hard_cap: 최대 대기 시간 도달
+
+URL별 대기 시간/종료 사유는 ReadinessRecorder에 기록되어 튜닝에 사용한다
+(최근에 기록된 max_urls개 URL만 유지).
+"""
+
+import logging
+import time
+from collections import OrderedDict, defaultdict, deque
+from typing import Optional
+from urllib.parse import urlparse
+
+from playwright.async_api import Page
+
+from apiv2.langchain_pipeline.config import (
+    READY_SELECTORS,
+    READINESS_QUIET_MS,
+    READINESS_PLATEAU_MS,
+    READINESS_HARD_CAP_MS,
+    READINESS_POLL_MS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# 페이지 안에서 실행되는 대기 로직 (Promise 반환 → page.evaluate가 resolve까지 대기)
+READINESS_JS = """
+(opts) => new Promise((resolve) => {
+    const start = performance.now();
+    let lastMutation = start;
+    let mutations = 0;
+    let lastLength = -1;
+    let lastLengthChange = start;
+
+    const observer = new MutationObserver((records) => {
+        mutations += records.length;
+        lastMutation = performance.now();
+    });
+    observer.observe(document.documentElement, {
+        childList: true, subtree: true, characterData: true, attributes: false
+    });
+
+    const finish = (reason) => {
+        observer.disconnect();
+        clearInterval(timer);
+        resolve({
+            reason,
+            elapsed_ms: Math.round(performance.now() - start),
+            text_length: lastLength,
+            mutations,
+        });
+    };
+
+    const timer = setInterval(() => {
+        const now = performance.now();
+        const length = document.body ? document.body.innerText.length : 0;
+        if (length !== lastLength) {
+            lastLength = length;
+            lastLengthChange = now;
+        }
+
+        if (now - start >= opts.hardCapMs) return finish('hard_cap');
+        if (length === 0) return;
+        if (now - lastMutation >= opts.quietMs) return finish('dom_quiet');
+        if (now - lastLengthChange >= opts.plateauMs) return finish('text_plateau');
+    }, opts.pollMs);
+})
+"""
+
+
+class ReadinessRecorder:
+    """URL별 준비 완료 대기 시간 기록 (URL당 최근 N개, 최근 기록된 max_urls개 URL까지)"""
+
+    def __init__(self, max_samples_per_url: int = 50, max_urls: int = 500):
+        self.max_samples_per_url = max_samples_per_url
+        self.max_urls = max_urls
+        # 오래 실행되는 프로세스에서 URL 수만큼 늘어나지 않도록 LRU로 유지
+        self._samples: OrderedDict[str, deque] = OrderedDict()
+
+    def record(self, url: str, readiness: dict):
+        samples = self._samples.get(url)
+        if samples is None:
+            samples = self._samples[url] = deque(maxlen=self.max_samples_per_url)
+            while len(self._samples) > self.max_urls:
+                self._samples.popitem(last=False)
+        else:
+            self._samples.move_to_end(url)
+        samples.append({
+            "reason": readiness.get("reason"),
+            "elapsed_ms": readiness.get("elapsed_ms", 0),
+            "text_length": readiness.get("text_length"),
+        })
+
+    def stats(self) -> dict:
+        """URL별 평균/최대 대기 시간 및 종료 사유 분포"""
+        result = {}
+        for url, samples in self._samples.items():
+            elapsed = sorted(s["elapsed_ms"] for s in samples)
+            reasons: dict[str, int] = defaultdict(int)
+            for s in samples:
+                reasons[s["reason"]] += 1
+            result[url] = {
+                "count": len(elapsed),
+                "avg_ms": round(sum(elapsed) / len(elapsed), 1),
+                "p95_ms": elapsed[min(len(elapsed) - 1, int(len(elapsed) * 0.95))],
+                "max_ms": elapsed[-1],
+                "reasons": dict(reasons),
+            }
+        return result
+
+
+_recorder = ReadinessRecorder()
+
+
+def get_readiness_stats() -> dict:
+    """URL별 준비 완료 대기 시간 메트릭"""
+    return _recorder.stats()
+
+
+def get_ready_selector(url: str) -> Optional[str]:
+    """도메인별 준비 완료 셀렉터 조회 (서브도메인은 상위 도메인 설정 상속)"""
+    host = (urlparse(url).hostname or "").lower()
+    while host:
+        if host in READY_SELECTORS:
+            return READY_SELECTORS[host]
+        if "." not in host:
+            break
+        host = host.split(".", 1)[1]
+    return None
+
+
+async def wait_for_ready(
+    page: Page,
+    url: str,
+    quiet_ms: int = READINESS_QUIET_MS,
+    plateau_ms: int = READINESS_PLATEAU_MS,
+    hard_cap_ms: int = READINESS_HARD_CAP_MS,
+    poll_ms: int = READINESS_POLL_MS,
+) -> dict:
+    """
+    페이지 준비 완료까지 대기
+
+    Args:
+        page: load 이벤트까지 완료된 페이지
+        url: 요청 URL (셀렉터 조회 및 기록용)
+        quiet_ms: DOM 변경이 없어야 하는 시간
+        plateau_ms: 텍스트 길이가 유지되어야 하는 시간
+        hard_cap_ms: 최대 대기 시간
+        poll_ms: 페이지 내 확인 주기
+
+    Returns:
+        {"reason", "elapsed_ms", "text_length", "mutations"}
+    """
+    start = time.monotonic()
+    selector = get_ready_selector(url)
+    readiness: Optional[dict] = None
+
+    if selector:
+        try:
+            await page.wait_for_selector(selector, state="attached", timeout=hard_cap_ms)
+            readiness = {
+                "reason": "selector",
+                "elapsed_ms": round((time.monotonic() - start) * 1000),
+                "selector": selector,
+            }
+        except Exception:
+            logger.debug(f"⏱️ [Readiness] 셀렉터 대기 실패, 휴리스틱으로 전환: {url} ({selector})")
+
+    if readiness is None:
+        remaining_ms = max(0, hard_cap_ms - round((time.monotonic() - start) * 1000))
+        try:
+            readiness = await page.evaluate(READINESS_JS, {
+                "quietMs": quiet_ms,
+                "plateauMs": plateau_ms,
+                "hardCapMs": remaining_ms,
+                "pollMs": poll_ms,
+            })
+        except Exception as e:
+            readiness = {"reason": "error", "error": str(e)}
+        readiness["elapsed_ms"] = round((time.monotonic() - start) * 1000)
+
+    _recorder.record(url, readiness)
+    return readiness
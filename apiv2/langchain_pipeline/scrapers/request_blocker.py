@@ -0,0 +1,139 @@
+"""
+스크래핑 요청 차단 (Playwright route interception)
+
+본문 텍스트(document.body.innerText)만 필요하므로 이미지/폰트/동영상과
+서드파티 분석 스크립트 요청을 페이지 로드 단계에서 차단한다.
+
+- 리소스 타입 차단: config.BLOCKED_RESOURCE_TYPES
+- 서드파티 도메인 차단: config.BLOCKED_DOMAIN_PATTERNS (호스트 suffix 매칭)
+- 도메인별 예외: config.BLOCKING_OVERRIDES (페이지 도메인 기준)
+
+차단된 요청은 실제 크기를 알 수 없으므로 리소스 타입별 평균 크기
+(config.BLOCKED_RESOURCE_AVG_BYTES)로 절감 바이트를 추정한다.
+"""
+
+from dataclasses import dataclass, field, asdict
+from urllib.parse import urlparse
+
+from playwright.async_api import Page, Route, Request, Response
+
+from apiv2.langchain_pipeline.config import (
+    BLOCKED_RESOURCE_TYPES,
+    BLOCKED_DOMAIN_PATTERNS,
+    BLOCKING_OVERRIDES,
+    BLOCKED_RESOURCE_AVG_BYTES,
+)
+
+
+@dataclass
+class BlockingStats:
+    """스크래핑 1회의 요청 차단 통계"""
+    requests_allowed: int = 0
+    requests_blocked: int = 0
+    bytes_loaded: int = 0
+    bytes_saved_estimate: int = 0
+    blocked_by_type: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class BlockingPolicy:
+    """페이지 도메인에 적용되는 차단 정책"""
+    resource_types: frozenset
+    domain_patterns: tuple
+
+    def should_block(self, request: Request) -> bool:
+        if request.resource_type in self.resource_types:
+            return True
+        host = (urlparse(request.url).hostname or "").lower()
+        return any(host == p or host.endswith(f".{p}") for p in self.domain_patterns)
+
+
+def _host_chain(host: str) -> list[str]:
+    """a.b.example.com → [a.b.example.com, b.example.com, example.com, com]"""
+    parts = host.split(".")
+    return [".".join(parts[i:]) for i in range(len(parts))]
+
+
+def get_blocking_policy(url: str) -> BlockingPolicy:
+    """
+    페이지 URL에 맞는 차단 정책 생성
+
+    BLOCKING_OVERRIDES 항목:
+        allow_resource_types: 이 도메인에서는 차단하지 않을 리소스 타입
+        block_resource_types: 추가로 차단할 리소스 타입
+        allow_domains: 이 도메인에서는 차단하지 않을 서드파티 도메인
+        block_domains: 추가로 차단할 서드파티 도메인
+    """
+    resource_types = set(BLOCKED_RESOURCE_TYPES)
+    domain_patterns = set(BLOCKED_DOMAIN_PATTERNS)
+
+    host = (urlparse(url).hostname or "").lower()
+    for candidate in reversed(_host_chain(host)):
+        override = BLOCKING_OVERRIDES.get(candidate)
+        if not override:
+            continue
+        resource_types -= set(override.get("allow_resource_types", []))
+        resource_types |= set(override.get("block_resource_types", []))
+        domain_patterns -= set(override.get("allow_domains", []))
+        domain_patterns |= set(override.get("block_domains", []))
+
+    return BlockingPolicy(
+        resource_types=frozenset(resource_types),
+        domain_patterns=tuple(sorted(domain_patterns)),
+    )
+
+
+# 프로세스 누적 통계
+_totals = BlockingStats()
+
+
+async def attach_request_blocker(page: Page, url: str) -> BlockingStats:
+    """
+    페이지에 요청 차단 라우트 등록
+
+    goto() 전에 호출해야 하며, 반환된 stats는 페이지 로드 동안 갱신된다.
+
+    Args:
+        page: 새로 연 페이지
+        url: 이동할 페이지 URL (도메인별 예외 적용용)
+
+    Returns:
+        BlockingStats: 이 페이지의 차단 통계
+    """
+    policy = get_blocking_policy(url)
+    stats = BlockingStats()
+
+    async def _handle_route(route: Route, request: Request):
+        if policy.should_block(request):
+            resource_type = request.resource_type
+            saved = BLOCKED_RESOURCE_AVG_BYTES.get(resource_type, BLOCKED_RESOURCE_AVG_BYTES.get("other", 0))
+            stats.requests_blocked += 1
+            stats.bytes_saved_estimate += saved
+            stats.blocked_by_type[resource_type] = stats.blocked_by_type.get(resource_type, 0) + 1
+            _totals.requests_blocked += 1
+            _totals.bytes_saved_estimate += saved
+            _totals.blocked_by_type[resource_type] = _totals.blocked_by_type.get(resource_type, 0) + 1
+            await route.abort("blockedbyclient")
+            return
+
+        stats.requests_allowed += 1
+        _totals.requests_allowed += 1
+        await route.continue_()
+
+    def _on_response(response: Response):
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            stats.bytes_loaded += int(length)
+            _totals.bytes_loaded += int(length)
+
+    await page.route("**/*", _handle_route)
+    page.on("response", _on_response)
+    return stats
+
+
+def get_blocking_stats() -> dict:
+    """프로세스 누적 요청 차단 메트릭"""
+    return _totals.to_dict()
@@ -0,0 +1,585 @@
+"""
+스크래핑 결과 캐시
+
+회사 문화/인재상 페이지(config.COMPANY_SOURCES)는 거의 바뀌지 않으므로
+정규화된 URL 기준으로 스크래핑 결과를 저장해두고 재사용한다.
+
+- 저장소: MongoDB (운영) / 로컬 디스크 (개발)
+- TTL: ttl_seconds 이내면 네트워크 없이 캐시 반환
+- stale-while-revalidate: TTL이 지났어도 stale_seconds 이내면 캐시를 즉시 반환하고
+  백그라운드에서 재스크래핑
+- content hash: 재스크래핑 결과가 같으면 본문은 그대로 두고 시각만 갱신
+- 용량 제한: max_entries / max_bytes 초과 시 오래 안 쓴 항목부터 삭제 (LRU)
+  용량 검사는 저장소 전체를 집계하므로 매 쓰기가 아니라 evict_every_writes번 쓰기마다
+  또는 evict_interval_seconds마다 실행 (그 사이에는 한도를 잠시 넘을 수 있음)
+
+사용법:
+    scraper = CachedScraper(BrowserScraper(), cache=get_scrape_cache())
+    result = await scraper.scrape("https://toss.im/career/culture")
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from apiv2.langchain_pipeline.config import (
+    MONGODB_URI,
+    MONGODB_DB_NAME,
+    COLLECTIONS,
+    SCRAPE_CACHE_BACKEND,
+    SCRAPE_CACHE_DIR,
+    SCRAPE_CACHE_TTL_SECONDS,
+    SCRAPE_CACHE_STALE_SECONDS,
+    SCRAPE_CACHE_MAX_ENTRIES,
+    SCRAPE_CACHE_MAX_BYTES,
+    SCRAPE_CACHE_EVICT_EVERY_WRITES,
+    SCRAPE_CACHE_EVICT_INTERVAL_SECONDS,
+)
+from apiv2.langchain_pipeline.scrapers.base_scraper import BaseScraper, ScrapeResult
+
+logger = logging.getLogger(__name__)
+
+# 캐시 키에서 제외할 추적용 쿼리 파라미터
+_TRACKING_PARAMS = ("utm_", "gclid", "fbclid")
+
+
+def normalize_url(url: str) -> str:
+    """
+    캐시 키용 URL 정규화
+
+    - scheme/host 소문자, 기본 포트 제거
+    - fragment 제거, 추적용 쿼리 제거, 쿼리 파라미터 정렬
+    - 경로 끝 슬래시 제거
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and not (
+        (scheme == "http" and parts.port == 80) or (scheme == "https" and parts.port == 443)
+    ):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path.rstrip("/") or "/"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith(_TRACKING_PARAMS)
+    )
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+def content_hash(content: str) -> str:
+    """본문 SHA-256 해시"""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    """캐시 항목"""
+    key: str
+    url: str
+    scraper: str
+    content: str
+    content_hash: str
+    fetched_at: float
+    last_accessed: float
+    size: int = 0
+    metadata: dict = field(default_factory=dict)
+
+    def age(self, now: Optional[float] = None) -> float:
+        return (now or time.time()) - self.fetched_at
+
+
+# ============================================================
+# 저장소
+# ============================================================
+
+class ScrapeCacheStore(ABC):
+    """캐시 저장소 인터페이스"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        pass
+
+    @abstractmethod
+    async def put(self, entry: CacheEntry, expires_at: float):
+        pass
+
+    @abstractmethod
+    async def touch(self, key: str, fetched_at: Optional[float] = None):
+        """last_accessed 갱신 (fetched_at 주면 함께 갱신)"""
+        pass
+
+    @abstractmethod
+    async def evict(self, max_entries: int, max_bytes: int) -> int:
+        """용량 초과분을 LRU 순서로 삭제하고 삭제 수 반환"""
+        pass
+
+
+class MongoScrapeCacheStore(ScrapeCacheStore):
+    """MongoDB 저장소 (expires_at TTL 인덱스로 만료 항목 자동 삭제)"""
+
+    def __init__(self, uri: str = MONGODB_URI, db_name: str = MONGODB_DB_NAME):
+        self.uri = uri
+        self.db_name = db_name
+        self._collection = None
+        self._indexes_ready = False
+
+    def _get_collection(self):
+        if self._collection is None:
+            from motor.motor_asyncio import AsyncIOMotorClient
+
+            client = AsyncIOMotorClient(self.uri)
+            self._collection = client[self.db_name][COLLECTIONS["scrape_cache"]]
+        return self._collection
+
+    async def _ensure_indexes(self):
+        if self._indexes_ready:
+            return
+        collection = self._get_collection()
+        await collection.create_index("expires_at", expireAfterSeconds=0)
+        await collection.create_index("last_accessed")
+        self._indexes_ready = True
+
+    @staticmethod
+    def _to_datetime(ts: float) -> datetime:
+        return datetime.fromtimestamp(ts, tz=timezone.utc)
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        doc = await self._get_collection().find_one({"_id": key})
+        if not doc:
+            return None
+        return CacheEntry(
+            key=doc["_id"],
+            url=doc["url"],
+            scraper=doc["scraper"],
+            content=doc["content"],
+            content_hash=doc["content_hash"],
+            fetched_at=doc["fetched_at"].replace(tzinfo=timezone.utc).timestamp(),
+            last_accessed=doc["last_accessed"].replace(tzinfo=timezone.utc).timestamp(),
+            size=doc.get("size", 0),
+            metadata=doc.get("metadata") or {},
+        )
+
+    async def put(self, entry: CacheEntry, expires_at: float):
+        await self._ensure_indexes()
+        doc = asdict(entry)
+        doc["_id"] = doc.pop("key")
+        doc["fetched_at"] = self._to_datetime(entry.fetched_at)
+        doc["last_accessed"] = self._to_datetime(entry.last_accessed)
+        doc["expires_at"] = self._to_datetime(expires_at)
+        await self._get_collection().replace_one({"_id": doc["_id"]}, doc, upsert=True)
+
+    async def touch(self, key: str, fetched_at: Optional[float] = None):
+        update = {"last_accessed": self._to_datetime(time.time())}
+        if fetched_at is not None:
+            update["fetched_at"] = self._to_datetime(fetched_at)
+        await self._get_collection().update_one({"_id": key}, {"$set": update})
+
+    async def evict(self, max_entries: int, max_bytes: int) -> int:
+        collection = self._get_collection()
+        total_count = 0
+        total_bytes = 0
+        async for doc in collection.aggregate([
+            {"$group": {"_id": None, "count": {"$sum": 1}, "bytes": {"$sum": "$size"}}}
+        ]):
+            total_count = doc["count"]
+            total_bytes = doc["bytes"]
+
+        if total_count <= max_entries and total_bytes <= max_bytes:
+            return 0
+
+        evicted_keys = []
+        cursor = collection.find({}, {"size": 1}).sort("last_accessed", 1)
+        async for doc in cursor:
+            if total_count <= max_entries and total_bytes <= max_bytes:
+                break
+            evicted_keys.append(doc["_id"])
+            total_count -= 1
+            total_bytes -= doc.get("size", 0)
+
+        if evicted_keys:
+            await collection.delete_many({"_id": {"$in": evicted_keys}})
+        return len(evicted_keys)
+
+
+class DiskScrapeCacheStore(ScrapeCacheStore):
+    """로컬 디스크 저장소 (개발용, 키당 JSON 파일 1개)"""
+
+    def __init__(self, cache_dir: str = SCRAPE_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def _read(self, path: Path) -> Optional[dict]:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _write(self, path: Path, doc: dict):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(doc, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(path)
+
+    def _get_sync(self, key: str) -> Optional[CacheEntry]:
+        path = self._path(key)
+        doc = self._read(path)
+        if doc is None:
+            return None
+        if doc.get("expires_at", 0) < time.time():
+            path.unlink(missing_ok=True)
+            return None
+        doc.pop("expires_at", None)
+        return CacheEntry(**doc)
+
+    def _touch_sync(self, key: str, fetched_at: Optional[float]):
+        path = self._path(key)
+        doc = self._read(path)
+        if doc is None:
+            return
+        doc["last_accessed"] = time.time()
+        if fetched_at is not None:
+            doc["fetched_at"] = fetched_at
+        self._write(path, doc)
+
+    def _evict_sync(self, max_entries: int, max_bytes: int) -> int:
+        if not self.cache_dir.exists():
+            return 0
+        items = []
+        for path in self.cache_dir.glob("*.json"):
+            doc = self._read(path)
+            if doc is None:
+                continue
+            items.append((doc.get("last_accessed", 0), doc.get("size", 0), path))
+
+        total_count = len(items)
+        total_bytes = sum(size for _, size, _ in items)
+        evicted = 0
+        for _, size, path in sorted(items, key=lambda item: item[0]):
+            if total_count <= max_entries and total_bytes <= max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_count -= 1
+            total_bytes -= size
+            evicted += 1
+        return evicted
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        return await asyncio.to_thread(self._get_sync, key)
+
+    async def put(self, entry: CacheEntry, expires_at: float):
+        doc = asdict(entry)
+        doc["expires_at"] = expires_at
+        await asyncio.to_thread(self._write, self._path(entry.key), doc)
+
+    async def touch(self, key: str, fetched_at: Optional[float] = None):
+        await asyncio.to_thread(self._touch_sync, key, fetched_at)
+
+    async def evict(self, max_entries: int, max_bytes: int) -> int:
+        return await asyncio.to_thread(self._evict_sync, max_entries, max_bytes)
+
+
+# ============================================================
+# 캐시 정책
+# ============================================================
+
+class ScrapeCache:
+    """TTL / stale-while-revalidate / 용량 제한 정책"""
+
+    def __init__(
+        self,
+        store: ScrapeCacheStore,
+        ttl_seconds: float = SCRAPE_CACHE_TTL_SECONDS,
+        stale_seconds: float = SCRAPE_CACHE_STALE_SECONDS,
+        max_entries: int = SCRAPE_CACHE_MAX_ENTRIES,
+        max_bytes: int = SCRAPE_CACHE_MAX_BYTES,
+        evict_every_writes: int = SCRAPE_CACHE_EVICT_EVERY_WRITES,
+        evict_interval_seconds: float = SCRAPE_CACHE_EVICT_INTERVAL_SECONDS,
+    ):
+        """
+        Args:
+            store: 캐시 저장소
+            ttl_seconds: 신선(fresh) 유지 시간
+            stale_seconds: TTL 이후 stale 응답을 허용하는 추가 시간 (0이면 SWR 비활성)
+            max_entries: 최대 항목 수
+            max_bytes: 최대 본문 바이트 합계
+            evict_every_writes: 용량 검사 간격 (새 항목 쓰기 수, 1이면 매번)
+            evict_interval_seconds: 용량 검사 최대 간격 (초)
+        """
+        self.store = store
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.evict_every_writes = max(1, evict_every_writes)
+        self.evict_interval_seconds = evict_interval_seconds
+        self._writes_since_evict = 0
+        self._last_evict = 0.0
+
+        self._stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "unchanged_refreshes": 0,
+            "evictions": 0,
+            "errors": 0,
+        }
+
+    @staticmethod
+    def make_key(scraper_name: str, url: str) -> str:
+        """스크래퍼 종류 + 정규화 URL 캐시 키"""
+        return f"{scraper_name}:{normalize_url(url)}"
+
+    async def lookup(self, key: str) -> tuple[Optional[CacheEntry], str]:
+        """
+        캐시 조회
+
+        Returns:
+            (항목, 상태) - 상태: "fresh" | "stale" | "miss"
+        """
+        try:
+            entry = await self.store.get(key)
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"🗄️ [ScrapeCache] 조회 실패: {e}")
+            return None, "miss"
+
+        if entry is None:
+            self._stats["misses"] += 1
+            return None, "miss"
+
+        age = entry.age()
+        if age <= self.ttl_seconds:
+            state = "fresh"
+            self._stats["hits"] += 1
+        elif age <= self.ttl_seconds + self.stale_seconds:
+            state = "stale"
+            self._stats["stale_hits"] += 1
+        else:
+            self._stats["misses"] += 1
+            return None, "miss"
+
+        try:
+            await self.store.touch(key)
+        except Exception:
+            pass
+        return entry, state
+
+    async def store_result(self, key: str, scraper_name: str, result: ScrapeResult):
+        """성공한 스크래핑 결과 저장 (본문 해시가 같으면 시각만 갱신)"""
+        if not result.success:
+            return
+
+        now = time.time()
+        new_hash = content_hash(result.content)
+        try:
+            existing = await self.store.get(key)
+            if existing is not None and existing.content_hash == new_hash:
+                self._stats["unchanged_refreshes"] += 1
+                await self.store.put(
+                    CacheEntry(**{**asdict(existing), "fetched_at": now, "last_accessed": now}),
+                    expires_at=now + self.ttl_seconds + self.stale_seconds,
+                )
+                return
+
+            entry = CacheEntry(
+                key=key,
+                url=result.url,
+                scraper=scraper_name,
+                content=result.content,
+                content_hash=new_hash,
+                fetched_at=now,
+                last_accessed=now,
+                size=len(result.content.encode("utf-8")),
+                metadata=result.metadata or {},
+            )
+            await self.store.put(entry, expires_at=now + self.ttl_seconds + self.stale_seconds)
+            self._stats["writes"] += 1
+            await self._maybe_evict(now)
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"🗄️ [ScrapeCache] 저장 실패: {e}")
+
+    async def _maybe_evict(self, now: float):
+        """N번 쓰기마다 또는 interval마다 용량 검사 (첫 쓰기는 항상 검사)"""
+        self._writes_since_evict += 1
+        if (
+            self._writes_since_evict < self.evict_every_writes
+            and now - self._last_evict < self.evict_interval_seconds
+        ):
+            return
+        self._writes_since_evict = 0
+        self._last_evict = now
+        self._stats["evictions"] += await self.store.evict(self.max_entries, self.max_bytes)
+
+    def stats(self) -> dict:
+        """캐시 히트/미스 메트릭"""
+        return {
+            "backend": type(self.store).__name__,
+            "ttl_seconds": self.ttl_seconds,
+            "stale_seconds": self.stale_seconds,
+            **self._stats,
+        }
+
+
+class CachedScraper(BaseScraper):
+    """
+    캐시 래퍼 스크래퍼
+
+    BrowserScraper / JinaScraper / GeminiScraper 어느 것이든 감싸서 사용.
+    캐시 키에 스크래퍼 종류가 포함되므로 스크래퍼별 결과가 섞이지 않는다.
+    """
+
+    def __init__(self, scraper: BaseScraper, cache: Optional[ScrapeCache]):
+        """
+        Args:
+            scraper: 실제 스크래퍼
+            cache: 스크래핑 캐시 (None이면 캐시 없이 그대로 위임)
+        """
+        self.scraper = scraper
+        self.cache = cache
+        self.scraper_name = type(scraper).__name__
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
+
+    def _from_entry(self, entry: CacheEntry, state: str) -> ScrapeResult:
+        return ScrapeResult(
+            url=entry.url,
+            content=entry.content,
+            success=True,
+            metadata={
+                **(entry.metadata or {}),
+                "cache": state,
+                "content_hash": entry.content_hash,
+                "cache_age_seconds": round(entry.age(), 1),
+            },
+        )
+
+    async def _fetch_and_store(self, key: str, url: str) -> ScrapeResult:
+        result = await self.scraper.scrape(url)
+        await self.cache.store_result(key, self.scraper_name, result)
+        if result.success:
+            result.metadata = {
+                **(result.metadata or {}),
+                "cache": "miss",
+                "content_hash": content_hash(result.content),
+            }
+        return result
+
+    def _schedule_refresh(self, key: str, url: str):
+        """stale 항목 백그라운드 재검증 (같은 키는 한 번만)"""
+        if key in self._refresh_tasks:
+            return
+        task = asyncio.create_task(self._fetch_and_store(key, url))
+        self._refresh_tasks[key] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(key, None))
+
+    async def scrape(self, url: str) -> ScrapeResult:
+        if self.cache is None:
+            return await self.scraper.scrape(url)
+
+        key = ScrapeCache.make_key(self.scraper_name, url)
+        entry, state = await self.cache.lookup(key)
+
+        if state == "fresh":
+            return self._from_entry(entry, state)
+        if state == "stale":
+            self._schedule_refresh(key, url)
+            return self._from_entry(entry, state)
+
+        return await self._fetch_and_store(key, url)
+
+    async def scrape_multiple(self, urls: list[str]) -> list[ScrapeResult]:
+        """캐시 히트는 바로 반환하고, 미스만 내부 스크래퍼로 한 번에 스크래핑"""
+        if self.cache is None:
+            return await self.scraper.scrape_multiple(urls)
+
+        results: list[Optional[ScrapeResult]] = [None] * len(urls)
+        miss_indices = []
+
+        for i, url in enumerate(urls):
+            key = ScrapeCache.make_key(self.scraper_name, url)
+            entry, state = await self.cache.lookup(key)
+            if state == "miss":
+                miss_indices.append(i)
+                continue
+            if state == "stale":
+                self._schedule_refresh(key, url)
+            results[i] = self._from_entry(entry, state)
+
+        if miss_indices:
+            fetched = await self.scraper.scrape_multiple([urls[i] for i in miss_indices])
+            for i, result in zip(miss_indices, fetched):
+                await self.cache.store_result(
+                    ScrapeCache.make_key(self.scraper_name, urls[i]), self.scraper_name, result
+                )
+                if result.success:
+                    result.metadata = {
+                        **(result.metadata or {}),
+                        "cache": "miss",
+                        "content_hash": content_hash(result.content),
+                    }
+                results[i] = result
+
+        return results
+
+    async def _close_after_refresh(self, tasks: list[asyncio.Task]):
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._close_inner()
+
+    async def _close_inner(self):
+        close = getattr(self.scraper, "close", None)
+        if close is not None:
+            await close()
+
+    async def close(self):
+        """
+        내부 스크래퍼 종료
+
+        백그라운드 재검증이 진행 중이면 호출자를 기다리게 하지 않고,
+        재검증이 끝난 뒤 종료하도록 예약한다.
+        """
+        pending = list(self._refresh_tasks.values())
+        if pending:
+            task = asyncio.create_task(self._close_after_refresh(pending))
+            _background_closes.add(task)
+            task.add_done_callback(_background_closes.discard)
+            return
+        await self._close_inner()
+
+
+# 백그라운드 종료 태스크 참조 유지 (GC로 인한 취소 방지)
+_background_closes: set[asyncio.Task] = set()
+
+
+# ============================================================
+# 앱 단위 싱글톤
+# ============================================================
+
+_scrape_cache: Optional[ScrapeCache] = None
+
+
+def get_scrape_cache() -> Optional[ScrapeCache]:
+    """
+    설정(SCRAPE_CACHE_BACKEND)에 맞는 스크래핑 캐시 반환
+
+    Returns:
+        ScrapeCache 또는 None (backend가 "none"인 경우)
+    """
+    global _scrape_cache
+    if _scrape_cache is None:
+        if SCRAPE_CACHE_BACKEND == "mongo":
+            _scrape_cache = ScrapeCache(MongoScrapeCacheStore())
+        elif SCRAPE_CACHE_BACKEND == "disk":
+            _scrape_cache = ScrapeCache(DiskScrapeCacheStore())
+    return _scrape_cache
@@ -0,0 +1,278 @@
+"""
+HTTP 우선 + 헤드리스 브라우저 폴백 스크래퍼
+
+서버 렌더링 페이지는 브라우저 없이 HTTP GET + HTML 텍스트 추출로 충분하므로
+1단계로 공유 httpx.AsyncClient를 사용하고, 다음 경우에만 Playwright로 넘어간다.
+
+- 추출 텍스트가 min_text_length 미만
+- 빈 SPA 껍데기로 보이는 HTML (<div id="root"></div>, "enable JavaScript" 등)
+- HTML이 아닌 응답 / HTTP 오류
+
+도메인별 통계를 유지해서 거의 항상 브라우저가 필요한 도메인은 1단계를 건너뛴다.
+(주기적으로 다시 1단계를 시도해서 페이지가 SSR로 바뀐 경우를 반영)
+"""
+
+import logging
+import re
+from collections import OrderedDict
+from html.parser import HTMLParser
+from typing import Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from apiv2.langchain_pipeline.config import (
+    SCRAPE_PER_DOMAIN_CONCURRENCY,
+    SCRAPE_DEADLINE_SECONDS,
+    HTTP_FETCH_TIMEOUT_SECONDS,
+    HTTP_FETCH_MIN_TEXT_LENGTH,
+    TIER_SKIP_MIN_SAMPLES,
+    TIER_SKIP_ESCALATION_RATIO,
+    TIER_REPROBE_EVERY,
+)
+from apiv2.langchain_pipeline.scrapers.base_scraper import BaseScraper, ScrapeResult
+from apiv2.langchain_pipeline.scrapers.browser_scraper import BrowserScraper
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# HTML → 텍스트
+# ============================================================
+
+# BrowserScraper의 selectorsToRemove와 같은 기준으로 제외
+_SKIP_TAGS = {
+    "script", "style", "noscript", "iframe", "template", "svg",
+    "nav", "footer", "header", "head",
+}
+_BLOCK_TAGS = {
+    "p", "div", "section", "article", "main", "aside", "li", "ul", "ol",
+    "h1", "h2", "h3", "h4", "h5", "h6", "br", "tr", "table", "dd", "dt",
+    "blockquote", "pre", "figcaption",
+}
+
+_SPA_SHELL_PATTERNS = [
+    re.compile(r'<div[^>]+id=["\'](root|app|__nuxt|__next|svelte)["\'][^>]*>\s*</div>', re.IGNORECASE),
+    re.compile(r'enable\s+javascript', re.IGNORECASE),
+    re.compile(r'자바스크립트를\s*활성화'),
+]
+
+
+class _TextExtractor(HTMLParser):
+    """innerText와 비슷한 줄 단위 텍스트 추출기"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if self._skip_depth == 0:
+            self.parts.append(data)
+
+
+def html_to_text(html: str) -> str:
+    """HTML에서 본문 텍스트 추출 (정리 전 원문)"""
+    extractor = _TextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return "".join(extractor.parts)
+
+
+def looks_like_spa_shell(html: str, text: str, min_text_length: int) -> bool:
+    """빈 SPA 껍데기 여부 (본문이 짧고 마운트 포인트만 있는 HTML)"""
+    if len(text) >= min_text_length * 3:
+        return False
+    return any(p.search(html) for p in _SPA_SHELL_PATTERNS)
+
+
+# ============================================================
+# 공유 HTTP 클라이언트
+# ============================================================
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """커넥션 풀을 공유하는 httpx 클라이언트 (지연 생성)"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=HTTP_FETCH_TIMEOUT_SECONDS,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            headers={
+                "User-Agent": (
+                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+                    "(KHTML, like Gecko) Chrome/131.0 Safari/537.36"
+                ),
+                "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+            },
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """앱 종료 시 HTTP 클라이언트 종료"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+# ============================================================
+# 도메인별 단계 통계
+# ============================================================
+
+class DomainTierStats:
+    """도메인별 HTTP 성공/브라우저 전환 통계 (최근 기록된 max_domains개 도메인까지)"""
+
+    def __init__(self, max_domains: int = 1000):
+        self.max_domains = max_domains
+        # 채용공고 URL은 어떤 도메인이든 올 수 있으므로 LRU로 유지
+        self._stats: OrderedDict[str, dict[str, int]] = OrderedDict()
+
+    def record(self, domain: str, outcome: str):
+        stats = self._stats.get(domain)
+        if stats is None:
+            stats = self._stats[domain] = {"http_ok": 0, "escalated": 0, "skipped_http": 0}
+            while len(self._stats) > self.max_domains:
+                self._stats.popitem(last=False)
+        else:
+            self._stats.move_to_end(domain)
+        stats[outcome] += 1
+
+    def should_skip_http(self, domain: str) -> bool:
+        """브라우저 전환 비율이 높은 도메인이면 HTTP 단계 생략 (주기적 재시도)"""
+        stats = self._stats.get(domain)
+        if stats is None:
+            return False
+        attempts = stats["http_ok"] + stats["escalated"]
+        if attempts < TIER_SKIP_MIN_SAMPLES:
+            return False
+        if stats["escalated"] / attempts < TIER_SKIP_ESCALATION_RATIO:
+            return False
+        # N번에 한 번은 HTTP 단계를 다시 시도
+        return (stats["skipped_http"] + 1) % TIER_REPROBE_EVERY != 0
+
+    def snapshot(self) -> dict:
+        return {domain: dict(stats) for domain, stats in self._stats.items()}
+
+
+_domain_stats = DomainTierStats()
+
+
+def get_tier_stats() -> dict:
+    """도메인별 단계 통계 메트릭"""
+    return _domain_stats.snapshot()
+
+
+# ============================================================
+# 스크래퍼
+# ============================================================
+
+class TieredScraper(BaseScraper):
+    """HTTP 우선, 필요 시 BrowserScraper로 폴백하는 스크래퍼"""
+
+    def __init__(
+        self,
+        browser_scraper: BrowserScraper,
+        min_text_length: int = HTTP_FETCH_MIN_TEXT_LENGTH,
+    ):
+        """
+        Args:
+            browser_scraper: 폴백용 브라우저 스크래퍼
+            min_text_length: HTTP 단계 결과로 인정할 최소 텍스트 길이
+        """
+        self.browser = browser_scraper
+        self.min_text_length = min_text_length
+
+    async def _http_scrape(self, url: str) -> tuple[Optional[str], str]:
+        """
+        HTTP 단계 스크래핑
+
+        Returns:
+            (텍스트, 사유) - 텍스트가 None이면 브라우저 전환 필요
+        """
+        try:
+            response = await get_http_client().get(url)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            return None, f"http_{e.response.status_code}"
+        except Exception as e:
+            return None, f"http_error: {type(e).__name__}"
+
+        content_type = response.headers.get("content-type", "")
+        if "html" not in content_type:
+            return None, f"non_html: {content_type}"
+
+        html = response.text
+        text = self.browser._clean_text(html_to_text(html))
+
+        if len(text) < self.min_text_length:
+            return None, f"short_text: {len(text)}"
+        if looks_like_spa_shell(html, text, self.min_text_length):
+            return None, "spa_shell"
+        return text, "ok"
+
+    async def scrape(self, url: str) -> ScrapeResult:
+        if not self.validate_url(url):
+            return ScrapeResult(
+                url=url,
+                content="",
+                success=False,
+                error_message="유효하지 않은 URL입니다."
+            )
+
+        domain = (urlparse(url).hostname or "").lower()
+
+        if _domain_stats.should_skip_http(domain):
+            _domain_stats.record(domain, "skipped_http")
+            result = await self.browser.scrape(url)
+            result.metadata = {**(result.metadata or {}), "tier": "browser", "escalation": "domain_skip"}
+            return result
+
+        text, reason = await self._http_scrape(url)
+        if text is not None:
+            _domain_stats.record(domain, "http_ok")
+            return ScrapeResult(
+                url=url,
+                content=text,
+                success=True,
+                metadata={"tier": "http", "content_length": len(text)},
+            )
+
+        _domain_stats.record(domain, "escalated")
+        logger.debug(f"🌐 [Tiered] 브라우저 전환: {url} ({reason})")
+        result = await self.browser.scrape(url)
+        result.metadata = {**(result.metadata or {}), "tier": "browser", "escalation": reason}
+        return result
+
+    async def scrape_multiple(self, urls: list[str]) -> list[ScrapeResult]:
+        """여러 URL 동시 스크래핑 (BrowserScraper와 동일한 동시성/제한 시간)"""
+        return await self.scrape_concurrent(
+            urls,
+            per_domain_limit=SCRAPE_PER_DOMAIN_CONCURRENCY,
+            deadline=SCRAPE_DEADLINE_SECONDS,
+        )
+
+    async def close(self):
+        """브라우저 스크래퍼 종료 (HTTP 클라이언트는 앱 단위로 공유되므로 유지)"""
+        await self.browser.close()
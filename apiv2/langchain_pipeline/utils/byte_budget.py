@@ -0,0 +1,97 @@
+"""
+PDF 전송 메모리 한도 (바이트 단위 세마포어)
+
+S3 → Gemini 전송 중 메모리에 올라가 있는 PDF 바이트 총량을 PDF_MEMORY_BUDGET_BYTES로 제한한다.
+- 메모리 경로(작은 PDF): 파일 크기만큼 예약
+- 스트리밍/임시 파일 경로(큰 PDF): 청크 크기만큼만 예약
+- 한도보다 큰 예약은 한도 전체로 잘라서 단독 실행 (영원히 기다리지 않도록)
+- 사전 분석에서 받아 둔 바이트: acquire로 예약하고 업로드가 끝나면 release (async with 블록을 넘어 유지)
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from apiv2.langchain_pipeline.config import PDF_MEMORY_BUDGET_BYTES
+
+
+class ByteBudget:
+    """동시에 예약할 수 있는 바이트 총량 제한"""
+
+    def __init__(self, limit_bytes: int):
+        """
+        Args:
+            limit_bytes: 동시에 메모리에 둘 수 있는 최대 바이트
+        """
+        self.limit_bytes = limit_bytes
+        self._in_use = 0
+        self._condition = asyncio.Condition()
+        self._stats = {
+            "reservations": 0,
+            "waits": 0,
+            "peak_bytes": 0,
+        }
+
+    async def acquire(self, num_bytes: int) -> int:
+        """
+        num_bytes만큼 예약 (한도를 넘으면 다른 전송이 끝날 때까지 대기, release로 반환)
+
+        Returns:
+            실제 예약한 바이트 (release에 그대로 넘김)
+        """
+        num_bytes = min(max(num_bytes, 0), self.limit_bytes)
+        async with self._condition:
+            if self._in_use + num_bytes > self.limit_bytes:
+                self._stats["waits"] += 1
+                await self._condition.wait_for(lambda: self._in_use + num_bytes <= self.limit_bytes)
+            self._in_use += num_bytes
+            self._stats["reservations"] += 1
+            self._stats["peak_bytes"] = max(self._stats["peak_bytes"], self._in_use)
+        return num_bytes
+
+    async def release(self, num_bytes: int) -> None:
+        """acquire로 예약한 바이트 반환"""
+        async with self._condition:
+            self._in_use -= num_bytes
+            self._condition.notify_all()
+
+    @asynccontextmanager
+    async def reserve(self, num_bytes: int):
+        """
+        num_bytes만큼 예약 (한도를 넘으면 다른 전송이 끝날 때까지 대기)
+
+        Yields:
+            실제 예약한 바이트
+        """
+        num_bytes = await self.acquire(num_bytes)
+        try:
+            yield num_bytes
+        finally:
+            await self.release(num_bytes)
+
+    def stats(self) -> dict:
+        return {
+            **self._stats,
+            "limit_bytes": self.limit_bytes,
+            "in_use_bytes": self._in_use,
+        }
+
+
+# ============================================================
+# 싱글톤
+# ============================================================
+
+_pdf_byte_budget: Optional[ByteBudget] = None
+
+
+def get_pdf_byte_budget() -> ByteBudget:
+    """S3 PDF 전송 공용 메모리 한도"""
+    global _pdf_byte_budget
+    if _pdf_byte_budget is None:
+        _pdf_byte_budget = ByteBudget(PDF_MEMORY_BUDGET_BYTES)
+    return _pdf_byte_budget
+
+
+def get_pdf_byte_budget_stats() -> Optional[dict]:
+    """PDF 전송 메모리 메트릭"""
+    return _pdf_byte_budget.stats() if _pdf_byte_budget else None
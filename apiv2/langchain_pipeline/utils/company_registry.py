@@ -0,0 +1,286 @@
+"""
+회사 레지스트리 (MongoDB + 핫 리로드)
+
+지원 회사 목록(키워드/참고 URL/채용 도메인)을 company_registry 컬렉션에서 읽어
+컴파일된 매처로 보관한다. config.py의 COMPANY_KEYWORDS/COMPANY_SOURCES/
+COMPANY_DOMAINS는 초기 시드 및 DB를 쓸 수 없을 때의 기본값으로만 사용한다.
+
+문서 형식:
+    {
+        "name": "토스",
+        "keywords": ["토스", "toss", ...],
+        "sources": ["https://toss.im/career/culture", ...],
+        "domains": ["toss.im", ...],
+        "priority": 2,          # 여러 회사가 매칭되면 낮은 값 우선
+        "analysis_mode": "fused",  # 선택, two_stage | fused (없으면 기본값)
+        "enabled": true,
+        "updated_at": datetime
+    }
+
+핫 리로드: COMPANY_REGISTRY_RELOAD_SECONDS마다 (문서 수, 최신 updated_at)을
+확인해서 바뀐 경우에만 다시 읽고 새 레지스트리로 교체한다.
+(change stream은 replica set이 필요하므로 폴링 사용)
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+from apiv2.langchain_pipeline.config import (
+    MONGODB_URI,
+    MONGODB_DB_NAME,
+    COLLECTIONS,
+    COMPANY_KEYWORDS,
+    COMPANY_SOURCES,
+    COMPANY_DOMAINS,
+    COMPANY_REGISTRY_RELOAD_SECONDS,
+)
+from apiv2.langchain_pipeline.utils.keyword_matcher import KeywordAutomaton
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CompanyEntry:
+    """레지스트리 항목"""
+    name: str
+    keywords: list[str] = field(default_factory=list)
+    sources: list[str] = field(default_factory=list)
+    domains: list[str] = field(default_factory=list)
+    priority: int = 0
+    analysis_mode: Optional[str] = None
+
+
+class CompanyRegistry:
+    """컴파일된 회사 매처 (불변, 리로드 시 통째로 교체)"""
+
+    def __init__(self, entries: list[CompanyEntry], source: str = "config"):
+        """
+        Args:
+            entries: 회사 항목 목록
+            source: 출처 ("config" 또는 "mongo")
+        """
+        self.entries = sorted(entries, key=lambda e: e.priority)
+        self.source = source
+        self.loaded_at = datetime.utcnow().isoformat()
+        self._by_name = {e.name: e for e in self.entries}
+
+        start = time.perf_counter()
+        self._automaton = KeywordAutomaton()
+        for rank, entry in enumerate(self.entries):
+            for keyword in entry.keywords:
+                self._automaton.add(keyword, rank)
+        self._automaton.build()
+        self.build_ms = round((time.perf_counter() - start) * 1000, 2)
+
+        self._domains: dict[str, str] = {}
+        for entry in self.entries:
+            for domain in entry.domains:
+                self._domains.setdefault(domain.lower(), entry.name)
+
+    @classmethod
+    def from_config(cls) -> "CompanyRegistry":
+        """config.py 기본값으로 생성 (dict 순서 = 우선순위)"""
+        names = list(dict.fromkeys([*COMPANY_KEYWORDS, *COMPANY_SOURCES, *COMPANY_DOMAINS]))
+        entries = [
+            CompanyEntry(
+                name=name,
+                keywords=COMPANY_KEYWORDS.get(name, []),
+                sources=COMPANY_SOURCES.get(name, []),
+                domains=COMPANY_DOMAINS.get(name, []),
+                priority=i,
+            )
+            for i, name in enumerate(names)
+        ]
+        return cls(entries, source="config")
+
+    @classmethod
+    def from_documents(cls, docs: list[dict[str, Any]]) -> "CompanyRegistry":
+        """company_registry 문서로 생성"""
+        entries = [
+            CompanyEntry(
+                name=doc["name"],
+                keywords=doc.get("keywords", []),
+                sources=doc.get("sources", []),
+                domains=doc.get("domains", []),
+                priority=doc.get("priority", 0),
+                analysis_mode=doc.get("analysis_mode"),
+            )
+            for doc in docs
+        ]
+        return cls(entries, source="mongo")
+
+    @property
+    def names(self) -> list[str]:
+        return [e.name for e in self.entries]
+
+    def match_text(self, text: str) -> Optional[str]:
+        """
+        스크래핑된 텍스트에서 회사명 매칭 (한 번의 순회)
+
+        여러 회사가 매칭되면 우선순위가 가장 높은(priority가 낮은) 회사를 반환한다.
+        """
+        best: Optional[int] = None
+        for _, rank in self._automaton.iter_matches(text):
+            if best is None or rank < best:
+                best = rank
+                if best == 0:
+                    break
+        return self.entries[best].name if best is not None else None
+
+    def match_url(self, url: str) -> Optional[str]:
+        """URL 도메인으로 회사명 매칭 (서브도메인은 상위 도메인 설정 상속)"""
+        host = (urlparse(url).hostname or "").lower()
+        while host:
+            if host in self._domains:
+                return self._domains[host]
+            if "." not in host:
+                break
+            host = host.split(".", 1)[1]
+        return None
+
+    def get_sources(self, company: str) -> list[str]:
+        """회사명으로 추가 URL 목록 반환"""
+        entry = self._by_name.get(company)
+        return list(entry.sources) if entry else []
+
+    def get_analysis_mode(self, company: str) -> Optional[str]:
+        """회사별 분석 모드 설정 (없으면 None)"""
+        entry = self._by_name.get(company)
+        return entry.analysis_mode if entry else None
+
+    def stats(self) -> dict:
+        return {
+            "source": self.source,
+            "companies": len(self.entries),
+            "patterns": self._automaton.pattern_count,
+            "states": self._automaton.state_count,
+            "domains": len(self._domains),
+            "build_ms": self.build_ms,
+            "loaded_at": self.loaded_at,
+        }
+
+
+# ============================================================
+# 싱글톤 + 핫 리로드
+# ============================================================
+
+_registry: CompanyRegistry = CompanyRegistry.from_config()
+_collection = None
+_fingerprint: Optional[tuple] = None
+_reload_task: Optional[asyncio.Task] = None
+_reload_count = 0
+
+
+def _get_collection():
+    global _collection
+    if _collection is None:
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        client = AsyncIOMotorClient(MONGODB_URI)
+        _collection = client[MONGODB_DB_NAME][COLLECTIONS["company_registry"]]
+    return _collection
+
+
+async def _seed_if_empty(collection):
+    """컬렉션이 비어 있으면 config 기본값으로 초기화"""
+    if await collection.estimated_document_count() > 0:
+        return
+    now = datetime.utcnow()
+    docs = [
+        {
+            "name": e.name,
+            "keywords": e.keywords,
+            "sources": e.sources,
+            "domains": e.domains,
+            "priority": e.priority,
+            "enabled": True,
+            "updated_at": now,
+        }
+        for e in CompanyRegistry.from_config().entries
+    ]
+    await collection.insert_many(docs)
+    logger.info(f"🏷️ [Registry] 기본 회사 {len(docs)}개로 레지스트리 초기화")
+
+
+async def reload_company_registry(force: bool = False) -> bool:
+    """
+    DB 변경 여부를 확인하고 바뀐 경우 레지스트리 교체
+
+    Args:
+        force: True면 변경 여부와 관계없이 다시 읽음
+
+    Returns:
+        교체 여부
+    """
+    global _registry, _fingerprint, _reload_count
+    collection = _get_collection()
+
+    summary = await collection.aggregate([
+        {"$group": {"_id": None, "count": {"$sum": 1}, "updated_at": {"$max": "$updated_at"}}}
+    ]).to_list(1)
+    fingerprint = (summary[0]["count"], summary[0]["updated_at"]) if summary else (0, None)
+    if not force and fingerprint == _fingerprint:
+        return False
+
+    docs = await collection.find({"enabled": {"$ne": False}}).to_list(None)
+    # 수천 개 패턴 컴파일은 이벤트 루프 밖에서 수행
+    registry = await asyncio.to_thread(CompanyRegistry.from_documents, docs)
+    _registry = registry
+    _fingerprint = fingerprint
+    _reload_count += 1
+    logger.info(
+        f"🏷️ [Registry] 레지스트리 로드: 회사 {len(registry.entries)}개, "
+        f"키워드 {registry.stats()['patterns']}개 ({registry.build_ms}ms)"
+    )
+    return True
+
+
+async def _reload_loop(interval: float):
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await reload_company_registry()
+        except Exception as e:
+            logger.warning(f"🏷️ [Registry] 리로드 실패 (기존 레지스트리 유지): {e}")
+
+
+async def start_company_registry(reload_seconds: float = COMPANY_REGISTRY_RELOAD_SECONDS):
+    """앱 시작 시 레지스트리 로드 및 주기적 리로드 시작 (DB 실패 시 config 기본값 유지)"""
+    global _reload_task
+    try:
+        collection = _get_collection()
+        await _seed_if_empty(collection)
+        await collection.create_index("name", unique=True)
+        await reload_company_registry(force=True)
+    except Exception as e:
+        logger.warning(f"🏷️ [Registry] DB 로드 실패, config 기본값 사용: {e}")
+
+    if reload_seconds > 0 and _reload_task is None:
+        _reload_task = asyncio.create_task(_reload_loop(reload_seconds))
+
+
+async def close_company_registry():
+    """앱 종료 시 리로드 작업 중지"""
+    global _reload_task
+    if _reload_task is not None:
+        _reload_task.cancel()
+        try:
+            await _reload_task
+        except asyncio.CancelledError:
+            pass
+        _reload_task = None
+
+
+def get_company_registry() -> CompanyRegistry:
+    """현재 레지스트리 반환 (start 전에는 config 기본값)"""
+    return _registry
+
+
+def get_registry_stats() -> dict:
+    """레지스트리 메트릭"""
+    return {**_registry.stats(), "reloads": _reload_count}
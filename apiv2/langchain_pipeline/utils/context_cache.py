@@ -0,0 +1,322 @@
+"""
+Gemini 컨텍스트 캐시 (cached content 핸들 관리)
+
+한 회사를 여러 지원자와 비교할 때 매번 반복되는 시스템 프롬프트 + 출력 스키마 +
+회사 프로필을 Gemini cached content로 한 번만 올려두고, 이후 호출은 핸들 이름만 보낸다.
+
+- 키: (모델, 프롬프트 버전, 컨텍스트 해시) → 핸들 이름 + 만료 시각
+- 같은 키를 동시에 요청하면 한 번만 생성 (키별 락)
+- 새로 생성할 때 만료된 핸들과 사용 중이 아닌 락을 정리 (회사 프로필 해시마다 쌓이지 않도록)
+- 만료 REFRESH_MARGIN_SECONDS 전부터는 새로 생성
+- 생성 실패/최소 토큰 미달이면 None 반환 → 호출 측은 전체 프롬프트로 폴백
+- 생성이 연속 실패하면 FAILURE_BACKOFF_SECONDS 동안 시도하지 않음
+- 캐시 호출 오류 중 서버에서 캐시가 만료/삭제된 경우(is_missing_cache_error)만 핸들을 폐기
+  (429/타임아웃 등은 다른 동시 호출이 같은 핸들을 쓰고 있으므로 유지)
+
+백엔드:
+- GeminiContextCacheBackend: google-genai caches API
+- LocalContextCacheBackend: 네트워크 없는 로컬 대역 (테스트용, 생성된 컨텍스트를 메모리에 보관)
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+from apiv2.langchain_pipeline.config import (
+    GOOGLE_API_KEY,
+    COMPARE_CONTEXT_CACHE,
+    CONTEXT_CACHE_TTL_SECONDS,
+    CONTEXT_CACHE_MIN_TOKENS,
+)
+from apiv2.langchain_pipeline.utils.token_counter import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+REFRESH_MARGIN_SECONDS = 30
+FAILURE_BACKOFF_SECONDS = 300
+
+# 만료/삭제된 cached content 호출 시 Gemini 응답 코드 (만료 후에는 403 PERMISSION_DENIED도 반환)
+MISSING_CACHE_STATUS_CODES = (403, 404)
+
+
+def is_missing_cache_error(error: BaseException) -> bool:
+    """
+    서버에서 cached content가 만료/삭제되어 실패한 오류인지 판별
+
+    langchain 래퍼 예외는 원인(__cause__)의 google-genai 오류까지 확인한다.
+    429/타임아웃/응답 파싱 오류 등은 False.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        code = getattr(error, "code", None)
+        message = str(error).lower().replace(" ", "").replace("_", "")
+        if "cachedcontent" in message and (
+            code in MISSING_CACHE_STATUS_CODES or "notfound" in message or "expired" in message
+        ):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+# ============================================================
+# 백엔드
+# ============================================================
+
+class ContextCacheBackend(ABC):
+    """cached content 생성/삭제 인터페이스"""
+
+    @abstractmethod
+    async def create(self, model: str, system_instruction: str, context: str, ttl_seconds: int, display_name: str) -> str:
+        """캐시 생성 후 핸들 이름 반환"""
+        pass
+
+    @abstractmethod
+    async def delete(self, name: str):
+        """캐시 삭제"""
+        pass
+
+
+class GeminiContextCacheBackend(ContextCacheBackend):
+    """google-genai caches API 백엔드"""
+
+    def __init__(self, api_key: str = GOOGLE_API_KEY):
+        self.api_key = api_key
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            from google import genai
+
+            self._client = genai.Client(api_key=self.api_key)
+        return self._client
+
+    async def create(self, model: str, system_instruction: str, context: str, ttl_seconds: int, display_name: str) -> str:
+        from google.genai import types
+
+        cached = await self._get_client().aio.caches.create(
+            model=model,
+            config=types.CreateCachedContentConfig(
+                system_instruction=system_instruction,
+                contents=[types.Content(role="user", parts=[types.Part(text=context)])],
+                ttl=f"{ttl_seconds}s",
+                display_name=display_name,
+            ),
+        )
+        return cached.name
+
+    async def delete(self, name: str):
+        await self._get_client().aio.caches.delete(name=name)
+
+
+class LocalContextCacheBackend(ContextCacheBackend):
+    """로컬 대역 (테스트용): 생성된 시스템 프롬프트/컨텍스트를 메모리에 보관"""
+
+    def __init__(self, fail: bool = False):
+        """
+        Args:
+            fail: True면 create가 항상 실패 (폴백 경로 확인용)
+        """
+        self.fail = fail
+        self.contents: dict[str, dict] = {}
+        self.created = 0
+        self.deleted = 0
+
+    async def create(self, model: str, system_instruction: str, context: str, ttl_seconds: int, display_name: str) -> str:
+        if self.fail:
+            raise RuntimeError("context caching unavailable")
+        self.created += 1
+        name = f"cachedContents/local-{self.created}"
+        self.contents[name] = {
+            "model": model,
+            "system_instruction": system_instruction,
+            "context": context,
+            "ttl_seconds": ttl_seconds,
+            "display_name": display_name,
+        }
+        return name
+
+    async def delete(self, name: str):
+        self.deleted += 1
+        self.contents.pop(name, None)
+
+
+# ============================================================
+# 캐시 관리
+# ============================================================
+
+@dataclass
+class CachedContext:
+    """생성된 캐시 핸들"""
+    name: str
+    expires_at: float
+    tokens: int
+    hits: int = 0
+
+
+class ContextCache:
+    """(모델, 프롬프트 버전, 컨텍스트 해시)별 cached content 핸들 관리"""
+
+    def __init__(
+        self,
+        backend: ContextCacheBackend,
+        ttl_seconds: int = CONTEXT_CACHE_TTL_SECONDS,
+        min_tokens: int = CONTEXT_CACHE_MIN_TOKENS,
+    ):
+        """
+        Args:
+            backend: 캐시 백엔드
+            ttl_seconds: 캐시 유지 시간
+            min_tokens: 이보다 짧은 컨텍스트는 캐시하지 않음 (Gemini 최소 크기)
+        """
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.min_tokens = min_tokens
+        self._entries: dict[tuple, CachedContext] = {}
+        self._locks: dict[tuple, asyncio.Lock] = {}
+        self._disabled_until = 0.0
+        self._stats = {
+            "hits": 0,
+            "creates": 0,
+            "failures": 0,
+            "skipped_small": 0,
+            "invalidations": 0,
+            "cached_tokens_reused": 0,
+        }
+
+    @staticmethod
+    def make_key(model: str, prompt_version: str, system_instruction: str, context: str) -> tuple:
+        digest = hashlib.sha256(f"{system_instruction}\x00{context}".encode("utf-8")).hexdigest()[:32]
+        return (model, prompt_version, digest)
+
+    def _valid(self, entry: Optional[CachedContext]) -> bool:
+        return entry is not None and entry.expires_at - REFRESH_MARGIN_SECONDS > time.time()
+
+    async def get_or_create(
+        self,
+        model: str,
+        prompt_version: str,
+        system_instruction: str,
+        context: str,
+    ) -> Optional[str]:
+        """
+        캐시 핸들 이름 반환 (없으면 생성)
+
+        Returns:
+            cached content 이름, 캐시를 쓸 수 없으면 None
+        """
+        tokens = estimate_tokens(system_instruction) + estimate_tokens(context)
+        if tokens < self.min_tokens:
+            self._stats["skipped_small"] += 1
+            return None
+        if time.time() < self._disabled_until:
+            return None
+
+        key = self.make_key(model, prompt_version, system_instruction, context)
+        entry = self._entries.get(key)
+        if self._valid(entry):
+            return self._hit(entry)
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._entries.get(key)
+            if self._valid(entry):
+                return self._hit(entry)
+
+            self._prune(time.time())
+
+            try:
+                name = await self.backend.create(
+                    model=model,
+                    system_instruction=system_instruction,
+                    context=context,
+                    ttl_seconds=self.ttl_seconds,
+                    display_name=f"{prompt_version}-{key[2][:12]}",
+                )
+            except Exception as e:
+                self._stats["failures"] += 1
+                self._disabled_until = time.time() + FAILURE_BACKOFF_SECONDS
+                logger.warning(f"🗄️ [ContextCache] 캐시 생성 실패, {FAILURE_BACKOFF_SECONDS}초간 전체 프롬프트 사용: {e}")
+                return None
+
+            self._entries[key] = CachedContext(name=name, expires_at=time.time() + self.ttl_seconds, tokens=tokens)
+            self._stats["creates"] += 1
+            logger.info(f"🗄️ [ContextCache] 캐시 생성: {name} (약 {tokens:,} tokens, TTL {self.ttl_seconds}s)")
+            return name
+
+    def _prune(self, now: float):
+        """만료된 핸들(서버에서도 TTL로 삭제됨)과 대기 중인 요청이 없는 키의 락 제거"""
+        for key, entry in list(self._entries.items()):
+            if entry.expires_at <= now:
+                del self._entries[key]
+        for key, lock in list(self._locks.items()):
+            if key not in self._entries and not lock.locked():
+                del self._locks[key]
+
+    def _hit(self, entry: CachedContext) -> str:
+        entry.hits += 1
+        self._stats["hits"] += 1
+        self._stats["cached_tokens_reused"] += entry.tokens
+        return entry.name
+
+    async def invalidate(self, name: str):
+        """핸들 폐기 (서버에서 만료/삭제된 경우 등), 다음 요청에서 새로 생성"""
+        for key, entry in list(self._entries.items()):
+            if entry.name == name:
+                del self._entries[key]
+                self._stats["invalidations"] += 1
+        try:
+            await self.backend.delete(name)
+        except Exception:
+            pass
+
+    async def close(self):
+        """보유한 캐시 삭제 (TTL 전에 저장 비용 정리)"""
+        for entry in list(self._entries.values()):
+            try:
+                await self.backend.delete(entry.name)
+            except Exception as e:
+                logger.debug(f"🗄️ [ContextCache] 캐시 삭제 실패 {entry.name}: {e}")
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        now = time.time()
+        return {
+            **self._stats,
+            "active": sum(1 for e in self._entries.values() if e.expires_at > now),
+            "disabled": now < self._disabled_until,
+        }
+
+
+# ============================================================
+# 싱글톤
+# ============================================================
+
+_context_cache: Optional[ContextCache] = None
+
+
+def get_context_cache() -> Optional[ContextCache]:
+    """비교 체인용 컨텍스트 캐시 (COMPARE_CONTEXT_CACHE=false면 None)"""
+    global _context_cache
+    if not COMPARE_CONTEXT_CACHE:
+        return None
+    if _context_cache is None:
+        _context_cache = ContextCache(GeminiContextCacheBackend())
+    return _context_cache
+
+
+async def close_context_cache():
+    """앱 종료 시 캐시 정리"""
+    global _context_cache
+    if _context_cache is not None:
+        await _context_cache.close()
+        _context_cache = None
+
+
+def get_context_cache_stats() -> Optional[dict]:
+    """컨텍스트 캐시 메트릭"""
+    return _context_cache.stats() if _context_cache else None
@@ -59,6 +59,67 @@ class DatabaseHandler:
         collection = self._get_collection("companies")
         return collection.find_one({"company_meta.company_name": company_name})
 
+    def find_cached_company_profile(
+        self,
+        company_name: str,
+        source_hash: str,
+        pipeline_version: str,
+        min_created_at: str
+    ) -> Optional[dict[str, Any]]:
+        """
+        프로필 캐시 조회 (같은 원문 해시 + 같은 프롬프트 버전의 최신 프로필)
+
+        Args:
+            company_name: 회사명
+            source_hash: 스크래핑 원문 해시
+            pipeline_version: 프롬프트/스키마 버전
+            min_created_at: 이 시각(ISO) 이후 생성된 프로필만 사용
+
+        Returns:
+            프로필 문서 또는 None
+        """
+        collection = self._get_collection("companies")
+        return collection.find_one(
+            {
+                "_meta.company_name": company_name,
+                "_meta.source_hash": source_hash,
+                "_meta.pipeline_version": pipeline_version,
+                "created_at": {"$gte": min_created_at},
+            },
+            sort=[("created_at", -1)],
+        )
+
+    def find_recent_company_profiles(
+        self,
+        company_name: str,
+        pipeline_version: str,
+        min_created_at: str,
+        limit: int = 5
+    ) -> list[dict[str, Any]]:
+        """
+        프로필 캐시 후보 조회 (원문 해시를 알기 전에 미리 가져올 때 사용)
+
+        Args:
+            company_name: 회사명
+            pipeline_version: 프롬프트/스키마 버전
+            min_created_at: 이 시각(ISO) 이후 생성된 프로필만 사용
+            limit: 최대 개수 (최신순)
+
+        Returns:
+            프로필 문서 리스트
+        """
+        collection = self._get_collection("companies")
+        cursor = collection.find(
+            {
+                "_meta.company_name": company_name,
+                "_meta.pipeline_version": pipeline_version,
+                "created_at": {"$gte": min_created_at},
+            },
+            sort=[("created_at", -1)],
+            limit=limit,
+        )
+        return list(cursor)
+
     def find_similar_companies(self, company_name: str) -> list[dict[str, Any]]:
         """유사 회사명 검색"""
         collection = self._get_collection("companies")
@@ -0,0 +1,350 @@
+"""
+Gemini 업로드 파일 레지스트리 (PDF 내용 주소 기반 재사용)
+
+같은 이력서를 다른 회사와 다시 분석할 때마다 PDF를 Gemini Files API에 올리고
+PROCESSING을 기다린 뒤 바로 삭제하던 것을, PDF 바이트의 SHA-256으로 업로드된 파일을
+찾아 재사용한다.
+
+- 키: SHA-256(PDF 바이트) → Gemini 파일 이름/URI + 만료 시각
+  (S3의 큰 PDF는 본문을 받기 전에 키가 필요하므로 S3 객체(버킷/키/ETag) 해시, object_digest)
+- Files API 보관 기간(48시간) - REUSE_MARGIN 전까지만 재사용, 이후 요청은 새로 업로드
+- 참조 카운트: 분석 작업이 acquire → release, 사용 중인 파일은 삭제하지 않음
+- 같은 내용을 동시에 요청하면 한 번만 업로드 (키별 락)
+- 백그라운드 스위퍼: 만료 임박 / 오래 안 쓴 / 폐기된 파일 삭제
+- 고아 파일(REMOTE_PREFIX로 올렸지만 추적되지 않는 파일) 삭제는 선택 사항
+  (GEMINI_FILE_ORPHAN_GRACE_SECONDS >= 0일 때만). 레지스트리는 프로세스 메모리에 있으므로
+  같은 API 키를 쓰는 다른 워커/환경의 사용 중인 파일도 고아로 보이기 때문에 기본은 끔.
+  끈 상태에서도 남은 파일은 Files API 보관 기간(48시간)이 지나면 서버에서 삭제된다.
+
+업로드 자체는 로더가 수행한다 (acquire에 upload 콜백 전달).
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Optional
+
+from apiv2.langchain_pipeline.config import (
+    GOOGLE_API_KEY,
+    GEMINI_FILE_REUSE,
+    GEMINI_FILE_TTL_SECONDS,
+    GEMINI_FILE_REUSE_MARGIN_SECONDS,
+    GEMINI_FILE_IDLE_SECONDS,
+    GEMINI_FILE_SWEEP_SECONDS,
+    GEMINI_FILE_ORPHAN_GRACE_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# 레지스트리가 올린 파일의 Gemini 쪽 display_name 접두사 (고아 파일 식별용)
+REMOTE_PREFIX = "cf-pdf-"
+
+
+def content_digest(data: bytes) -> str:
+    """PDF 바이트의 SHA-256 (큰 파일은 asyncio.to_thread로 호출)"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def object_digest(bucket: str, key: str, etag: str) -> str:
+    """S3 객체(버킷/키/ETag) 기준 키 (본문을 받지 않고 계산, 큰 PDF 스트리밍 업로드용)"""
+    return hashlib.sha256(f"s3://{bucket}/{key}\x00{etag}".encode("utf-8")).hexdigest()
+
+
+@dataclass
+class RegisteredFile:
+    """업로드된 파일 항목"""
+    digest: str
+    file: Any                 # 로더의 GeminiFile
+    expires_at: float
+    upload_seconds: float
+    size_bytes: Optional[int] = None
+    refcount: int = 0
+    hits: int = 0
+    last_used: float = 0.0
+    retired: bool = False     # True면 새 요청에 내주지 않고 참조가 끝나면 삭제
+
+
+class GeminiFileRegistry:
+    """SHA-256별 Gemini 업로드 파일 재사용 + 참조 카운트 + 주기적 정리"""
+
+    def __init__(
+        self,
+        genai_client=None,
+        ttl_seconds: float = GEMINI_FILE_TTL_SECONDS,
+        reuse_margin_seconds: float = GEMINI_FILE_REUSE_MARGIN_SECONDS,
+        idle_seconds: float = GEMINI_FILE_IDLE_SECONDS,
+        orphan_grace_seconds: float = GEMINI_FILE_ORPHAN_GRACE_SECONDS,
+    ):
+        """
+        Args:
+            genai_client: google-genai 클라이언트 (삭제/목록 조회용, None이면 GOOGLE_API_KEY로 생성)
+            ttl_seconds: Files API 보관 기간
+            reuse_margin_seconds: 만료 이 시간 전부터는 재사용하지 않음 (가장 긴 분석 시간보다 길게)
+            idle_seconds: 참조 없이 이 시간 동안 안 쓴 파일은 스위퍼가 삭제 (0이면 만료까지 유지)
+            orphan_grace_seconds: 추적되지 않는 REMOTE_PREFIX 파일을 고아로 보기까지의 유예 시간
+                (음수면 고아 파일을 삭제하지 않음, API 키를 이 프로세스만 쓸 때만 0 이상으로 설정)
+        """
+        self._client = genai_client
+        self.ttl_seconds = ttl_seconds
+        self.reuse_margin_seconds = reuse_margin_seconds
+        self.idle_seconds = idle_seconds
+        self.orphan_grace_seconds = orphan_grace_seconds
+        self._entries: dict[str, RegisteredFile] = {}   # digest → 재사용 가능한 항목
+        self._by_name: dict[str, RegisteredFile] = {}   # Gemini 파일 이름 → 모든 추적 항목
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._stats = {
+            "hits": 0,
+            "uploads": 0,
+            "deletes": 0,
+            "orphans_deleted": 0,
+            "upload_seconds_saved": 0.0,
+            "bytes_saved": 0,
+        }
+
+    def _get_client(self):
+        if self._client is None:
+            from google import genai
+
+            self._client = genai.Client(api_key=GOOGLE_API_KEY)
+        return self._client
+
+    def _reusable(self, entry: Optional[RegisteredFile]) -> bool:
+        return (
+            entry is not None
+            and not entry.retired
+            and entry.expires_at - self.reuse_margin_seconds > time.time()
+        )
+
+    async def acquire(
+        self,
+        digest: str,
+        filename: str,
+        upload: Callable[[str], Awaitable[Any]],
+        size_bytes: Optional[int] = None,
+    ):
+        """
+        내용이 같은 업로드 파일을 재사용하거나 새로 업로드 (참조 카운트 +1)
+
+        Args:
+            digest: content_digest(PDF 바이트) 또는 object_digest(S3 객체)
+            filename: 원본 파일명 (반환 파일의 display_name)
+            upload: Gemini 쪽 display_name을 받아 업로드 후 GeminiFile을 반환하는 콜백
+            size_bytes: PDF 크기 (메트릭용)
+
+        Returns:
+            GeminiFile 사본 (display_name=filename), 사용 후 release() 호출 필요
+        """
+        entry = self._entries.get(digest)
+        if not self._reusable(entry):
+            lock = self._locks.setdefault(digest, asyncio.Lock())
+            async with lock:
+                entry = self._entries.get(digest)
+                if not self._reusable(entry):
+                    if entry is not None:
+                        self._retire(entry)
+                    entry = await self._upload(digest, filename, upload, size_bytes)
+                    entry.refcount += 1
+                    entry.last_used = time.time()
+                    return replace(entry.file, display_name=filename)
+
+        entry.refcount += 1
+        entry.hits += 1
+        entry.last_used = time.time()
+        self._stats["hits"] += 1
+        self._stats["upload_seconds_saved"] += entry.upload_seconds
+        self._stats["bytes_saved"] += entry.size_bytes or 0
+        logger.info(f"📎 [FileRegistry] 재사용: {entry.file.name} ({filename}, 참조 {entry.refcount})")
+        return replace(entry.file, display_name=filename)
+
+    async def _upload(
+        self,
+        digest: str,
+        filename: str,
+        upload: Callable[[str], Awaitable[Any]],
+        size_bytes: Optional[int],
+    ) -> RegisteredFile:
+        start = time.time()
+        gemini_file = await upload(f"{REMOTE_PREFIX}{digest[:16]}")
+        entry = RegisteredFile(
+            digest=digest,
+            file=gemini_file,
+            # 업로드 시작 시각 기준으로 계산 (서버 만료보다 약간 이르게)
+            expires_at=start + self.ttl_seconds,
+            upload_seconds=time.time() - start,
+            size_bytes=size_bytes,
+        )
+        self._entries[digest] = entry
+        self._by_name[gemini_file.name] = entry
+        self._stats["uploads"] += 1
+        logger.info(f"📎 [FileRegistry] 업로드: {gemini_file.name} ({filename}, {entry.upload_seconds:.1f}초)")
+        return entry
+
+    def _retire(self, entry: RegisteredFile):
+        """새 요청에 내주지 않도록 분리 (참조가 끝나면 삭제)"""
+        entry.retired = True
+        if self._entries.get(entry.digest) is entry:
+            del self._entries[entry.digest]
+
+    async def release(self, gemini_file, evict: bool = False) -> bool:
+        """
+        참조 카운트 -1 (파일은 삭제하지 않고 재사용을 위해 유지)
+
+        Args:
+            gemini_file: acquire()가 반환한 파일
+            evict: True면 이후 재사용하지 않음 (처리 실패/분석 오류 등)
+
+        Returns:
+            레지스트리가 관리하는 파일인지 여부 (False면 호출 측이 직접 삭제)
+        """
+        entry = self._by_name.get(gemini_file.name)
+        if entry is None:
+            return False
+
+        entry.refcount = max(0, entry.refcount - 1)
+        entry.last_used = time.time()
+        if gemini_file.state == 'ACTIVE':
+            entry.file = replace(entry.file, state=gemini_file.state, uri=gemini_file.uri or entry.file.uri)
+        elif gemini_file.state == 'FAILED':
+            evict = True
+
+        if evict:
+            self._retire(entry)
+        if entry.retired and entry.refcount == 0:
+            await self._delete(entry)
+        return True
+
+    async def _delete(self, entry: RegisteredFile):
+        self._by_name.pop(entry.file.name, None)
+        if self._entries.get(entry.digest) is entry:
+            del self._entries[entry.digest]
+        try:
+            await self._get_client().aio.files.delete(name=entry.file.name)
+            self._stats["deletes"] += 1
+        except Exception as e:
+            logger.debug(f"📎 [FileRegistry] 파일 삭제 실패 {entry.file.name}: {e}")
+
+    async def sweep(self) -> int:
+        """
+        참조 없는 만료 임박/유휴/폐기 파일과 고아 파일 삭제
+
+        Returns:
+            삭제한 파일 수
+        """
+        now = time.time()
+        stale = [
+            entry for entry in list(self._by_name.values())
+            if entry.refcount == 0 and (
+                entry.retired
+                or not self._reusable(entry)
+                or (self.idle_seconds > 0 and now - entry.last_used > self.idle_seconds)
+            )
+        ]
+        for entry in stale:
+            await self._delete(entry)
+
+        orphans = 0
+        if self.orphan_grace_seconds >= 0:
+            try:
+                orphans = await self._delete_orphans()
+            except Exception as e:
+                logger.warning(f"📎 [FileRegistry] 고아 파일 조회 실패: {e}")
+
+        if stale or orphans:
+            logger.info(f"📎 [FileRegistry] 정리: 만료/유휴 {len(stale)}개, 고아 {orphans}개 삭제")
+        return len(stale) + orphans
+
+    async def _delete_orphans(self) -> int:
+        """REMOTE_PREFIX로 올렸지만 추적되지 않는 파일 삭제 (이전 프로세스 잔여, 중단된 업로드 등)"""
+        client = self._get_client()
+        now = datetime.now(timezone.utc)
+        orphan_names = []
+        async for remote in await client.aio.files.list(config={"page_size": 100}):
+            if not (remote.display_name or "").startswith(REMOTE_PREFIX):
+                continue
+            if remote.name in self._by_name:
+                continue
+            # 업로드 직후 아직 등록되지 않은 파일은 건너뜀
+            if remote.create_time and (now - remote.create_time).total_seconds() < self.orphan_grace_seconds:
+                continue
+            orphan_names.append(remote.name)
+
+        for name in orphan_names:
+            try:
+                await client.aio.files.delete(name=name)
+                self._stats["orphans_deleted"] += 1
+            except Exception as e:
+                logger.debug(f"📎 [FileRegistry] 고아 파일 삭제 실패 {name}: {e}")
+        return len(orphan_names)
+
+    async def close(self):
+        """참조 없는 파일 삭제 (재시작 후에는 재사용할 수 없으므로)"""
+        for entry in list(self._by_name.values()):
+            if entry.refcount == 0:
+                await self._delete(entry)
+
+    def stats(self) -> dict:
+        return {
+            **self._stats,
+            "upload_seconds_saved": round(self._stats["upload_seconds_saved"], 1),
+            "files": len(self._by_name),
+            "in_use": sum(1 for e in self._by_name.values() if e.refcount > 0),
+        }
+
+
+# ============================================================
+# 싱글톤 + 백그라운드 정리
+# ============================================================
+
+_file_registry: Optional[GeminiFileRegistry] = None
+_sweep_task: Optional[asyncio.Task] = None
+
+
+def get_file_registry() -> Optional[GeminiFileRegistry]:
+    """PDF 로더용 파일 레지스트리 (GEMINI_FILE_REUSE=false면 None)"""
+    global _file_registry
+    if not GEMINI_FILE_REUSE:
+        return None
+    if _file_registry is None:
+        _file_registry = GeminiFileRegistry()
+    return _file_registry
+
+
+async def _sweep_loop(registry: GeminiFileRegistry, interval: float):
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await registry.sweep()
+        except Exception as e:
+            logger.warning(f"📎 [FileRegistry] 정리 실패: {e}")
+
+
+async def start_file_registry(sweep_seconds: float = GEMINI_FILE_SWEEP_SECONDS):
+    """앱 시작 시 주기적 정리 시작"""
+    global _sweep_task
+    registry = get_file_registry()
+    if registry is None or sweep_seconds <= 0 or _sweep_task is not None:
+        return
+    _sweep_task = asyncio.create_task(_sweep_loop(registry, sweep_seconds))
+
+
+async def close_file_registry():
+    """앱 종료 시 정리 작업 중지 및 참조 없는 파일 삭제"""
+    global _file_registry, _sweep_task
+    if _sweep_task is not None:
+        _sweep_task.cancel()
+        try:
+            await _sweep_task
+        except asyncio.CancelledError:
+            pass
+        _sweep_task = None
+    if _file_registry is not None:
+        await _file_registry.close()
+        _file_registry = None
+
+
+def get_file_registry_stats() -> Optional[dict]:
+    """파일 레지스트리 메트릭"""
+    return _file_registry.stats() if _file_registry else None
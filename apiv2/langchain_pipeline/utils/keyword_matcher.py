@@ -0,0 +1,90 @@
+"""
+다중 키워드 매처 (Aho-Corasick 오토마톤)
+
+회사 키워드 수가 늘어나도 텍스트를 한 번만 훑어서 모든 키워드 등장을 찾는다.
+매칭 비용은 O(텍스트 길이 + 매칭 수)로 키워드 개수와 무관하다.
+
+- 대소문자 무시 (패턴/텍스트 모두 소문자로 정규화)
+- 부분 문자열 매칭 (기존 `keyword in text` 동작과 동일)
+"""
+
+from collections import deque
+from typing import Any, Iterator
+
+
+class KeywordAutomaton:
+    """패턴 → 값 매핑을 컴파일한 Aho-Corasick 오토마톤"""
+
+    def __init__(self):
+        # 상태 i의 전이 / 실패 링크 / 출력(값 목록)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[Any]] = [[]]
+        self._pattern_count = 0
+        self._built = False
+
+    def add(self, pattern: str, value: Any):
+        """패턴 추가 (build() 전에만 가능)"""
+        if self._built:
+            raise RuntimeError("이미 컴파일된 오토마톤에는 패턴을 추가할 수 없습니다.")
+        pattern = pattern.lower()
+        if not pattern:
+            return
+
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(value)
+        self._pattern_count += 1
+
+    def build(self) -> "KeywordAutomaton":
+        """실패 링크 계산 (BFS) 및 출력 병합"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # 접미사로 끝나는 패턴의 값도 함께 출력
+                if self._out[self._fail[nxt]]:
+                    self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+        self._built = True
+        return self
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, Any]]:
+        """
+        텍스트에서 모든 패턴 등장 위치 탐색
+
+        Yields:
+            (패턴이 끝나는 인덱스, 값)
+        """
+        if not self._built:
+            self.build()
+
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text.lower()):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for value in out[state]:
+                yield i, value
+
+    @property
+    def pattern_count(self) -> int:
+        return self._pattern_count
+
+    @property
+    def state_count(self) -> int:
+        return len(self._goto)
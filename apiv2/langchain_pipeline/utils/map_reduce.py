@@ -0,0 +1,172 @@
+"""
+대용량 스크래핑 텍스트 map-reduce 유틸리티
+
+collect 프롬프트가 토큰 예산을 넘으면 스크래핑 텍스트를 섹션(페이지) 단위로
+청크를 나눠 각각 추출한 뒤, 부분 JSON을 규칙 기반으로 병합한다.
+
+분할:
+- "=== URL ===" 페이지 헤더 기준으로 섹션 분리
+- 섹션을 순서대로 예산 안에서 묶고, 한 섹션이 예산보다 크면 문단/줄 경계로 분할
+  (분할된 조각에는 원래 헤더를 "(계속 i/n)"과 함께 반복)
+
+병합 (청크 순서 = 우선순위, 결과는 입력 순서에만 의존):
+- dict: 키별 재귀 병합
+- list: 순서 유지 합집합 (JSON 정규화 값으로 중복 제거)
+- 요약 문자열(summary 등): 서로 다른 값을 " / "로 연결
+- 점수("0".."4")/confidence: 최댓값
+- 그 외 값: unknown/no/not_mentioned보다 구체적인 값을 우선, 같은 등급이면 먼저 나온 값
+"""
+
+import json
+import re
+from typing import Any
+
+from apiv2.langchain_pipeline.utils.token_counter import estimate_tokens
+
+_SECTION_HEADER = re.compile(r"^=== .+ ===$", re.MULTILINE)
+
+# 여러 청크의 값을 이어 붙이는 서술형 필드
+JOIN_KEYS = {"summary", "hiring_summary", "required_experience", "notes"}
+
+# 다른 청크에 구체적인 값이 있으면 덮어쓰는 "정보 없음" 계열 값
+_WEAK_VALUES = {None, "", "unknown", "no", "not_mentioned", "null"}
+
+_CONFIDENCE_ORDER = {"low": 0, "medium": 1, "high": 2}
+
+
+# ============================================================
+# 분할
+# ============================================================
+
+def split_sections(content: str) -> list[str]:
+    """페이지 헤더 기준 섹션 분리 (헤더 포함)"""
+    starts = [m.start() for m in _SECTION_HEADER.finditer(content)]
+    if not starts or starts[0] != 0:
+        starts = [0] + starts
+    bounds = starts + [len(content)]
+    sections = (content[bounds[i]:bounds[i + 1]].strip() for i in range(len(starts)))
+    return [section for section in sections if section]
+
+
+def _split_oversized(section: str, max_tokens: int) -> list[str]:
+    """예산보다 큰 섹션을 문단 → 줄 경계로 분할"""
+    lines = section.split("\n")
+    header = lines[0] if _SECTION_HEADER.match(lines[0]) else ""
+    body_lines = lines[1:] if header else lines
+
+    pieces: list[str] = []
+    current: list[str] = []
+    current_tokens = estimate_tokens(header)
+    for line in body_lines:
+        line_tokens = estimate_tokens(line)
+        if current and current_tokens + line_tokens > max_tokens:
+            pieces.append("\n".join(current))
+            current, current_tokens = [], estimate_tokens(header)
+        current.append(line)
+        current_tokens += line_tokens
+    if current:
+        pieces.append("\n".join(current))
+
+    if not header or len(pieces) == 1:
+        return [f"{header}\n{p}".strip() for p in pieces]
+    title = header[len("=== "):-len(" ===")]
+    return [f"=== {title} (계속 {i}/{len(pieces)}) ===\n{p}" for i, p in enumerate(pieces, 1)]
+
+
+def chunk_content(content: str, max_tokens: int) -> list[str]:
+    """
+    섹션 경계를 지키면서 토큰 예산 단위로 청크 분할
+
+    Args:
+        content: 결합된 스크래핑 텍스트
+        max_tokens: 청크당 최대 추정 토큰 수
+
+    Returns:
+        청크 목록 (원래 순서 유지)
+    """
+    chunks: list[str] = []
+    current: list[str] = []
+    current_tokens = 0
+
+    for section in split_sections(content):
+        section_tokens = estimate_tokens(section)
+        parts = [section] if section_tokens <= max_tokens else _split_oversized(section, max_tokens)
+        for part in parts:
+            part_tokens = estimate_tokens(part)
+            if current and current_tokens + part_tokens > max_tokens:
+                chunks.append("\n\n".join(current))
+                current, current_tokens = [], 0
+            current.append(part)
+            current_tokens += part_tokens
+
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+# ============================================================
+# 병합
+# ============================================================
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True)
+
+
+def _is_score(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) or (
+        isinstance(value, str) and value.isdigit()
+    )
+
+
+def _merge_values(key: str, values: list[Any]) -> Any:
+    present = [v for v in values if v is not None]
+    if not present:
+        return None
+
+    if all(isinstance(v, dict) for v in present):
+        keys: list[str] = []
+        for v in present:
+            keys.extend(k for k in v if k not in keys)
+        return {k: _merge_values(k, [v.get(k) for v in present]) for k in keys}
+
+    if all(isinstance(v, list) for v in present):
+        merged, seen = [], set()
+        for v in present:
+            for item in v:
+                marker = _canonical(item)
+                if marker not in seen:
+                    seen.add(marker)
+                    merged.append(item)
+        return merged
+
+    strong = [v for v in present if not (isinstance(v, str) and v.lower() in _WEAK_VALUES)]
+    if not strong:
+        return present[0]
+
+    if key in JOIN_KEYS and all(isinstance(v, str) for v in strong):
+        return " / ".join(dict.fromkeys(strong))
+
+    if all(_is_score(v) for v in strong):
+        return max(strong, key=int)
+
+    if all(isinstance(v, str) and v in _CONFIDENCE_ORDER for v in strong):
+        return max(strong, key=_CONFIDENCE_ORDER.get)
+
+    return strong[0]
+
+
+def merge_partials(partials: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    청크별 부분 추출 결과를 하나의 문서로 병합
+
+    Args:
+        partials: 청크 순서대로 정렬된 부분 JSON 목록
+
+    Returns:
+        병합된 JSON (같은 입력이면 항상 같은 결과)
+    """
+    if not partials:
+        return {}
+    if len(partials) == 1:
+        return partials[0]
+    return _merge_values("", partials)
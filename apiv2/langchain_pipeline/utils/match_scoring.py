@@ -0,0 +1,247 @@
+"""
+매칭 결과 overall 로컬 계산
+
+축별 axis_score/status와 가중치(ScoringWeights와 같은 키)로 overall을 계산한다.
+규칙은 culture_compare 프롬프트의 Scoring Rules와 동일하다.
+
+- match_score: 점수가 있는 축의 가중 평균 (unknown 축은 분모에서 제외)
+- confidence: 1.0에서 unknown 축마다 0.10, 한쪽 근거만 있는 축마다 0.05 감점, [0, 1]로 제한
+- score_band: 0–39 low, 40–69 medium, 70–100 high
+
+계산은 (N, 축) 배열 단위로 벡터화되어 있어 저장된 결과 수천~수십만 건을
+한 번에 재계산할 수 있다. 단건 compute_overall도 같은 경로(N=1)를 사용한다.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping, Optional
+
+import numpy as np
+
+# 매칭 축 (matching_schema.meta.axes_used)
+AXES = [
+    "technical_fit",
+    "execution_style",
+    "collaboration_style",
+    "growth_learning_orientation",
+    "product_user_impact_orientation",
+    "ops_quality_responsibility",
+]
+
+# schema.culture_fit_result.ScoringWeights 기본값과 동일 (동일 가중치)
+DEFAULT_AXIS_WEIGHTS = {axis: 1.0 for axis in AXES}
+
+# 로컬 계산 결과의 meta.scoring_version
+SCORING_VERSION = "alignment-v1-local"
+
+UNKNOWN_PENALTY = 0.10
+ONE_SIDED_PENALTY = 0.05
+HIGH_ALIGNMENT_MIN_SCORE = 75
+RISK_MAX_SCORE = 25
+
+BANDS = np.array(["low", "medium", "high", "unknown"])
+
+
+def normalize_weights(weights: Optional[Any] = None) -> dict[str, float]:
+    """가중치 정규화 (dict 또는 ScoringWeights 같은 pydantic 모델, 빠진 축은 기본값)"""
+    if weights is None:
+        return dict(DEFAULT_AXIS_WEIGHTS)
+    if hasattr(weights, "model_dump"):
+        weights = weights.model_dump()
+    return {axis: float(weights.get(axis, DEFAULT_AXIS_WEIGHTS[axis])) for axis in AXES}
+
+
+def score_band(match_score: Optional[float]) -> str:
+    """점수 구간"""
+    if match_score is None:
+        return "unknown"
+    if match_score >= 70:
+        return "high"
+    if match_score >= 40:
+        return "medium"
+    return "low"
+
+
+def parse_axis_score(alignment: Optional[Mapping[str, Any]]) -> Optional[int]:
+    """axis_score를 정수로 변환 (unknown/누락/잘못된 값은 None)"""
+    if not alignment or alignment.get("status") == "unknown":
+        return None
+    value = alignment.get("axis_score")
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value.strip())
+    return None
+
+
+def is_one_sided(alignment: Mapping[str, Any]) -> bool:
+    """한쪽(회사/지원자) 근거만 있는 축인지"""
+    refs = alignment.get("evidence_refs") or {}
+    return bool(refs.get("company")) != bool(refs.get("developer"))
+
+
+# ============================================================
+# 배열 변환 / 벡터화 계산
+# ============================================================
+
+@dataclass
+class AxisMatrix:
+    """매칭 결과 N건의 축별 점수 배열"""
+    scores: np.ndarray     # (N, 축) float, unknown은 NaN
+    one_sided: np.ndarray  # (N, 축) bool
+
+    def __len__(self) -> int:
+        return self.scores.shape[0]
+
+
+def to_axis_matrix(axis_alignments_list: Iterable[Mapping[str, Any]]) -> AxisMatrix:
+    """axis_alignments 목록 → 점수/한쪽 근거 배열"""
+    rows: list[list[float]] = []
+    flags: list[list[bool]] = []
+    for axis_alignments in axis_alignments_list:
+        axis_alignments = axis_alignments or {}
+        row, flag = [], []
+        for axis in AXES:
+            alignment = axis_alignments.get(axis)
+            score = parse_axis_score(alignment)
+            row.append(np.nan if score is None else float(score))
+            flag.append(score is not None and is_one_sided(alignment))
+        rows.append(row)
+        flags.append(flag)
+
+    shape = (len(rows), len(AXES))
+    return AxisMatrix(
+        scores=np.array(rows, dtype=np.float64).reshape(shape),
+        one_sided=np.array(flags, dtype=bool).reshape(shape),
+    )
+
+
+def weight_vector(weights: Optional[Any] = None) -> np.ndarray:
+    """가중치 dict → AXES 순서 배열"""
+    normalized = normalize_weights(weights)
+    return np.array([normalized[axis] for axis in AXES], dtype=np.float64)
+
+
+def score_matrix(matrix: AxisMatrix, weights: Optional[Any] = None) -> dict[str, np.ndarray]:
+    """
+    N건 overall 일괄 계산
+
+    Args:
+        matrix: to_axis_matrix() 결과
+        weights: 축별 가중치 (dict / ScoringWeights / AXES 순서 배열)
+
+    Returns:
+        {"match_score": (N,) float (점수 없으면 NaN), "confidence": (N,), "band": (N,) str,
+         "scored": (N, 축) bool}
+    """
+    w = weights if isinstance(weights, np.ndarray) else weight_vector(weights)
+    scores = matrix.scores
+    scored = ~np.isnan(scores)
+    active = scored & (w > 0)
+
+    weighted = np.where(active, scores * w, 0.0).sum(axis=1)
+    total = np.where(active, w, 0.0).sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        match_score = np.where(total > 0, np.rint(weighted / total), np.nan)
+
+    unknown_count = (~scored).sum(axis=1)
+    one_sided_count = (matrix.one_sided & scored).sum(axis=1)
+    confidence = 1.0 - UNKNOWN_PENALTY * unknown_count - ONE_SIDED_PENALTY * one_sided_count
+    confidence = np.round(np.clip(confidence, 0.0, 1.0), 2)
+
+    band_index = np.select(
+        [np.isnan(match_score), match_score >= 70, match_score >= 40],
+        [3, 2, 1],
+        default=0,
+    )
+    return {
+        "match_score": match_score,
+        "confidence": confidence,
+        "band": BANDS[band_index],
+        "scored": scored,
+    }
+
+
+def build_overalls(
+    matrix: AxisMatrix,
+    result: dict[str, np.ndarray],
+    weights: Mapping[str, float],
+) -> list[dict[str, Any]]:
+    """score_matrix() 결과 → matching_schema.overall dict 목록"""
+    w = np.array([weights[axis] for axis in AXES])
+    scored = result["scored"]
+    scores = np.nan_to_num(matrix.scores, nan=-1.0)
+
+    # 축 목록 필드는 축별 bool 배열로 계산한 뒤 파이썬 값으로 한 번에 변환
+    high = (scored & (scores >= HIGH_ALIGNMENT_MIN_SCORE)).tolist()
+    risk = (scored & (scores <= RISK_MAX_SCORE)).tolist()
+    unknown = (~scored).tolist()
+    excluded = ((~scored) | (w <= 0)).tolist()
+    scored_count = scored.sum(axis=1).tolist()
+    one_sided_count = (matrix.one_sided & scored).sum(axis=1).tolist()
+    match_scores = result["match_score"].tolist()
+    confidences = result["confidence"].tolist()
+    bands = result["band"].tolist()
+    weights = dict(weights)
+
+    def pick(mask: list[bool]) -> list[str]:
+        return [axis for axis, flag in zip(AXES, mask) if flag]
+
+    overalls = []
+    for i, match_score in enumerate(match_scores):
+        unknown_count = len(AXES) - scored_count[i]
+        overalls.append({
+            "match_score": "unknown" if match_score != match_score else int(match_score),
+            "score_band": bands[i],
+            "confidence": confidences[i],
+            "scoring": {
+                "weights": dict(weights),
+                "excluded_axes": pick(excluded[i]),
+                "calculation_notes": (
+                    f"점수가 있는 {scored_count[i]}개 축의 가중 평균 (unknown {unknown_count}개 축 제외). "
+                    f"confidence = 1.0 - 0.10 x unknown {unknown_count}개 - 0.05 x 한쪽 근거 {one_sided_count[i]}개."
+                ),
+            },
+            "high_alignment_axes": pick(high[i]),
+            "risk_or_mismatch_axes": pick(risk[i]),
+            "unknown_axes": pick(unknown[i]),
+            "overall_notes": "축별 비교 결과와 가중치로 로컬 계산한 종합 점수입니다.",
+        })
+    return overalls
+
+
+def compute_overall_batch(
+    axis_alignments_list: list[Mapping[str, Any]],
+    weights: Optional[Any] = None,
+) -> list[dict[str, Any]]:
+    """
+    여러 매칭 결과의 overall 일괄 계산
+
+    Args:
+        axis_alignments_list: axis_alignments dict 목록
+        weights: 축별 가중치 (기본: 동일 가중치)
+
+    Returns:
+        overall dict 목록 (입력 순서 유지)
+    """
+    normalized = normalize_weights(weights)
+    matrix = to_axis_matrix(axis_alignments_list)
+    return build_overalls(matrix, score_matrix(matrix, weight_vector(normalized)), normalized)
+
+
+def compute_overall(
+    axis_alignments: Mapping[str, Any],
+    weights: Optional[Any] = None,
+) -> dict[str, Any]:
+    """
+    축별 정합성 결과로 overall 계산
+
+    Args:
+        axis_alignments: {축: AxisAlignment dict}
+        weights: 축별 가중치 (기본: 동일 가중치)
+
+    Returns:
+        matching_schema.overall 형식의 dict
+    """
+    return compute_overall_batch([axis_alignments], weights)[0]
@@ -0,0 +1,222 @@
+"""
+회사 컬쳐핏 프로필 캐시
+
+같은 회사를 같은 입력으로 다시 분석하면 LLM 2단계(데이터 수집 → 컬쳐핏 분석)를
+건너뛰고 companies 컬렉션에 저장된 결과를 그대로 반환한다.
+
+캐시 키: (회사명, 회사 소스 원문 해시, 프롬프트/스키마/전처리 설정 버전)
+- 원문 해시는 레지스트리의 추가 소스 페이지(회사 소개/블로그 등, 중복 제거 전)만으로 계산
+  → 같은 회사의 다른 채용공고나 공고 페이지의 변하는 문구로는 미스가 나지 않음
+  (추가 소스를 하나도 받지 못하면 채용공고 본문 포함 해시 사용, hash_sources 참고)
+- 소스 원문이 바뀌거나 프롬프트/스키마/전처리 설정이 바뀌면 자동으로 미스
+- max_age_seconds보다 오래된 프로필은 사용하지 않음
+- force_refresh=True면 조회를 건너뛰고 새로 분석
+
+URL로 회사를 먼저 알 수 있으면 prefetch()로 후보 프로필을 스크래핑과 동시에
+가져온 뒤, 원문 해시가 나오면 lookup(candidates=...)으로 DB 왕복 없이 비교한다
+(후보에 없는 해시는 최근 limit개 밖의 프로필일 수 있으므로 DB에서 직접 조회).
+"""
+
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from apiv2.langchain_pipeline.config import (
+    COMPANY_PROFILE_CACHE_MAX_AGE_SECONDS,
+    COLLECT_MAX_PROMPT_TOKENS,
+    COLLECT_CHUNK_TOKENS,
+    COLLECT_SECTION_PARALLEL,
+    TEXT_DEDUP_ENABLED,
+    TEXT_DEDUP_SHINGLE_LINES,
+)
+from apiv2.langchain_pipeline.prompts import (
+    company_data_collect,
+    company_culture_analyze,
+    company_fused_analyze,
+)
+from apiv2.langchain_pipeline.utils.db_handler import DatabaseHandler
+from apiv2.langchain_pipeline.utils.schema_loader import load_schema, schema_to_string
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 전체 히트/미스 카운터 (체인은 요청마다 새로 생성되므로 모듈 단위로 유지)
+_stats = {
+    "hits": 0,
+    "misses": 0,
+    "force_refreshes": 0,
+    "stores": 0,
+    "errors": 0,
+}
+
+
+def hash_text(text: str) -> str:
+    """텍스트 SHA-256 해시"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def hash_sources(pages: list[tuple[str, str]]) -> str:
+    """
+    캐시 키용 원문 해시
+
+    Args:
+        pages: (페이지 헤더, 본문) 목록, 첫 항목은 채용공고
+
+    Returns:
+        채용공고를 제외한 추가 소스 페이지 해시 (추가 소스가 없으면 채용공고 포함 전체 해시)
+    """
+    sources = pages[1:] or pages
+    return hash_text("\n\n".join(f"{header}\n{content}" for header, content in sources))
+
+
+def get_pipeline_version(mode: str = "two_stage") -> str:
+    """
+    회사 분석 프롬프트/스키마 버전 해시
+
+    프롬프트 본문이나 company_schema, 결과를 바꾸는 전처리 설정(중복 제거, map-reduce 분할)이
+    바뀌면 값이 바뀌어 이전 캐시가 무효화된다.
+    분석 모드(two_stage/fused)마다 사용하는 프롬프트가 달라 버전도 따로 계산한다.
+    """
+    if mode == "fused":
+        parts = [
+            company_fused_analyze.SYSTEM_MESSAGE,
+            company_fused_analyze.HUMAN_MESSAGE_TEMPLATE,
+        ]
+    else:
+        parts = [
+            company_data_collect.SYSTEM_MESSAGE,
+            company_data_collect.HUMAN_MESSAGE_TEMPLATE,
+            company_culture_analyze.SYSTEM_MESSAGE,
+            company_culture_analyze.HUMAN_MESSAGE_TEMPLATE,
+        ]
+        if COLLECT_SECTION_PARALLEL:
+            parts.append(company_data_collect.SECTION_HUMAN_MESSAGE_TEMPLATE)
+            parts.append(repr(company_data_collect.SECTION_GROUPS))
+        parts.append(f"map_reduce={COLLECT_MAX_PROMPT_TOKENS}/{COLLECT_CHUNK_TOKENS}")
+    parts.append(f"dedup={TEXT_DEDUP_ENABLED}/{TEXT_DEDUP_SHINGLE_LINES}")
+    parts.append(schema_to_string(load_schema("company_schema")))
+    version = hash_text("\n".join(parts))[:16]
+    return f"fused-{version}" if mode == "fused" else version
+
+
+class CompanyProfileCache:
+    """companies 컬렉션 기반 프로필 캐시"""
+
+    def __init__(
+        self,
+        db: DatabaseHandler,
+        max_age_seconds: float = COMPANY_PROFILE_CACHE_MAX_AGE_SECONDS,
+    ):
+        """
+        Args:
+            db: 데이터베이스 핸들러
+            max_age_seconds: 재사용 가능한 최대 프로필 나이 (초)
+        """
+        self.db = db
+        self.max_age_seconds = max_age_seconds
+        self.versions = {mode: get_pipeline_version(mode) for mode in ("two_stage", "fused")}
+        self.pipeline_version = self.versions["two_stage"]
+
+    def _min_created_at(self) -> str:
+        return (datetime.utcnow() - timedelta(seconds=self.max_age_seconds)).isoformat()
+
+    def prefetch(
+        self,
+        company_name: str,
+        limit: int = 5,
+        mode: str = "two_stage",
+    ) -> Optional[dict[str, dict[str, Any]]]:
+        """
+        원문 해시를 알기 전에 최근 프로필 후보 조회
+
+        Args:
+            company_name: URL로 확정된 회사명
+            limit: 가져올 최근 프로필 수
+            mode: 분석 모드 (모드별 프롬프트 버전으로 조회)
+
+        Returns:
+            {source_hash: 프로필} (조회 실패 시 None → lookup에서 직접 조회)
+        """
+        try:
+            docs = self.db.find_recent_company_profiles(
+                company_name=company_name,
+                pipeline_version=self.versions[mode],
+                min_created_at=self._min_created_at(),
+                limit=limit,
+            )
+        except Exception as e:
+            logger.warning(f"🗄️ [ProfileCache] 후보 조회 실패: {e}")
+            return None
+
+        candidates: dict[str, dict[str, Any]] = {}
+        for doc in docs:
+            # 최신순이므로 같은 해시는 처음 것만 사용
+            candidates.setdefault(doc.get("_meta", {}).get("source_hash"), doc)
+        return candidates
+
+    def lookup(
+        self,
+        company_name: str,
+        source_hash: str,
+        force_refresh: bool = False,
+        candidates: Optional[dict[str, dict[str, Any]]] = None,
+        mode: str = "two_stage",
+    ) -> Optional[dict[str, Any]]:
+        """
+        캐시된 회사 프로필 조회
+
+        Args:
+            company_name: 매칭된 회사명
+            source_hash: 회사 소스 원문 해시 (hash_sources)
+            force_refresh: True면 항상 미스 처리
+            candidates: prefetch() 결과 (해시가 있으면 DB를 다시 조회하지 않음)
+            mode: 분석 모드
+
+        Returns:
+            저장된 프로필 (없으면 None)
+        """
+        if force_refresh:
+            _stats["force_refreshes"] += 1
+            _stats["misses"] += 1
+            return None
+
+        try:
+            # 선조회 후보는 최근 limit개뿐이므로 없으면 해시로 직접 조회 (오래된 유효 프로필)
+            doc = candidates.get(source_hash) if candidates is not None else None
+            if doc is None:
+                doc = self.db.find_cached_company_profile(
+                    company_name=company_name,
+                    source_hash=source_hash,
+                    pipeline_version=self.versions[mode],
+                    min_created_at=self._min_created_at(),
+                )
+        except Exception as e:
+            _stats["errors"] += 1
+            logger.warning(f"🗄️ [ProfileCache] 조회 실패: {e}")
+            return None
+
+        if doc is None:
+            _stats["misses"] += 1
+            return None
+
+        _stats["hits"] += 1
+        doc["_id"] = str(doc["_id"])
+        return doc
+
+    def cache_fields(self, source_hash: str, mode: str = "two_stage") -> dict[str, str]:
+        """저장할 프로필의 _meta에 넣을 캐시 키 필드"""
+        _stats["stores"] += 1
+        return {
+            "source_hash": source_hash,
+            "pipeline_version": self.versions[mode],
+        }
+
+
+def get_profile_cache_stats() -> dict:
+    """프로필 캐시 히트/미스 메트릭"""
+    lookups = _stats["hits"] + _stats["misses"]
+    return {
+        **_stats,
+        "hit_rate": round(_stats["hits"] / lookups, 3) if lookups else 0.0,
+        "max_age_seconds": COMPANY_PROFILE_CACHE_MAX_AGE_SECONDS,
+    }
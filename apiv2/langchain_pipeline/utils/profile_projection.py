@@ -0,0 +1,110 @@
+"""
+비교 프롬프트용 프로필 축약
+
+CultureCompareChain에 넣기 전에 회사/구직자 프로필에서 매칭 프롬프트가 쓰는 필드만 남기고
+JSON을 공백 없이 직렬화한다.
+
+- 최상위: 회사 profile_meta/company_info_fields/scoring_axes,
+  구직자 profile_meta/profile_keywords/user_info_fields/scoring_axes만 유지
+  (_id, _meta, _source, created_at/updated_at, extraction_quality, schema_version 제외)
+- scoring_axes.scoring_policy: 모든 문서에 같은 정책 설명이므로 제외
+- evidence 목록: 항목 수 EVIDENCE_MAX_ITEMS, quote 길이 EVIDENCE_QUOTE_MAX_CHARS로 제한
+- None / 빈 목록 / 빈 객체 제거 ("unknown" 값은 근거 부족 표시이므로 유지)
+"""
+
+import json
+import logging
+from typing import Any, Optional
+
+from apiv2.langchain_pipeline.config import EVIDENCE_MAX_ITEMS, EVIDENCE_QUOTE_MAX_CHARS
+from apiv2.langchain_pipeline.utils.token_counter import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+COMPANY_PROMPT_KEYS = ["profile_meta", "company_info_fields", "scoring_axes"]
+DEVELOPER_PROMPT_KEYS = ["profile_meta", "profile_keywords", "user_info_fields", "scoring_axes"]
+
+DROP_KEYS = {"_id", "_meta", "_source", "created_at", "updated_at", "scoring_policy"}
+
+_stats = {
+    "calls": 0,
+    "tokens_before": 0,
+    "tokens_after": 0,
+}
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    return text if len(text) <= max_chars else text[:max_chars].rstrip() + "…"
+
+
+def _compact(value: Any, key: str = "") -> Any:
+    if isinstance(value, dict):
+        result = {}
+        for k, v in value.items():
+            if k in DROP_KEYS:
+                continue
+            v = _compact(v, k)
+            if v is None or v == [] or v == {}:
+                continue
+            result[k] = v
+        return result
+    if isinstance(value, list):
+        items = value[:EVIDENCE_MAX_ITEMS] if key == "evidence" else value
+        return [item for item in (_compact(v) for v in items) if item not in (None, [], {})]
+    if isinstance(value, str) and key == "quote":
+        return _truncate(value, EVIDENCE_QUOTE_MAX_CHARS)
+    return value
+
+
+def project_profile(profile: dict[str, Any], keys: Optional[list[str]] = None) -> dict[str, Any]:
+    """
+    프롬프트에 필요한 필드만 남긴 프로필
+
+    Args:
+        profile: 회사 또는 구직자 프로필
+        keys: 유지할 최상위 키 (COMPANY_PROMPT_KEYS / DEVELOPER_PROMPT_KEYS, None이면 전체)
+
+    Returns:
+        축약된 프로필 (원본은 변경하지 않음)
+    """
+    if keys is not None:
+        profile = {k: profile[k] for k in keys if k in profile}
+    return _compact(profile)
+
+
+def dumps_compact(value: Any) -> str:
+    """공백 없는 JSON 직렬화"""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def serialize_for_prompt(profile: dict[str, Any], keys: Optional[list[str]], label: str = "") -> str:
+    """
+    프로필 축약 + 직렬화, 축약 전후 토큰 수 기록
+
+    Args:
+        profile: 회사 또는 구직자 프로필
+        keys: 유지할 최상위 키 (None이면 전체, 축별 비교처럼 이미 필요한 경로만 고른 경우)
+        label: 로그용 이름 (company / developer 등)
+
+    Returns:
+        프롬프트에 넣을 JSON 문자열
+    """
+    before = estimate_tokens(json.dumps(profile, ensure_ascii=False, indent=2, default=str))
+    text = dumps_compact(project_profile(profile, keys))
+    after = estimate_tokens(text)
+
+    _stats["calls"] += 1
+    _stats["tokens_before"] += before
+    _stats["tokens_after"] += after
+    logger.info(f"🔄 [Match]    {label} 프로필 축약: {before:,} → {after:,} tokens")
+    return text
+
+
+def get_projection_stats() -> dict:
+    """프로필 축약 메트릭"""
+    saved = _stats["tokens_before"] - _stats["tokens_after"]
+    return {
+        **_stats,
+        "tokens_saved": saved,
+        "saved_ratio": round(saved / _stats["tokens_before"], 3) if _stats["tokens_before"] else 0.0,
+    }
@@ -0,0 +1,145 @@
+"""
+저장된 매칭 결과 일괄 재채점
+
+culture_fit_results의 axis_alignments만 커서로 읽어 새 가중치로 overall을 다시 계산하고
+bulk_write로 되돌려 쓴다. LLM 호출 없이 가중치 변경("what if")을 반영할 때 사용.
+
+- 배치 단위(batch_size)로 match_scoring.score_matrix 벡터화 계산
+- 제자리 모드: overall + meta.scoring_version 갱신 (이미 같은 버전인 문서는 건너뜀 → 재실행 시 이어서 진행)
+- 변형 모드: overall_variants.<scoring_version>에만 저장 (현재 overall 유지)
+"""
+
+import logging
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from pymongo import UpdateOne
+from pymongo.collection import Collection
+
+from apiv2.langchain_pipeline.utils.match_scoring import (
+    AXES,
+    build_overalls,
+    normalize_weights,
+    score_matrix,
+    to_axis_matrix,
+    weight_vector,
+)
+
+logger = logging.getLogger(__name__)
+
+# axis_alignments 중 점수 계산에 필요한 필드만 읽음
+RESCORE_PROJECTION = {
+    f"axis_alignments.{axis}.{field}": 1
+    for axis in AXES
+    for field in ("status", "axis_score", "evidence_refs")
+}
+
+
+@dataclass
+class RescoreStats:
+    """재채점 결과"""
+    scoring_version: str
+    matched: int = 0
+    modified: int = 0
+    batches: int = 0
+    read_seconds: float = 0.0
+    score_seconds: float = 0.0
+    write_seconds: float = 0.0
+    total_seconds: float = 0.0
+
+    @property
+    def docs_per_second(self) -> float:
+        return round(self.matched / self.total_seconds, 1) if self.total_seconds else 0.0
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "docs_per_second": self.docs_per_second}
+
+
+def rescore_collection(
+    collection: Collection,
+    weights: Optional[Any],
+    scoring_version: str,
+    query: Optional[dict] = None,
+    batch_size: int = 5000,
+    variant: bool = False,
+    dry_run: bool = False,
+    on_batch: Optional[Callable[[RescoreStats], None]] = None,
+) -> RescoreStats:
+    """
+    매칭 결과 컬렉션 일괄 재채점
+
+    Args:
+        collection: culture_fit_results 컬렉션 (pymongo)
+        weights: 축별 가중치 (ScoringWeights 또는 dict)
+        scoring_version: 새 meta.scoring_version (변형 모드에서는 저장 키)
+        query: 추가 필터 (예: 특정 회사)
+        batch_size: 커서 배치 / bulk_write 단위
+        variant: True면 overall_variants.<scoring_version>에만 저장
+        dry_run: True면 계산만 하고 쓰지 않음
+        on_batch: 배치마다 호출되는 진행 콜백
+
+    Returns:
+        RescoreStats
+    """
+    normalized = normalize_weights(weights)
+    w = weight_vector(normalized)
+    stats = RescoreStats(scoring_version=scoring_version)
+
+    target = f"overall_variants.{scoring_version}" if variant else "overall"
+    filter_ = dict(query or {})
+    if not variant:
+        # 재실행 시 이미 반영된 문서는 건너뜀
+        filter_["meta.scoring_version"] = {"$ne": scoring_version}
+
+    total_start = time.perf_counter()
+    cursor = collection.find(filter_, RESCORE_PROJECTION, batch_size=batch_size)
+
+    def flush(docs: list[dict]):
+        score_start = time.perf_counter()
+        matrix = to_axis_matrix(doc.get("axis_alignments") for doc in docs)
+        overalls = build_overalls(matrix, score_matrix(matrix, w), normalized)
+        now = datetime.utcnow()
+        ops = []
+        for doc, overall in zip(docs, overalls):
+            update = {target: overall, "updated_at": now}
+            if not variant:
+                update["meta.scoring_version"] = scoring_version
+            ops.append(UpdateOne({"_id": doc["_id"]}, {"$set": update}))
+        stats.score_seconds += time.perf_counter() - score_start
+
+        if not dry_run:
+            write_start = time.perf_counter()
+            write_result = collection.bulk_write(ops, ordered=False)
+            stats.modified += write_result.modified_count
+            stats.write_seconds += time.perf_counter() - write_start
+
+        stats.matched += len(docs)
+        stats.batches += 1
+        if on_batch:
+            stats.total_seconds = time.perf_counter() - total_start
+            on_batch(stats)
+
+    batch: list[dict] = []
+    read_start = time.perf_counter()
+    for doc in cursor:
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            stats.read_seconds += time.perf_counter() - read_start
+            flush(batch)
+            batch = []
+            read_start = time.perf_counter()
+    stats.read_seconds += time.perf_counter() - read_start
+    if batch:
+        flush(batch)
+
+    stats.total_seconds = time.perf_counter() - total_start
+    for key in ("read_seconds", "score_seconds", "write_seconds", "total_seconds"):
+        setattr(stats, key, round(getattr(stats, key), 2))
+
+    logger.info(
+        f"🔄 [Match] 재채점 완료 ({scoring_version}): {stats.matched:,}건, "
+        f"{stats.total_seconds}s ({stats.docs_per_second:,} docs/s)"
+    )
+    return stats
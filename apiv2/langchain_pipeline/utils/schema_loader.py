@@ -75,6 +75,60 @@ def get_schema_for_prompt(schema_name: str, escape_braces: bool = True) -> str:
     return schema_str
 
 
+def select_paths(document: dict[str, Any], paths: list[str]) -> dict[str, Any]:
+    """
+    점(.) 경로로 지정한 섹션만 남긴 부분 문서 반환 (중첩 구조 유지)
+
+    스키마와 LLM 출력 모두에 사용한다.
+    예: ["profile_meta", "company_info_fields.basic_profile"]
+
+    Args:
+        document: 원본 딕셔너리
+        paths: 남길 섹션 경로 목록
+
+    Returns:
+        같은 모양의 부분 딕셔너리 (없는 경로는 생략)
+    """
+    result: dict[str, Any] = {}
+    for path in paths:
+        keys = path.split(".")
+        source: Any = document
+        for key in keys:
+            if not isinstance(source, dict) or key not in source:
+                break
+            source = source[key]
+        else:
+            target = result
+            for key in keys[:-1]:
+                target = target.setdefault(key, {})
+            target[keys[-1]] = source
+    return result
+
+
+def get_section_schema_for_prompt(
+    schema_name: str,
+    paths: list[str],
+    escape_braces: bool = True,
+) -> str:
+    """
+    지정한 섹션만 포함한 프롬프트용 스키마 문자열 반환
+
+    Args:
+        schema_name: 스키마 파일명
+        paths: 포함할 섹션 경로 목록
+        escape_braces: LangChain 템플릿용 중괄호 이스케이프 여부
+
+    Returns:
+        프롬프트용 부분 스키마 문자열
+    """
+    schema_str = schema_to_string(select_paths(load_schema(schema_name), paths))
+
+    if escape_braces:
+        schema_str = schema_str.replace("{", "{{").replace("}", "}}")
+
+    return schema_str
+
+
 def list_available_schemas() -> list[str]:
     """
     사용 가능한 스키마 목록 반환
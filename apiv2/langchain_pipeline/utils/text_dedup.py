@@ -0,0 +1,89 @@
+"""
+페이지 간 중복 블록 제거
+
+같은 회사 사이트에서 스크래핑한 페이지들은 메뉴, 푸터, 쿠키 안내, 채용공고 목록 등
+같은 블록을 반복해서 포함한다. 연속된 N줄(line shingle) 단위로 지문을 만들어
+앞선 페이지(또는 같은 페이지 앞부분)에 이미 나온 블록에 속한 줄을 제거한다.
+
+- 페이지 순서가 우선순위 (채용공고 → 추가 소스 순으로 넘기면 공고 본문은 그대로 유지)
+- 줄 비교는 공백/대소문자를 정규화한 값으로 수행
+- N줄보다 짧은 페이지는 페이지 전체를 하나의 블록으로 취급
+"""
+
+import re
+from dataclasses import dataclass, asdict
+
+from apiv2.langchain_pipeline.utils.token_counter import estimate_tokens
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class DedupStats:
+    """중복 제거 통계"""
+    pages: int = 0
+    lines_before: int = 0
+    lines_removed: int = 0
+    chars_before: int = 0
+    chars_after: int = 0
+    tokens_before: int = 0
+    tokens_after: int = 0
+
+    @property
+    def chars_removed(self) -> int:
+        return self.chars_before - self.chars_after
+
+    @property
+    def tokens_removed(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "chars_removed": self.chars_removed, "tokens_removed": self.tokens_removed}
+
+
+def _normalize_line(line: str) -> str:
+    return _WHITESPACE.sub(" ", line).strip().lower()
+
+
+def dedupe_pages(pages: list[str], shingle_lines: int = 3) -> tuple[list[str], DedupStats]:
+    """
+    페이지 목록에서 반복 블록 제거
+
+    Args:
+        pages: 페이지 본문 목록 (앞쪽 페이지가 우선)
+        shingle_lines: 블록 지문을 만들 연속 줄 수
+
+    Returns:
+        (중복이 제거된 페이지 목록, 통계)
+    """
+    stats = DedupStats(pages=len(pages))
+    seen: set[int] = set()
+    deduped: list[str] = []
+
+    for page in pages:
+        lines = [line for line in page.split("\n") if line.strip()]
+        normalized = [_normalize_line(line) for line in lines]
+        size = min(shingle_lines, len(lines))
+        drop = [False] * len(lines)
+
+        for i in range(len(lines) - size + 1):
+            fingerprint = hash(tuple(normalized[i:i + size]))
+            if fingerprint in seen:
+                for j in range(i, i + size):
+                    drop[j] = True
+            else:
+                seen.add(fingerprint)
+
+        kept = [line for line, dropped in zip(lines, drop) if not dropped]
+        deduped.append("\n".join(kept))
+
+        stats.lines_before += len(lines)
+        stats.lines_removed += sum(drop)
+
+    before = "\n".join(pages)
+    after = "\n".join(deduped)
+    stats.chars_before = len(before)
+    stats.chars_after = len(after)
+    stats.tokens_before = estimate_tokens(before)
+    stats.tokens_after = estimate_tokens(after)
+    return deduped, stats
@@ -0,0 +1,21 @@
+"""
+토큰 수 추정
+
+Gemini 토크나이저를 호출하지 않고 로컬에서 대략적인 토큰 수를 계산한다.
+(로그/예산 계산용, 정확한 과금 토큰은 응답의 usage_metadata 기준)
+
+- ASCII(영문/숫자/기호): 약 4자당 1토큰
+- 한글 등 비ASCII: 약 1.5자당 1토큰
+"""
+
+ASCII_CHARS_PER_TOKEN = 4.0
+NON_ASCII_CHARS_PER_TOKEN = 1.5
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 대략적인 토큰 수"""
+    if not text:
+        return 0
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    non_ascii_chars = len(text) - ascii_chars
+    return int(ascii_chars / ASCII_CHARS_PER_TOKEN + non_ascii_chars / NON_ASCII_CHARS_PER_TOKEN) + 1
@@ -0,0 +1,157 @@
+"""
+회사 분석 모드 비교: two_stage(수집 → 분석 2회 호출) vs fused(단일 호출)
+
+같은 스크래핑 텍스트로 두 모드를 번갈아 실행하고 지연 시간, 토큰 사용량,
+출력 차이(축별 점수/confidence, unknown 필드 수)를 비교한다.
+결과를 보고 회사별로 company_registry.analysis_mode를 정한다.
+
+실행:
+    python bench_company_modes.py https://toss.im/career/job-detail?job_id=...
+    python bench_company_modes.py <URL> --repeat 3 --output modes_toss.json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any
+
+from apiv2.langchain_pipeline.chains.company_chain import CompanyAnalysisChain
+from apiv2.langchain_pipeline.utils.company_registry import get_company_registry
+from apiv2.langchain_pipeline.utils.token_counter import estimate_tokens
+
+AXES = [
+    "technical_fit_company",
+    "execution_style_company",
+    "collaboration_style_company",
+    "ownership_company",
+    "growth_orientation_company",
+    "work_expectation_company",
+]
+
+
+def count_unknowns(value: Any) -> int:
+    """unknown/null 리프 값 개수"""
+    if isinstance(value, dict):
+        return sum(count_unknowns(v) for v in value.values())
+    if isinstance(value, list):
+        return sum(count_unknowns(v) for v in value)
+    return 1 if value in (None, "unknown") else 0
+
+
+def axis_summary(result: dict) -> dict[str, dict]:
+    axes = result.get("scoring_axes", {}) or {}
+    return {
+        axis: {
+            "score": (axes.get(axis) or {}).get("score"),
+            "confidence": (axes.get(axis) or {}).get("confidence"),
+            "evidence": len((axes.get(axis) or {}).get("evidence") or []),
+        }
+        for axis in AXES
+    }
+
+
+async def run_mode(chain: CompanyAnalysisChain, content: str, mode: str) -> dict:
+    before = dict(chain.usage)
+    start = time.perf_counter()
+    result, used_mode = await chain.analyze_content(content, mode)
+    elapsed = time.perf_counter() - start
+    return {
+        "mode": used_mode,
+        "seconds": round(elapsed, 2),
+        "calls": chain.usage["calls"] - before["calls"],
+        "input_tokens": chain.usage["input_tokens"] - before["input_tokens"],
+        "output_tokens": chain.usage["output_tokens"] - before["output_tokens"],
+        "unknowns": count_unknowns(result),
+        "axes": axis_summary(result),
+    }
+
+
+def aggregate(runs: list[dict]) -> dict:
+    seconds = [r["seconds"] for r in runs]
+    return {
+        "runs": len(runs),
+        "mean_seconds": round(statistics.mean(seconds), 2),
+        "min_seconds": min(seconds),
+        "max_seconds": max(seconds),
+        "mean_input_tokens": round(statistics.mean(r["input_tokens"] for r in runs)),
+        "mean_output_tokens": round(statistics.mean(r["output_tokens"] for r in runs)),
+        "mean_unknowns": round(statistics.mean(r["unknowns"] for r in runs), 1),
+    }
+
+
+def score_diffs(two_stage: list[dict], fused: list[dict]) -> dict[str, int | None]:
+    """축별 점수 차이 (마지막 실행 기준, fused - two_stage)"""
+    diffs = {}
+    for axis in AXES:
+        a = two_stage[-1]["axes"][axis]["score"]
+        b = fused[-1]["axes"][axis]["score"]
+        try:
+            diffs[axis] = int(b) - int(a)
+        except (TypeError, ValueError):
+            diffs[axis] = None
+    return diffs
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="회사 분석 모드 비교")
+    parser.add_argument("url", help="채용공고 URL")
+    parser.add_argument("--repeat", type=int, default=2, help="모드별 반복 횟수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    chain = CompanyAnalysisChain(save_to_db=False)
+    registry = get_company_registry()
+    company = registry.match_url(args.url)
+
+    urls = [args.url] + (registry.get_sources(company) if company else [])
+    content = await chain.scrape_urls(urls)
+    await chain.scraper.close()
+    print(f"회사: {company or '미확인'} | 페이지 {len(urls)}개 | {len(content):,} chars (약 {estimate_tokens(content):,} tokens)\n")
+
+    runs: dict[str, list[dict]] = {"two_stage": [], "fused": []}
+    for i in range(args.repeat):
+        # 순서 효과를 줄이기 위해 번갈아 실행
+        order = ["two_stage", "fused"] if i % 2 == 0 else ["fused", "two_stage"]
+        for mode in order:
+            run = await run_mode(chain, content, mode)
+            runs[mode].append(run)
+            print(f"  [{i + 1}/{args.repeat}] {mode:<9} {run['seconds']:>6.1f}s  "
+                  f"calls={run['calls']}  in={run['input_tokens']:,}  out={run['output_tokens']:,}")
+
+    if any(r["mode"] != "fused" for r in runs["fused"]):
+        print("\n⚠️ 토큰 예산 초과로 fused 실행이 two_stage로 전환되어 비교할 수 없습니다.")
+
+    report = {
+        "company": company,
+        "url": args.url,
+        "content_chars": len(content),
+        "two_stage": aggregate(runs["two_stage"]),
+        "fused": aggregate(runs["fused"]),
+        "score_diff_fused_minus_two_stage": score_diffs(runs["two_stage"], runs["fused"]),
+        "runs": runs,
+    }
+
+    print(f"\n{'':<12}{'two_stage':>12}{'fused':>12}")
+    for key in ("mean_seconds", "max_seconds", "mean_input_tokens", "mean_output_tokens", "mean_unknowns"):
+        print(f"{key:<20}{report['two_stage'][key]:>12}{report['fused'][key]:>12}")
+    print("\n축별 점수 차이 (fused - two_stage):")
+    for axis, diff in report["score_diff_fused_minus_two_stage"].items():
+        print(f"  {axis:<30} {diff if diff is not None else 'n/a'}")
+
+    diffs = [d for d in report["score_diff_fused_minus_two_stage"].values() if d is not None]
+    faster = report["fused"]["mean_seconds"] < report["two_stage"]["mean_seconds"]
+    close = len(diffs) == len(AXES) and all(abs(d) <= 1 for d in diffs)
+    recommendation = "fused" if faster and close else "two_stage"
+    report["recommendation"] = recommendation
+    print(f"\n권장 모드: {recommendation} (fused가 더 빠르고 모든 축 점수 차이가 1 이하일 때 fused)")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
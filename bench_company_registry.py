@@ -0,0 +1,104 @@
+"""
+회사 매칭 벤치마크: 기존 중첩 `in` 검사 vs Aho-Corasick 레지스트리
+
+레지스트리 크기(회사 수)를 늘려가며 스크래핑 텍스트 1건의 매칭 시간을 비교한다.
+
+실행:
+    python bench_company_registry.py
+    python bench_company_registry.py --sizes 3 100 1000 5000 --text-kb 60
+"""
+
+import argparse
+import random
+import string
+import time
+
+from apiv2.langchain_pipeline.config import COMPANY_KEYWORDS
+from apiv2.langchain_pipeline.utils.company_registry import CompanyEntry, CompanyRegistry
+
+
+def naive_match(text: str, keywords: dict[str, list[str]]) -> str | None:
+    """레지스트리 이전 config.match_company와 같은 방식 (키워드 순차 검사)"""
+    text_lower = text.lower()
+    for company, words in keywords.items():
+        for word in words:
+            if word.lower() in text_lower:
+                return company
+    return None
+
+
+def random_word(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(length))
+
+
+def build_keywords(size: int, rng: random.Random) -> dict[str, list[str]]:
+    """실제 시드 회사 + 합성 회사 (회사당 키워드 4개). 실제 회사는 맨 뒤에 둬서 최악의 경우 측정"""
+    keywords: dict[str, list[str]] = {}
+    for i in range(max(0, size - len(COMPANY_KEYWORDS))):
+        base = random_word(rng, 8)
+        keywords[f"company_{i}"] = [base, f"{base} inc", f"{base}corp", f"회사{base}"]
+    keywords.update(COMPANY_KEYWORDS)
+    return keywords
+
+
+def build_text(kb: int, rng: random.Random) -> str:
+    """한/영 혼합 채용공고 느낌의 텍스트 + 끝부분에 회사명 등장"""
+    filler = [
+        "백엔드 개발자", "자격요건", "우대사항", "협업", "코드 리뷰", "서비스 운영",
+        "python", "kubernetes", "distributed systems", "on-call", "product", "growth",
+    ]
+    parts = []
+    size = 0
+    while size < kb * 1024:
+        word = rng.choice(filler)
+        parts.append(word)
+        size += len(word.encode("utf-8")) + 1
+    parts.append("비바리퍼블리카")
+    return " ".join(parts)
+
+
+def time_it(fn, repeat: int) -> float:
+    """평균 실행 시간 (ms)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="회사 매칭 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 30, 300, 1000, 3000, 10000])
+    parser.add_argument("--text-kb", type=int, default=60, help="매칭 대상 텍스트 크기 (KB)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    text = build_text(args.text_kb, rng)
+
+    print(f"텍스트 {len(text):,} chars, 반복 {args.repeat}회 평균\n")
+    print(f"{'회사 수':>8} {'키워드':>8} {'상태 수':>10} {'컴파일(ms)':>11} {'naive(ms)':>11} {'automaton(ms)':>14} {'배율':>7}")
+    print("-" * 76)
+
+    for size in args.sizes:
+        keywords = build_keywords(size, rng)
+        entries = [
+            CompanyEntry(name=name, keywords=words, priority=i)
+            for i, (name, words) in enumerate(keywords.items())
+        ]
+        registry = CompanyRegistry(entries)
+
+        expected = naive_match(text, keywords)
+        actual = registry.match_text(text)
+        assert expected == actual, f"결과 불일치: naive={expected}, automaton={actual}"
+
+        naive_ms = time_it(lambda: naive_match(text, keywords), args.repeat)
+        automaton_ms = time_it(lambda: registry.match_text(text), args.repeat)
+        stats = registry.stats()
+        print(
+            f"{len(keywords):>8} {stats['patterns']:>8} {stats['states']:>10} {stats['build_ms']:>11.1f} "
+            f"{naive_ms:>11.2f} {automaton_ms:>14.2f} {naive_ms / automaton_ms:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -287,7 +287,9 @@ async def get_scoring_axes(candidate_id: str) -> Optional[dict]:
 async def get_candidates_for_matching(
     role: Optional[str] = None,
     min_score: int = 0,
-    limit: int = 50
+    limit: int = 50,
+    candidate_ids: Optional[list[str]] = None,
+    full_profile: bool = False
 ) -> list[dict]:
     """회사와 매칭할 지원자 목록 조회 (매칭에 필요한 필드만)
 
@@ -295,6 +297,8 @@ async def get_candidates_for_matching(
         role: 역할 필터
         min_score: 최소 기술 점수
         limit: 최대 반환 문서 수
+        candidate_ids: 지원자 ID 목록 필터
+        full_profile: True면 비교 프롬프트에 쓰는 섹션 전체 포함 (배치 매칭용)
 
     Returns:
         매칭용 지원자 데이터 리스트
@@ -304,16 +308,25 @@ async def get_candidates_for_matching(
         query["profile_meta.primary_role"] = role
     if min_score > 0:
         query["scoring_axes.technical_fit_user.score"] = {"$gte": min_score}
+    if candidate_ids:
+        query["_id"] = {"$in": [ObjectId(i) for i in candidate_ids if ObjectId.is_valid(i)]}
 
-    cursor = get_collection().find(
-        query,
-        {
+    if full_profile:
+        projection = {
+            "profile_meta": 1,
+            "profile_keywords": 1,
+            "user_info_fields": 1,
+            "scoring_axes": 1,
+        }
+    else:
+        projection = {
             "profile_meta": 1,
             "scoring_axes": 1,
             "user_info_fields.technical_capability.stack": 1,
             "user_info_fields.work_environment_signals": 1,
         }
-    ).limit(limit)
+
+    cursor = get_collection().find(query, projection).limit(limit)
 
     results = []
     async for doc in cursor:
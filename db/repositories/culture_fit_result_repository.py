@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Optional
 
 from db.mongodb import get_database
+from schema.culture_fit_result import ScoringWeights
 
 
 def get_collection():
@@ -29,6 +30,34 @@ async def create_matching_result(data: dict) -> str:
     return str(result.inserted_id)
 
 
+async def upsert_matching_result(data: dict) -> str:
+    """회사-개발자 쌍 기준으로 매칭 결과 저장 (이미 있으면 교체)
+
+    Args:
+        data: inputs.company_profile_ref.profile_id / developer_profile_ref.profile_id가 채워진 매칭 결과
+
+    Returns:
+        문서의 ObjectId 문자열
+    """
+    key = {
+        "inputs.company_profile_ref.profile_id": data["inputs"]["company_profile_ref"]["profile_id"],
+        "inputs.developer_profile_ref.profile_id": data["inputs"]["developer_profile_ref"]["profile_id"],
+    }
+    now = datetime.utcnow()
+    data.pop("_id", None)
+    data.pop("created_at", None)
+    data["updated_at"] = now
+    result = await get_collection().update_one(
+        key,
+        {"$set": data, "$setOnInsert": {"created_at": now}},
+        upsert=True
+    )
+    if result.upserted_id is not None:
+        return str(result.upserted_id)
+    doc = await get_collection().find_one(key, {"_id": 1})
+    return str(doc["_id"])
+
+
 async def get_matching_result(result_id: str) -> Optional[dict]:
     """ID로 매칭 결과 조회
 
@@ -356,6 +385,151 @@ async def get_top_matches_for_company(
     return results
 
 
+# ============================================================
+# 가중치 랭킹 (쿼리 시점 재계산)
+# ============================================================
+
+# 요청 가중치 스키마와 같은 축 목록 (축이 추가되면 ScoringWeights만 수정)
+RANKING_AXES = list(ScoringWeights.model_fields)
+
+
+def _axis_score_expr(axis: str) -> dict:
+    """match_scoring.parse_axis_score와 같은 규칙의 축 점수 (unknown/누락/bool/숫자가 아닌 문자열은 null)
+
+    숫자는 정수로 내리고, "3" 같은 숫자 문자열은 $convert로 변환한다.
+    """
+    alignment = f"$axis_alignments.{axis}"
+    value = f"{alignment}.axis_score"
+    return {
+        "$cond": [
+            {"$eq": [f"{alignment}.status", "unknown"]},
+            None,
+            {"$switch": {
+                "branches": [
+                    {"case": {"$isNumber": value}, "then": {"$trunc": value}},
+                    {
+                        "case": {"$and": [
+                            {"$eq": [{"$type": value}, "string"]},
+                            {"$regexMatch": {"input": value, "regex": r"^\s*[0-9]+\s*$"}},
+                        ]},
+                        "then": {"$convert": {
+                            "input": {"$trim": {"input": value}},
+                            "to": "double",
+                            "onError": None,
+                            "onNull": None,
+                        }},
+                    },
+                ],
+                "default": None,
+            }},
+        ]
+    }
+
+
+def build_weighted_ranking_pipeline(
+    match: dict,
+    weights: dict[str, float],
+    skip: int = 0,
+    limit: int = 10
+) -> list[dict]:
+    """가중 점수 랭킹 집계 파이프라인 생성
+
+    overall 계산 규칙과 같게 점수가 있는 축만 분모에 넣는다.
+
+    Args:
+        match: $match 조건
+        weights: 축별 가중치 (RANKING_AXES 키)
+        skip: 건너뛸 문서 수
+        limit: 최대 반환 문서 수
+
+    Returns:
+        aggregate()에 넘길 파이프라인
+    """
+    active = [axis for axis in RANKING_AXES if weights.get(axis, 0) > 0]
+    weighted_sum = [
+        {"$multiply": [{"$ifNull": [f"$axis_scores.{axis}", 0]}, weights[axis]]}
+        for axis in active
+    ]
+    weight_total = [
+        {"$cond": [{"$eq": [f"$axis_scores.{axis}", None]}, 0, weights[axis]]}
+        for axis in active
+    ]
+
+    return [
+        {"$match": match},
+        # 정렬 전에 필요한 필드만 남겨 메모리 사용 최소화
+        {"$project": {
+            "inputs": 1,
+            "overall.match_score": 1,
+            "overall.score_band": 1,
+            "overall.confidence": 1,
+            "axis_scores": {axis: _axis_score_expr(axis) for axis in RANKING_AXES},
+        }},
+        {"$addFields": {
+            "weight_total": {"$add": weight_total} if active else 0,
+            "weighted_sum": {"$add": weighted_sum} if active else 0,
+        }},
+        {"$addFields": {
+            "weighted_score": {
+                "$cond": [
+                    {"$gt": ["$weight_total", 0]},
+                    {"$round": [{"$divide": ["$weighted_sum", "$weight_total"]}, 1]},
+                    None,
+                ]
+            }
+        }},
+        {"$project": {"weight_total": 0, "weighted_sum": 0}},
+        # 점수 없는 결과는 맨 뒤, 동점은 _id로 고정해 페이지 간 순서 유지
+        {"$sort": {"weighted_score": -1, "_id": 1}},
+        {"$facet": {
+            "total": [{"$count": "count"}],
+            "items": [{"$skip": skip}, {"$limit": limit}],
+        }},
+    ]
+
+
+async def rank_matches_for_company(
+    company_profile_id: str,
+    weights: Optional[dict[str, float]] = None,
+    skip: int = 0,
+    limit: int = 10
+) -> dict:
+    """회사의 매칭 결과를 요청 가중치로 다시 계산해 순위 조회 (LLM 호출 없음)
+
+    Args:
+        company_profile_id: 회사 프로필 ID
+        weights: 축별 가중치 (기본: 동일 가중치)
+        skip: 건너뛸 문서 수
+        limit: 최대 반환 수
+
+    Returns:
+        {"total", "skip", "limit", "weights", "items"} (items는 weighted_score 내림차순)
+    """
+    weights = {axis: float((weights or {}).get(axis, 1.0)) for axis in RANKING_AXES}
+    pipeline = build_weighted_ranking_pipeline(
+        {"inputs.company_profile_ref.profile_id": company_profile_id},
+        weights,
+        skip=skip,
+        limit=limit,
+    )
+
+    total = 0
+    items = []
+    async for doc in get_collection().aggregate(pipeline, allowDiskUse=True):
+        total = doc["total"][0]["count"] if doc["total"] else 0
+        items = doc["items"]
+    for item in items:
+        item["_id"] = str(item["_id"])
+
+    return {
+        "total": total,
+        "skip": skip,
+        "limit": limit,
+        "weights": weights,
+        "items": items,
+    }
+
+
 # ============================================================
 # 인덱스 설정
 # ============================================================
@@ -4,16 +4,49 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from db.mongodb import connect_db, close_db
 from db.repositories import candidate_repository
+from apiv2.langchain_pipeline.scrapers.browser_pool import (
+    start_browser_pool,
+    close_browser_pool,
+    get_browser_pool,
+)
+from apiv2.langchain_pipeline.scrapers.scrape_cache import get_scrape_cache
+from apiv2.langchain_pipeline.scrapers.tiered_scraper import close_http_client, get_tier_stats
+from apiv2.langchain_pipeline.scrapers.page_readiness import get_readiness_stats
+from apiv2.langchain_pipeline.scrapers.request_blocker import get_blocking_stats
+from apiv2.langchain_pipeline.utils.profile_cache import get_profile_cache_stats
+from apiv2.langchain_pipeline.utils.profile_projection import get_projection_stats
+from apiv2.langchain_pipeline.utils.context_cache import close_context_cache, get_context_cache_stats
+from apiv2.langchain_pipeline.loaders.pdf_text_extractor import get_text_extraction_stats
+from apiv2.langchain_pipeline.utils.byte_budget import get_pdf_byte_budget_stats
+from apiv2.langchain_pipeline.utils.file_registry import (
+    start_file_registry,
+    close_file_registry,
+    get_file_registry_stats,
+)
+from apiv2.langchain_pipeline.utils.company_registry import (
+    start_company_registry,
+    close_company_registry,
+    get_registry_stats,
+)
 
 from api.routes.upload_router import router as upload_router
 from api.routes.analyze_router import router as analyze_router
+from api.routes.matching_router import router as matching_router
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await connect_db()
     await candidate_repository.create_indexes()
+    await start_company_registry()
+    await start_browser_pool()
+    await start_file_registry()
     yield
+    await close_browser_pool()
+    await close_context_cache()
+    await close_file_registry()
+    await close_company_registry()
+    await close_http_client()
     await close_db()
 
 
@@ -35,7 +68,29 @@ app.add_middleware(
 
 app.include_router(upload_router)
 app.include_router(analyze_router)
+app.include_router(matching_router)
 
 @app.get("/")
 def read_root():
     return {"message": "CultureFit AI API"}
+
+
+@app.get("/metrics")
+def read_metrics():
+    """파이프라인 리소스 메트릭 (브라우저 풀 등)"""
+    pool = get_browser_pool()
+    scrape_cache = get_scrape_cache()
+    return {
+        "browser_pool": pool.stats() if pool else None,
+        "scrape_cache": scrape_cache.stats() if scrape_cache else None,
+        "company_profile_cache": get_profile_cache_stats(),
+        "page_readiness": get_readiness_stats(),
+        "request_blocking": get_blocking_stats(),
+        "scrape_tiers": get_tier_stats(),
+        "company_registry": get_registry_stats(),
+        "compare_context_cache": get_context_cache_stats(),
+        "compare_profile_projection": get_projection_stats(),
+        "gemini_file_registry": get_file_registry_stats(),
+        "pdf_memory_budget": get_pdf_byte_budget_stats(),
+        "pdf_text_extraction": get_text_extraction_stats(),
+    }
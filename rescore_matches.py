@@ -0,0 +1,79 @@
+"""
+매칭 결과 일괄 재채점 (LLM 호출 없음)
+
+culture_fit_results에 저장된 axis_alignments로 overall을 새 가중치로 다시 계산한다.
+
+실행:
+    # 기술 적합도 2배 가중치로 전체 재채점 (overall 갱신)
+    python rescore_matches.py --version alignment-v1-tech2 --weights technical_fit=2
+
+    # 현재 overall은 두고 overall_variants.<version>에 what-if 결과만 저장
+    python rescore_matches.py --version whatif-ops0 --weights ops_quality_responsibility=0 --variant
+
+    # 특정 회사만, 계산만 하고 쓰지 않음
+    python rescore_matches.py --version test --weights-file weights.json --company 토스 --dry-run
+"""
+
+import argparse
+import json
+
+from apiv2.langchain_pipeline.utils.db_handler import DatabaseHandler
+from apiv2.langchain_pipeline.utils.match_scoring import AXES, normalize_weights
+from apiv2.langchain_pipeline.utils.rescoring import rescore_collection
+
+
+def parse_weights(args) -> dict[str, float]:
+    """--weights-file(JSON) + --weights(axis=value,...) 병합, 지정하지 않은 축은 1.0"""
+    weights: dict[str, float] = {}
+    if args.weights_file:
+        with open(args.weights_file, encoding="utf-8") as f:
+            weights.update(json.load(f))
+    for item in filter(None, (args.weights or "").split(",")):
+        axis, _, value = item.partition("=")
+        weights[axis.strip()] = float(value)
+
+    unknown = set(weights) - set(AXES)
+    if unknown:
+        raise SystemExit(f"알 수 없는 축: {', '.join(sorted(unknown))} (사용 가능: {', '.join(AXES)})")
+    return normalize_weights(weights)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="매칭 결과 일괄 재채점")
+    parser.add_argument("--version", required=True, help="새 scoring_version")
+    parser.add_argument("--weights", help="축별 가중치 (예: technical_fit=2,collaboration_style=0.5)")
+    parser.add_argument("--weights-file", help="축별 가중치 JSON 파일")
+    parser.add_argument("--company", help="회사명 필터 (inputs.company_profile_ref.company_name)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="배치 크기")
+    parser.add_argument("--variant", action="store_true", help="overall 대신 overall_variants.<version>에 저장")
+    parser.add_argument("--dry-run", action="store_true", help="계산만 하고 저장하지 않음")
+    args = parser.parse_args()
+
+    weights = parse_weights(args)
+    query = {"inputs.company_profile_ref.company_name": args.company} if args.company else {}
+
+    print(f"scoring_version: {args.version}{' (variant)' if args.variant else ''}{' [dry-run]' if args.dry_run else ''}")
+    print(f"weights: {weights}\n")
+
+    def progress(stats):
+        print(f"  batch {stats.batches:>4}  {stats.matched:>9,} docs  {stats.docs_per_second:>10,} docs/s")
+
+    with DatabaseHandler() as db:
+        stats = rescore_collection(
+            db._get_collection("comparisons"),
+            weights,
+            args.version,
+            query=query,
+            batch_size=args.batch_size,
+            variant=args.variant,
+            dry_run=args.dry_run,
+            on_batch=progress,
+        )
+
+    print(f"\n처리 {stats.matched:,}건 | 수정 {stats.modified:,}건 | {stats.total_seconds}s "
+          f"({stats.docs_per_second:,} docs/s)")
+    print(f"  read {stats.read_seconds}s  score {stats.score_seconds}s  write {stats.write_seconds}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -123,4 +123,21 @@ class MatchingResultCreate(BaseModel):
 
 
 class MatchingResultResponse(MatchingResultCreate):
-    id: str
\ No newline at end of file
+    id: str
+
+# ============================================================
+# Ranking (쿼리 시점 가중치 재계산)
+# ============================================================
+
+class MatchRankingRequest(BaseModel):
+    weights: ScoringWeights = ScoringWeights()
+    skip: int = Field(default=0, ge=0)
+    limit: int = Field(default=10, ge=1, le=100)
+
+
+class BatchMatchingRequest(BaseModel):
+    role: Optional[str] = None
+    min_score: int = Field(default=0, ge=0, le=4)
+    candidate_ids: Optional[list[str]] = None
+    limit: int = Field(default=100, ge=1, le=1000)
+    concurrency: Optional[int] = Field(default=None, ge=1, le=32)  # None이면 BATCH_MATCH_CONCURRENCY
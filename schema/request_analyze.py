@@ -8,6 +8,7 @@ class File(BaseModel):
 class RequestAnalyze(BaseModel):
     jd_url: str
     files: list[File]
+    force_refresh: bool = False  # True면 회사 프로필 캐시 무시
 
 
 
@@ -0,0 +1,171 @@
+import asyncio
+import logging
+import os
+import time
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from db.repositories import candidate_repository, company_repository, culture_fit_result_repository
+from apiv2.langchain_pipeline.chains.compare_chain import CultureCompareChain
+from apiv2.langchain_pipeline.utils.context_cache import (
+    ContextCache,
+    GeminiContextCacheBackend,
+    get_context_cache,
+)
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 동시에 실행할 비교 호출 수 (Gemini 분당 요청 한도에 맞춰 조정)
+BATCH_MATCH_CONCURRENCY = int(os.getenv("BATCH_MATCH_CONCURRENCY", "8"))
+BATCH_MATCH_MAX_CANDIDATES = int(os.getenv("BATCH_MATCH_MAX_CANDIDATES", "1000"))
+
+# 배치 작업 상태 저장소 (프로덕션에서는 Redis 권장)
+batch_jobs: dict[str, dict] = {}
+
+
+def create_batch_job(company_profile_id: str) -> str:
+    """배치 작업 상태 초기화 후 job_id 반환"""
+    job_id = str(uuid.uuid4())
+    batch_jobs[job_id] = {
+        "job_id": job_id,
+        "company_profile_id": company_profile_id,
+        "status": "pending",
+        "total": 0,
+        "completed": 0,
+        "failed": 0,
+        "progress": 0,
+        "message": "배치 매칭 대기 중...",
+        "results": [],
+        "errors": [],
+        "started_at": None,
+        "finished_at": None,
+    }
+    return job_id
+
+
+def _set_refs(result: dict, company_profile_id: str, company: dict, candidate: dict) -> dict:
+    """입력 참조를 저장된 프로필 ID로 고정 (회사별 조회/랭킹 키)"""
+    inputs = result.setdefault("inputs", {})
+    company_ref = inputs.setdefault("company_profile_ref", {})
+    developer_ref = inputs.setdefault("developer_profile_ref", {})
+    company_ref["profile_id"] = company_profile_id
+    company_ref.setdefault("company_name", company.get("profile_meta", {}).get("company_name", "unknown"))
+    developer_ref["profile_id"] = candidate["_id"]
+    developer_ref.setdefault("candidate_name", candidate.get("profile_meta", {}).get("candidate_name", "unknown"))
+    return result
+
+
+async def run_batch_matching(
+    job_id: str,
+    company_profile_id: str,
+    role: Optional[str] = None,
+    min_score: int = 0,
+    candidate_ids: Optional[list[str]] = None,
+    limit: int = 100,
+    concurrency: Optional[int] = None,
+):
+    """회사 1곳과 저장된 지원자 N명을 비교하고, 끝나는 대로 culture_fit_results에 저장
+
+    Args:
+        job_id: create_batch_job()이 반환한 ID
+        company_profile_id: 회사 프로필 ID
+        role: 지원자 역할 필터
+        min_score: 지원자 최소 기술 점수 필터
+        candidate_ids: 지원자 ID 목록 필터
+        limit: 최대 지원자 수
+        concurrency: 동시 비교 호출 수 (None이면 BATCH_MATCH_CONCURRENCY)
+    """
+    concurrency = concurrency or BATCH_MATCH_CONCURRENCY
+    job = batch_jobs[job_id]
+    job.update({"status": "processing", "started_at": datetime.utcnow().isoformat()})
+    total_start = time.time()
+
+    # 회사 쪽 컨텍스트(시스템 프롬프트 + 스키마 + 회사 프로필)는 배치 내 모든 호출이 공유
+    context_cache = get_context_cache()
+    owns_cache = context_cache is None
+    if owns_cache:
+        context_cache = ContextCache(GeminiContextCacheBackend())
+    compare_chain = None
+
+    try:
+        company = await company_repository.get_company(company_profile_id)
+        if not company:
+            raise ValueError(f"회사 프로필을 찾을 수 없습니다: {company_profile_id}")
+
+        candidates = await candidate_repository.get_candidates_for_matching(
+            role=role,
+            min_score=min_score,
+            limit=min(limit, BATCH_MATCH_MAX_CANDIDATES),
+            candidate_ids=candidate_ids,
+            full_profile=True,
+        )
+        job.update({
+            "total": len(candidates),
+            "message": f"지원자 {len(candidates)}명 매칭 중...",
+        })
+        logger.info(f"🔄 [Batch] 배치 매칭 시작 | 회사: {company_profile_id} | 지원자 {len(candidates)}명 | 동시 {concurrency}")
+
+        compare_chain = CultureCompareChain(save_to_db=False, context_cache=context_cache)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def match_one(candidate: dict) -> dict:
+            async with semaphore:
+                result = await compare_chain.compare(company, candidate)
+            _set_refs(result, company_profile_id, company, candidate)
+            result["_meta"] = {
+                "company_name": company.get("profile_meta", {}).get("company_name", "unknown"),
+                "developer_name": candidate.get("profile_meta", {}).get("candidate_name", "unknown"),
+                "batch_job_id": job_id,
+            }
+            matching_id = await culture_fit_result_repository.upsert_matching_result(result)
+            return {
+                "candidate_id": candidate["_id"],
+                "candidate_name": result["_meta"]["developer_name"],
+                "matching_id": matching_id,
+                "match_score": result.get("overall", {}).get("match_score", "unknown"),
+                "score_band": result.get("overall", {}).get("score_band", "unknown"),
+            }
+
+        tasks = {asyncio.create_task(match_one(c)): c for c in candidates}
+        for finished in asyncio.as_completed(tasks):
+            try:
+                job["results"].append(await finished)
+                job["completed"] += 1
+            except Exception as e:
+                job["failed"] += 1
+                job["errors"].append(str(e))
+                logger.warning(f"🔄 [Batch] 매칭 실패: {e}")
+
+            done = job["completed"] + job["failed"]
+            job["progress"] = int(done / job["total"] * 100) if job["total"] else 100
+            job["message"] = f"{done}/{job['total']} 완료 (실패 {job['failed']})"
+
+        job["results"].sort(
+            key=lambda r: r["match_score"] if isinstance(r["match_score"], (int, float)) else -1,
+            reverse=True,
+        )
+        job.update({
+            "status": "completed",
+            "progress": 100,
+            "message": f"배치 매칭 완료: {job['completed']}건 성공, {job['failed']}건 실패",
+        })
+        logger.info(
+            f"🔄 [Batch] ✅ 배치 매칭 완료 | {job['completed']}/{job['total']}건 | "
+            f"{time.time() - total_start:.1f}초 | 캐시 {context_cache.stats()}"
+        )
+
+    except Exception as e:
+        logger.error(f"🔄 [Batch] ❌ 배치 매칭 실패: {e}")
+        job.update({"status": "failed", "message": f"배치 매칭 실패: {e}"})
+
+    finally:
+        job["finished_at"] = datetime.utcnow().isoformat()
+        if compare_chain:
+            compare_chain.close()
+        if owns_cache:
+            await context_cache.close()
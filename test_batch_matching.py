@@ -0,0 +1,164 @@
+"""
+회사 1곳 vs 지원자 N명 배치 매칭 테스트 (services.batch_matching_service, matching_router)
+
+DB/LLM 대신 저장소 함수와 비교 체인을 대역으로 바꿔 동시 실행 한도, 실패 집계,
+진행률 갱신, 결과 저장 키(회사/지원자 프로필 ID)를 확인한다.
+
+실행:
+    python -m pytest -q test_batch_matching.py
+"""
+
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routes import matching_router
+from apiv2.langchain_pipeline.utils.context_cache import ContextCache, LocalContextCacheBackend
+from services import batch_matching_service
+from services.batch_matching_service import batch_jobs, create_batch_job, run_batch_matching
+
+COMPANY_ID = "64b000000000000000000001"
+COMPANY = {"_id": COMPANY_ID, "profile_meta": {"company_name": "토스"}}
+CANDIDATES = [
+    {"_id": f"c{i}", "profile_meta": {"candidate_name": f"지원자{i}"}}
+    for i in range(6)
+]
+
+
+class RecordingJob(dict):
+    """진행률 갱신 기록"""
+
+    def __init__(self, job: dict):
+        super().__init__(job)
+        self.progress_updates = []
+
+    def __setitem__(self, key, value):
+        if key == "progress":
+            self.progress_updates.append(value)
+        super().__setitem__(key, value)
+
+
+class FakeCompareChain:
+    """동시 실행 수를 기록하고 fail_ids 지원자는 실패"""
+
+    active = 0
+    max_active = 0
+    fail_ids: set = set()
+
+    def __init__(self, save_to_db: bool = True, context_cache=None):
+        self.context_cache = context_cache
+        self.closed = False
+
+    async def compare(self, company: dict, candidate: dict) -> dict:
+        cls = FakeCompareChain
+        cls.active += 1
+        cls.max_active = max(cls.max_active, cls.active)
+        try:
+            await asyncio.sleep(0.01)
+            if candidate["_id"] in cls.fail_ids:
+                raise RuntimeError(f"compare failed: {candidate['_id']}")
+            score = 50 + int(candidate["_id"][1:])
+            return {"overall": {"match_score": score, "score_band": "medium"}}
+        finally:
+            cls.active -= 1
+
+    def close(self):
+        self.closed = True
+
+
+def setup_fakes(monkeypatch, candidates=CANDIDATES, fail_ids=()):
+    saved = []
+    queries = []
+
+    async def get_company(company_id):
+        return COMPANY if company_id == COMPANY_ID else None
+
+    async def get_candidates_for_matching(**kwargs):
+        queries.append(kwargs)
+        return candidates
+
+    async def upsert_matching_result(data):
+        saved.append(data)
+        return f"m-{data['inputs']['developer_profile_ref']['profile_id']}"
+
+    FakeCompareChain.active = FakeCompareChain.max_active = 0
+    FakeCompareChain.fail_ids = set(fail_ids)
+    monkeypatch.setattr(batch_matching_service, "CultureCompareChain", FakeCompareChain)
+    monkeypatch.setattr(batch_matching_service, "get_context_cache", lambda: ContextCache(LocalContextCacheBackend()))
+    monkeypatch.setattr(batch_matching_service.company_repository, "get_company", get_company)
+    monkeypatch.setattr(batch_matching_service.candidate_repository, "get_candidates_for_matching", get_candidates_for_matching)
+    monkeypatch.setattr(batch_matching_service.culture_fit_result_repository, "upsert_matching_result", upsert_matching_result)
+    return saved, queries
+
+
+def start_job() -> tuple[str, RecordingJob]:
+    job_id = create_batch_job(COMPANY_ID)
+    job = batch_jobs[job_id] = RecordingJob(batch_jobs[job_id])
+    return job_id, job
+
+
+def test_batch_respects_concurrency_and_counts_failures(monkeypatch):
+    saved, queries = setup_fakes(monkeypatch, fail_ids={"c2"})
+    job_id, job = start_job()
+
+    asyncio.run(run_batch_matching(job_id, COMPANY_ID, role="backend", limit=10, concurrency=2))
+
+    assert FakeCompareChain.max_active == 2
+    assert queries == [{"role": "backend", "min_score": 0, "limit": 10, "candidate_ids": None, "full_profile": True}]
+    assert (job["status"], job["total"], job["completed"], job["failed"]) == ("completed", 6, 5, 1)
+    assert job["errors"] == ["compare failed: c2"]
+    # 끝나는 대로 진행률 갱신 (지원자 1명마다 한 번)
+    assert job.progress_updates == sorted(job.progress_updates)
+    assert len(job.progress_updates) == 6 and job.progress_updates[-1] == 100
+    # 결과는 점수 내림차순
+    assert [r["candidate_id"] for r in job["results"]] == ["c5", "c4", "c3", "c1", "c0"]
+    assert job["results"][0]["matching_id"] == "m-c5"
+
+
+def test_results_are_upserted_by_company_and_candidate(monkeypatch):
+    saved, _ = setup_fakes(monkeypatch, candidates=CANDIDATES[:2])
+    job_id, _ = start_job()
+
+    asyncio.run(run_batch_matching(job_id, COMPANY_ID))
+
+    keys = sorted(
+        (d["inputs"]["company_profile_ref"]["profile_id"], d["inputs"]["developer_profile_ref"]["profile_id"])
+        for d in saved
+    )
+    assert keys == [(COMPANY_ID, "c0"), (COMPANY_ID, "c1")]
+    assert {d["_meta"]["batch_job_id"] for d in saved} == {job_id}
+    assert saved[0]["inputs"]["company_profile_ref"]["company_name"] == "토스"
+
+
+def test_default_concurrency_and_missing_company(monkeypatch):
+    setup_fakes(monkeypatch)
+    monkeypatch.setattr(batch_matching_service, "BATCH_MATCH_CONCURRENCY", 3)
+    job_id, job = start_job()
+
+    asyncio.run(run_batch_matching(job_id, COMPANY_ID, concurrency=None))
+    assert FakeCompareChain.max_active == 3
+
+    job_id, job = start_job()
+    asyncio.run(run_batch_matching(job_id, "64b0000000000000000000ff"))
+    assert job["status"] == "failed" and job["finished_at"] is not None
+
+
+def test_router_rejects_invalid_candidate_ids(monkeypatch):
+    started = []
+    monkeypatch.setattr(matching_router, "run_batch_matching", lambda *args, **kwargs: started.append((args, kwargs)))
+    app = FastAPI()
+    app.include_router(matching_router.router)
+    client = TestClient(app)
+    url = f"/api/matching/companies/{COMPANY_ID}/batch"
+    jobs_before = len(batch_jobs)
+
+    response = client.post(url, json={"candidate_ids": ["64b000000000000000000002", "not-an-id"]})
+
+    assert response.status_code == 422
+    assert response.json()["detail"]["invalid_ids"] == ["not-an-id"]
+    assert started == [] and len(batch_jobs) == jobs_before
+
+    response = client.post(url, json={"candidate_ids": ["64b000000000000000000002"]})
+    assert response.status_code == 200
+    assert started[0][1]["candidate_ids"] == ["64b000000000000000000002"]
@@ -0,0 +1,70 @@
+"""
+브라우저 풀 컨텍스트 집계 테스트 (browser_pool.BrowserPool)
+
+Playwright 대신 브라우저/컨텍스트 대역으로 발급/반환 시 live_contexts 집계를 확인한다.
+- 같은 컨텍스트를 두 번 반환하거나 close() 이후 반환해도 음수가 되지 않음
+
+실행:
+    python -m pytest -q test_browser_pool.py
+"""
+
+import asyncio
+import time
+
+from apiv2.langchain_pipeline.scrapers.browser_pool import BrowserPool, _BrowserSlot
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = 0
+
+    async def close(self):
+        self.closed += 1
+
+
+class FakeBrowser:
+    def is_connected(self) -> bool:
+        return True
+
+    async def new_context(self, **kwargs):
+        return FakeContext()
+
+    async def close(self):
+        pass
+
+
+def make_pool() -> BrowserPool:
+    pool = BrowserPool(pool_size=1)
+    pool._playwright = object()
+    pool._slots.append(_BrowserSlot(browser=FakeBrowser(), launched_at=time.monotonic()))
+    return pool
+
+
+def test_double_release_does_not_go_negative():
+    async def run():
+        pool = make_pool()
+        first = await pool.new_context()
+        second = await pool.new_context()
+        await pool.release_context(first)
+        await pool.release_context(first)
+        return pool, second
+
+    pool, second = asyncio.run(run())
+
+    assert pool.stats()["live_contexts"] == 1
+    assert pool._slots[0].active_contexts == 1
+
+
+def test_release_after_close_is_ignored():
+    async def run():
+        pool = make_pool()
+        context = await pool.new_context()
+        pool._playwright = None
+        await pool.close()
+        await pool.release_context(context)
+        return pool, context
+
+    pool, context = asyncio.run(run())
+
+    assert pool.stats()["live_contexts"] == 0
+    assert context.closed == 1
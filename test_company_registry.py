@@ -0,0 +1,175 @@
+"""
+회사 레지스트리 매처 테스트 (keyword_matcher.KeywordAutomaton, company_registry)
+
+Aho-Corasick 결과를 단순 부분 문자열 탐색(기존 `keyword in text` 방식)과 비교한다.
+- 겹치는 키워드 (접두사/접미사/포함 관계), 한글 텍스트, 대소문자
+- 리로드는 (문서 수, 최신 updated_at) 지문이 바뀔 때만 레지스트리 교체
+
+실행:
+    python -m pytest -q test_company_registry.py
+"""
+
+import asyncio
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from apiv2.langchain_pipeline.utils import company_registry
+from apiv2.langchain_pipeline.utils.company_registry import CompanyEntry, CompanyRegistry, reload_company_registry
+from apiv2.langchain_pipeline.utils.keyword_matcher import KeywordAutomaton
+
+KEYWORDS = {
+    "토스": ["토스", "toss", "Toss Bank", "비바리퍼블리카"],
+    "토스페이먼츠": ["토스페이먼츠", "tosspayments"],
+    "카카오": ["카카오", "Kakao", "kakao pay"],
+    "카카오뱅크": ["카카오뱅크", "뱅크"],
+    "당근": ["당근마켓", "당근", "DAANGN"],
+    "에이비": ["ab", "abc", "bc", "c", "bca"],
+}
+
+
+def naive_matches(patterns: list[tuple[str, int]], text: str) -> list[tuple[int, int]]:
+    """모든 등장 위치를 직접 탐색 (끝 인덱스, 값)"""
+    text = text.lower()
+    found = []
+    for pattern, value in patterns:
+        pattern = pattern.lower()
+        start = text.find(pattern)
+        while start != -1:
+            found.append((start + len(pattern) - 1, value))
+            start = text.find(pattern, start + 1)
+    return sorted(found)
+
+
+def naive_match_text(entries: list[CompanyEntry], text: str):
+    """기존 구현: 우선순위 순으로 첫 번째로 포함된 키워드의 회사"""
+    text = text.lower()
+    for entry in sorted(entries, key=lambda e: e.priority):
+        if any(keyword.lower() in text for keyword in entry.keywords):
+            return entry.name
+    return None
+
+
+def build_automaton(patterns: list[tuple[str, int]]) -> KeywordAutomaton:
+    automaton = KeywordAutomaton()
+    for pattern, value in patterns:
+        automaton.add(pattern, value)
+    return automaton.build()
+
+
+def registry_entries() -> list[CompanyEntry]:
+    return [CompanyEntry(name=name, keywords=kws, priority=i) for i, (name, kws) in enumerate(KEYWORDS.items())]
+
+
+TEXTS = [
+    "토스페이먼츠는 토스 계열사입니다. Toss Bank와 TOSSPAYMENTS 채용",
+    "카카오뱅크 백엔드 엔지니어 (Kakao Pay 아님)",
+    "당근마켓에서 당근을 팝니다 daangn.com",
+    "abcabca bcab",
+    "관련 없는 회사 소개 문서",
+    "",
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_automaton_matches_naive_search(text):
+    patterns = [(kw, rank) for rank, kws in enumerate(KEYWORDS.values()) for kw in kws]
+
+    assert sorted(build_automaton(patterns).iter_matches(text)) == naive_matches(patterns, text)
+
+
+def test_automaton_matches_naive_on_random_overlapping_text():
+    rng = random.Random(7)
+    alphabet = "ab토스카오c "
+    patterns = [("".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))), i) for i in range(60)]
+    automaton = build_automaton(patterns)
+
+    for _ in range(50):
+        text = "".join(rng.choice(alphabet + "AB") for _ in range(rng.randint(0, 80)))
+        assert sorted(automaton.iter_matches(text)) == naive_matches(patterns, text)
+
+
+def test_duplicate_and_empty_patterns():
+    automaton = build_automaton([("토스", 0), ("토스", 1), ("", 2), ("TOSS", 3)])
+
+    assert automaton.pattern_count == 3
+    assert sorted(automaton.iter_matches("토스 toss")) == [(1, 0), (1, 1), (6, 3)]
+    with pytest.raises(RuntimeError):
+        automaton.add("카카오", 4)
+
+
+@pytest.mark.parametrize("text", TEXTS + ["카카오뱅크보다 토스", "bank: 뱅크", "KAKAO PAY 소개"])
+def test_registry_match_text_keeps_priority_order(text):
+    entries = registry_entries()
+
+    assert CompanyRegistry(entries).match_text(text) == naive_match_text(entries, text)
+
+
+def test_match_url_inherits_parent_domain():
+    registry = CompanyRegistry([CompanyEntry(name="토스", domains=["toss.im"]), CompanyEntry(name="당근", domains=["daangn.com"])])
+
+    assert registry.match_url("https://career.toss.im/job/1") == "토스"
+    assert registry.match_url("https://DAANGN.com/jobs") == "당근"
+    assert registry.match_url("https://example.com") is None
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def to_list(self, length):
+        return list(self.docs)
+
+
+class FakeRegistryCollection:
+    """reload_company_registry가 쓰는 aggregate/find만 구현"""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.finds = 0
+
+    def aggregate(self, pipeline):
+        if not self.docs:
+            return FakeCursor([])
+        return FakeCursor([{"_id": None, "count": len(self.docs), "updated_at": max(d["updated_at"] for d in self.docs)}])
+
+    def find(self, filter_):
+        self.finds += 1
+        return FakeCursor([d for d in self.docs if d.get("enabled") is not False])
+
+
+def test_reload_only_when_fingerprint_changes(monkeypatch):
+    now = datetime(2025, 1, 1)
+    collection = FakeRegistryCollection([
+        {"name": "토스", "keywords": ["토스"], "priority": 0, "updated_at": now},
+        {"name": "당근", "keywords": ["당근"], "priority": 1, "updated_at": now, "enabled": False},
+    ])
+    monkeypatch.setattr(company_registry, "_get_collection", lambda: collection)
+    # 모듈 전역 상태는 테스트 후 복원
+    monkeypatch.setattr(company_registry, "_registry", company_registry._registry)
+    monkeypatch.setattr(company_registry, "_fingerprint", None)
+    monkeypatch.setattr(company_registry, "_reload_count", company_registry._reload_count)
+
+    assert asyncio.run(reload_company_registry()) is True
+    first = company_registry.get_company_registry()
+    assert first.names == ["토스"] and first.source == "mongo"
+
+    # 지문이 같으면 문서를 다시 읽지 않음
+    assert asyncio.run(reload_company_registry()) is False
+    assert collection.finds == 1 and company_registry.get_company_registry() is first
+
+    # 문서가 수정되면 (최신 updated_at 변경) 새 레지스트리로 교체
+    collection.docs[1].update(enabled=True, updated_at=now + timedelta(seconds=1))
+    assert asyncio.run(reload_company_registry()) is True
+    second = company_registry.get_company_registry()
+    assert second is not first and second.match_text("당근 채용") == "당근"
+
+    # 문서 추가 (updated_at은 그대로, 문서 수만 변경)
+    collection.docs.append({"name": "카카오", "keywords": ["kakao"], "priority": 2, "updated_at": now})
+    assert asyncio.run(reload_company_registry()) is True
+    assert company_registry.get_company_registry().match_text("KAKAO") == "카카오"
+
+    # force는 지문과 관계없이 다시 읽음
+    assert asyncio.run(reload_company_registry(force=True)) is True
+    assert collection.finds == 4
@@ -0,0 +1,232 @@
+"""
+컨텍스트 캐시 테스트 (ContextCache + LocalContextCacheBackend)
+
+네트워크 없이 로컬 대역으로 cached content 핸들 관리와 비교 체인의 폴백을 확인한다.
+- 동시 get_or_create는 한 번만 생성
+- 만료 REFRESH_MARGIN_SECONDS 전부터 새로 생성
+- min_tokens 미달 컨텍스트는 캐시하지 않음
+- 생성 실패 후 FAILURE_BACKOFF_SECONDS 동안 시도하지 않음
+- 서버에서 만료된 핸들만 폐기 후 전체 프롬프트로 폴백 (429 등은 핸들 유지)
+- 만료된 핸들/락은 다음 생성 때 정리
+
+실행:
+    python -m pytest -q test_context_cache.py
+"""
+
+import asyncio
+import json
+
+import pytest
+from google.genai import errors as genai_errors
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from apiv2.langchain_pipeline.chains.compare_chain import CultureCompareChain
+from apiv2.langchain_pipeline.utils import context_cache as context_cache_module
+from apiv2.langchain_pipeline.utils.context_cache import (
+    FAILURE_BACKOFF_SECONDS,
+    REFRESH_MARGIN_SECONDS,
+    ContextCache,
+    ContextCacheBackend,
+    LocalContextCacheBackend,
+    is_missing_cache_error,
+)
+from apiv2.langchain_pipeline.utils.match_scoring import AXES, normalize_weights
+
+MODEL = "gemini-test"
+SYSTEM = "system instruction " * 50
+CONTEXT = "company profile " * 500
+
+
+class SlowLocalBackend(LocalContextCacheBackend):
+    """생성 중 다른 요청이 끼어들 수 있도록 지연"""
+
+    async def create(self, *args, **kwargs) -> str:
+        await asyncio.sleep(0.05)
+        return await super().create(*args, **kwargs)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(context_cache_module.time, "time", fake)
+    return fake
+
+
+def get(cache: ContextCache, context: str = CONTEXT):
+    return cache.get_or_create(model=MODEL, prompt_version="v1", system_instruction=SYSTEM, context=context)
+
+
+def test_concurrent_get_or_create_creates_once():
+    backend = SlowLocalBackend()
+    cache = ContextCache(backend, ttl_seconds=3600, min_tokens=0)
+
+    async def run():
+        return await asyncio.gather(*(get(cache) for _ in range(10)))
+
+    names = asyncio.run(run())
+
+    assert backend.created == 1
+    assert set(names) == {"cachedContents/local-1"}
+    assert backend.contents["cachedContents/local-1"]["context"] == CONTEXT
+    assert cache.stats()["creates"] == 1
+    assert cache.stats()["hits"] == 9
+
+
+def test_refresh_at_ttl_margin(clock):
+    backend = LocalContextCacheBackend()
+    cache = ContextCache(backend, ttl_seconds=600, min_tokens=0)
+
+    first = asyncio.run(get(cache))
+    clock.now += 600 - REFRESH_MARGIN_SECONDS - 1
+    assert asyncio.run(get(cache)) == first
+
+    clock.now += 2
+    second = asyncio.run(get(cache))
+    assert second != first
+    assert backend.created == 2
+
+
+def test_small_context_is_not_cached():
+    backend = LocalContextCacheBackend()
+    cache = ContextCache(backend, ttl_seconds=600, min_tokens=100_000)
+
+    assert asyncio.run(get(cache)) is None
+    assert backend.created == 0
+    assert cache.stats()["skipped_small"] == 1
+
+
+def test_backoff_after_create_failure(clock):
+    backend = LocalContextCacheBackend(fail=True)
+    cache = ContextCache(backend, ttl_seconds=600, min_tokens=0)
+
+    assert asyncio.run(get(cache)) is None
+    assert cache.stats()["failures"] == 1
+
+    # 백엔드가 회복돼도 백오프 동안은 시도하지 않음
+    backend.fail = False
+    clock.now += FAILURE_BACKOFF_SECONDS - 1
+    assert asyncio.run(get(cache)) is None
+    assert backend.created == 0
+    assert cache.stats()["disabled"]
+
+    clock.now += 2
+    assert asyncio.run(get(cache)) == "cachedContents/local-1"
+
+
+def test_is_missing_cache_error():
+    expired = genai_errors.ClientError(
+        403, {"error": {"code": 403, "message": "CachedContent not found (or permission denied)", "status": "PERMISSION_DENIED"}}
+    )
+    throttled = genai_errors.ClientError(
+        429, {"error": {"code": 429, "message": "Resource has been exhausted", "status": "RESOURCE_EXHAUSTED"}}
+    )
+    try:
+        try:
+            raise expired
+        except genai_errors.ClientError as e:
+            raise RuntimeError("Error calling model") from e
+    except RuntimeError as wrapped:
+        assert is_missing_cache_error(wrapped)
+
+    assert is_missing_cache_error(expired)
+    assert not is_missing_cache_error(throttled)
+    assert not is_missing_cache_error(asyncio.TimeoutError())
+    assert not is_missing_cache_error(ValueError("invalid json"))
+
+
+def make_compare_chain(cache: ContextCache, cached_error: Exception) -> tuple[CultureCompareChain, list]:
+    """cached_content로 호출하면 cached_error를 던지는 가짜 LLM을 쓰는 비교 체인"""
+    calls = []
+
+    def fake_llm(prompt_value, **kwargs):
+        raise AssertionError("동기 LLM 호출")
+
+    async def fake_allm(prompt_value, **kwargs):
+        calls.append(kwargs.get("cached_content"))
+        if kwargs.get("cached_content"):
+            raise cached_error
+        alignments = {
+            axis: {"status": "aligned", "axis_score": 80, "evidence_refs": {"company": [1], "developer": [1]}}
+            for axis in AXES
+        }
+        return AIMessage(content=json.dumps({"meta": {}, "axis_alignments": alignments}))
+
+    chain = CultureCompareChain.__new__(CultureCompareChain)
+    chain._setup_prompts()
+    chain.llm = RunnableLambda(fake_llm, afunc=fake_allm)
+    chain.model_name = MODEL
+    chain.axis_fanout = False
+    chain.local_overall = True
+    chain.compact_profiles = True
+    chain.context_cache = cache
+    chain.weights = normalize_weights(None)
+    chain.save_to_db = False
+    chain.db = None
+    return chain, calls
+
+
+def test_invalidate_then_fallback_to_full_prompt():
+    backend = LocalContextCacheBackend()
+    cache = ContextCache(backend, ttl_seconds=600, min_tokens=0)
+    expired = genai_errors.ClientError(404, {"error": {"code": 404, "message": "CachedContent not found", "status": "NOT_FOUND"}})
+    chain, calls = make_compare_chain(cache, expired)
+
+    result = asyncio.run(chain.compare({"profile_meta": {"company_name": "토스"}}, {"profile_meta": {}}))
+
+    assert result["overall"]["match_score"] == 80
+    assert calls == ["cachedContents/local-1", None]
+    assert backend.contents == {} and backend.deleted == 1
+    assert cache.stats()["invalidations"] == 1
+
+    # 폐기된 핸들은 다음 요청에서 새로 생성
+    asyncio.run(chain.compare({"profile_meta": {"company_name": "토스"}}, {"profile_meta": {}}))
+    assert backend.created == 2
+
+
+def test_rate_limit_keeps_shared_handle():
+    backend = LocalContextCacheBackend()
+    cache = ContextCache(backend, ttl_seconds=600, min_tokens=0)
+    throttled = genai_errors.ClientError(429, {"error": {"code": 429, "message": "Resource has been exhausted", "status": "RESOURCE_EXHAUSTED"}})
+    chain, calls = make_compare_chain(cache, throttled)
+
+    with pytest.raises(genai_errors.ClientError):
+        asyncio.run(chain.compare({"profile_meta": {"company_name": "토스"}}, {"profile_meta": {}}))
+
+    assert calls == ["cachedContents/local-1"]
+    assert list(backend.contents) == ["cachedContents/local-1"]
+    assert backend.deleted == 0
+    assert cache.stats()["invalidations"] == 0
+
+
+def test_expired_entries_and_locks_are_pruned(clock):
+    backend = LocalContextCacheBackend()
+    cache = ContextCache(backend, ttl_seconds=600, min_tokens=0)
+
+    for i in range(3):
+        asyncio.run(get(cache, context=f"{CONTEXT} {i}"))
+    assert len(cache._entries) == len(cache._locks) == 3
+
+    clock.now += 600
+    asyncio.run(get(cache, context=f"{CONTEXT} new"))
+
+    # 새 키만 남음 (생성 중이던 자기 락은 유지)
+    assert len(cache._entries) == len(cache._locks) == 1
+    assert cache.stats()["active"] == 1
+
+
+def test_backend_requires_create_and_delete():
+    class CreateOnly(ContextCacheBackend):
+        async def create(self, *args, **kwargs) -> str:
+            return "cachedContents/x"
+
+    with pytest.raises(TypeError):
+        CreateOnly()
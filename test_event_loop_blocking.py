@@ -0,0 +1,184 @@
+"""
+이벤트 루프 블로킹 테스트
+
+구직자(S3 PDF 단일/다중 문서, 로컬 PDF) 분석과 컬쳐핏 비교를 동시에 실행하면서
+이벤트 루프가 MAX_BLOCK_MS 이상 멈추지 않는지 확인한다.
+
+Gemini/S3는 네트워크 없이 동작하는 가짜 클라이언트로 대체한다.
+- Gemini: 비동기 클라이언트(aio)만 구현 → 동기 API를 호출하면 AttributeError
+- S3: get_object가 time.sleep으로 블로킹 → 스레드에서 실행하지 않으면 지연 측정에 걸림
+
+실행:
+    python -m pytest -q test_event_loop_blocking.py
+    python test_event_loop_blocking.py
+"""
+
+import asyncio
+import io
+import json
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from apiv2.langchain_pipeline.chains.applicant_chain import ApplicantAnalysisChain
+from apiv2.langchain_pipeline.chains.compare_chain import CultureCompareChain
+from apiv2.langchain_pipeline.loaders.local_pdf_loader import LocalPDFLoader
+from apiv2.langchain_pipeline.loaders.s3_pdf_loader import S3PDFLoader
+from apiv2.langchain_pipeline.utils.match_scoring import AXES, normalize_weights
+
+MAX_BLOCK_MS = 100
+NETWORK_DELAY = 0.2
+S3_BLOCKING_DELAY = 0.3
+
+PROFILE_JSON = json.dumps({"profile_meta": {"candidate_name": "테스트"}, "scoring_axes": {}})
+
+
+class FakeAsyncFiles:
+    def __init__(self):
+        self.deleted = []
+
+    async def upload(self, file, config=None):
+        await asyncio.sleep(NETWORK_DELAY)
+        return SimpleNamespace(name=f"files/{config.display_name}", uri=f"uri://{config.display_name}", state="PROCESSING")
+
+    async def get(self, name):
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(name=name, uri=f"uri://{name}", state="ACTIVE")
+
+    async def delete(self, name):
+        await asyncio.sleep(0.01)
+        self.deleted.append(name)
+
+
+class FakeAsyncModels:
+    async def generate_content(self, model, contents):
+        await asyncio.sleep(NETWORK_DELAY)
+        return SimpleNamespace(text=PROFILE_JSON)
+
+
+class FakeGenaiClient:
+    """client.aio만 제공 (동기 files/models 호출은 실패)"""
+
+    def __init__(self):
+        self.aio = SimpleNamespace(files=FakeAsyncFiles(), models=FakeAsyncModels())
+
+
+class BlockingS3Client:
+    def __init__(self):
+        self.keys = []
+
+    def get_object(self, Bucket, Key):
+        time.sleep(S3_BLOCKING_DELAY)
+        self.keys.append(Key)
+        return {"Body": io.BytesIO(b"%PDF-1.4 fake"), "ContentType": "application/pdf", "ContentLength": 13}
+
+
+def make_applicant_chain() -> ApplicantAnalysisChain:
+    chain = ApplicantAnalysisChain.__new__(ApplicantAnalysisChain)
+    chain.model_name = "gemini-test"
+    chain.save_to_db = False
+    chain.db = None
+    # 가짜 PDF는 텍스트 추출에 실패 → 사전 분석(S3 다운로드 + 파싱) 후 받은 바이트로 multimodal 경로
+    chain.text_fast_path = True
+
+    s3_loader = S3PDFLoader.__new__(S3PDFLoader)
+    s3_loader.bucket_name = "test-bucket"
+    s3_loader.s3_client = BlockingS3Client()
+    s3_loader.genai_client = FakeGenaiClient()
+    s3_loader.POLL_INTERVAL_SECONDS = 0.05
+    s3_loader.file_registry = None
+    chain._s3_loader = s3_loader
+
+    local_loader = LocalPDFLoader.__new__(LocalPDFLoader)
+    local_loader.genai_client = FakeGenaiClient()
+    local_loader.POLL_INTERVAL_SECONDS = 0.05
+    local_loader.file_registry = None
+    chain._local_loader = local_loader
+    return chain
+
+
+def make_compare_chain() -> CultureCompareChain:
+    def fake_llm(prompt_value):
+        raise AssertionError("동기 LLM 호출")
+
+    async def fake_allm(prompt_value):
+        await asyncio.sleep(NETWORK_DELAY)
+        alignments = {
+            axis: {"status": "aligned", "axis_score": 75, "evidence_refs": {"company": [1], "developer": [1]}}
+            for axis in AXES
+        }
+        return AIMessage(content=json.dumps({"meta": {}, "axis_alignments": alignments}))
+
+    chain = CultureCompareChain.__new__(CultureCompareChain)
+    chain._setup_prompts()
+    chain.llm = RunnableLambda(fake_llm, afunc=fake_allm)
+    chain.axis_fanout = False
+    chain.local_overall = True
+    chain.compact_profiles = True
+    chain.context_cache = None
+    chain.weights = normalize_weights(None)
+    chain.save_to_db = False
+    chain.db = None
+    return chain
+
+
+async def measure_max_lag(stop: asyncio.Event, interval: float = 0.005) -> float:
+    """interval마다 깨어나서 예정보다 늦은 최대 시간(ms) 측정"""
+    max_lag = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        max_lag = max(max_lag, (time.perf_counter() - start - interval) * 1000)
+    return max_lag
+
+
+async def run_pipeline(tmp_dir: Path) -> tuple[float, float, list, list]:
+    pdfs = []
+    for name in ("resume.pdf", "portfolio.pdf", "essay.pdf"):
+        path = tmp_dir / name
+        path.write_bytes(b"%PDF-1.4 fake")
+        pdfs.append(str(path))
+
+    applicant_chain = make_applicant_chain()
+    compare_chain = make_compare_chain()
+
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(measure_max_lag(stop))
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        applicant_chain.run_from_s3("token/resume.pdf"),
+        applicant_chain.run_from_s3_keys(["token/resume.pdf", "token/portfolio.pdf", "token/essay.pdf"]),
+        applicant_chain.analyze_local_pdfs(pdfs),
+        compare_chain.compare({"profile_meta": {"company_name": "토스"}}, {"profile_meta": {}}),
+    )
+    elapsed = time.perf_counter() - start
+    stop.set()
+    return await monitor, elapsed, results, applicant_chain._s3_loader.s3_client.keys
+
+
+def test_event_loop_not_blocked():
+    with tempfile.TemporaryDirectory() as tmp:
+        max_lag_ms, elapsed, results, s3_keys = asyncio.run(run_pipeline(Path(tmp)))
+
+    s3_profile, s3_multi_profile, local_profile, comparison = results
+    assert s3_profile["_source"]["type"] == "s3_pdf"
+    assert s3_multi_profile["_source"]["s3_keys"] == ["token/resume.pdf", "token/portfolio.pdf", "token/essay.pdf"]
+    assert local_profile["profile_meta"]["candidate_name"] == "테스트"
+    assert comparison["overall"]["match_score"] == 75
+    # multimodal 경로는 사전 분석에서 받은 바이트를 업로드 → 파일당 S3 다운로드 1회
+    assert sorted(s3_keys) == sorted(["token/resume.pdf"] * 2 + ["token/portfolio.pdf", "token/essay.pdf"])
+
+    # 가장 긴 단일 경로(사전 분석 S3 다운로드 + 업로드 + 폴링 + 생성 + 삭제)보다
+    # 크게 늦지 않아야 함 (체인 간 병렬 실행 + 다중 문서의 파일별 다운로드/업로드 병렬 실행)
+    assert elapsed < S3_BLOCKING_DELAY + 3 * NETWORK_DELAY + 0.3, f"elapsed {elapsed:.2f}s"
+    assert max_lag_ms < MAX_BLOCK_MS, f"event loop blocked for {max_lag_ms:.0f}ms"
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        lag, elapsed, _, _ = asyncio.run(run_pipeline(Path(tmp)))
+    print(f"max event loop lag: {lag:.1f}ms (limit {MAX_BLOCK_MS}ms), elapsed {elapsed:.2f}s")
@@ -0,0 +1,151 @@
+"""
+Gemini 업로드 파일 레지스트리 테스트 (GeminiFileRegistry)
+
+가짜 Files API로 내용 주소 기반 재사용, 참조 카운트, 스위퍼의 고아 파일 정리를 확인한다.
+
+실행:
+    python -m pytest -q test_file_registry.py
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from apiv2.langchain_pipeline.utils.file_registry import REMOTE_PREFIX, GeminiFileRegistry, content_digest
+
+
+@dataclass
+class FakeFile:
+    name: str
+    uri: str
+    display_name: str
+    state: str = "ACTIVE"
+
+
+class FakeFiles:
+    def __init__(self):
+        self.remote: dict[str, SimpleNamespace] = {}
+        self.deleted: list[str] = []
+        self.listed = 0
+
+    def add_remote(self, name: str, display_name: str, age_seconds: float):
+        self.remote[name] = SimpleNamespace(
+            name=name,
+            display_name=display_name,
+            create_time=datetime.now(timezone.utc) - timedelta(seconds=age_seconds),
+        )
+
+    async def delete(self, name):
+        self.deleted.append(name)
+        self.remote.pop(name, None)
+
+    async def list(self, config=None):
+        self.listed += 1
+        items = list(self.remote.values())
+
+        async def pages():
+            for item in items:
+                yield item
+
+        return pages()
+
+
+def make_registry(**kwargs) -> tuple[GeminiFileRegistry, FakeFiles]:
+    files = FakeFiles()
+    registry = GeminiFileRegistry(genai_client=SimpleNamespace(aio=SimpleNamespace(files=files)), **kwargs)
+    return registry, files
+
+
+def make_uploader(files: FakeFiles):
+    uploads = []
+
+    async def upload(display_name: str) -> FakeFile:
+        await asyncio.sleep(0.01)
+        uploads.append(display_name)
+        name = f"files/{len(uploads)}"
+        files.add_remote(name, display_name, age_seconds=0)
+        return FakeFile(name=name, uri=f"uri://{name}", display_name=display_name)
+
+    return upload, uploads
+
+
+def test_same_content_is_uploaded_once():
+    registry, files = make_registry()
+    upload, uploads = make_uploader(files)
+    digest = content_digest(b"%PDF resume")
+
+    async def run():
+        acquired = await asyncio.gather(*(registry.acquire(digest, "resume.pdf", upload) for _ in range(5)))
+        for gemini_file in acquired:
+            assert await registry.release(gemini_file)
+        return acquired
+
+    acquired = asyncio.run(run())
+
+    assert uploads == [f"{REMOTE_PREFIX}{digest[:16]}"]
+    assert {f.name for f in acquired} == {"files/1"}
+    assert all(f.display_name == "resume.pdf" for f in acquired)
+    assert registry.stats()["hits"] == 4
+    assert files.deleted == []
+
+
+def test_evicted_file_is_deleted_and_reuploaded():
+    registry, files = make_registry()
+    upload, uploads = make_uploader(files)
+    digest = content_digest(b"%PDF resume")
+
+    async def run():
+        first = await registry.acquire(digest, "resume.pdf", upload)
+        await registry.release(first, evict=True)
+        second = await registry.acquire(digest, "resume.pdf", upload)
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert files.deleted == [first.name]
+    assert second.name != first.name
+    assert len(uploads) == 2
+
+
+def test_sweep_keeps_files_in_use():
+    registry, files = make_registry(idle_seconds=0.001)
+    upload, _ = make_uploader(files)
+
+    async def run():
+        held = await registry.acquire(content_digest(b"held"), "held.pdf", upload)
+        idle = await registry.acquire(content_digest(b"idle"), "idle.pdf", upload)
+        await registry.release(idle)
+        # 만료 임박으로 만들어도 참조 중인 파일은 삭제하지 않음
+        for entry in registry._by_name.values():
+            entry.expires_at = time.time() + 10
+        await asyncio.sleep(0.01)
+        deleted = await registry.sweep()
+        return held, idle, deleted
+
+    held, idle, deleted = asyncio.run(run())
+
+    assert deleted == 1
+    assert files.deleted == [idle.name]
+    assert held.name in files.remote
+
+
+def test_orphans_are_kept_by_default():
+    registry, files = make_registry()
+    files.add_remote("files/other-worker", f"{REMOTE_PREFIX}abc", age_seconds=3600)
+
+    assert asyncio.run(registry.sweep()) == 0
+    assert files.listed == 0
+    assert "files/other-worker" in files.remote
+
+
+def test_orphans_are_deleted_when_opted_in():
+    registry, files = make_registry(orphan_grace_seconds=600)
+    files.add_remote("files/old", f"{REMOTE_PREFIX}old", age_seconds=3600)
+    files.add_remote("files/fresh", f"{REMOTE_PREFIX}fresh", age_seconds=10)
+    files.add_remote("files/unrelated", "resume.pdf", age_seconds=3600)
+
+    assert asyncio.run(registry.sweep()) == 1
+    assert files.deleted == ["files/old"]
+    assert sorted(files.remote) == ["files/fresh", "files/unrelated"]
@@ -0,0 +1,95 @@
+"""
+map-reduce 분할/병합 테스트 (map_reduce.chunk_content / merge_partials)
+
+실행:
+    python -m pytest -q test_map_reduce.py
+"""
+
+from apiv2.langchain_pipeline.utils.map_reduce import chunk_content, merge_partials, split_sections
+from apiv2.langchain_pipeline.utils.token_counter import estimate_tokens
+
+
+def section(url: str, lines: int, word: str = "culture") -> str:
+    return "\n".join([f"=== {url} ==="] + [(f"{word} line {i} " * 4).strip() for i in range(lines)])
+
+
+def test_split_sections_keeps_headers_and_preamble():
+    content = "intro text\n=== https://a ===\nbody a\n=== https://b ===\nbody b"
+
+    assert split_sections(content) == ["intro text", "=== https://a ===\nbody a", "=== https://b ===\nbody b"]
+
+
+def test_chunks_respect_budget_and_section_order():
+    a, b, c = section("https://a", 10), section("https://b", 10), section("https://c", 10)
+    budget = estimate_tokens(a) + estimate_tokens(b) + 5
+
+    chunks = chunk_content("\n\n".join([a, b, c]), budget)
+
+    assert chunks == [f"{a}\n\n{b}", c]
+
+
+def test_oversized_section_is_split_with_repeated_header():
+    big = section("https://big", 60)
+
+    budget = estimate_tokens(big) // 3
+    chunks = chunk_content(big, budget)
+
+    assert len(chunks) >= 3
+    # "(계속 i/n)" 표시만큼만 예산을 넘을 수 있음
+    assert all(estimate_tokens(chunk) <= budget + 10 for chunk in chunks)
+    assert chunks[0].startswith(f"=== https://big (계속 1/{len(chunks)}) ===\n")
+    assert chunks[-1].startswith(f"=== https://big (계속 {len(chunks)}/{len(chunks)}) ===\n")
+    # 헤더를 제외한 본문 줄은 순서대로 모두 포함
+    body = [line for chunk in chunks for line in chunk.split("\n")[1:]]
+    assert body == big.split("\n")[1:]
+
+
+def test_merge_rules():
+    partials = [
+        {
+            "company": {"name": "토스", "summary": "핀테크", "remote": "unknown"},
+            "values": ["자율", "책임"],
+            "scores": {"ownership": "2", "speed": 3},
+            "confidence": "low",
+            "hiring": None,
+        },
+        {
+            "company": {"name": "비바리퍼블리카", "summary": "송금 앱", "remote": "hybrid"},
+            "values": ["책임", "빠른 실행"],
+            "scores": {"ownership": "4", "speed": 1},
+            "confidence": "high",
+            "hiring": {"roles": ["backend"]},
+        },
+        {
+            "company": {"summary": "핀테크"},
+            "values": [{"k": 1, "j": 2}],
+            "confidence": "medium",
+            "hiring": {"roles": ["backend", "data"]},
+        },
+    ]
+
+    merged = merge_partials(partials)
+
+    # 일반 값은 먼저 나온 구체적인 값, "정보 없음" 계열은 덮어씀
+    assert merged["company"]["name"] == "토스"
+    assert merged["company"]["remote"] == "hybrid"
+    # 요약 필드는 서로 다른 값만 연결
+    assert merged["company"]["summary"] == "핀테크 / 송금 앱"
+    # 리스트는 순서 유지 합집합
+    assert merged["values"] == ["자율", "책임", "빠른 실행", {"k": 1, "j": 2}]
+    # 점수/confidence는 최댓값
+    assert merged["scores"] == {"ownership": "4", "speed": 3}
+    assert merged["confidence"] == "high"
+    assert merged["hiring"] == {"roles": ["backend", "data"]}
+
+
+def test_merge_only_weak_values_keeps_first():
+    assert merge_partials([{"remote": "unknown"}, {"remote": "no"}]) == {"remote": "unknown"}
+
+
+def test_merge_is_deterministic_and_handles_edges():
+    partials = [{"a": ["x", "y"], "b": "1"}, {"a": ["y", "z"], "b": "3"}]
+
+    assert merge_partials(partials) == merge_partials([dict(p) for p in partials])
+    assert merge_partials([]) == {}
+    assert merge_partials([{"only": 1}]) == {"only": 1}
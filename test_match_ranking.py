@@ -0,0 +1,260 @@
+"""
+가중치 랭킹 테스트 (culture_fit_result_repository.build_weighted_ranking_pipeline)
+
+랭킹/재채점/요청 스키마의 축 목록이 같은지, 가중치 0인 축이 분모에서 빠지는지 확인하고,
+파이프라인이 쓰는 집계 연산자만 구현한 작은 평가기로 샘플 문서에 실제로 실행해
+순서/점수/페이지를 확인한다 (축 점수 규칙은 match_scoring.parse_axis_score와 같아야 함).
+
+실행:
+    python -m pytest -q test_match_ranking.py
+"""
+
+import asyncio
+import math
+import re
+
+from db.repositories import culture_fit_result_repository
+from db.repositories.culture_fit_result_repository import (
+    RANKING_AXES,
+    build_weighted_ranking_pipeline,
+    rank_matches_for_company,
+)
+from apiv2.langchain_pipeline.utils.match_scoring import AXES, parse_axis_score
+from schema.culture_fit_result import ScoringWeights
+
+_MISSING = object()
+
+
+# ============================================================
+# 집계 파이프라인 평가기 (이 파이프라인이 쓰는 연산자만)
+# ============================================================
+
+def _get(doc, path: str):
+    for part in path.split("."):
+        if not isinstance(doc, dict) or part not in doc:
+            return _MISSING
+        doc = doc[part]
+    return doc
+
+
+def _set(doc: dict, path: str, value):
+    *parents, last = path.split(".")
+    for part in parents:
+        doc = doc.setdefault(part, {})
+    doc[last] = value
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _type(value) -> str:
+    if value is _MISSING:
+        return "missing"
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, str):
+        return "string"
+    return "int" if isinstance(value, int) else "double"
+
+
+def _convert_double(spec: dict, doc):
+    value = _raw(spec["input"], doc)
+    if value is None or value is _MISSING:
+        return _value(spec.get("onNull"), doc)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return _value(spec.get("onError"), doc)
+
+
+OPERATORS = {
+    "$cond": lambda a, d: _value(a[1] if _value(a[0], d) else a[2], d),
+    "$switch": lambda a, d: next(
+        (_value(b["then"], d) for b in a["branches"] if _value(b["case"], d)), _value(a.get("default"), d)
+    ),
+    "$and": lambda a, d: all(_value(x, d) for x in a),
+    "$eq": lambda a, d: _value(a[0], d) == _value(a[1], d),
+    "$ne": lambda a, d: _value(a[0], d) != _value(a[1], d),
+    "$gt": lambda a, d: _value(a[0], d) > _value(a[1], d),
+    "$isNumber": lambda a, d: _is_number(_raw(a, d)),
+    "$type": lambda a, d: _type(_raw(a, d)),
+    "$regexMatch": lambda a, d: re.search(a["regex"], _value(a["input"], d)) is not None,
+    "$trim": lambda a, d: _value(a["input"], d).strip(),
+    "$convert": _convert_double,
+    "$trunc": lambda a, d: math.trunc(_value(a, d)),
+    "$ifNull": lambda a, d: next((v for v in (_value(x, d) for x in a) if v is not None), None),
+    "$multiply": lambda a, d: math.prod(_value(x, d) for x in a),
+    "$add": lambda a, d: sum(_value(x, d) for x in a),
+    "$divide": lambda a, d: _value(a[0], d) / _value(a[1], d),
+    "$round": lambda a, d: round(_value(a[0], d), a[1]),
+}
+
+
+def _raw(expr, doc):
+    """필드 경로는 누락(_MISSING)을 그대로 반환"""
+    if isinstance(expr, str) and expr.startswith("$"):
+        return _get(doc, expr[1:])
+    if isinstance(expr, dict) and len(expr) == 1 and next(iter(expr)).startswith("$"):
+        op, arg = next(iter(expr.items()))
+        return OPERATORS[op](arg, doc)
+    if isinstance(expr, dict):
+        return {k: _value(v, doc) for k, v in expr.items()}
+    return expr
+
+
+def _value(expr, doc):
+    value = _raw(expr, doc)
+    return None if value is _MISSING else value
+
+
+def _project(doc: dict, spec: dict) -> dict:
+    if all(v == 0 for v in spec.values()):
+        return {k: v for k, v in doc.items() if k not in spec}
+    out = {"_id": doc["_id"]}
+    for path, expr in spec.items():
+        if expr == 1:
+            value = _get(doc, path)
+            if value is not _MISSING:
+                _set(out, path, value)
+        else:
+            _set(out, path, _value(expr, doc))
+    return out
+
+
+def _sort_key(spec: dict):
+    """null은 가장 작은 값 (내림차순이면 맨 뒤), 내림차순 필드는 숫자만 지원"""
+    def key(doc):
+        parts = []
+        for field, direction in spec.items():
+            value = doc.get(field)
+            if direction == 1:
+                parts.append((0, 0) if value is None else (1, value))
+            else:
+                parts.append((1, 0) if value is None else (0, -value))
+        return parts
+    return key
+
+
+def run_pipeline(docs: list[dict], pipeline: list[dict]) -> list[dict]:
+    for stage in pipeline:
+        (name, spec), = stage.items()
+        if name == "$match":
+            docs = [d for d in docs if all(_get(d, k) == v for k, v in spec.items())]
+        elif name == "$project":
+            docs = [_project(d, spec) for d in docs]
+        elif name == "$addFields":
+            docs = [{**d, **{k: _value(v, d) for k, v in spec.items()}} for d in docs]
+        elif name == "$sort":
+            docs = sorted(docs, key=_sort_key(spec))
+        elif name == "$facet":
+            docs = [{k: run_pipeline(docs, sub) for k, sub in spec.items()}]
+        elif name == "$count":
+            docs = [{spec: len(docs)}] if docs else []
+        elif name == "$skip":
+            docs = docs[spec:]
+        elif name == "$limit":
+            docs = docs[:spec]
+        else:
+            raise AssertionError(f"unsupported stage {name}")
+    return docs
+
+
+class MemoryCollection:
+    def __init__(self, docs: list[dict]):
+        self.docs = docs
+
+    async def aggregate(self, pipeline, allowDiskUse=False):
+        for doc in run_pipeline(self.docs, pipeline):
+            yield doc
+
+
+def result_doc(doc_id: str, scores: dict, company: str = "c1", unknown: tuple = ()) -> dict:
+    return {
+        "_id": doc_id,
+        "inputs": {"company_profile_ref": {"profile_id": company}},
+        "overall": {"match_score": 0, "score_band": "low", "confidence": 1.0},
+        "axis_alignments": {
+            axis: {"status": "unknown" if axis in unknown else "aligned", "axis_score": score}
+            for axis, score in scores.items()
+        },
+    }
+
+
+# ============================================================
+# 테스트
+# ============================================================
+
+def test_axes_share_one_definition():
+    assert RANKING_AXES == list(ScoringWeights.model_fields)
+    assert list(AXES) == RANKING_AXES
+
+
+def test_zero_weight_axes_are_excluded():
+    weights = {axis: 0.0 for axis in RANKING_AXES}
+    weights.update(technical_fit=2.0, execution_style=1.0)
+
+    pipeline = build_weighted_ranking_pipeline({"inputs.company_profile_ref.profile_id": "c1"}, weights, skip=10, limit=5)
+
+    project = pipeline[1]["$project"]
+    assert set(project["axis_scores"]) == set(RANKING_AXES)
+
+    totals = pipeline[2]["$addFields"]["weight_total"]["$add"]
+    assert [t["$cond"][0]["$eq"][0] for t in totals] == ["$axis_scores.technical_fit", "$axis_scores.execution_style"]
+    assert [t["$cond"][2] for t in totals] == [2.0, 1.0]
+
+    facet = pipeline[-1]["$facet"]
+    assert facet["items"] == [{"$skip": 10}, {"$limit": 5}]
+
+
+def test_all_zero_weights_rank_without_score():
+    pipeline = build_weighted_ranking_pipeline({}, {axis: 0.0 for axis in RANKING_AXES})
+
+    assert pipeline[2]["$addFields"] == {"weight_total": 0, "weighted_sum": 0}
+
+
+def test_axis_score_rule_matches_parse_axis_score():
+    values = [90, 72.9, "80", " 70 ", "7.5", "-3", "high", True, None, _MISSING]
+    docs = [
+        {"_id": i, "axis_alignments": {"technical_fit": {"status": "aligned"} if v is _MISSING else {"status": "aligned", "axis_score": v}}}
+        for i, v in enumerate(values)
+    ]
+    docs.append({"_id": "unknown", "axis_alignments": {"technical_fit": {"status": "unknown", "axis_score": 90}}})
+    docs.append({"_id": "no-axis", "axis_alignments": {}})
+
+    pipeline = build_weighted_ranking_pipeline({}, {"technical_fit": 1.0})
+    ranked = run_pipeline(docs, pipeline[:2])
+
+    for doc, projected in zip(docs, ranked):
+        expected = parse_axis_score(doc["axis_alignments"].get("technical_fit"))
+        assert projected["axis_scores"]["technical_fit"] == expected, doc
+
+
+def test_ranking_order_scores_and_pages(monkeypatch):
+    weights = {axis: 0.0 for axis in RANKING_AXES}
+    weights.update(technical_fit=3.0, execution_style=1.0)
+    docs = [
+        result_doc("a", {"technical_fit": 60, "execution_style": 100}),
+        # 숫자 문자열도 점수로 계산 (overall과 같은 규칙)
+        result_doc("b", {"technical_fit": "90", "execution_style": 50}),
+        # unknown 축은 분모에서 빠짐 → technical_fit만으로 70
+        result_doc("c", {"technical_fit": 70, "execution_style": 100}, unknown=("execution_style",)),
+        result_doc("d", {"technical_fit": "high", "execution_style": None}),
+        result_doc("e", {"technical_fit": 70, "execution_style": 70}),
+        result_doc("other", {"technical_fit": 100, "execution_style": 100}, company="c2"),
+    ]
+    collection = MemoryCollection(docs)
+    monkeypatch.setattr(culture_fit_result_repository, "get_collection", lambda: collection)
+
+    first = asyncio.run(rank_matches_for_company("c1", weights, skip=0, limit=3))
+    second = asyncio.run(rank_matches_for_company("c1", weights, skip=3, limit=3))
+
+    assert first["total"] == second["total"] == 5
+    # b: (90*3 + 50) / 4 = 80, a: (60*3 + 100) / 4 = 70, c/e: 70 (동점은 _id 순), d: 점수 없음 → 맨 뒤
+    assert [(i["_id"], i["weighted_score"]) for i in first["items"]] == [("b", 80.0), ("a", 70.0), ("c", 70.0)]
+    assert [(i["_id"], i["weighted_score"]) for i in second["items"]] == [("e", 70.0), ("d", None)]
+    assert first["items"][0]["axis_scores"]["technical_fit"] == 90
+    assert "axis_alignments" not in first["items"][0]
+    assert first["weights"] == weights
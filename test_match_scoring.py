@@ -0,0 +1,115 @@
+"""
+overall 로컬 계산 테스트 (match_scoring)
+
+실행:
+    python -m pytest -q test_match_scoring.py
+"""
+
+import math
+
+import numpy as np
+
+from apiv2.langchain_pipeline.utils.match_scoring import (
+    AXES,
+    build_overalls,
+    compute_overall,
+    compute_overall_batch,
+    normalize_weights,
+    score_matrix,
+    to_axis_matrix,
+    weight_vector,
+)
+
+BOTH = {"company": [1], "developer": [2]}
+COMPANY_ONLY = {"company": [1], "developer": []}
+
+
+def alignment(score, status: str = "aligned", refs: dict = BOTH) -> dict:
+    return {"status": status, "axis_score": score, "evidence_refs": refs}
+
+
+def full_row(score) -> dict:
+    return {axis: alignment(score) for axis in AXES}
+
+
+def test_weighted_mean_skips_unknown_axes():
+    row = {
+        "technical_fit": alignment(90),
+        "execution_style": alignment("60"),
+        "collaboration_style": alignment(None, status="unknown"),
+        "growth_learning_orientation": alignment(20, refs=COMPANY_ONLY),
+        "product_user_impact_orientation": alignment(80, status="unknown"),
+    }
+    weights = {"technical_fit": 2.0}
+
+    overall = compute_overall(row, weights)
+
+    # (90*2 + 60 + 20) / 4 = 65
+    assert overall["match_score"] == 65
+    assert overall["score_band"] == "medium"
+    # unknown 3개(collaboration, product, ops 누락) + 한쪽 근거 1개
+    assert overall["confidence"] == 0.65
+    assert overall["unknown_axes"] == ["collaboration_style", "product_user_impact_orientation", "ops_quality_responsibility"]
+    assert overall["high_alignment_axes"] == ["technical_fit"]
+    assert overall["risk_or_mismatch_axes"] == ["growth_learning_orientation"]
+    assert overall["scoring"]["weights"] == normalize_weights(weights)
+
+
+def test_all_unknown_row():
+    overall = compute_overall({axis: alignment(None, status="unknown") for axis in AXES})
+
+    assert overall["match_score"] == "unknown"
+    assert overall["score_band"] == "unknown"
+    assert overall["confidence"] == 0.4
+    assert overall["unknown_axes"] == AXES
+    assert overall["scoring"]["excluded_axes"] == AXES
+
+
+def test_zero_weight_axes_are_excluded_from_score_only():
+    row = full_row(50)
+    row["technical_fit"] = alignment(100)
+    weights = {axis: 0.0 for axis in AXES}
+    weights["technical_fit"] = 1.0
+
+    overall = compute_overall(row, weights)
+
+    assert overall["match_score"] == 100
+    assert overall["confidence"] == 1.0
+    assert overall["scoring"]["excluded_axes"] == AXES[1:]
+    assert overall["unknown_axes"] == []
+
+
+def test_all_zero_weights_have_no_score():
+    matrix = to_axis_matrix([full_row(80)])
+
+    result = score_matrix(matrix, np.zeros(len(AXES)))
+
+    assert math.isnan(result["match_score"][0])
+    assert result["band"][0] == "unknown"
+    assert result["confidence"][0] == 1.0
+
+
+def test_score_matrix_bands_and_batch_matches_single():
+    rows = [full_row(70), full_row(69), full_row(40), full_row(39), {}, None]
+
+    matrix = to_axis_matrix(rows)
+    result = score_matrix(matrix, weight_vector(None))
+
+    assert matrix.scores.shape == (6, len(AXES))
+    assert result["band"].tolist() == ["high", "medium", "medium", "low", "unknown", "unknown"]
+    assert result["confidence"].tolist() == [1.0, 1.0, 1.0, 1.0, 0.4, 0.4]
+
+    batch = compute_overall_batch(rows)
+    assert batch == [compute_overall(row) for row in rows]
+    assert batch == build_overalls(matrix, result, normalize_weights(None))
+
+
+def test_invalid_scores_are_unknown():
+    row = full_row(60)
+    row["technical_fit"] = alignment(True)
+    row["execution_style"] = alignment("high")
+
+    overall = compute_overall(row)
+
+    assert overall["unknown_axes"] == ["technical_fit", "execution_style"]
+    assert overall["match_score"] == 60
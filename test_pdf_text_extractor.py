@@ -0,0 +1,161 @@
+"""
+텍스트 PDF 판별 테스트 (pdf_text_extractor)
+
+pypdf로 만든 PDF로 텍스트 / 이미지 전용 / 텍스트+이미지 혼합 / 암호화 문서를 판별하고,
+업로드 측정값이 없어도 텍스트 경로의 절감 시간이 기록되는지 확인한다.
+
+실행:
+    python -m pytest -q test_pdf_text_extractor.py
+"""
+
+import io
+
+from pypdf import PdfWriter
+from pypdf.generic import DictionaryObject, NameObject, NumberObject, StreamObject
+
+from apiv2.langchain_pipeline.config import PDF_TEXT_UPLOAD_BASELINE_SECONDS
+from apiv2.langchain_pipeline.loaders import pdf_text_extractor
+from apiv2.langchain_pipeline.loaders.pdf_text_extractor import (
+    extract_pdf_text,
+    format_documents_for_prompt,
+    record_extraction,
+    record_multimodal_upload,
+)
+
+RESUME_LINES = [f"Line {i}: Built a Kafka based event pipeline and led code reviews." for i in range(30)]
+
+
+def _font(writer: PdfWriter):
+    return writer._add_object(DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    }))
+
+
+def _image(writer: PdfWriter):
+    image = StreamObject()
+    image.set_data(bytes([200] * (100 * 100)))
+    image.update({
+        NameObject("/Type"): NameObject("/XObject"),
+        NameObject("/Subtype"): NameObject("/Image"),
+        NameObject("/Width"): NumberObject(100),
+        NameObject("/Height"): NumberObject(100),
+        NameObject("/ColorSpace"): NameObject("/DeviceGray"),
+        NameObject("/BitsPerComponent"): NumberObject(8),
+    })
+    return writer._add_object(image)
+
+
+def _add_page(writer: PdfWriter, lines: list[str] = (), with_image: bool = False):
+    page = writer.add_blank_page(612, 792)
+    ops = []
+    resources = DictionaryObject()
+    if with_image:
+        ops.append("q 500 0 0 700 50 50 cm /Im1 Do Q")
+        resources[NameObject("/XObject")] = DictionaryObject({NameObject("/Im1"): _image(writer)})
+    if lines:
+        ops.append("BT /F1 11 Tf 14 TL 50 750 Td " + " ".join(f"({line}) Tj T*" for line in lines) + " ET")
+        resources[NameObject("/Font")] = DictionaryObject({NameObject("/F1"): _font(writer)})
+    content = StreamObject()
+    content.set_data("\n".join(ops).encode())
+    page[NameObject("/Contents")] = writer._add_object(content)
+    page[NameObject("/Resources")] = resources
+
+
+def _to_bytes(writer: PdfWriter) -> bytes:
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def make_text_pdf() -> bytes:
+    writer = PdfWriter()
+    _add_page(writer, RESUME_LINES)
+    _add_page(writer, ["References available on request."])
+    return _to_bytes(writer)
+
+
+def make_image_pdf() -> bytes:
+    writer = PdfWriter()
+    _add_page(writer, with_image=True)
+    _add_page(writer, with_image=True)
+    return _to_bytes(writer)
+
+
+def make_portfolio_pdf() -> bytes:
+    writer = PdfWriter()
+    _add_page(writer, RESUME_LINES[:20])
+    for caption in ("Project A", "Project B", "Project C"):
+        _add_page(writer, [caption], with_image=True)
+    return _to_bytes(writer)
+
+
+def make_encrypted_pdf() -> bytes:
+    writer = PdfWriter()
+    _add_page(writer, RESUME_LINES)
+    writer.encrypt(user_password="secret", owner_password="owner")
+    return _to_bytes(writer)
+
+
+def test_text_pdf_is_text_native():
+    doc = extract_pdf_text(make_text_pdf(), "이력서_홍길동.pdf")
+
+    assert doc.is_text_native and doc.reason == "text"
+    assert doc.doc_id == "resume"
+    assert len(doc.pages) == 2
+    assert doc.line_count == len(RESUME_LINES) + 1
+
+    text = doc.to_prompt_text()
+    assert text.startswith("[p1:L1] Line 0:")
+    assert "[p2:L1] References available on request." in text
+    assert "doc_id: resume" in format_documents_for_prompt([doc])
+
+
+def test_image_only_pdf_is_multimodal():
+    doc = extract_pdf_text(make_image_pdf(), "scanned_resume.pdf")
+
+    assert not doc.is_text_native
+    assert doc.reason == "image_pages(2/2)"
+    assert [page.images for page in doc.pages] == [1, 1]
+
+
+def test_mostly_image_pdf_is_multimodal():
+    doc = extract_pdf_text(make_portfolio_pdf(), "portfolio.pdf")
+
+    assert not doc.is_text_native
+    assert doc.reason == "image_pages(3/4)"
+    assert doc.doc_id == "portfolio"
+
+
+def test_encrypted_pdf_is_multimodal():
+    doc = extract_pdf_text(make_encrypted_pdf(), "essay.pdf")
+
+    assert not doc.is_text_native
+    assert doc.reason == "encrypted"
+    assert doc.pages == []
+
+
+def test_broken_pdf_is_multimodal():
+    doc = extract_pdf_text(b"%PDF-1.4 fake", "resume.pdf")
+
+    assert not doc.is_text_native
+    assert doc.reason.startswith("extract_failed(")
+
+
+def test_saved_seconds_use_baseline_until_measured(monkeypatch):
+    monkeypatch.setattr(pdf_text_extractor, "_upload_seconds_avg", None)
+    monkeypatch.setattr(pdf_text_extractor, "_stats", dict(pdf_text_extractor._stats))
+
+    doc = extract_pdf_text(make_text_pdf(), "resume.pdf")
+    doc.extract_seconds = 0.5
+    [summary] = record_extraction([doc], used_text_path=True)
+    assert summary["upload_seconds_saved"] == round(PDF_TEXT_UPLOAD_BASELINE_SECONDS - 0.5, 2)
+    assert pdf_text_extractor.get_text_extraction_stats()["upload_seconds_basis"] == "baseline"
+
+    record_multimodal_upload(9.0, documents=3)
+    [summary] = record_extraction([doc], used_text_path=True)
+    assert summary["upload_seconds_saved"] == 2.5
+    stats = pdf_text_extractor.get_text_extraction_stats()
+    assert stats["upload_seconds_basis"] == "measured"
+    assert stats["text_native"] == 2
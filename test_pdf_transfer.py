@@ -0,0 +1,259 @@
+"""
+PDF 전송 메모리 한도 / 스트리밍 업로드 테스트 (ByteBudget, S3PDFLoader._stream_to_gemini)
+
+네트워크 없이 S3 본문 대역과 httpx.MockTransport로 Gemini 재개 가능 업로드를 흉내 낸다.
+- 한도를 넘는 예약은 앞선 예약이 풀릴 때까지 대기, 한도보다 큰 예약은 한도로 제한
+- 스트리밍 업로드: start 요청의 Content-Length, 청크 offset/크기, 마지막 청크의 finalize
+- 스트리밍 실패(503) 시 S3를 다시 열어 임시 파일 경로로 업로드
+- 파일 레지스트리 사용 시에도 스트리밍, 같은 S3 객체(ETag)는 본문을 받지 않고 재사용
+- 사전 분석에서 보관한 바이트는 업로드가 끝날 때까지 예약 유지 (텍스트 PDF / 큰 PDF는 바로 해제)
+
+실행:
+    python -m pytest -q test_pdf_transfer.py
+"""
+
+import asyncio
+import io
+import json
+import os
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from apiv2.langchain_pipeline.loaders import s3_pdf_loader
+from apiv2.langchain_pipeline.loaders.pdf_text_extractor import ExtractedPDF
+from apiv2.langchain_pipeline.loaders.s3_pdf_loader import UPLOAD_CHUNK_GRANULARITY, S3PDFLoader
+from apiv2.langchain_pipeline.utils import byte_budget
+from apiv2.langchain_pipeline.utils.byte_budget import ByteBudget
+from apiv2.langchain_pipeline.utils.file_registry import REMOTE_PREFIX, GeminiFileRegistry
+
+CHUNK = UPLOAD_CHUNK_GRANULARITY
+PDF = os.urandom(4 * CHUNK + 100)
+
+
+class ShortReadBody(io.RawIOBase):
+    """요청보다 적게 돌려주는 S3 StreamingBody 대역"""
+
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+
+    def read(self, n=-1):
+        return self._buffer.read(min(n, 50_000) if n and n > 0 else -1)
+
+
+class FakeS3:
+    def __init__(self):
+        self.keys = []
+        self.bodies = []
+
+    def get_object(self, Bucket, Key):
+        self.keys.append(Key)
+        self.bodies.append(ShortReadBody(PDF))
+        return {"Body": self.bodies[-1], "ContentType": "application/pdf", "ContentLength": len(PDF), "ETag": '"etag-1"'}
+
+
+class FakeFiles:
+    """업로드된 내용 기록 (임시 파일 경로 또는 BytesIO)"""
+
+    def __init__(self):
+        self.uploads = []
+
+    async def upload(self, file, config=None):
+        if isinstance(file, str):
+            with open(file, "rb") as f:
+                self.uploads.append((file, f.read()))
+        else:
+            self.uploads.append((None, file.getvalue()))
+        return SimpleNamespace(name="files/spooled", uri="uri://spooled", state="ACTIVE", size_bytes=len(PDF))
+
+
+class ResumableUploadServer:
+    """Gemini 재개 가능 업로드 엔드포인트 대역"""
+
+    def __init__(self, fail_chunks: bool = False):
+        self.fail_chunks = fail_chunks
+        self.start_headers = None
+        self.start_json = None
+        self.chunks = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/upload/v1beta/files"):
+            self.start_headers = request.headers
+            self.start_json = json.loads(request.content)
+            return httpx.Response(200, headers={"x-goog-upload-url": "https://upload.test/session"})
+        if self.fail_chunks:
+            return httpx.Response(503)
+        command = request.headers["X-Goog-Upload-Command"]
+        offset = int(request.headers["X-Goog-Upload-Offset"])
+        self.chunks.append((command, offset, request.content))
+        if command == "upload, finalize":
+            file = {"name": "files/streamed", "uri": "uri://streamed", "state": "PROCESSING", "sizeBytes": str(offset + len(request.content))}
+            return httpx.Response(200, json={"file": file})
+        return httpx.Response(200, headers={"X-Goog-Upload-Status": "active"})
+
+
+@pytest.fixture
+def server(monkeypatch) -> ResumableUploadServer:
+    server = ResumableUploadServer()
+    original = httpx.AsyncClient
+    monkeypatch.setattr(
+        s3_pdf_loader.httpx, "AsyncClient",
+        lambda **kwargs: original(transport=httpx.MockTransport(server), **kwargs),
+    )
+    return server
+
+
+@pytest.fixture
+def budget(monkeypatch) -> ByteBudget:
+    budget = ByteBudget(2 * CHUNK)
+    monkeypatch.setattr(byte_budget, "_pdf_byte_budget", budget)
+    return budget
+
+
+def make_loader() -> S3PDFLoader:
+    loader = S3PDFLoader.__new__(S3PDFLoader)
+    loader.bucket_name = "bucket"
+    loader.s3_client = FakeS3()
+    loader.genai_client = SimpleNamespace(aio=SimpleNamespace(files=FakeFiles()))
+    loader.gemini_api_key = "key"
+    loader.file_registry = None
+    loader.STREAM_THRESHOLD_BYTES = CHUNK
+    loader.STREAM_CHUNK_BYTES = CHUNK
+    return loader
+
+
+def test_budget_waits_until_released():
+    async def run():
+        budget = ByteBudget(100)
+        order = []
+
+        async def hold(name: str, num_bytes: int, delay: float):
+            async with budget.reserve(num_bytes) as reserved:
+                order.append((name, reserved, budget.stats()["in_use_bytes"]))
+                await asyncio.sleep(delay)
+
+        first = asyncio.create_task(hold("first", 70, 0.05))
+        await asyncio.sleep(0)
+        await asyncio.gather(first, hold("second", 50, 0))
+        return budget.stats(), order
+
+    stats, order = asyncio.run(run())
+
+    assert order == [("first", 70, 70), ("second", 50, 50)]
+    assert stats["waits"] == 1 and stats["reservations"] == 2
+    assert stats["peak_bytes"] == 70 and stats["in_use_bytes"] == 0
+
+
+def test_budget_clamps_to_limit():
+    async def run():
+        budget = ByteBudget(100)
+        async with budget.reserve(500) as big:
+            pass
+        async with budget.reserve(-5) as negative:
+            pass
+        return big, negative, budget.stats()
+
+    big, negative, stats = asyncio.run(run())
+
+    # 한도보다 큰 파일도 단독으로는 진행 가능
+    assert (big, negative) == (100, 0)
+    assert stats["waits"] == 0 and stats["in_use_bytes"] == 0
+
+
+def test_stream_uploads_in_aligned_chunks(server):
+    loader = make_loader()
+
+    async def run():
+        opened = await loader._open_s3_object("token/big.pdf")
+        return await loader._stream_to_gemini(opened, len(PDF))
+
+    gemini_file = asyncio.run(run())
+
+    assert server.start_headers["X-Goog-Upload-Command"] == "start"
+    assert server.start_headers["X-Goog-Upload-Header-Content-Length"] == str(len(PDF))
+    assert [offset for _, offset, _ in server.chunks] == [0, CHUNK, 2 * CHUNK, 3 * CHUNK, 4 * CHUNK]
+    # 짧은 읽기가 섞여도 마지막 청크 전까지는 정확히 CHUNK 크기
+    assert [len(content) for _, _, content in server.chunks] == [CHUNK] * 4 + [100]
+    assert [command for command, _, _ in server.chunks] == ["upload"] * 4 + ["upload, finalize"]
+    assert b"".join(content for _, _, content in server.chunks) == PDF
+    assert (gemini_file.name, gemini_file.size_bytes, gemini_file.display_name) == ("files/streamed", len(PDF), "big.pdf")
+
+
+def test_stream_failure_falls_back_to_spool(server, budget):
+    server.fail_chunks = True
+    loader = make_loader()
+
+    gemini_file = asyncio.run(loader.load_from_s3("token/big.pdf", wait_for_processing=False))
+
+    assert gemini_file.name == "files/spooled"
+    # 실패한 스트림 대신 S3를 다시 열어 임시 파일로 받음
+    assert loader.s3_client.keys == ["token/big.pdf", "token/big.pdf"]
+    [(path, uploaded)] = loader.genai_client.aio.files.uploads
+    assert uploaded == PDF
+    assert not os.path.exists(path)
+    # 큰 PDF는 청크 크기만큼만 예약
+    stats = budget.stats()
+    assert stats["peak_bytes"] == CHUNK and stats["in_use_bytes"] == 0
+
+
+def test_prefetched_bytes_keep_reservation_until_upload(budget):
+    loader = make_loader()
+    loader.STREAM_THRESHOLD_BYTES = len(PDF)
+
+    async def run():
+        [doc] = await loader.extract_text_from_s3(["token/scan.pdf"])
+        held = budget.stats()["in_use_bytes"]
+        gemini_file = await loader.load_from_s3("token/scan.pdf", wait_for_processing=False, prefetched=doc)
+        return doc, held, gemini_file
+
+    doc, held, gemini_file = asyncio.run(run())
+
+    # 이미지 PDF(추출 실패)는 multimodal 대상 → 업로드 전까지 바이트와 예약 유지
+    assert held == budget.limit_bytes
+    assert gemini_file.name == "files/spooled"
+    assert loader.s3_client.keys == ["token/scan.pdf"]
+    assert loader.genai_client.aio.files.uploads == [(None, PDF)]
+    assert doc.pdf_bytes is None and budget.stats()["in_use_bytes"] == 0
+
+
+def test_text_or_large_pdfs_release_reservation(budget, monkeypatch):
+    loader = make_loader()
+
+    # 스트리밍 경로 대상(STREAM_THRESHOLD_BYTES 초과)은 보관하지 않음
+    [large] = asyncio.run(loader.extract_text_from_s3(["token/big.pdf"]))
+    assert large.pdf_bytes is None and budget.stats()["in_use_bytes"] == 0
+
+    loader.STREAM_THRESHOLD_BYTES = len(PDF)
+    monkeypatch.setattr(
+        s3_pdf_loader, "extract_pdf_text",
+        lambda data, filename: ExtractedPDF(filename=filename, doc_id="resume", is_text_native=True, reason="text"),
+    )
+
+    # 모두 텍스트 PDF면 업로드가 없으므로 바로 해제
+    [text] = asyncio.run(loader.extract_text_from_s3(["token/resume.pdf"]))
+    assert text.pdf_bytes is None and budget.stats()["in_use_bytes"] == 0
+    assert budget.stats()["peak_bytes"] == budget.limit_bytes
+
+
+def test_registry_streams_and_reuses_same_object(server, budget):
+    loader = make_loader()
+    loader.file_registry = GeminiFileRegistry(genai_client=loader.genai_client)
+
+    async def run():
+        first = await loader.load_from_s3("token/big.pdf", wait_for_processing=False)
+        second = await loader.load_from_s3("token/big.pdf", wait_for_processing=False)
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    # 레지스트리가 있어도 임시 파일 없이 스트리밍
+    assert first.name == second.name == "files/streamed"
+    assert len(server.chunks) == 5
+    assert loader.genai_client.aio.files.uploads == []
+    assert server.start_json["file"]["display_name"].startswith(REMOTE_PREFIX)
+    # 두 번째 요청은 S3 객체를 열기만 하고 본문은 받지 않음
+    first_body, second_body = loader.s3_client.bodies
+    assert first_body._buffer.tell() == len(PDF) and second_body._buffer.tell() == 0
+    stats = loader.file_registry.stats()
+    assert (stats["uploads"], stats["hits"], stats["in_use"]) == (1, 1, 1)
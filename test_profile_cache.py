@@ -0,0 +1,37 @@
+"""
+회사 프로필 캐시 키 테스트 (profile_cache.hash_sources / get_pipeline_version)
+
+실행:
+    python -m pytest -q test_profile_cache.py
+"""
+
+from apiv2.langchain_pipeline.utils import profile_cache
+from apiv2.langchain_pipeline.utils.profile_cache import get_pipeline_version, hash_sources
+
+SOURCES = [("=== https://toss.im/team ===", "일하는 방식"), ("=== https://toss.tech ===", "기술 블로그")]
+
+
+def test_source_hash_ignores_job_posting():
+    first = [("=== 채용공고: https://toss.im/career/1 ===", "백엔드 개발자"), *SOURCES]
+    second = [("=== 채용공고: https://toss.im/career/2 ===", "데이터 엔지니어 (마감 D-3)"), *SOURCES]
+
+    assert hash_sources(first) == hash_sources(second)
+    assert hash_sources(first) != hash_sources([first[0], SOURCES[0]])
+
+
+def test_posting_only_falls_back_to_posting_hash():
+    posting = [("=== 채용공고: https://toss.im/career/1 ===", "백엔드 개발자")]
+
+    assert hash_sources(posting) != hash_sources([("=== 채용공고: https://toss.im/career/2 ===", "백엔드 개발자")])
+
+
+def test_version_changes_with_preprocessing_settings(monkeypatch):
+    base = {mode: get_pipeline_version(mode) for mode in ("two_stage", "fused")}
+
+    monkeypatch.setattr(profile_cache, "COLLECT_CHUNK_TOKENS", profile_cache.COLLECT_CHUNK_TOKENS + 1)
+    assert get_pipeline_version("two_stage") != base["two_stage"]
+    # fused는 map-reduce를 쓰지 않음
+    assert get_pipeline_version("fused") == base["fused"]
+
+    monkeypatch.setattr(profile_cache, "TEXT_DEDUP_SHINGLE_LINES", profile_cache.TEXT_DEDUP_SHINGLE_LINES + 1)
+    assert get_pipeline_version("fused") != base["fused"]
@@ -0,0 +1,129 @@
+"""
+비교 프롬프트용 프로필 축약 테스트 (profile_projection.project_profile)
+
+실행:
+    python -m pytest -q test_profile_projection.py
+"""
+
+import asyncio
+import copy
+import json
+
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from apiv2.langchain_pipeline.chains.compare_chain import CultureCompareChain
+from apiv2.langchain_pipeline.config import EVIDENCE_MAX_ITEMS, EVIDENCE_QUOTE_MAX_CHARS
+from apiv2.langchain_pipeline.utils.profile_projection import (
+    COMPANY_PROMPT_KEYS,
+    DEVELOPER_PROMPT_KEYS,
+    dumps_compact,
+    get_projection_stats,
+    project_profile,
+    serialize_for_prompt,
+)
+
+
+def evidence(count: int, quote: str = "근거 문장") -> list[dict]:
+    return [{"quote": quote, "source": f"https://toss.im/{i}"} for i in range(count)]
+
+
+def company_profile() -> dict:
+    return {
+        "_id": "abc",
+        "_meta": {"source_hash": "h"},
+        "schema_version": "v3",
+        "created_at": "2025-01-01",
+        "extraction_quality": {"coverage": 0.8},
+        "profile_meta": {"company_name": "토스", "updated_at": "2025-01-02"},
+        "company_info_fields": {
+            "industry": "핀테크",
+            "remote": "unknown",
+            "perks": [],
+            "office": None,
+            "hiring": {},
+        },
+        "scoring_axes": {
+            "scoring_policy": "모든 문서에 같은 설명",
+            "technical_fit": {"summary": "Kotlin", "evidence": evidence(EVIDENCE_MAX_ITEMS + 2)},
+        },
+    }
+
+
+def test_company_keys_and_dropped_fields():
+    profile = company_profile()
+    original = copy.deepcopy(profile)
+
+    projected = project_profile(profile, COMPANY_PROMPT_KEYS)
+
+    assert list(projected) == COMPANY_PROMPT_KEYS
+    # 중첩된 메타 필드와 공통 정책 설명도 제외
+    assert projected["profile_meta"] == {"company_name": "토스"}
+    assert "scoring_policy" not in projected["scoring_axes"]
+    # 원본은 변경하지 않음
+    assert profile == original
+
+
+def test_empty_values_dropped_but_unknown_kept():
+    projected = project_profile(company_profile(), COMPANY_PROMPT_KEYS)
+
+    assert projected["company_info_fields"] == {"industry": "핀테크", "remote": "unknown"}
+
+
+def test_evidence_items_and_quotes_are_truncated():
+    long_quote = "가" * (EVIDENCE_QUOTE_MAX_CHARS + 40)
+    profile = {"axis": {"evidence": evidence(EVIDENCE_MAX_ITEMS + 2, quote=long_quote), "quote": long_quote}}
+
+    projected = project_profile(profile)
+
+    items = projected["axis"]["evidence"]
+    assert len(items) == EVIDENCE_MAX_ITEMS
+    assert [item["source"] for item in items] == [f"https://toss.im/{i}" for i in range(EVIDENCE_MAX_ITEMS)]
+    assert all(item["quote"] == "가" * EVIDENCE_QUOTE_MAX_CHARS + "…" for item in items)
+    # evidence가 아닌 목록은 자르지 않음
+    assert len(project_profile({"tags": list(range(10))})["tags"]) == 10
+
+
+def test_short_quote_and_nested_empty_items():
+    profile = {"evidence": [{"quote": "짧은 근거"}, {"quote": None}, {}, []]}
+
+    assert project_profile(profile) == {"evidence": [{"quote": "짧은 근거"}]}
+
+
+def test_developer_keys_and_missing_keys():
+    profile = {
+        "profile_keywords": ["Kotlin"],
+        "user_info_fields": {"name": "홍길동"},
+        "_source": {"resume": "s3://bucket/a.pdf"},
+    }
+
+    projected = project_profile(profile, DEVELOPER_PROMPT_KEYS)
+
+    assert projected == {"profile_keywords": ["Kotlin"], "user_info_fields": {"name": "홍길동"}}
+
+
+def test_serialize_is_compact_json():
+    text = serialize_for_prompt(company_profile(), COMPANY_PROMPT_KEYS, label="company")
+
+    assert ", " not in text and ": " not in text
+    assert json.loads(text) == project_profile(company_profile(), COMPANY_PROMPT_KEYS)
+    assert dumps_compact({"a": [1, 2]}) == '{"a":[1,2]}'
+
+
+def test_axis_fanout_records_token_counts():
+    async def fake_allm(prompt_value, **kwargs):
+        return AIMessage(content=json.dumps({"status": "aligned", "axis_score": 70}))
+
+    chain = CultureCompareChain.__new__(CultureCompareChain)
+    chain._setup_prompts()
+    chain.llm = RunnableLambda(lambda prompt_value: None, afunc=fake_allm)
+    chain.compact_profiles = True
+    before = get_projection_stats()
+
+    result = asyncio.run(chain._compare_axis("technical_fit", company_profile(), {"profile_keywords": ["Kotlin"]}))
+
+    after = get_projection_stats()
+    assert result == {"status": "aligned", "axis_score": 70}
+    # 축별 호출도 회사/지원자 프로필 축약 전후 토큰 수를 기록
+    assert after["calls"] == before["calls"] + 2
+    assert after["tokens_before"] > before["tokens_before"]
@@ -0,0 +1,192 @@
+"""
+저장된 매칭 결과 일괄 재채점 테스트 (rescoring.rescore_collection)
+
+pymongo 컬렉션 대신 find/bulk_write만 구현한 메모리 컬렉션을 사용한다.
+bulk_write는 받은 UpdateOne을 기록만 하고, 테스트가 기대하는 UpdateOne 목록과 == 로
+비교한 뒤 같은 갱신을 메모리 문서에 반영한다 (pymongo 비공개 속성에 의존하지 않음).
+
+실행:
+    python -m pytest -q test_rescoring.py
+"""
+
+import copy
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from pymongo import UpdateOne
+
+from apiv2.langchain_pipeline.utils import rescoring
+from apiv2.langchain_pipeline.utils.match_scoring import AXES, compute_overall
+from apiv2.langchain_pipeline.utils.rescoring import RESCORE_PROJECTION, rescore_collection
+
+NOW = datetime(2025, 1, 1, 12, 0, 0)
+
+_MISSING = object()
+
+
+def _get(doc: dict, path: str):
+    for part in path.split("."):
+        if not isinstance(doc, dict) or part not in doc:
+            return _MISSING
+        doc = doc[part]
+    return doc
+
+
+def _set(doc: dict, path: str, value):
+    *parents, last = path.split(".")
+    for part in parents:
+        doc = doc.setdefault(part, {})
+    doc[last] = value
+
+
+def _matches(doc: dict, filter_: dict) -> bool:
+    for path, condition in filter_.items():
+        value = _get(doc, path)
+        if isinstance(condition, dict) and "$ne" in condition:
+            if value == condition["$ne"]:
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+class MemoryCollection:
+    """rescore_collection이 쓰는 find/bulk_write만 구현"""
+
+    def __init__(self, docs: list[dict]):
+        self.docs = {doc["_id"]: doc for doc in docs}
+        self.finds = []
+        self.bulk_sizes = []
+        self.ops = []
+
+    def find(self, filter_, projection=None, batch_size=None):
+        self.finds.append((filter_, projection, batch_size))
+        for doc in list(self.docs.values()):
+            if _matches(doc, filter_):
+                projected = {"_id": doc["_id"]}
+                for path in projection or {}:
+                    value = _get(doc, path)
+                    if value is not _MISSING:
+                        _set(projected, path, copy.deepcopy(value))
+                yield projected
+
+    def bulk_write(self, ops, ordered=True):
+        self.bulk_sizes.append(len(ops))
+        self.ops.extend(ops)
+        return SimpleNamespace(modified_count=len(ops))
+
+    def apply(self, updates: list[tuple[dict, dict]]):
+        """기대 갱신 목록이 기록된 UpdateOne과 같은지 확인한 뒤 메모리 문서에 반영"""
+        assert self.ops == [UpdateOne(filter_, update) for filter_, update in updates]
+        for filter_, update in updates:
+            doc = self.docs[filter_["_id"]]
+            for path, value in update["$set"].items():
+                _set(doc, path, value)
+        self.ops = []
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    """updated_at을 고정해 기대 UpdateOne과 비교"""
+    monkeypatch.setattr(rescoring, "datetime", SimpleNamespace(utcnow=lambda: NOW))
+
+
+def expected_updates(docs: list[dict], weights, scoring_version: str, variant: bool = False) -> list[tuple[dict, dict]]:
+    target = f"overall_variants.{scoring_version}" if variant else "overall"
+    updates = []
+    for doc in docs:
+        update = {target: compute_overall(doc["axis_alignments"], weights), "updated_at": NOW}
+        if not variant:
+            update["meta.scoring_version"] = scoring_version
+        updates.append(({"_id": doc["_id"]}, {"$set": update}))
+    return updates
+
+
+def alignments(score: int) -> dict:
+    return {
+        axis: {"status": "aligned", "axis_score": score + i, "evidence_refs": {"company": [1], "developer": [1]}, "summary": "x"}
+        for i, axis in enumerate(AXES)
+    }
+
+
+def make_docs(count: int, company: str = "c1", version: str = "alignment-v1") -> list[dict]:
+    return [
+        {
+            "_id": f"{company}-{i}",
+            "inputs": {"company_profile_ref": {"profile_id": company}},
+            "meta": {"scoring_version": version},
+            "axis_alignments": alignments(40 + i),
+            "overall": {"match_score": 0},
+        }
+        for i in range(count)
+    ]
+
+
+def test_rescore_in_place_in_batches():
+    docs = make_docs(5)
+    collection = MemoryCollection(docs + make_docs(2, company="c2"))
+    weights = {"technical_fit": 3.0}
+    seen_batches = []
+
+    stats = rescore_collection(
+        collection, weights, "tech-heavy-v1",
+        query={"inputs.company_profile_ref.profile_id": "c1"},
+        batch_size=2,
+        on_batch=lambda s: seen_batches.append(s.matched),
+    )
+
+    assert (stats.matched, stats.modified, stats.batches) == (5, 5, 3)
+    assert seen_batches == [2, 4, 5]
+    assert collection.bulk_sizes == [2, 2, 1]
+    filter_, projection, batch_size = collection.finds[0]
+    assert filter_["meta.scoring_version"] == {"$ne": "tech-heavy-v1"}
+    assert projection == RESCORE_PROJECTION and batch_size == 2
+
+    collection.apply(expected_updates(docs, weights, "tech-heavy-v1"))
+    for doc_id, doc in collection.docs.items():
+        if doc_id.startswith("c1"):
+            assert doc["meta"]["scoring_version"] == "tech-heavy-v1"
+            assert doc["overall"] == compute_overall(doc["axis_alignments"], weights)
+        else:
+            assert doc["overall"] == {"match_score": 0}
+
+
+def test_rerun_skips_already_rescored_documents():
+    docs = make_docs(3)
+    collection = MemoryCollection(docs)
+    rescore_collection(collection, None, "equal-v2")
+    collection.apply(expected_updates(docs, None, "equal-v2"))
+
+    stats = rescore_collection(collection, None, "equal-v2")
+
+    assert stats.matched == 0 and stats.batches == 0
+
+
+def test_variant_mode_keeps_current_overall():
+    docs = make_docs(2)
+    collection = MemoryCollection(docs)
+
+    rescore_collection(collection, {"execution_style": 0.0}, "no-exec")
+    collection.apply(expected_updates(docs, {"execution_style": 0.0}, "no-exec"))
+
+    stats = rescore_collection(collection, {"technical_fit": 2.0}, "what-if", variant=True)
+
+    assert stats.matched == 2
+    collection.apply(expected_updates(docs, {"technical_fit": 2.0}, "what-if", variant=True))
+    assert "meta.scoring_version" not in collection.finds[-1][0]
+    for doc in collection.docs.values():
+        assert doc["meta"]["scoring_version"] == "no-exec"
+        assert doc["overall"] == compute_overall(doc["axis_alignments"], {"execution_style": 0.0})
+        assert doc["overall_variants"]["what-if"] == compute_overall(doc["axis_alignments"], {"technical_fit": 2.0})
+
+
+def test_dry_run_does_not_write():
+    collection = MemoryCollection(make_docs(3))
+    before = copy.deepcopy(collection.docs)
+
+    stats = rescore_collection(collection, None, "dry", dry_run=True)
+
+    assert stats.matched == 3 and stats.modified == 0
+    assert collection.bulk_sizes == [] and collection.ops == []
+    assert collection.docs == before
@@ -0,0 +1,76 @@
+"""
+페이지 간 중복 블록 제거 테스트 (text_dedup.dedupe_pages)
+
+실행:
+    python -m pytest -q test_text_dedup.py
+"""
+
+from apiv2.langchain_pipeline.utils.text_dedup import dedupe_pages
+
+NAV = ["회사소개", "채용", "블로그"]
+FOOTER = ["© 2025 Toss", "개인정보처리방침", "이용약관"]
+
+
+def page(*body: str) -> str:
+    return "\n".join([*NAV, *body, *FOOTER])
+
+
+def test_repeated_blocks_are_removed_from_later_pages():
+    posting = page("백엔드 개발자 채용", "Kotlin/Spring 경험 3년 이상", "코드 리뷰 문화")
+    culture = page("토스의 일하는 방식", "자율과 책임", "빠른 실행")
+
+    (first, second), stats = dedupe_pages([posting, culture])
+
+    # 앞선 페이지(채용공고)는 그대로 유지
+    assert first == posting
+    assert second.split("\n") == ["토스의 일하는 방식", "자율과 책임", "빠른 실행"]
+    assert stats.pages == 2
+    assert stats.lines_removed == len(NAV) + len(FOOTER)
+    assert stats.chars_after < stats.chars_before
+    assert stats.tokens_removed > 0
+
+
+def test_lines_are_compared_after_normalizing_whitespace_and_case():
+    first = "Cookie Policy\nWe use cookies\nAccept all"
+    second = "cookie   policy\nWE USE COOKIES\n  Accept all  \n본문 내용"
+
+    (_, deduped), stats = dedupe_pages([first, second])
+
+    assert deduped == "본문 내용"
+    assert stats.lines_removed == 3
+
+
+def test_shared_lines_shorter_than_shingle_are_kept():
+    first = "공통 문장\n첫 페이지 본문 A\n첫 페이지 본문 B"
+    second = "두 번째 페이지 본문 A\n공통 문장\n두 번째 페이지 본문 B"
+
+    deduped, stats = dedupe_pages([first, second])
+
+    # 한 줄만 겹치면 블록(3줄)으로 보지 않음
+    assert deduped == [first, second]
+    assert stats.lines_removed == 0
+
+
+def test_short_page_is_one_block():
+    banner = "지금 지원하세요\n채용 중"
+
+    deduped, stats = dedupe_pages([banner, "다른 본문", banner])
+
+    assert deduped == [banner, "다른 본문", ""]
+    assert stats.lines_removed == 2
+
+
+def test_repeats_within_a_page_are_removed():
+    block = "포지션 A\n서울\n정규직"
+
+    [deduped], _ = dedupe_pages([f"{block}\n중간 설명\n{block}"])
+
+    assert deduped == f"{block}\n중간 설명"
+
+
+def test_empty_lines_and_stats():
+    deduped, stats = dedupe_pages(["a\n\n\nb", ""])
+
+    assert deduped == ["a\nb", ""]
+    assert stats.lines_before == 2
+    assert stats.to_dict()["chars_removed"] == stats.chars_removed
@@ -0,0 +1,43 @@
+"""
+도메인별 스크래핑 단계 통계 테스트 (tiered_scraper.DomainTierStats)
+
+실행:
+    python -m pytest -q test_tier_stats.py
+"""
+
+from apiv2.langchain_pipeline.config import TIER_REPROBE_EVERY, TIER_SKIP_MIN_SAMPLES
+from apiv2.langchain_pipeline.scrapers.tiered_scraper import DomainTierStats
+
+
+def test_lookup_does_not_add_domains():
+    stats = DomainTierStats()
+
+    assert not stats.should_skip_http("new.example.com")
+    assert stats.snapshot() == {}
+
+
+def test_domains_are_capped_lru():
+    stats = DomainTierStats(max_domains=2)
+    stats.record("a.com", "http_ok")
+    stats.record("b.com", "http_ok")
+    stats.record("a.com", "http_ok")
+    stats.record("c.com", "escalated")
+
+    # 가장 오래 기록되지 않은 b.com 제거
+    assert list(stats.snapshot()) == ["a.com", "c.com"]
+    assert stats.snapshot()["a.com"]["http_ok"] == 2
+
+
+def test_skip_after_escalations_with_periodic_reprobe():
+    stats = DomainTierStats()
+    for _ in range(TIER_SKIP_MIN_SAMPLES):
+        stats.record("spa.com", "escalated")
+
+    decisions = []
+    for _ in range(TIER_REPROBE_EVERY):
+        skip = stats.should_skip_http("spa.com")
+        decisions.append(skip)
+        if skip:
+            stats.record("spa.com", "skipped_http")
+
+    assert decisions.count(False) == 1 and decisions[-1] is False